@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark DatabaseConnectionManager checkouts: a fresh connection per call vs. the pool.
+
+Runs ``--calls`` short ``with get_connection(...)`` blocks, each executing one
+parameterised lookup against a file-backed SQLite database of ``--rows`` rows,
+from ``--threads`` worker threads. The ``fresh`` path reproduces the previous
+behaviour (open, query, close per call); the ``pooled`` path checks
+connections out of a pool of ``--pool-size``. Afterwards the whole table is read
+with ``execute_query`` and with ``iter_query`` batches.
+
+Usage:
+    python scripts/benchmarks/benchmark_database_pool.py --calls 20000 --threads 4
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.data_integration.database_connections import (  # noqa: E402
+    DatabaseConfig,
+    DatabaseConnectionManager,
+    DatabaseType,
+)
+
+LOOKUP = "SELECT name, value FROM tags WHERE id = :id"
+
+
+def populate(path: str, rows: int) -> None:
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT, value REAL)")
+        connection.executemany(
+            "INSERT INTO tags VALUES (?, ?, ?)", ((i, f"Line{i % 50}/Tag{i}", i * 0.5) for i in range(rows))
+        )
+
+
+def run_fresh(path: str, calls: int, rows: int, threads: int) -> float:
+    def call(i: int) -> None:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        try:
+            connection.row_factory = sqlite3.Row
+            cursor = connection.cursor()
+            cursor.execute(LOOKUP, {"id": i % rows})
+            [dict(row) for row in cursor.fetchall()]
+        finally:
+            connection.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(call, range(calls)))
+    return time.perf_counter() - start
+
+
+def run_pooled(manager: DatabaseConnectionManager, calls: int, rows: int, threads: int) -> float:
+    def call(i: int) -> None:
+        with manager.get_connection("bench") as connection_id:
+            manager.execute_query(connection_id, LOOKUP, {"id": i % rows})
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(call, range(calls)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000, help="Checkout + query calls")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows in the table")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent worker threads")
+    parser.add_argument("--pool-size", type=int, default=4, help="Maximum pooled connections")
+    parser.add_argument("--batch", type=int, default=5000, help="Rows per iter_query batch")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.db")
+        populate(path, args.rows)
+
+        manager = DatabaseConnectionManager()
+        manager.add_config(
+            "bench",
+            DatabaseConfig(
+                db_type=DatabaseType.SQLITE,
+                host=path,
+                port=0,
+                database="bench",
+                username="",
+                password="",
+                pool_size=args.pool_size,
+            ),
+        )
+
+        fresh = run_fresh(path, args.calls, args.rows, args.threads)
+        pooled = run_pooled(manager, args.calls, args.rows, args.threads)
+        print(f"{'path':>8}{'seconds':>9}{'calls/s':>10}")
+        for name, seconds in (("fresh", fresh), ("pooled", pooled)):
+            print(f"{name:>8}{seconds:>9.2f}{args.calls / seconds:>10,.0f}")
+
+        stats = manager.list_connections()[0]["pool"]
+        print(
+            f"pool: {stats['created']} connections, wait p50/p99 {stats['wait_ms']['p50']:.3f}/"
+            f"{stats['wait_ms']['p99']:.3f} ms, query p50/p99 {stats['query_ms']['p50']:.3f}/"
+            f"{stats['query_ms']['p99']:.3f} ms, statement cache hits {stats['statement_cache_hits']}"
+        )
+
+        with manager.get_connection("bench") as connection_id:
+            start = time.perf_counter()
+            rows = manager.execute_query(connection_id, "SELECT * FROM tags")
+            print(f"execute_query full table: {len(rows):,} rows in {time.perf_counter() - start:.2f} s")
+            del rows
+
+            start = time.perf_counter()
+            streamed = largest = 0
+            for batch in manager.iter_query(connection_id, "SELECT * FROM tags", batch_size=args.batch):
+                streamed += len(batch)
+                largest = max(largest, len(batch))
+            print(
+                f"iter_query full table:    {streamed:,} rows in {time.perf_counter() - start:.2f} s "
+                f"(at most {largest:,} rows held)"
+            )
+        manager.disconnect_all()
+
+
+if __name__ == "__main__":
+    main()
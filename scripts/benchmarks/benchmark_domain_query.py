@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark domain knowledge queries: linear relevance scan vs. the BM25 inverted index.
+
+Builds ``SystemFunctionsDomainManager`` knowledge bases of increasing size
+from synthetic system functions with usage examples. The ``scan`` path
+reproduces the previous ``query_knowledge`` loop, which lower-cases and
+substring-matches every item's fields and ``str(item.content)`` on every
+query. The ``index`` path is ``search_knowledge``. Queries are function
+names; the index only visits items sharing one of their terms, here the
+verb or module part each shared by a tenth of the items. Index build time
+and the time to reload a saved index are reported as well.
+
+Usage:
+    python scripts/benchmarks/benchmark_domain_query.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.sme_agent.knowledge_domains import (  # noqa: E402
+    DomainKnowledgeItem,
+    SystemFunctionsDomainManager,
+)
+
+MODULES = ["tag", "db", "device", "opcua", "file", "nav", "alarm", "util", "net", "report"]
+VERBS = ["read", "write", "browse", "list", "query", "configure", "export", "import", "reset", "subscribe"]
+
+
+def items(count: int) -> list[DomainKnowledgeItem]:
+    result = []
+    for i in range(count):
+        module, verb = MODULES[i % len(MODULES)], VERBS[(i // len(MODULES)) % len(VERBS)]
+        name = f"{verb}{module.capitalize()}{i}"
+        result.append(
+            DomainKnowledgeItem(
+                id=f"system.{module}.{name}",
+                name=name,
+                description=f"{verb.capitalize()} {module} item {i} with optional timeout and retry settings",
+                category=module,
+                content={
+                    "module": f"system.{module}",
+                    "parameters": ["path", "timeout", f"option{i % 13}"],
+                    "usage_examples": [f"result = system.{module}.{name}('[default]Area{i % 50}/Value')"] * 3,
+                },
+                confidence=0.8,
+                tags=[module, verb],
+            )
+        )
+    return result
+
+
+def scan(manager: SystemFunctionsDomainManager, query: str) -> list[DomainKnowledgeItem]:
+    """The previous query loop: score every item from scratch."""
+    query = query.lower().strip()
+    results = []
+    for item in manager.knowledge_items.values():
+        score = 0.0
+        if query in item.name.lower():
+            score += 0.6
+        if query in item.content.get("module", "").lower():
+            score += 0.4
+        if query in item.description.lower():
+            score += 0.3
+        for tag in item.tags:
+            if query in tag.lower() or tag.lower() in query:
+                score += 0.2
+        content = str(item.content).lower()
+        score += 0.1 * sum(1 for word in query.split() if len(word) > 3 and word in content)
+        if score > 0.2:
+            results.append(item)
+    results.sort(key=lambda x: x.confidence, reverse=True)
+    return results[:10]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 50_000], help="Knowledge base sizes")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per size")
+    args = parser.parse_args()
+
+    print(f"{'items':>8}{'scan p50 ms':>13}{'index p50 ms':>14}{'build s':>9}{'reload s':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = SystemFunctionsDomainManager(data_dir=tmp)
+            corpus = items(size)
+            start = time.perf_counter()
+            for item in corpus:
+                manager.add_knowledge_item(item)
+            build = time.perf_counter() - start
+            manager.save_knowledge_base()
+
+            start = time.perf_counter()
+            SystemFunctionsDomainManager(data_dir=tmp)
+            reload = time.perf_counter() - start
+
+            queries = [corpus[i * 7919 % size].name for i in range(args.queries)]
+            timings = {"scan": [], "index": []}
+            for query in queries:
+                start = time.perf_counter()
+                scan(manager, query)
+                timings["scan"].append(time.perf_counter() - start)
+                start = time.perf_counter()
+                manager.search_knowledge(query, limit=10)
+                timings["index"].append(time.perf_counter() - start)
+
+            print(
+                f"{size:>8,}{np.median(timings['scan']) * 1e3:>13.2f}{np.median(timings['index']) * 1e3:>14.3f}"
+                f"{build:>9.2f}{reload:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
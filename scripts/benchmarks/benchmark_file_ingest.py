@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark FileAdapter streaming reads of large CSV and Parquet historian exports.
+
+Writes ``--rows`` historian points (timestamp, tag_name, value, quality) over
+``--tags`` tags at 10 Hz to a CSV file and a Parquet file, generated chunk by
+chunk. Each read then runs in a fresh child process so its peak memory is
+reported on its own: peak RSS (which includes memory-mapped file pages, i.e.
+reclaimable page cache), peak anonymous RSS sampled from ``/proc`` and the
+peak of Arrow's allocator.
+
+* ``full``     the whole file materialised in one table (``read_csv`` / ``read_table``);
+* ``stream``   every row through ``FileAdapter.read_blocks`` in ``--batch`` row blocks;
+* ``pushdown`` one tag and a one-hour window with only ``timestamp``/``value``
+  projected, so Parquet row groups outside the window are skipped.
+
+Usage:
+    python scripts/benchmarks/benchmark_file_ingest.py --rows 10000000 --batch 100000
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import resource
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.data_integration.adapters.file_adapter import FileAdapter  # noqa: E402
+from src.ignition.modules.data_integration.integration_module import (  # noqa: E402
+    DataSourceConfig,
+    DataSourceType,
+)
+
+START = np.datetime64("2024-01-01T00:00:00", "us")
+GENERATE_CHUNK = 1_000_000
+
+
+def generate(csv_path: Path, parquet_path: Path, rows: int, tags: int) -> None:
+    rng = np.random.default_rng(0)
+    names = np.array([f"Line{i % 10}/Tag{i}" for i in range(tags)], dtype=object)
+    schema = pa.schema(
+        [("timestamp", pa.timestamp("us")), ("tag_name", pa.string()), ("value", pa.float64()), ("quality", pa.int32())]
+    )
+    with (
+        pq.ParquetWriter(parquet_path, schema) as parquet_writer,
+        pa_csv.CSVWriter(csv_path, schema) as csv_writer,
+    ):
+        for first in range(0, rows, GENERATE_CHUNK):
+            index = np.arange(first, min(first + GENERATE_CHUNK, rows))
+            table = pa.table(
+                {
+                    "timestamp": START + index * 100_000,
+                    "tag_name": names[index % tags],
+                    "value": rng.normal(50.0, 5.0, len(index)),
+                    "quality": np.full(len(index), 192, dtype=np.int32),
+                },
+                schema=schema,
+            )
+            parquet_writer.write_table(table, row_group_size=100_000)
+            csv_writer.write_table(table)
+
+
+def anonymous_rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def read(path: str, file_format: str, mode: str, batch: int, result: multiprocessing.Queue) -> None:
+    logging.disable(logging.WARNING)
+    peak_anonymous = anonymous_rss_mb()
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak_anonymous
+        while not done.wait(0.01):
+            peak_anonymous = max(peak_anonymous, anonymous_rss_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    if mode == "full":
+        table = pa_csv.read_csv(path) if file_format == "csv" else pq.read_table(path)
+        rows = table.num_rows
+        table.column("value").to_numpy().mean()
+    else:
+        source_type = DataSourceType.CSV if file_format == "csv" else DataSourceType.PARQUET
+        adapter = FileAdapter(
+            DataSourceConfig(
+                source_id="bench", source_type=source_type, connection_params={"path": path}, batch_size=batch
+            )
+        )
+        query = {}
+        if mode == "pushdown":
+            query = {
+                "columns": ["timestamp", "value"],
+                "tags": ["Line3/Tag3"],
+                "start_time": "2024-01-01T05:00:00",
+                "end_time": "2024-01-01T06:00:00",
+            }
+
+        async def consume() -> int:
+            await adapter.connect()
+            count = 0
+            async for block in adapter.read_blocks(query):
+                count += len(block["value"])
+                block["value"].mean()
+            return count
+
+        rows = asyncio.run(consume())
+    seconds = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    result.put(
+        (
+            rows,
+            seconds,
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            max(peak_anonymous, anonymous_rss_mb()),
+            pa.default_memory_pool().max_memory() / 2**20,
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Rows per file")
+    parser.add_argument("--tags", type=int, default=1000, help="Distinct tags")
+    parser.add_argument("--batch", type=int, default=100_000, help="Rows per streamed block")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, parquet_path = Path(tmp) / "history.csv", Path(tmp) / "history.parquet"
+        start = time.perf_counter()
+        generate(csv_path, parquet_path, args.rows, args.tags)
+        print(
+            f"Generated {args.rows:,} rows in {time.perf_counter() - start:.1f} s: "
+            f"CSV {csv_path.stat().st_size / 1e6:,.0f} MB, Parquet {parquet_path.stat().st_size / 1e6:,.0f} MB"
+        )
+
+        print(f"{'format':>8}{'mode':>10}{'rows':>12}{'seconds':>9}{'peak RSS MB':>13}{'anon MB':>9}{'arrow MB':>10}")
+        for file_format, path in (("csv", csv_path), ("parquet", parquet_path)):
+            for mode in ("full", "stream", "pushdown"):
+                result = context.Queue()
+                process = context.Process(target=read, args=(str(path), file_format, mode, args.batch, result))
+                process.start()
+                rows, seconds, peak, anonymous, arrow = result.get()
+                process.join()
+                print(
+                    f"{file_format:>8}{mode:>10}{rows:>12,}{seconds:>9.2f}{peak:>13,.0f}{anonymous:>9,.0f}{arrow:>10,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark per-item vs. batched UNWIND writes in IgnitionGraphClient.
+
+Creates synthetic ``Function`` nodes and ``BELONGS_TO`` relationships under a
+dedicated benchmark category, reports nodes/sec and relationships/sec for the
+per-item ``create_node``/``create_relationship`` path and the bulk
+``create_nodes_bulk``/``create_relationships_bulk`` path, and removes all
+benchmark data afterwards.
+
+Requires a running Neo4j instance configured through the NEO4J_* env vars.
+
+Usage:
+    python scripts/benchmarks/benchmark_graph_bulk_writes.py --count 2000 --batch-size 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.graph.client import IgnitionGraphClient  # noqa: E402
+from src.ignition.graph.schema import (  # noqa: E402
+    GraphNode,
+    GraphRelationship,
+    NodeType,
+    RelationshipType,
+)
+
+BENCHMARK_CATEGORY = "__bulk_write_benchmark__"
+
+
+def _make_items(prefix: str, count: int) -> tuple[list[GraphNode], list[GraphRelationship]]:
+    nodes = [
+        GraphNode(
+            NodeType.FUNCTION,
+            {"name": f"{prefix}.{i}", "description": "benchmark node", "category": BENCHMARK_CATEGORY},
+        )
+        for i in range(count)
+    ]
+    relationships = [
+        GraphRelationship(
+            from_node_type=NodeType.FUNCTION,
+            to_node_type=NodeType.CATEGORY,
+            relationship_type=RelationshipType.BELONGS_TO,
+            from_name=node.properties["name"],
+            to_name=BENCHMARK_CATEGORY,
+        )
+        for node in nodes
+    ]
+    return nodes, relationships
+
+
+def _cleanup(client: IgnitionGraphClient) -> None:
+    client.execute_write_query(
+        "MATCH (n) WHERE n.category = $category OR n.name = $category DETACH DELETE n",
+        {"category": BENCHMARK_CATEGORY},
+    )
+
+
+def run_benchmark(count: int, batch_size: int) -> dict[str, float]:
+    """Run both write paths and return throughput figures."""
+    client = IgnitionGraphClient(batch_size=batch_size)
+    if not client.connect():
+        raise SystemExit("Could not connect to Neo4j - check NEO4J_URI/NEO4J_USERNAME/NEO4J_PASSWORD")
+
+    try:
+        _cleanup(client)
+        client.create_node(GraphNode(NodeType.CATEGORY, {"name": BENCHMARK_CATEGORY}))
+
+        nodes, relationships = _make_items("bench.single", count)
+        start = time.perf_counter()
+        for node in nodes:
+            client.create_node(node)
+        single_nodes = time.perf_counter() - start
+        start = time.perf_counter()
+        for rel in relationships:
+            client.create_relationship(rel)
+        single_rels = time.perf_counter() - start
+
+        nodes, relationships = _make_items("bench.bulk", count)
+        start = time.perf_counter()
+        client.create_nodes_bulk(nodes)
+        bulk_nodes = time.perf_counter() - start
+        start = time.perf_counter()
+        client.create_relationships_bulk(relationships)
+        bulk_rels = time.perf_counter() - start
+    finally:
+        _cleanup(client)
+        client.disconnect()
+
+    return {
+        "single_nodes_per_sec": count / single_nodes,
+        "single_rels_per_sec": count / single_rels,
+        "bulk_nodes_per_sec": count / bulk_nodes,
+        "bulk_rels_per_sec": count / bulk_rels,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="Number of nodes/relationships per path")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per UNWIND batch")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.count, args.batch_size)
+
+    print(f"Items per path: {args.count} (batch size {args.batch_size})")
+    print(f"{'':<16}{'per-item':>14}{'bulk':>14}{'speedup':>10}")
+    for kind in ("nodes", "rels"):
+        single = results[f"single_{kind}_per_sec"]
+        bulk = results[f"bulk_{kind}_per_sec"]
+        print(f"{kind + '/sec':<16}{single:>14.1f}{bulk:>14.1f}{bulk / single:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
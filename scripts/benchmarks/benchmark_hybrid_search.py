@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark hybrid search latency: sequential legs vs. concurrent legs vs. the query cache.
+
+Loads ``--documents`` synthetic documents with ``--dims``-dimensional
+embeddings into ``VectorEmbeddingEnhancement`` and stands in for Neo4j with a
+driver that blocks for ``--graph-ms`` per full-text query, the way a
+synchronous driver call does. No Neo4j server is needed, so the graph leg's
+latency is a parameter rather than a measurement; set it to the full-text
+query latency observed on the target graph.
+
+Three paths run ``--queries`` queries each and report p50/p95 latency:
+``sequential`` awaits the graph leg and then the vector leg, ``concurrent``
+is ``hybrid_search`` with the cache cleared before every query, and
+``cached`` repeats the same queries once the query cache is warm.
+
+Usage:
+    python scripts/benchmarks/benchmark_hybrid_search.py --documents 100000 --graph-ms 20
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.sme_agent.vector_embedding_enhancement import (  # noqa: E402
+    SearchMode,
+    VectorConfig,
+    VectorEmbeddingEnhancement,
+)
+
+
+class HashEncoder:
+    """Deterministic embedding model stand-in hashing tokens onto axes."""
+
+    def __init__(self, dims: int) -> None:
+        self.dims = dims
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                vectors[row, hash(token) % self.dims] += 1.0
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+class GraphNode(dict):
+    """Node stand-in: a property mapping with labels."""
+
+    labels = frozenset({"Task"})
+
+
+class BlockingDriver:
+    """Neo4j driver stand-in whose full-text query blocks the calling thread."""
+
+    def __init__(self, latency: float, hits: int) -> None:
+        self.latency = latency
+        self.records = [
+            {"node": GraphNode(name=f"Task {i}"), "node_id": f"4:graph:{i}", "score": 1.0 / (i + 1)}
+            for i in range(hits)
+        ]
+
+    def session(self, **_options) -> "BlockingDriver":
+        return self
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> "BlockingDriver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def run(self, _cypher: str, **params) -> list[dict]:
+        time.sleep(self.latency)
+        return self.records[: params["max_results"]]
+
+
+def percentiles(latencies: list[float]) -> str:
+    p50, p95 = np.percentile(latencies, [50, 95]) * 1e3
+    return f"{p50:>10.2f}{p95:>10.2f}"
+
+
+async def run(args: argparse.Namespace, directory: Path) -> None:
+    config = VectorConfig(
+        embedding_dimension=args.dims,
+        use_faiss=False,
+        enable_persistence=False,
+        cache_directory=str(directory / "cache"),
+        index_directory=str(directory / "index"),
+        similarity_threshold=0.0,
+    )
+    enhancement = VectorEmbeddingEnhancement(config)
+    enhancement.embedding_model = HashEncoder(args.dims)
+    enhancement._initialize_vector_store()
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(args.documents, args.dims)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    enhancement.vector_store.add(
+        [{"id": f"doc{i}", "text": f"Document {i}", "embedding": embeddings[i]} for i in range(args.documents)]
+    )
+    enhancement.neo4j_driver = BlockingDriver(args.graph_ms / 1000.0, args.k)
+    queries = [f"pump {i % 17} trip on tank level {i % 5}" for i in range(args.queries)]
+
+    async def sequential(query: str) -> None:
+        graph = await enhancement._graph_search(query, args.k)
+        vector = await enhancement._vector_search(query, args.k)
+        enhancement._fuse_results({"vector": vector, "graph": graph}, args.k)
+
+    async def concurrent(query: str) -> None:
+        enhancement.query_cache.clear()
+        await enhancement.hybrid_search(query, SearchMode.HYBRID, args.k)
+
+    async def cached(query: str) -> None:
+        await enhancement.hybrid_search(query, SearchMode.HYBRID, args.k)
+
+    print(f"{args.documents:,} documents, {args.dims}D, graph leg {args.graph_ms:.0f} ms, k={args.k}")
+    print(f"{'path':>12}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, search in (("sequential", sequential), ("concurrent", concurrent), ("cached", cached)):
+        if search is cached:
+            for query in queries:
+                await cached(query)
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            await search(query)
+            latencies.append(time.perf_counter() - start)
+        print(f"{name:>12}{percentiles(latencies)}")
+    await enhancement.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=100_000, help="Documents in the vector store")
+    parser.add_argument("--dims", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--graph-ms", type=float, default=20.0, help="Simulated full-text query latency")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per path")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(args, Path(tmp)))
+
+
+if __name__ == "__main__":
+    main()
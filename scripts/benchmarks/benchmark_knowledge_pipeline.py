@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark knowledge dataset creation: collected records vs. the streaming pipeline.
+
+Stands in for Neo4j with a driver that serves ``--nodes`` synthetic nodes per
+extraction label in keyset pages, blocking for ``--page-ms`` per page the way a
+synchronous driver call does. No Neo4j server is needed, so the per-page
+latency is a parameter rather than a measurement.
+
+The ``collected`` path runs ``extract_knowledge`` and then
+``create_fine_tuning_dataset`` from the collected records, which holds every
+record at once as the pipeline did before. The ``streamed`` paths write pages
+straight into the JSONL dataset, first one query at a time and then with
+``--concurrency`` queries in flight. Each path runs twice: untraced for wall
+time, then under tracemalloc for peak Python memory.
+
+Usage:
+    python scripts/benchmarks/benchmark_knowledge_pipeline.py --nodes 10000 --page-ms 100
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.sme_agent.knowledge_graph_pipeline import (  # noqa: E402
+    EXTRACTION_LABELS,
+    KnowledgeGraphConfig,
+    KnowledgeGraphPipeline,
+)
+
+
+class SyntheticNode(dict):
+    """Node stand-in with an ID, labels and text properties."""
+
+    def __init__(self, node_id: int, label: str) -> None:
+        super().__init__(
+            name=f"{label}_{node_id}",
+            description=f"{label} {node_id} reads Line{node_id % 40}/Pump{node_id % 7} and alarms above setpoint. " * 4,
+            usage=f"system.tag.readBlocking(['[default]Line{node_id % 40}/Pump{node_id % 7}'])",
+        )
+        self.id = node_id
+        self.labels = frozenset({label})
+
+
+class PagedDriver:
+    """Neo4j driver stand-in generating keyset pages on demand."""
+
+    def __init__(self, nodes: int, latency: float) -> None:
+        self.nodes = nodes
+        self.latency = latency
+        self.offsets = {label: index * nodes for index, (_, label) in enumerate(EXTRACTION_LABELS.values())}
+
+    def session(self, **_options) -> "PagedDriver":
+        return self
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> "PagedDriver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def run(self, query: str, after: int | None, limit: int) -> list[dict]:
+        time.sleep(self.latency)
+        label = re.search(r"MATCH \(n:(\w+)\)", query).group(1)
+        first = self.offsets[label]
+        start = first if after is None else after + 1
+        stop = min(start + limit, first + self.nodes)
+        relationships = [{"type": "USES", "node": None}, {"type": "DOCUMENTED_BY", "node": None}]
+        return [
+            {"n": SyntheticNode(node_id, label), "node_key": node_id, "relationships": relationships}
+            for node_id in range(start, stop)
+        ]
+
+
+async def create(args: argparse.Namespace, directory: Path, name: str, concurrency: int) -> float:
+    config = KnowledgeGraphConfig(
+        max_nodes_per_query=args.page_size,
+        max_concurrent_extractions=concurrency,
+        output_directory=str(directory),
+        dataset_name=name,
+    )
+    pipeline = KnowledgeGraphPipeline(config)
+    pipeline.driver = PagedDriver(args.nodes, args.page_ms / 1000.0)
+
+    start = time.perf_counter()
+    if name == "collected":
+        await pipeline.extract_knowledge()
+    await pipeline.create_fine_tuning_dataset()
+    elapsed = time.perf_counter() - start
+    await pipeline.cleanup()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=10_000, help="Nodes per extraction label")
+    parser.add_argument("--page-size", type=int, default=1000, help="Nodes per keyset page")
+    parser.add_argument("--page-ms", type=float, default=100.0, help="Simulated latency per page query")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent extraction queries")
+    args = parser.parse_args()
+
+    print(
+        f"{args.nodes:,} nodes x {len(EXTRACTION_LABELS)} labels, pages of {args.page_size}, {args.page_ms:.0f} ms/page"
+    )
+    print(f"{'path':>22}{'seconds':>10}{'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, concurrency in (
+            ("collected", args.concurrency),
+            ("streamed", 1),
+            ("streamed", args.concurrency),
+        ):
+            elapsed = asyncio.run(create(args, Path(tmp), name, concurrency))
+            tracemalloc.start()
+            asyncio.run(create(args, Path(tmp), name, concurrency))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            label = f"{name} x{concurrency}"
+            print(f"{label:>22}{elapsed:>10.2f}{peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent LLM requests: one prompt per generate call vs. dynamic batching.
+
+Builds a tiny randomly initialised GPT-2 and a byte-level BPE tokenizer
+trained on synthetic Ignition questions, saves them to a temporary directory
+and loads them with ``LLMModelManager.load_model`` on CPU, so neither a GPU
+nor a model download is needed. Pass ``--model`` to load a local model instead.
+
+``--clients`` threads each send ``--requests`` prompts of varying length
+through ``generate_response`` with greedy decoding. The ``unbatched`` path
+sets ``max_batch_size=1``, so every prompt gets its own generate call as
+before. The ``batched`` path groups prompts up to ``--batch-size`` and waits
+at most ``--wait-ms`` for a batch to fill. A streaming request is timed to its
+first chunk while the batched clients are running.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/benchmark_llm_batching.py --clients 8 --requests 4
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.sme_agent.llm_integration import (  # noqa: E402
+    LLMConfig,
+    LLMModelManager,
+)
+
+SUBJECTS = ["tag", "alarm", "historian", "gateway script", "Perspective view", "OPC UA device", "database query"]
+ACTIONS = ["configure", "troubleshoot", "read", "write", "optimize", "secure", "document"]
+
+
+def prompts(count: int) -> list[str]:
+    result = []
+    for i in range(count):
+        subject, action = SUBJECTS[i % len(SUBJECTS)], ACTIONS[(i // len(SUBJECTS)) % len(ACTIONS)]
+        detail = f" on Line{i % 12}/Pump{i % 5} with a {i % 4 + 1} second scan class" * (1 + i % 3)
+        result.append(f"Question: How do I {action} a {subject}{detail}?\nAnswer:")
+    return result
+
+
+def build_tiny_model(directory: Path) -> None:
+    """Save a random 4-layer GPT-2 and a BPE tokenizer trained on the prompts."""
+    from tokenizers import ByteLevelBPETokenizer
+    from transformers import GPT2Config, GPT2LMHeadModel, PreTrainedTokenizerFast
+
+    bpe = ByteLevelBPETokenizer()
+    bpe.train_from_iterator(prompts(500), vocab_size=1024, special_tokens=["<|endoftext|>"])
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=bpe, eos_token="<|endoftext|>", pad_token="<|endoftext|>")
+    tokenizer.save_pretrained(directory)
+
+    config = GPT2Config(
+        vocab_size=len(tokenizer),
+        n_positions=512,
+        n_embd=128,
+        n_layer=4,
+        n_head=4,
+        initializer_range=0.2,
+        bos_token_id=tokenizer.eos_token_id,
+        eos_token_id=tokenizer.eos_token_id,
+    )
+    GPT2LMHeadModel(config).save_pretrained(directory)
+
+
+def run(manager: LLMModelManager, args: argparse.Namespace, stream: bool) -> dict:
+    work = prompts(args.clients * args.requests)
+    latencies: list[float] = []
+    tokens = [0]
+    lock = threading.Lock()
+
+    def client(index: int) -> None:
+        for prompt in work[index :: args.clients]:
+            start = time.perf_counter()
+            response = manager.generate_response(prompt, max_tokens=args.max_tokens, do_sample=False)
+            assert response["success"], response["error"]
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                tokens[0] += response["token_counts"]["output_tokens"]
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    first_chunk = None
+    if stream:
+        time.sleep(0.05)
+        submitted = time.perf_counter()
+        handle = manager.submit_generation(work[0], max_tokens=args.max_tokens, do_sample=False)
+        for _chunk in handle:
+            first_chunk = first_chunk or time.perf_counter() - submitted
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    metrics = manager.scheduler.get_metrics()
+    return {
+        "seconds": elapsed,
+        "tokens/s": tokens[0] / elapsed,
+        "p50": np.percentile(latencies, 50),
+        "p95": np.percentile(latencies, 95),
+        "batch": metrics["average_batch_size"],
+        "first_chunk": first_chunk,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", help="Local model directory, a tiny random GPT-2 by default")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent client threads")
+    parser.add_argument("--requests", type=int, default=4, help="Requests per client")
+    parser.add_argument("--max-tokens", type=int, default=32, help="New tokens per request")
+    parser.add_argument("--batch-size", type=int, default=8, help="Max batch size of the batched path")
+    parser.add_argument("--wait-ms", type=float, default=10.0, help="Max batch wait of the batched path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = args.model
+        if model_path is None:
+            model_path = str(Path(tmp) / "tiny-gpt2")
+            build_tiny_model(Path(model_path))
+
+        print(f"{args.clients} clients x {args.requests} requests, {args.max_tokens} new tokens each")
+        print(f"{'path':>10}{'seconds':>9}{'tokens/s':>10}{'p50 s':>8}{'p95 s':>8}{'batch':>7}{'first chunk s':>15}")
+        for name, batch_size in (("unbatched", 1), ("batched", args.batch_size)):
+            config = LLMConfig(
+                model_path=model_path,
+                target_device="cpu",
+                cache_dir=str(Path(tmp) / "cache"),
+                max_batch_size=batch_size,
+                max_batch_wait_ms=args.wait_ms,
+                log_level="WARNING",
+            )
+            manager = LLMModelManager(config)
+            if not manager.load_model():
+                raise SystemExit(f"Could not load {model_path}")
+            manager.generate_response("Warm up", max_tokens=4, do_sample=False)
+            manager.scheduler.stop()
+            manager.scheduler = None
+
+            result = run(manager, args, stream=name == "batched")
+            first_chunk = f"{result['first_chunk']:>15.3f}" if result["first_chunk"] else f"{'-':>15}"
+            print(
+                f"{name:>10}{result['seconds']:>9.2f}{result['tokens/s']:>10.0f}{result['p50']:>8.3f}"
+                f"{result['p95']:>8.3f}{result['batch']:>7.1f}{first_chunk}"
+            )
+            manager.unload_model()
+
+
+if __name__ == "__main__":
+    main()
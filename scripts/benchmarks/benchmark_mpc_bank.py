@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark MPC loop throughput: per-loop ProductionMPCController vs. MPCControllerBank.
+
+Builds N FOPDT loops with randomised gains and time constants, then measures
+loops per second on one core for (a) one ``ProductionMPCController`` per loop,
+each ticked through ``compute_control`` as concurrent coroutines, and (b) a
+single ``MPCControllerBank`` that runs the Kalman update and control move for
+all loops as stacked NumPy operations.
+
+Usage:
+    python scripts/benchmarks/benchmark_mpc_bank.py --loops 10 100 300 1000 --ticks 20
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.mpc_framework.mpc_bank import MPCControllerBank  # noqa: E402
+from src.ignition.modules.mpc_framework.mpc_controller import (  # noqa: E402
+    ControlConstraints,
+    MPCConfiguration,
+    ProcessModel,
+    ProductionMPCController,
+)
+
+
+def make_configs(loops: int, horizon: int, seed: int) -> list[MPCConfiguration]:
+    """Return ``loops`` FOPDT configurations with random process parameters."""
+    rng = np.random.default_rng(seed)
+    return [
+        MPCConfiguration(
+            prediction_horizon=horizon,
+            control_horizon=max(1, horizon // 2),
+            sample_time=1.0,
+            Q=[[1.0]],
+            R=[[0.1]],
+            process_model=ProcessModel(
+                model_type="FOPDT",
+                parameters={"gain": float(gain), "time_constant": float(tau), "dead_time": 0.0},
+                sample_time=1.0,
+            ),
+            constraints=ControlConstraints(u_min=[-5.0], u_max=[5.0], du_min=[-1.0], du_max=[1.0]),
+        )
+        for gain, tau in zip(rng.uniform(0.5, 3.0, loops), rng.uniform(1.0, 20.0, loops), strict=True)
+    ]
+
+
+async def time_controllers(configs: list[MPCConfiguration], ticks: int, outputs: np.ndarray) -> float:
+    """Return loops per second for one ProductionMPCController per loop."""
+    controllers = [ProductionMPCController(config=config) for config in configs]
+    for controller in controllers:
+        await controller.initialize()
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        await asyncio.gather(
+            *(controller.compute_control(float(y), 1.0) for controller, y in zip(controllers, outputs, strict=True))
+        )
+    return len(configs) * ticks / (time.perf_counter() - start)
+
+
+async def time_bank(configs: list[MPCConfiguration], ticks: int, outputs: np.ndarray) -> float:
+    """Return loops per second for a single MPCControllerBank."""
+    bank = MPCControllerBank(configs)
+    await bank.initialize()
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        bank.step(outputs, 1.0)
+    return len(configs) * ticks / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, nargs="+", default=[10, 100, 300, 1000], help="Loop counts to compare")
+    parser.add_argument("--ticks", type=int, default=20, help="Control ticks per measurement")
+    parser.add_argument("--horizon", type=int, default=20, help="Prediction horizon")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'loops':>8}{'controllers loops/s':>22}{'bank loops/s':>15}{'speedup':>9}")
+    for loops in args.loops:
+        configs = make_configs(loops, args.horizon, args.seed)
+        outputs = np.random.default_rng(args.seed).normal(size=loops)
+        per_loop = asyncio.run(time_controllers(configs, args.ticks, outputs))
+        bank = asyncio.run(time_bank(configs, args.ticks, outputs))
+        print(f"{loops:>8}{per_loop:>22,.0f}{bank:>15,.0f}{bank / per_loop:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark the condensed QP solver against the SLSQP fallback in ProductionMPCController.
+
+Runs a closed loop against a simulated FOPDT plant for each horizon and solver,
+reporting the mean and worst per-cycle latency of ``compute_control`` and the
+largest difference between the two solvers' control moves. The condensed QP
+precomputes the prediction matrices once and warm-starts each cycle; SLSQP
+re-simulates the model with finite-difference gradients. SLSQP runs fewer
+cycles by default because it takes seconds per cycle at long horizons.
+
+Usage:
+    python scripts/benchmarks/benchmark_mpc_qp.py --horizons 10 50 200 --cycles 50 --slsqp-cycles 5
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.mpc_framework.mpc_controller import (  # noqa: E402
+    ControlConstraints,
+    MPCConfiguration,
+    ProcessModel,
+    ProductionMPCController,
+)
+
+
+def make_config(horizon: int, solver: str, u_max: float) -> MPCConfiguration:
+    """Return a FOPDT configuration with equal prediction and control horizons."""
+    return MPCConfiguration(
+        prediction_horizon=horizon,
+        control_horizon=horizon,
+        sample_time=1.0,
+        Q=[[1.0]],
+        R=[[0.1]],
+        process_model=ProcessModel(
+            model_type="FOPDT",
+            parameters={"gain": 1.5, "time_constant": 3.0, "dead_time": 0.0},
+            sample_time=1.0,
+        ),
+        constraints=ControlConstraints(u_min=[-u_max], u_max=[u_max], du_min=[-1.0], du_max=[1.0]),
+        solver=solver,
+        max_iterations=200,
+    )
+
+
+async def run_loop(config: MPCConfiguration, cycles: int) -> tuple[list[float], list[float]]:
+    """Run ``cycles`` closed-loop steps with setpoint changes; return (latencies s, control moves)."""
+    controller = ProductionMPCController(config=config)
+    await controller.initialize()
+
+    a = np.exp(-1.0 / 3.0)
+    output, latencies, controls = 0.0, [], []
+    for cycle in range(cycles):
+        setpoint = 2.0 if (cycle // 10) % 2 == 0 else -1.0
+        start = time.perf_counter()
+        result = await controller.compute_control(current_output=output, setpoint=setpoint)
+        latencies.append(time.perf_counter() - start)
+        controls.append(result["control_output"])
+        output = a * output + 1.5 * (1 - a) * result["control_output"]
+
+    await controller.cleanup()
+    return latencies, controls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--horizons", type=int, nargs="+", default=[10, 50, 200], help="Horizons to compare")
+    parser.add_argument("--cycles", type=int, default=50, help="Control cycles for the condensed QP")
+    parser.add_argument("--slsqp-cycles", type=int, default=5, help="Control cycles for SLSQP")
+    parser.add_argument("--u-max", type=float, default=1.5, help="Input bound; small values keep bounds active")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    print(
+        f"{'horizon':>8}{'qp mean ms':>12}{'qp max ms':>11}"
+        f"{'slsqp mean ms':>15}{'slsqp max ms':>14}{'speedup':>9}{'max |du|':>10}"
+    )
+    for horizon in args.horizons:
+        qp_times, qp_controls = asyncio.run(run_loop(make_config(horizon, "condensed_qp", args.u_max), args.cycles))
+        sq_times, sq_controls = asyncio.run(run_loop(make_config(horizon, "slsqp", args.u_max), args.slsqp_cycles))
+        overlap = min(len(qp_controls), len(sq_controls))
+        difference = float(np.max(np.abs(np.subtract(qp_controls[:overlap], sq_controls[:overlap]))))
+        print(
+            f"{horizon:>8}{np.mean(qp_times) * 1000:>12.2f}{np.max(qp_times) * 1000:>11.2f}"
+            f"{np.mean(sq_times) * 1000:>15.1f}{np.max(sq_times) * 1000:>14.1f}"
+            f"{np.mean(sq_times) / np.mean(qp_times):>8.0f}x{difference:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark per-node vs. batched OPC-UA reads and writes with IgnitionOPCUAClient.
+
+Starts a local asyncua test server with N Double variables, then compares the
+old pattern (one ``read_value``/``write_value`` round trip per node) with the
+client's batched ``read_values``/``write_values``, which use multi-node
+Read/Write service calls chunked by the server's operation limits.
+
+Usage:
+    python scripts/benchmarks/benchmark_opcua_batch_io.py --tags 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+from asyncua import Server
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.opcua.client import IgnitionOPCUAClient  # noqa: E402
+
+
+async def start_server(url: str, tags: int) -> tuple[Server, list[str]]:
+    """Start a test server exposing ``tags`` writable Double variables."""
+    server = Server()
+    await server.init()
+    server.set_endpoint(url)
+    namespace = await server.register_namespace("urn:ign-scripts:benchmark")
+    folder = await server.nodes.objects.add_folder(namespace, "Benchmark")
+
+    node_ids = []
+    for i in range(tags):
+        variable = await folder.add_variable(namespace, f"Tag{i}", float(i))
+        await variable.set_writable()
+        node_ids.append(variable.nodeid.to_string())
+
+    await server.start()
+    return server, node_ids
+
+
+async def run_benchmark(url: str, tag_counts: list[int]) -> list[tuple[int, float, float, float, float]]:
+    """Return (tags, sequential read s, batched read s, sequential write s, batched write s) per count."""
+    server, all_node_ids = await start_server(url, max(tag_counts))
+    timings = []
+    try:
+        async with IgnitionOPCUAClient(url) as client:
+            for count in tag_counts:
+                node_ids = all_node_ids[:count]
+                nodes = [client.client.get_node(node_id) for node_id in node_ids]
+
+                start = time.perf_counter()
+                for node in nodes:
+                    await node.read_value()
+                sequential_read = time.perf_counter() - start
+
+                start = time.perf_counter()
+                values = await client.read_values(node_ids)
+                batched_read = time.perf_counter() - start
+                assert all(value is not None for value in values)
+
+                start = time.perf_counter()
+                for node in nodes:
+                    await node.write_value(1.0)
+                sequential_write = time.perf_counter() - start
+
+                start = time.perf_counter()
+                results = await client.write_values(dict.fromkeys(node_ids, 2.0))
+                batched_write = time.perf_counter() - start
+                assert all(results.values())
+
+                timings.append((count, sequential_read, batched_read, sequential_write, batched_write))
+    finally:
+        await server.stop()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="opc.tcp://127.0.0.1:48401/benchmark/", help="Test server endpoint")
+    parser.add_argument("--tags", type=int, nargs="+", default=[100, 1000, 10000], help="Tag counts to compare")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    timings = asyncio.run(run_benchmark(args.url, args.tags))
+
+    print(
+        f"{'tags':>8}{'read seq ms':>14}{'read batch ms':>15}{'speedup':>9}"
+        f"{'write seq ms':>15}{'write batch ms':>16}{'speedup':>9}"
+    )
+    for tags, seq_read, batch_read, seq_write, batch_write in timings:
+        print(
+            f"{tags:>8}{seq_read * 1000:>14.1f}{batch_read * 1000:>15.1f}{seq_read / batch_read:>8.1f}x"
+            f"{seq_write * 1000:>15.1f}{batch_write * 1000:>16.1f}{seq_write / batch_write:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
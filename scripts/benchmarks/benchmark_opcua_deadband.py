@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark OPC-UA data change notifications with and without a deadband profile.
+
+Starts an asyncua server in a child process with ``--tags`` analog variables
+that drift slowly around a setpoint with measurement noise, updated every
+``--update-ms``. The client then subscribes to all of them for ``--seconds``
+through ``SubscriptionManager``, first with the previous default parameters
+(no deadband, sampling at the publishing interval) and then with an absolute
+deadband profile, and reports notifications received and client CPU time.
+
+The asyncua server compares each sample with the previous sample rather than
+with the last reported value, so slow drift is suppressed more than on a
+server that follows the specification; the noise reduction is representative.
+
+Usage:
+    python scripts/benchmarks/benchmark_opcua_deadband.py --tags 2000 --seconds 10
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from asyncua import Client, Server, ua
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.opcua.subscription import DeadbandType, MonitoringProfile, SubscriptionManager  # noqa: E402
+
+URL = "opc.tcp://127.0.0.1:48410/benchmark/"
+NAMESPACE = "urn:ignition-tools:benchmark"
+
+
+async def serve(tags: int, update_ms: float, noise: float, ready: multiprocessing.Event) -> None:
+    server = Server()
+    await server.init()
+    server.set_endpoint(URL)
+    index = await server.register_namespace(NAMESPACE)
+    plant = await server.nodes.objects.add_object(index, "Plant")
+    variables = [await plant.add_variable(ua.NodeId(f"AI{i}", index), f"AI{i}", 50.0) for i in range(tags)]
+    rng = np.random.default_rng(0)
+    setpoints = rng.uniform(20.0, 80.0, tags)
+    async with server:
+        ready.set()
+        step = 0
+        while True:
+            drift = 2.0 * np.sin(step / 40.0 + setpoints)
+            values = setpoints + drift + rng.normal(0.0, noise, tags)
+            for variable, value in zip(variables, values, strict=True):
+                await server.write_attribute_value(variable.nodeid, ua.DataValue(ua.Variant(float(value))))
+            step += 1
+            await asyncio.sleep(update_ms / 1000.0)
+
+
+def run_server(tags: int, update_ms: float, noise: float, ready: multiprocessing.Event) -> None:
+    logging.disable(logging.ERROR)
+    asyncio.run(serve(tags, update_ms, noise, ready))
+
+
+async def measure(tags: int, seconds: float, profile: MonitoringProfile | None, interval: float) -> tuple[int, float]:
+    client = Client(URL)
+    async with client:
+        index = await client.get_namespace_index(NAMESPACE)
+        manager = SubscriptionManager(client)
+        received = 0
+
+        def on_change(_node_id: str, _value: float) -> None:
+            nonlocal received
+            received += 1
+
+        node_ids = [f"ns={index};s=AI{i}" for i in range(tags)]
+        subscription_id = await manager.create_subscription(node_ids, on_change, interval, profile=profile)
+        # Skip the initial value every new monitored item reports
+        await asyncio.sleep(2 * interval / 1000.0)
+        received = 0
+        cpu = time.process_time()
+        await asyncio.sleep(seconds)
+        cpu = time.process_time() - cpu
+        await manager.remove_subscription(subscription_id)
+    return received, cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=2000, help="Analog variables on the server")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Measurement window per run")
+    parser.add_argument("--update-ms", type=float, default=250.0, help="Server value update period")
+    parser.add_argument("--interval", type=float, default=500.0, help="Publishing interval in milliseconds")
+    parser.add_argument("--noise", type=float, default=0.05, help="Standard deviation of measurement noise")
+    parser.add_argument("--deadband", type=float, default=0.25, help="Absolute deadband in engineering units")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    server = context.Process(target=run_server, args=(args.tags, args.update_ms, args.noise, ready), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(120):
+            raise RuntimeError("OPC-UA benchmark server did not start")
+        deadband = MonitoringProfile(
+            sampling_interval=args.interval, deadband_type=DeadbandType.ABSOLUTE, deadband_value=args.deadband
+        )
+        print(f"{'profile':>10}{'notifications':>15}{'per second':>12}{'client CPU s':>14}")
+        for name, profile in (("none", None), ("deadband", deadband)):
+            received, cpu = asyncio.run(measure(args.tags, args.seconds, profile, args.interval))
+            print(f"{name:>10}{received:>15,}{received / args.seconds:>12,.0f}{cpu:>14.2f}")
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
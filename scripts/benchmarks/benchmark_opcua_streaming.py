@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark OPC-UA data-change delivery: task-per-notification vs. bounded micro-batches.
+
+Replays ``--changes`` data-change notifications spread over ``--tags`` nodes in
+publish bursts of ``--burst`` notifications, as the subscription handler would
+receive them, to a consumer whose every call costs ``--call-us`` microseconds
+(a database write or network round trip) plus ``--record-us`` per record.
+
+* ``tasks`` is the previous ``stream_data`` path: every notification schedules
+  ``asyncio.create_task(callback(record))``, so a burst becomes a burst of tasks.
+* ``drop_oldest`` / ``coalesce`` / ``block`` feed ``StreamBuffer`` and consume
+  ``batches()``.
+
+Reported: wall time until the consumer has seen everything it will see, records
+delivered, dropped and coalesced, and the peak backlog (pending tasks or queue depth).
+
+Usage:
+    python scripts/benchmarks/benchmark_opcua_streaming.py --changes 100000 --tags 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.data_integration.adapters.streaming import (  # noqa: E402
+    OverflowPolicy,
+    StreamBuffer,
+)
+
+
+def make_record(i: int, tags: int) -> dict:
+    return {"node_id": f"ns=2;s=Tag{i % tags}", "value": float(i), "timestamp": 0.0, "source_type": "opcua"}
+
+
+def spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def run_tasks(changes: int, tags: int, burst: int, call_cost: float, record_cost: float) -> dict:
+    delivered = 0
+    peak = 0
+    tasks: set[asyncio.Task] = set()
+
+    async def callback(_record: dict) -> None:
+        nonlocal delivered
+        spin(call_cost + record_cost)
+        delivered += 1
+
+    start = time.perf_counter()
+    for i in range(changes):
+        task = asyncio.create_task(callback(make_record(i, tags)))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        if (i + 1) % burst == 0:
+            peak = max(peak, len(tasks))
+            await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return {"seconds": time.perf_counter() - start, "delivered": delivered, "dropped": 0, "coalesced": 0, "peak": peak}
+
+
+async def run_buffer(
+    changes: int,
+    tags: int,
+    burst: int,
+    call_cost: float,
+    record_cost: float,
+    policy: OverflowPolicy,
+    queue: int,
+    batch: int,
+) -> dict:
+    buffer = StreamBuffer(max_size=queue, batch_size=batch, batch_window=0.005, overflow=policy)
+    delivered = 0
+
+    async def consume() -> None:
+        nonlocal delivered
+        async for records in buffer.batches():
+            spin(call_cost + record_cost * len(records))
+            delivered += len(records)
+
+    start = time.perf_counter()
+    consumer = asyncio.create_task(consume())
+    for i in range(changes):
+        if policy is OverflowPolicy.BLOCK:
+            await buffer.put(make_record(i, tags))
+        else:
+            buffer.offer(make_record(i, tags))
+        if (i + 1) % burst == 0:
+            await asyncio.sleep(0)
+    buffer.close()
+    await consumer
+    stats = buffer.stats
+    return {
+        "seconds": time.perf_counter() - start,
+        "delivered": delivered,
+        "dropped": stats.dropped,
+        "coalesced": stats.coalesced,
+        "peak": stats.max_depth,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changes", type=int, default=100000, help="Data-change notifications to replay")
+    parser.add_argument("--tags", type=int, default=5000, help="Distinct nodes")
+    parser.add_argument("--burst", type=int, default=1000, help="Notifications per publish response")
+    parser.add_argument("--call-us", type=float, default=20.0, help="Consumer cost per call in microseconds")
+    parser.add_argument("--record-us", type=float, default=1.0, help="Consumer cost per record in microseconds")
+    parser.add_argument("--queue", type=int, default=10000, help="Stream buffer capacity")
+    parser.add_argument("--batch", type=int, default=1000, help="Records per micro-batch")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    costs = (args.call_us / 1e6, args.record_us / 1e6)
+    results = {"tasks": asyncio.run(run_tasks(args.changes, args.tags, args.burst, *costs))}
+    for policy in OverflowPolicy:
+        results[policy.value] = asyncio.run(
+            run_buffer(args.changes, args.tags, args.burst, *costs, policy, args.queue, args.batch)
+        )
+
+    print(f"{'path':>12}{'seconds':>9}{'k changes/s':>13}{'delivered':>11}{'dropped':>9}{'coalesced':>11}{'peak':>8}")
+    for path, r in results.items():
+        rate = args.changes / r["seconds"] / 1e3
+        print(
+            f"{path:>12}{r['seconds']:>9.2f}{rate:>13.1f}{r['delivered']:>11}"
+            f"{r['dropped']:>9}{r['coalesced']:>11}{r['peak']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Benchmark serial vs. process-pool AST analysis with CodeAnalyzer.
+
+Analyzes every Python file under a directory (the repository's own ``src/``
+tree by default) once per worker count and reports files/sec and speedup
+relative to the serial run. No database is required.
+
+Usage:
+    python scripts/benchmarks/benchmark_parallel_code_analysis.py --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.code_intelligence.analyzer import CodeAnalyzer  # noqa: E402
+
+
+def run_benchmark(directory: Path, worker_counts: list[int]) -> list[tuple[int, int, float]]:
+    """Return (workers, files_analyzed, seconds) for each worker count."""
+    analyzer = CodeAnalyzer()
+    file_paths = analyzer.collect_files(directory)
+
+    timings = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        analyzed = sum(1 for _ in analyzer.iter_analyze_files(file_paths, workers))
+        timings.append((workers, analyzed, time.perf_counter() - start))
+    return timings
+
+
+def main() -> None:
+    cpu_count = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directory", type=Path, default=project_root / "src", help="Directory to analyze")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers, help="Worker counts to compare")
+    args = parser.parse_args()
+
+    timings = run_benchmark(args.directory, args.workers)
+    baseline = next((seconds for workers, _, seconds in timings if workers == 1), timings[0][2])
+
+    print(f"Directory: {args.directory} ({timings[0][1]} files analyzed, {cpu_count} CPUs)")
+    print(f"{'workers':>8}{'seconds':>10}{'files/sec':>12}{'speedup':>10}")
+    for workers, analyzed, seconds in timings:
+        print(f"{workers:>8}{seconds:>10.2f}{analyzed / seconds:>12.1f}{baseline / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
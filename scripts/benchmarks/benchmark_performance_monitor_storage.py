@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark performance-monitor history storage: dataclass lists vs. NumPy ring buffers.
+
+Fills N metrics with ``--history`` samples each, then times ``--ticks`` monitor
+ticks. A tick appends one sample per metric, evicts by age, and computes the
+100-point mean, the 50-point standard deviation and the least-squares trend.
+The list layout is the previous ``ProductionPerformanceMonitor`` storage (one
+``PerformanceDataPoint`` per sample, lists rebuilt on cleanup, statistics
+recomputed from slices). The ring layout is ``MetricRingBuffer`` with O(1)
+rolling windows. Memory is the traced Python allocation for the stored history.
+
+Usage:
+    python scripts/benchmarks/benchmark_performance_monitor_storage.py --metrics 10000 --history 100 --ticks 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.mpc_framework.metric_store import MetricRingBuffer  # noqa: E402
+from src.ignition.modules.mpc_framework.performance_monitor import PerformanceDataPoint  # noqa: E402
+
+
+def list_trend(values: list[float]) -> float:
+    """Least-squares slope as computed by the previous monitor implementation."""
+    n = len(values)
+    x_mean = (n - 1) / 2
+    y_mean = statistics.mean(values)
+    numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator if denominator else 0.0
+
+
+def run_lists(names: list[str], samples: np.ndarray, ticks: int) -> tuple[int, float]:
+    """Return (bytes, seconds per tick) for dataclass-list storage."""
+    start_time = datetime.now()
+    tracemalloc.start()
+    data = {
+        name: [
+            PerformanceDataPoint(start_time + timedelta(seconds=t), name, float(v), "unit", {"system": "bench"})
+            for t, v in enumerate(row)
+        ]
+        for name, row in zip(names, samples, strict=True)
+    }
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    history = samples.shape[1]
+    start = time.perf_counter()
+    for tick in range(ticks):
+        now = start_time + timedelta(seconds=history + tick)
+        cutoff = now - timedelta(seconds=history)
+        for name, points in data.items():
+            points.append(PerformanceDataPoint(now, name, 1.0, "unit", {"system": "bench"}))
+            statistics.mean(dp.value for dp in points[-100:])
+            recent = [dp.value for dp in points[-50:]]
+            statistics.stdev(recent)
+            list_trend(recent)
+            data[name] = [dp for dp in points if dp.timestamp > cutoff]
+    return memory, (time.perf_counter() - start) / ticks
+
+
+def run_rings(names: list[str], samples: np.ndarray, ticks: int) -> tuple[int, float]:
+    """Return (bytes, seconds per tick) for ring-buffer storage."""
+    history = samples.shape[1]
+    start_time = datetime.now().timestamp()
+    tracemalloc.start()
+    data = {}
+    for name, row in zip(names, samples, strict=True):
+        buffer = MetricRingBuffer(capacity=history + ticks, windows=(50, 100))
+        for t, value in enumerate(row):
+            buffer.append(start_time + t, float(value))
+        data[name] = buffer
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        now = start_time + history + tick
+        for buffer in data.values():
+            buffer.append(now, 1.0)
+            buffer.window(100).mean  # noqa: B018
+            trend_window = buffer.window(50)
+            trend_window.stdev  # noqa: B018
+            trend_window.slope  # noqa: B018
+            buffer.evict_older_than(now - history)
+    return memory, (time.perf_counter() - start) / ticks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--metrics", type=int, default=10000, help="Number of metrics")
+    parser.add_argument("--history", type=int, default=100, help="Samples retained per metric")
+    parser.add_argument("--ticks", type=int, default=10, help="Monitor ticks to time")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    names = [f"metric_{i}" for i in range(args.metrics)]
+    samples = np.random.default_rng(args.seed).normal(50.0, 5.0, (args.metrics, args.history))
+
+    list_memory, list_tick = run_lists(names, samples, args.ticks)
+    ring_memory, ring_tick = run_rings(names, samples, args.ticks)
+
+    rate = args.metrics / 1e3
+    print(f"{'storage':>10}{'memory MB':>12}{'tick ms':>10}{'k samples/s':>13}")
+    print(f"{'lists':>10}{list_memory / 1e6:>12.1f}{list_tick * 1000:>10.1f}{rate / list_tick:>13.1f}")
+    print(f"{'rings':>10}{ring_memory / 1e6:>12.1f}{ring_tick * 1000:>10.1f}{rate / ring_tick:>13.1f}")
+    print(f"Memory reduction: {list_memory / ring_memory:.1f}x, tick speedup: {list_tick / ring_tick:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark ProductionSafetySystem limit checks: per-parameter scans vs. the compiled index.
+
+Configures N limited parameters and times one full sweep of new values through:
+
+* the previous path - one awaited update per parameter, each scanning
+  ``config.safety_limits`` linearly for its limit;
+* ``update_parameter`` with the compiled name index;
+* ``update_parameters_batch`` with a name -> value mapping and with a vector
+  aligned to ``parameter_names``.
+
+``--violations`` of the parameters exceed their high limit in every sweep, so
+each path also pays for raising those alarms. The watchdog stale-data check is
+timed against the previous per-parameter datetime scan.
+
+Usage:
+    python scripts/benchmarks/benchmark_safety_limits.py --parameters 10000 --sweeps 5
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.mpc_framework.safety_system import (  # noqa: E402
+    AlarmPriority,
+    EmergencyProcedure,
+    ProductionSafetySystem,
+    SafetyConfiguration,
+    SafetyLevel,
+    SafetyLimit,
+)
+
+
+async def legacy_update(system: ProductionSafetySystem, parameter_name: str, value: float) -> None:
+    """Replicate the previous update: store the value, then scan the limit list."""
+    system._parameter_values[parameter_name] = value
+    system._last_update[parameter_name] = datetime.now()
+    for limit in system.config.safety_limits:
+        if limit.parameter_name == parameter_name:
+            if limit.low_limit is not None and value < limit.low_limit:
+                await system._raise_limit_alarm(system._limit_index[parameter_name], "low", value)
+            elif limit.high_limit is not None and value > limit.high_limit:
+                await system._raise_limit_alarm(system._limit_index[parameter_name], "high", value)
+            break
+
+
+def legacy_stale_check(system: ProductionSafetySystem) -> list[str]:
+    current_time = datetime.now()
+    return [name for name, last in system._last_update.items() if (current_time - last).total_seconds() > 60]
+
+
+async def run(parameters: int, sweeps: int, violations: float, seed: int) -> None:
+    config = SafetyConfiguration(
+        system_name="benchmark",
+        safety_level=SafetyLevel.SIL_2,
+        watchdog_interval=3600.0,
+        safety_limits=[
+            SafetyLimit(
+                parameter_name=f"param_{i}",
+                low_limit=0.0,
+                high_limit=100.0,
+                safety_level=SafetyLevel.SIL_1,
+                alarm_priority=AlarmPriority.LOW,
+            )
+            for i in range(parameters)
+        ],
+        emergency_procedures=[
+            EmergencyProcedure(
+                procedure_id="shutdown",
+                name="Shutdown",
+                trigger_conditions=["critical alarm"],
+                safety_level=SafetyLevel.SIL_2,
+                timeout_seconds=1.0,
+                steps=["Stop"],
+            )
+        ],
+    )
+    system = ProductionSafetySystem(config=config)
+    rng = np.random.default_rng(seed)
+    names = system.parameter_names
+    timings: dict[str, list[float]] = {"previous": [], "indexed": [], "batch dict": [], "batch vector": []}
+
+    async with system.managed_safety_session():
+        for _ in range(sweeps):
+            vector = rng.uniform(10.0, 90.0, parameters)
+            vector[rng.random(parameters) < violations] = 150.0
+            mapping = dict(zip(names, vector.tolist(), strict=True))
+
+            start = time.perf_counter()
+            for name, value in mapping.items():
+                await legacy_update(system, name, value)
+            timings["previous"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for name, value in mapping.items():
+                await system.update_parameter(name, value)
+            timings["indexed"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await system.update_parameters_batch(mapping)
+            timings["batch dict"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            result = await system.update_parameters_batch(vector)
+            timings["batch vector"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        legacy_stale_check(system)
+        legacy_stale = time.perf_counter() - start
+        start = time.perf_counter()
+        await system._check_safety_parameters()
+        stale = time.perf_counter() - start
+        latency = system.get_status()["latency_ms"]
+
+    print(f"{parameters} parameters, {len(result['violations'])} violations in the last sweep")
+    print(f"{'path':>14}{'sweep ms':>10}{'updates/s':>14}")
+    for path, samples in timings.items():
+        sweep = float(np.median(samples))
+        print(f"{path:>14}{sweep * 1000:>10.2f}{parameters / sweep:>14,.0f}")
+    print(
+        f"Speedup vs previous: indexed {np.median(timings['previous']) / np.median(timings['indexed']):.0f}x, "
+        f"batch vector {np.median(timings['previous']) / np.median(timings['batch vector']):.0f}x"
+    )
+    print(f"Stale-data check: {legacy_stale * 1000:.2f} ms previous, {stale * 1000:.2f} ms vectorised")
+    for name, summary in latency.items():
+        if summary["samples"]:
+            print(f"{name} latency ms: p50 {summary['p50']:.3f}, p95 {summary['p95']:.3f}, p99 {summary['p99']:.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parameters", type=int, default=10000, help="Limited parameters")
+    parser.add_argument("--sweeps", type=int, default=5, help="Full sweeps of new values per path")
+    parser.add_argument("--violations", type=float, default=0.01, help="Fraction of values over the high limit")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.parameters, args.sweeps, args.violations, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark incremental document ingestion: full pickle rewrites vs. the append-only vector store.
+
+Adds ``--documents`` synthetic documents with ``--dims``-dimensional embeddings
+in ``add_documents`` calls of ``--batch`` documents. The ``pickle`` path
+reproduces the previous behaviour: the document store dict, embeddings
+included, is pickled in full after every call. The ``store`` path appends each
+batch to ``DocumentVectorStore``'s SQLite log and checkpoints the index every
+``--checkpoint-interval`` changes. For each path it reports the time of the
+first and last tenth of the calls, the total time and the bytes written per
+call. Vector search latency is reported for the store afterwards.
+
+Usage:
+    python scripts/benchmarks/benchmark_sme_vector_store.py --documents 50000 --batch 500
+"""
+
+import argparse
+import pickle
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.sme_agent.vector_store import DocumentVectorStore  # noqa: E402
+
+
+def batches(documents: int, batch: int, dims: int) -> list[list[dict]]:
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(documents, dims)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return [
+        [
+            {"id": f"doc{i}", "text": f"Document {i} about tag Line{i % 40}/Pump{i % 7}", "embedding": embeddings[i]}
+            for i in range(start, min(start + batch, documents))
+        ]
+        for start in range(0, documents, batch)
+    ]
+
+
+def directory_bytes(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.iterdir() if file.is_file())
+
+
+def run_pickle(calls: list[list[dict]], directory: Path) -> tuple[list[float], int]:
+    document_store = {}
+    timings = []
+    written = 0
+    for call in calls:
+        start = time.perf_counter()
+        for doc in call:
+            document_store[doc["id"]] = {
+                "text": doc["text"],
+                "embedding": doc["embedding"].tolist(),
+                "metadata": {},
+                "added_at": datetime.now().isoformat(),
+            }
+        with open(directory / "document_store.pkl", "wb") as f:
+            pickle.dump(document_store, f)
+        timings.append(time.perf_counter() - start)
+        written += (directory / "document_store.pkl").stat().st_size
+    return timings, written
+
+
+def run_store(calls: list[list[dict]], directory: Path, dims: int, interval: int) -> tuple[list[float], int, object]:
+    store = DocumentVectorStore(dims, directory, use_faiss=False, checkpoint_interval=interval)
+    timings = []
+    written = 0
+    size = 0
+    for call in calls:
+        start = time.perf_counter()
+        store.add(call)
+        timings.append(time.perf_counter() - start)
+        current = directory_bytes(directory)
+        written += max(current - size, 0)
+        size = current
+    return timings, written, store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=50_000, help="Documents to add")
+    parser.add_argument("--batch", type=int, default=500, help="Documents per add_documents call")
+    parser.add_argument("--dims", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--checkpoint-interval", type=int, default=20_000, help="Changes between index checkpoints")
+    parser.add_argument("--queries", type=int, default=200, help="Search queries for latency")
+    args = parser.parse_args()
+
+    calls = batches(args.documents, args.batch, args.dims)
+    tenth = max(1, len(calls) // 10)
+    print(f"{len(calls)} calls of {args.batch} documents, {args.dims}D")
+    print(f"{'path':>8}{'first 10% s':>13}{'last 10% s':>12}{'total s':>9}{'MB written/call':>17}")
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_dir, store_dir = Path(tmp) / "pickle", Path(tmp) / "store"
+        pickle_dir.mkdir()
+        results = {"pickle": run_pickle(calls, pickle_dir)}
+        *results["store"], store = run_store(calls, store_dir, args.dims, args.checkpoint_interval)
+        for name, (timings, written) in results.items():
+            print(
+                f"{name:>8}{sum(timings[:tenth]):>13.2f}{sum(timings[-tenth:]):>12.2f}{sum(timings):>9.2f}"
+                f"{written / len(calls) / 1e6:>17.2f}"
+            )
+
+        rng = np.random.default_rng(1)
+        latencies = []
+        for query in rng.normal(size=(args.queries, args.dims)).astype(np.float32):
+            start = time.perf_counter()
+            store.search(query / np.linalg.norm(query), 10)
+            latencies.append(time.perf_counter() - start)
+        print(f"store search p50 {np.percentile(latencies, 50) * 1e3:.2f} ms ({store.info()['backend']} backend)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark TimeSeriesAdapter ingest and read throughput in points per second.
+
+Generates ``--points`` samples spread over ``--tags`` tags and measures:
+
+* encoding every point as InfluxDB line protocol and as PostgreSQL ``COPY`` CSV
+  (what the InfluxDB and TimescaleDB writers send per chunk);
+* a chunked ingest into the SQLite historian stand-in (file-backed by default);
+* reading the data back as columnar NumPy blocks vs. as a list of dicts.
+
+Usage:
+    python scripts/benchmarks/benchmark_timeseries_ingest.py --points 1000000 --chunk 50000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ignition.modules.data_integration.adapters.timeseries_adapter import (  # noqa: E402
+    TimeSeriesAdapter,
+    encode_copy_csv,
+    encode_line_protocol,
+)
+from src.ignition.modules.data_integration.integration_module import (  # noqa: E402
+    DataSourceConfig,
+    DataSourceType,
+)
+
+
+def rate(points: int, seconds: float) -> str:
+    return f"{points / seconds / 1e3:>10,.0f}k pts/s ({seconds:.2f} s)"
+
+
+async def run(points: int, tags: int, chunk: int, database: str) -> None:
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2024-01-01T00:00:00", "us")
+    timestamps = start + np.arange(points) * 100_000  # 10 Hz
+    tag_names = [f"Line{i % tags}/Temperature" for i in range(points)]
+    values = rng.normal(50.0, 5.0, points)
+    quality = np.full(points, 192)
+
+    t0 = time.perf_counter()
+    for i in range(0, points, chunk):
+        encode_line_protocol(
+            "historian_data", timestamps[i : i + chunk], tag_names[i : i + chunk], values[i : i + chunk]
+        )
+    print(f"Line protocol encode: {rate(points, time.perf_counter() - t0)}")
+
+    t0 = time.perf_counter()
+    for i in range(0, points, chunk):
+        encode_copy_csv(
+            timestamps[i : i + chunk], tag_names[i : i + chunk], values[i : i + chunk], quality[i : i + chunk]
+        )
+    print(f"COPY CSV encode:      {rate(points, time.perf_counter() - t0)}")
+
+    config = DataSourceConfig(
+        source_id="benchmark",
+        source_type=DataSourceType.SQLITE,
+        connection_params={"database": database},
+        batch_size=chunk,
+    )
+    async with TimeSeriesAdapter(config) as adapter:
+        t0 = time.perf_counter()
+        written = await adapter.write_points(timestamps, tag_names, values, quality)
+        print(f"SQLite chunked ingest: {rate(written, time.perf_counter() - t0)}")
+
+        end = (timestamps[-1] + 1).astype(object)
+        query = {
+            "tags": [f"Line{i}/Temperature" for i in range(tags)],
+            "start_time": start.astype(object),
+            "end_time": end,
+        }
+
+        t0 = time.perf_counter()
+        rows = 0
+        async for block in adapter.read_blocks(query, page_size=chunk):
+            rows += len(block["value"])
+            block["value"].mean()
+        print(f"Read as NumPy blocks: {rate(rows, time.perf_counter() - t0)}")
+
+        t0 = time.perf_counter()
+        records = await adapter.read_data(query)
+        sum(record["value"] for record in records) / len(records)
+        print(f"Read as list of dicts: {rate(len(records), time.perf_counter() - t0)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=1_000_000, help="Points to ingest")
+    parser.add_argument("--tags", type=int, default=100, help="Distinct tags")
+    parser.add_argument("--chunk", type=int, default=50_000, help="Points per write chunk and read page")
+    parser.add_argument("--memory", action="store_true", help="Use an in-memory SQLite database")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        database = ":memory:" if args.memory else str(Path(tmp) / "historian.db")
+        asyncio.run(run(args.points, args.tags, args.chunk, database))
+
+
+if __name__ == "__main__":
+    main()
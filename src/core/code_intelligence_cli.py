@@ -157,7 +157,9 @@ def analyze(file_path: str, detailed: bool) -> None:
 @code.command()
 @click.argument("directory_path", type=click.Path(exists=True))
 @click.option("--recursive/--no-recursive", default=True, help="Analyze subdirectories")
-def scan(directory_path: str, recursive: bool) -> None:
+@click.option("--incremental", is_flag=True, help="Only re-analyze files changed since the last scan")
+@click.option("--workers", default=1, type=int, help="Analysis processes to use (0 = all CPUs)")
+def scan(directory_path: str, recursive: bool, incremental: bool, workers: int) -> None:
     """Scan and analyze all Python files in a directory."""
     try:
         from src.ignition.code_intelligence import CodeIntelligenceManager
@@ -181,7 +183,7 @@ def scan(directory_path: str, recursive: bool) -> None:
             manager = CodeIntelligenceManager(client)
 
             progress.update(task, description=f"Scanning {directory_path}...")
-            results = manager.analyze_and_store_directory(dir_path, recursive)
+            results = manager.analyze_and_store_directory(dir_path, recursive, incremental=incremental, workers=workers)
 
         console.print(f"\n📂 Directory Scan Results: {directory_path}", style="bold blue")
         console.print(f"Files processed: {results['files_processed']}")
@@ -191,6 +193,12 @@ def scan(directory_path: str, recursive: bool) -> None:
             style="red" if results["files_failed"] > 0 else "white",
         )
 
+        if incremental:
+            console.print(
+                f"Unchanged: {results['files_unchanged']}, changed: {results['files_changed']}, "
+                f"added: {results['files_added']}, removed: {results['files_removed']}"
+            )
+
         if results["errors"]:
             console.print("\n❌ Errors encountered:")
             for error in results["errors"][:5]:  # Show first 5 errors
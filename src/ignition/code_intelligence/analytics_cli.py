@@ -357,11 +357,11 @@ def refresh() -> None:
 
                 if metrics.get("circular_dependencies"):
                     console.print(
-                        f"⚠️  Found {len(metrics['circular_dependencies'])} circular dependencies",
+                        f"⚠️  Found {len(metrics['circular_dependencies'])} circular dependency clusters",
                         style="yellow",
                     )
                     for cycle in metrics["circular_dependencies"][:3]:
-                        cycle_str = " → ".join([Path(f).name for f in cycle])
+                        cycle_str = " ⇄ ".join([Path(f).name for f in cycle])
                         console.print(f"   • {cycle_str}", style="yellow")
                 else:
                     console.print("✅ No circular dependencies found", style="green")
@@ -383,36 +383,28 @@ class CodeIntelligenceDashboard:
     ) -> tuple[list[dict[str, Any]], dict[str, int], list[list[str]]]:
         """Analyze dependency patterns and coupling."""
         try:
-            # Highly coupled files
-            coupling_query = """
-            MATCH (f:CodeFile)
-            OPTIONAL MATCH (f)-[:DEPENDS_ON]->(dep:CodeFile)
-            OPTIONAL MATCH (dependent:CodeFile)-[:DEPENDS_ON]->(f)
-            WITH f, count(DISTINCT dep) as out_degree, count(DISTINCT dependent) as in_degree
-            WHERE out_degree + in_degree > 10
-            RETURN f.path as file_path,
-                   out_degree,
-                   in_degree,
-                   out_degree + in_degree as total_coupling
-            ORDER BY total_coupling DESC
-            LIMIT 10
-            """
+            # Fetch the DEPENDS_ON edges once and derive coupling, depth and cycles client-side
+            from .dependency_analyzer import DependencyAnalyzer
 
-            highly_coupled = self.code_manager.client.execute_query(coupling_query)
+            structure = DependencyAnalyzer(self.code_manager.client).analyze_dependency_structure()
 
-            # Dependency depth analysis
-            depth_query = """
-            MATCH (f:CodeFile)
-            OPTIONAL MATCH path = (f)-[:DEPENDS_ON*1..5]->(dep:CodeFile)
-            RETURN f.path as file_path,
-                   length(path) as max_depth
-            ORDER BY max_depth DESC
-            """
+            # Highly coupled files
+            highly_coupled = [
+                {
+                    "file_path": path,
+                    "out_degree": structure.fan_out[path],
+                    "in_degree": structure.fan_in[path],
+                    "total_coupling": structure.fan_out[path] + structure.fan_in[path],
+                }
+                for path in structure.fan_in
+                if structure.fan_out[path] + structure.fan_in[path] > 10
+            ]
+            highly_coupled.sort(key=lambda row: row["total_coupling"], reverse=True)
 
-            depth_data = self.code_manager.client.execute_query(depth_query)
-            dependency_depth = {row["file_path"]: row["max_depth"] or 0 for row in depth_data}
+            # Dependency depth: a file's topological layer is its longest dependency chain
+            dependency_depth = {path: depth for depth, layer in enumerate(structure.layers) for path in layer}
 
-            return highly_coupled, dependency_depth, []
+            return highly_coupled[:10], dependency_depth, structure.cycles
 
         except Exception:
             return [], {}, []
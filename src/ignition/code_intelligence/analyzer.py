@@ -3,6 +3,9 @@
 import ast
 import hashlib
 import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -94,23 +97,60 @@ class CodeAnalyzer:
             logger.error(f"Failed to analyze file {file_path}: {e}")
             return None
 
-    def analyze_directory(self, directory_path: Path, recursive: bool = True) -> list[dict[str, Any]]:
-        """Analyze all Python files in a directory."""
-        results = []
+    def analyze_directory(self, directory_path: Path, recursive: bool = True, workers: int = 1) -> list[dict[str, Any]]:
+        """Analyze all Python files in a directory.
 
+        Args:
+            directory_path: Directory to analyze
+            recursive: Whether to include subdirectories
+            workers: Number of worker processes (``0`` uses every CPU)
+        """
         try:
-            pattern = "**/*.py" if recursive else "*.py"
-
-            for file_path in directory_path.glob(pattern):
-                if file_path.is_file():
-                    result = self.analyze_file(file_path)
-                    if result:
-                        results.append(result)
-
+            return self.analyze_files(self.collect_files(directory_path, recursive), workers)
         except Exception as e:
             logger.error(f"Failed to analyze directory {directory_path}: {e}")
-
-        return results
+            return []
+
+    def analyze_files(self, file_paths: list[Path], workers: int = 1) -> list[dict[str, Any]]:
+        """Analyze the given files, skipping any that cannot be parsed."""
+        return list(self.iter_analyze_files(file_paths, workers))
+
+    def iter_analyze_files(self, file_paths: list[Path], workers: int = 1) -> Iterator[dict[str, Any]]:
+        """Yield analysis results in input order as soon as each one is ready.
+
+        With more than one worker, files are parsed in a process pool. Results
+        are yielded in the order of ``file_paths`` while later files are still
+        being parsed, so callers can store results as they stream in.
+
+        Args:
+            file_paths: Files to analyze
+            workers: Number of worker processes (``0`` uses every CPU)
+        """
+        workers = workers if workers > 0 else os.cpu_count() or 1
+        workers = min(workers, len(file_paths))
+
+        if workers <= 1:
+            for file_path in file_paths:
+                result = self.analyze_file(file_path)
+                if result:
+                    yield result
+            return
+
+        # Small chunks keep results flowing while amortising IPC overhead
+        chunksize = max(1, len(file_paths) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(_analyze_file_in_worker, file_paths, chunksize=chunksize):
+                if result:
+                    yield result
+
+    def collect_files(self, directory_path: Path, recursive: bool = True) -> list[Path]:
+        """List supported files in a directory in a stable, sorted order."""
+        pattern = "**/*.py" if recursive else "*.py"
+        return sorted(file_path for file_path in directory_path.glob(pattern) if file_path.is_file())
+
+    def compute_content_hash(self, content: str) -> str:
+        """Return the SHA-256 hex digest used to detect content changes."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
     def _is_supported_file(self, file_path: Path) -> bool:
         """Check if file is supported for analysis."""
@@ -138,7 +178,7 @@ class CodeAnalyzer:
         maintainability = max(0, 171 - 5.2 * complexity_calc.complexity - 0.23 * lines)
 
         # Calculate content hash
-        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        content_hash = self.compute_content_hash(content)
 
         return CodeFileNode(
             path=self._get_relative_path(file_path),
@@ -334,3 +374,14 @@ class CodeAnalyzer:
             "file_complexity": file_info.complexity,
             "maintainability_index": file_info.maintainability_index,
         }
+
+
+_worker_analyzer: CodeAnalyzer | None = None
+
+
+def _analyze_file_in_worker(file_path: Path) -> dict[str, Any] | None:
+    """Process-pool entry point reusing one analyzer per worker process."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = CodeAnalyzer()
+    return _worker_analyzer.analyze_file(file_path)
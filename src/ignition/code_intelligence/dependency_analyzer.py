@@ -5,8 +5,10 @@ for accurate dependency graph visualization and analysis.
 """
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,132 @@ class DependencyRelationship:
     import_details: list[str]  # specific imports
 
 
+@dataclass
+class DependencyStructure:
+    """Structure of the file dependency graph computed from its edge list."""
+
+    total_files: int = 0
+    total_dependencies: int = 0
+    fan_in: dict[str, int] = field(default_factory=dict)  # files depending on each file
+    fan_out: dict[str, int] = field(default_factory=dict)  # dependencies of each file
+    cycles: list[list[str]] = field(default_factory=list)  # strongly connected clusters of 2+ files
+    layers: list[list[str]] = field(default_factory=list)  # layer 0 depends on nothing, layer n on layers < n
+
+
+def find_strongly_connected_components(graph: dict[str, Iterable[str]]) -> list[list[str]]:
+    """Return the strongly connected components of a directed graph (Tarjan's algorithm).
+
+    Iterative, so deep dependency chains do not hit the recursion limit.
+    Components are returned in reverse topological order: every component
+    appears after all components it has edges into.
+
+    Args:
+        graph: Adjacency mapping of node to successors; successors need not be keys
+
+    Returns:
+        list of components, each a list of nodes
+    """
+    index_of: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    def visit(node: str) -> None:
+        index_of[node] = lowlink[node] = len(index_of)
+        stack.append(node)
+        on_stack.add(node)
+
+    for root in graph:
+        if root in index_of:
+            continue
+        visit(root)
+        work = [(root, iter(graph.get(root, ())))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index_of:
+                    visit(successor)
+                    work.append((successor, iter(graph.get(successor, ()))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            else:
+                # All successors explored
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def analyze_dependency_graph(edges: Iterable[tuple[str, str]]) -> DependencyStructure:
+    """Compute cycles, fan-in/fan-out and topological layers from (source, target) edges.
+
+    Runs in O(V + E).
+
+    Args:
+        edges: Dependency edges, source depends on target
+
+    Returns:
+        DependencyStructure for the graph
+    """
+    graph: dict[str, set[str]] = {}
+    for source, target in edges:
+        graph.setdefault(source, set()).add(target)
+        graph.setdefault(target, set())
+
+    fan_out = {node: len(targets) for node, targets in graph.items()}
+    fan_in = dict.fromkeys(graph, 0)
+    for targets in graph.values():
+        for target in targets:
+            fan_in[target] += 1
+
+    components = find_strongly_connected_components(graph)
+    component_of = {node: i for i, component in enumerate(components) for node in component}
+
+    # Components arrive dependencies-first, so every successor's layer is already known
+    component_layers: list[int] = []
+    for i, component in enumerate(components):
+        layer = 0
+        for node in component:
+            for target in graph[node]:
+                target_component = component_of[target]
+                if target_component != i:
+                    layer = max(layer, component_layers[target_component] + 1)
+        component_layers.append(layer)
+
+    layers: list[list[str]] = [[] for _ in range(max(component_layers, default=-1) + 1)]
+    for component, layer in zip(components, component_layers, strict=True):
+        layers[layer].extend(component)
+
+    cycles = [
+        sorted(component) for component in components if len(component) > 1 or component[0] in graph[component[0]]
+    ]
+    cycles.sort(key=lambda cycle: (-len(cycle), cycle[0]))
+
+    return DependencyStructure(
+        total_files=len(graph),
+        total_dependencies=sum(fan_out.values()),
+        fan_in=fan_in,
+        fan_out=fan_out,
+        cycles=cycles,
+        layers=[sorted(layer) for layer in layers],
+    )
+
+
 class DependencyAnalyzer:
     """Analyzes and creates dependency relationships between code files."""
 
@@ -61,59 +189,49 @@ class DependencyAnalyzer:
             logger.error(f"Failed to analyze dependencies: {e}")
             return 0
 
-    def get_dependency_metrics(self) -> dict[str, any]:
+    def get_dependency_metrics(self) -> dict[str, Any]:
         """Get metrics about the dependency structure.
 
         Returns:
             Dictionary with dependency metrics
         """
         try:
-            metrics = {}
-
-            # Count total dependencies
-            dep_count_query = """
-            MATCH (a:CodeFile)-[:DEPENDS_ON]->(b:CodeFile)
-            RETURN count(*) as total_dependencies
-            """
-            result = self.client.execute_query(dep_count_query)
-            metrics["total_dependencies"] = result[0]["total_dependencies"] if result else 0
-
-            # Get files with highest in-degree (most depended upon)
-            high_in_degree_query = """
-            MATCH (f:CodeFile)
-            OPTIONAL MATCH (dependent:CodeFile)-[:DEPENDS_ON]->(f)
-            WITH f, count(dependent) as in_degree
-            WHERE in_degree > 0
-            RETURN f.path as file_path, in_degree
-            ORDER BY in_degree DESC
-            LIMIT 10
-            """
-            result = self.client.execute_query(high_in_degree_query)
-            metrics["most_depended_upon"] = result
-
-            # Get files with highest out-degree (most dependencies)
-            high_out_degree_query = """
-            MATCH (f:CodeFile)
-            OPTIONAL MATCH (f)-[:DEPENDS_ON]->(dependency:CodeFile)
-            WITH f, count(dependency) as out_degree
-            WHERE out_degree > 0
-            RETURN f.path as file_path, out_degree
-            ORDER BY out_degree DESC
-            LIMIT 10
-            """
-            result = self.client.execute_query(high_out_degree_query)
-            metrics["most_dependencies"] = result
-
-            # Detect circular dependencies
-            circular_deps = self._detect_circular_dependencies()
-            metrics["circular_dependencies"] = circular_deps
-
-            return metrics
+            structure = self.analyze_dependency_structure()
+
+            def top(degrees: dict[str, int], key: str) -> list[dict[str, Any]]:
+                ranked = sorted((item for item in degrees.items() if item[1] > 0), key=lambda item: (-item[1], item[0]))
+                return [{"file_path": path, key: degree} for path, degree in ranked[:10]]
+
+            return {
+                "total_dependencies": structure.total_dependencies,
+                # Files with highest in-degree (most depended upon)
+                "most_depended_upon": top(structure.fan_in, "in_degree"),
+                # Files with highest out-degree (most dependencies)
+                "most_dependencies": top(structure.fan_out, "out_degree"),
+                "circular_dependencies": structure.cycles,
+                "dependency_layers": structure.layers,
+                "dependency_depth": len(structure.layers),
+            }
 
         except Exception as e:
             logger.error(f"Failed to get dependency metrics: {e}")
             return {}
 
+    def analyze_dependency_structure(self) -> DependencyStructure:
+        """Compute cycle clusters, fan-in/fan-out and layering from the DEPENDS_ON edges.
+
+        The edge list is fetched once and analysed client-side in linear time.
+
+        Returns:
+            DependencyStructure for the current graph
+        """
+        query = """
+        MATCH (a:CodeFile)-[:DEPENDS_ON]->(b:CodeFile)
+        RETURN a.path as source, b.path as target
+        """
+        result = self.client.execute_query(query)
+        return analyze_dependency_graph((row["source"], row["target"]) for row in result)
+
     def _get_file_imports(self) -> dict[str, list[dict[str, str]]]:
         """Get all imports for each CodeFile.
 
@@ -332,31 +450,10 @@ class DependencyAnalyzer:
         """Detect circular dependencies in the codebase.
 
         Returns:
-            list of circular dependency chains
+            list of cycle clusters (strongly connected components), each a sorted list of file paths
         """
         try:
-            # Find cycles using Neo4j's path finding
-            cycle_query = """
-            MATCH path = (start:CodeFile)-[:DEPENDS_ON*2..10]->(start)
-            WHERE length(path) >= 2
-            RETURN [node in nodes(path) | node.path] as cycle_path
-            LIMIT 10
-            """
-
-            result = self.client.execute_query(cycle_query)
-            cycles = [row["cycle_path"] for row in result]
-
-            # Remove duplicates (same cycle in different order)
-            unique_cycles = []
-            for cycle in cycles:
-                # Normalize cycle by starting with the lexicographically smallest file
-                min_index = cycle.index(min(cycle))
-                normalized_cycle = cycle[min_index:] + cycle[:min_index]
-
-                if normalized_cycle not in unique_cycles:
-                    unique_cycles.append(normalized_cycle)
-
-            return unique_cycles
+            return self.analyze_dependency_structure().cycles
 
         except Exception as e:
             logger.error(f"Failed to detect circular dependencies: {e}")
@@ -0,0 +1,285 @@
+"""Memory-mapped embedding cache for Code Intelligence.
+
+Embeddings are stored as rows of a single float32 matrix in a memory-mapped
+file instead of one JSON file per text hash. A small append-only index log maps
+text hashes to rows, lookups return read-only views into the mapped file, and
+an LRU bound evicts the least recently used rows, which are reclaimed by
+compaction.
+
+Files in the cache directory:
+    vectors.f32  - float32 matrix, ``capacity`` rows x ``dimensions`` columns
+    index.log    - one ``<hash> <row> <created_at>`` line per write, ``<hash> -1`` per eviction
+    meta.json    - dimensions and model name the vectors were produced with
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Append-only, LRU-bounded float32 embedding store backed by ``np.memmap``."""
+
+    VECTORS_FILE = "vectors.f32"
+    INDEX_FILE = "index.log"
+    META_FILE = "meta.json"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        dimensions: int,
+        model_name: str,
+        max_entries: int = 100_000,
+        initial_capacity: int = 1024,
+    ) -> None:
+        """Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            dimensions: Embedding width
+            model_name: Model that produced the embeddings; a mismatch resets the cache
+            max_entries: LRU bound on the number of live embeddings
+            initial_capacity: Rows preallocated when the vectors file is created
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.dimensions = dimensions
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.initial_capacity = initial_capacity
+
+        self.hits = 0
+        self.misses = 0
+
+        # hash -> (row, created_at), ordered from least to most recently used
+        self._index: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        self._next_row = 0
+        self._dead_rows = 0
+        self._vectors: np.memmap | None = None
+
+        self._open()
+
+    @property
+    def vectors_path(self) -> Path:
+        return self.cache_dir / self.VECTORS_FILE
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / self.INDEX_FILE
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, text_hash: str) -> bool:
+        return text_hash in self._index
+
+    def get(self, text_hash: str) -> np.ndarray | None:
+        """Return a read-only view of a cached embedding, or None on a miss."""
+        entry = self._index.get(text_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._index.move_to_end(text_hash)
+        view = self._vectors[entry[0]]
+        view.flags.writeable = False
+        return view
+
+    def get_created_at(self, text_hash: str) -> datetime | None:
+        """Return when an embedding was cached."""
+        entry = self._index.get(text_hash)
+        return datetime.fromisoformat(entry[1]) if entry else None
+
+    def get_many(self, text_hashes: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Look up many hashes at once.
+
+        Returns:
+            tuple of (hit_mask, vectors) where ``vectors`` holds the cached rows
+            for the hits, in input order, gathered in a single indexing pass
+        """
+        rows = np.fromiter(
+            (self._index[h][0] if h in self._index else -1 for h in text_hashes),
+            dtype=np.int64,
+            count=len(text_hashes),
+        )
+        hit_mask = rows >= 0
+        hit_count = int(hit_mask.sum())
+        self.hits += hit_count
+        self.misses += len(text_hashes) - hit_count
+
+        for text_hash, hit in zip(text_hashes, hit_mask, strict=True):
+            if hit:
+                self._index.move_to_end(text_hash)
+
+        vectors = self._vectors[rows[hit_mask]] if hit_count else np.empty((0, self.dimensions), np.float32)
+        return hit_mask, vectors
+
+    def put(self, text_hash: str, embedding: Any) -> None:
+        """Cache one embedding."""
+        self.put_many([text_hash], np.asarray(embedding, dtype=np.float32).reshape(1, -1))
+
+    def put_many(self, text_hashes: list[str], embeddings: np.ndarray) -> None:
+        """Append embeddings for hashes not already cached."""
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(text_hashes), self.dimensions)
+        # Skip cached hashes and duplicates within the batch (first occurrence wins)
+        new: list[tuple[int, str]] = []
+        seen: set[str] = set()
+        for i, text_hash in enumerate(text_hashes):
+            if text_hash not in self._index and text_hash not in seen:
+                seen.add(text_hash)
+                new.append((i, text_hash))
+        if not new:
+            return
+
+        self._ensure_capacity(self._next_row + len(new))
+        start = self._next_row
+        self._vectors[start : start + len(new)] = embeddings[[i for i, _ in new]]
+        self._vectors.flush()
+
+        created_at = datetime.now().isoformat()
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for offset, (_, text_hash) in enumerate(new):
+                self._index[text_hash] = (start + offset, created_at)
+                f.write(f"{text_hash} {start + offset} {created_at}\n")
+        self._next_row += len(new)
+
+        self._evict_lru()
+
+    def compact(self) -> None:
+        """Rewrite the vectors file and index with only live rows, in LRU order."""
+        live_rows = np.fromiter((row for row, _ in self._index.values()), dtype=np.int64, count=len(self._index))
+        live_vectors = np.array(self._vectors[live_rows]) if len(live_rows) else np.empty((0, self.dimensions))
+
+        capacity = max(self.initial_capacity, len(live_rows))
+        tmp_path = self.vectors_path.with_suffix(".tmp")
+        compacted = np.memmap(tmp_path, dtype=np.float32, mode="w+", shape=(capacity, self.dimensions))
+        compacted[: len(live_rows)] = live_vectors
+        compacted.flush()
+        del compacted
+
+        self._vectors = None
+        tmp_path.replace(self.vectors_path)
+
+        self._index = OrderedDict(
+            (text_hash, (row, created_at)) for row, (text_hash, (_, created_at)) in enumerate(self._index.items())
+        )
+        self._next_row = len(self._index)
+        self._dead_rows = 0
+        self._write_index()
+        self._map(capacity)
+
+        logger.debug(f"Compacted embedding cache to {len(self._index)} rows")
+
+    def clear(self) -> None:
+        """Remove every cached embedding."""
+        self._vectors = None
+        for name in (self.VECTORS_FILE, self.INDEX_FILE):
+            (self.cache_dir / name).unlink(missing_ok=True)
+        self._index.clear()
+        self._next_row = 0
+        self._dead_rows = 0
+        self.hits = 0
+        self.misses = 0
+        self._open()
+
+    def stats(self) -> dict[str, Any]:
+        """Return size and hit-rate statistics."""
+        lookups = self.hits + self.misses
+        size = sum(p.stat().st_size for p in (self.vectors_path, self.index_path) if p.exists())
+        return {
+            "cached_embeddings": len(self._index),
+            "max_entries": self.max_entries,
+            "capacity_rows": 0 if self._vectors is None else self._vectors.shape[0],
+            "dead_rows": self._dead_rows,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "cache_size_mb": size / (1024 * 1024),
+        }
+
+    def _open(self) -> None:
+        """Load metadata and index, resetting the cache if the model changed."""
+        meta_path = self.cache_dir / self.META_FILE
+        meta = {"dimensions": self.dimensions, "model_name": self.model_name, "dtype": "float32"}
+
+        if meta_path.exists():
+            try:
+                stored = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                stored = {}
+            if stored != meta:
+                logger.info("Embedding cache model or dimensions changed - resetting cache")
+                for name in (self.VECTORS_FILE, self.INDEX_FILE):
+                    (self.cache_dir / name).unlink(missing_ok=True)
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+        self._load_index()
+
+        capacity = self.initial_capacity
+        if self.vectors_path.exists():
+            capacity = self.vectors_path.stat().st_size // (4 * self.dimensions)
+        self._map(max(capacity, self._next_row, 1))
+
+    def _load_index(self) -> None:
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 2:
+                    continue
+                text_hash, row = parts[0], int(parts[1])
+                if row < 0:
+                    if self._index.pop(text_hash, None) is not None:
+                        self._dead_rows += 1
+                    continue
+                if text_hash in self._index:
+                    self._dead_rows += 1
+                self._index[text_hash] = (row, parts[2] if len(parts) > 2 else datetime.now().isoformat())
+                self._next_row = max(self._next_row, row + 1)
+
+    def _map(self, capacity: int) -> None:
+        """Memory-map the vectors file with the given row capacity, growing it if needed."""
+        mode = "r+" if self.vectors_path.exists() else "w+"
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode=mode, shape=(capacity, self.dimensions))
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+
+        while capacity < rows:
+            capacity *= 2
+        self._vectors.flush()
+        self._vectors = None
+        with open(self.vectors_path, "r+b") as f:
+            f.truncate(capacity * self.dimensions * 4)
+        self._map(capacity)
+
+    def _evict_lru(self) -> None:
+        if len(self._index) <= self.max_entries:
+            return
+
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            while len(self._index) > self.max_entries:
+                text_hash, _ = self._index.popitem(last=False)
+                f.write(f"{text_hash} -1\n")
+                self._dead_rows += 1
+
+        # Reclaim space once evicted rows outnumber live ones
+        if self._dead_rows > len(self._index):
+            self.compact()
+
+    def _write_index(self) -> None:
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            for text_hash, (row, created_at) in self._index.items():
+                f.write(f"{text_hash} {row} {created_at}\n")
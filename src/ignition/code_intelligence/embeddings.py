@@ -5,13 +5,17 @@ It provides semantic search capabilities using sentence transformers and Neo4j v
 """
 
 import hashlib
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from .embedding_cache import EmbeddingCache
+from .vector_index import LocalVectorIndex
+
 # Vector embeddings dependencies
 try:
     import torch
@@ -23,6 +27,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+
+# Local index key queries per node type: keys are the path, path::name and path::name::start_line
+LOCAL_INDEX_QUERIES = {
+    "file": "MATCH (n:CodeFile) WHERE n.embedding IS NOT NULL AND ($paths IS NULL OR n.path IN $paths) "
+    "RETURN n.path AS key, n.embedding AS embedding",
+    "class": "MATCH (n:Class) WHERE n.embedding IS NOT NULL AND ($paths IS NULL OR n.file_path IN $paths) "
+    "RETURN n.file_path + '::' + n.name AS key, n.embedding AS embedding",
+    "method": "MATCH (n:Method) WHERE n.embedding IS NOT NULL AND ($paths IS NULL OR n.file_path IN $paths) "
+    "RETURN n.file_path + '::' + n.name + '::' + toString(n.start_line) AS key, n.embedding AS embedding",
+}
+
 
 @dataclass
 class EmbeddingResult:
@@ -39,12 +55,18 @@ class EmbeddingResult:
 class CodeEmbeddingGenerator:
     """Generates vector embeddings for code elements."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_dir: str | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_dir: str | None = None,
+        max_cache_entries: int = 100_000,
+    ) -> None:
         """Initialize the embedding generator.
 
         Args:
             model_name: Name of the sentence transformer model
             cache_dir: Directory to cache embeddings
+            max_cache_entries: LRU bound on the number of cached embeddings
         """
         self.model_name = model_name
         self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".ignition" / "embeddings_cache"
@@ -55,6 +77,11 @@ class CodeEmbeddingGenerator:
         self.dimensions = 384  # Default for all-MiniLM-L6-v2
         self._initialize_model()
 
+        # Memory-mapped float32 cache, sized to the model's embedding width
+        self.cache = None
+        if self.model:
+            self.cache = EmbeddingCache(self.cache_dir, self.dimensions, self.model_name, max_cache_entries)
+
     def _initialize_model(self) -> None:
         """Initialize the sentence transformer model."""
         if not EMBEDDINGS_AVAILABLE:
@@ -88,33 +115,164 @@ class CodeEmbeddingGenerator:
 
         # Check cache first
         if use_cache:
-            cached = self._get_cached_embedding(text_hash)
+            cached = self._get_cached_embedding(text, text_hash)
             if cached:
                 return cached
 
         try:
             # Generate embedding
-            embedding = self.model.encode(text, convert_to_numpy=True).tolist()
+            vector = self.model.encode(text, convert_to_numpy=True)
 
-            result = EmbeddingResult(
+            # Cache the raw float32 vector
+            if use_cache:
+                self._cache_embedding(text_hash, vector)
+
+            return EmbeddingResult(
                 text=text,
-                embedding=embedding,
+                embedding=vector.tolist(),
                 model_name=self.model_name,
                 dimensions=self.dimensions,
                 created_at=datetime.now(),
                 text_hash=text_hash,
             )
 
-            # Cache the result
-            if use_cache:
-                self._cache_embedding(result)
-
-            return result
-
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return None
 
+    def generate_embeddings_batch(
+        self,
+        texts: list[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        use_cache: bool = True,
+    ) -> list[EmbeddingResult | None]:
+        """Generate embeddings for many texts with batched model calls.
+
+        Texts are deduplicated by hash, cache hits are served in a single
+        lookup, and only the misses are passed to the model in ``batch_size``
+        chunks.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts per model forward pass
+            use_cache: Whether to use cached embeddings
+
+        Returns:
+            list of EmbeddingResult (or None where encoding failed), in input order
+        """
+        if not texts:
+            return []
+        if not self.model:
+            logger.warning("Embedding model not available")
+            return [None] * len(texts)
+
+        # Deduplicate by text hash, keeping the first text for each hash
+        text_hashes = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+        unique_texts: dict[str, str] = {}
+        for text, text_hash in zip(texts, text_hashes, strict=True):
+            unique_texts.setdefault(text_hash, text)
+        unique_hashes = list(unique_texts)
+
+        vectors = np.empty((len(unique_hashes), self.dimensions), dtype=np.float32)
+        ok_mask = np.zeros(len(unique_hashes), dtype=bool)
+        if use_cache and self.cache is not None:
+            hit_mask, hit_vectors = self.cache.get_many(unique_hashes)
+            vectors[hit_mask] = hit_vectors
+            ok_mask |= hit_mask
+
+        miss_rows = np.flatnonzero(~ok_mask)
+        if len(miss_rows):
+            miss_hashes = [unique_hashes[i] for i in miss_rows]
+            try:
+                encoded = self.model.encode(
+                    [unique_texts[text_hash] for text_hash in miss_hashes],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+                vectors[miss_rows] = encoded
+                ok_mask[miss_rows] = True
+                if use_cache and self.cache is not None:
+                    self.cache.put_many(miss_hashes, encoded)
+            except Exception as e:
+                logger.error(f"Failed to generate batch embeddings: {e}")
+
+        logger.debug(
+            f"Embedded {len(texts)} texts: {len(unique_hashes)} unique, "
+            f"{len(unique_hashes) - len(miss_rows)} cached, {len(miss_rows)} encoded"
+        )
+
+        now = datetime.now()
+        unique_results: dict[str, EmbeddingResult | None] = {}
+        for row, text_hash in enumerate(unique_hashes):
+            if not ok_mask[row]:
+                unique_results[text_hash] = None
+                continue
+            unique_results[text_hash] = EmbeddingResult(
+                text=unique_texts[text_hash],
+                embedding=vectors[row].tolist(),
+                model_name=self.model_name,
+                dimensions=self.dimensions,
+                created_at=now,
+                text_hash=text_hash,
+            )
+
+        return [unique_results[text_hash] for text_hash in text_hashes]
+
+    def embed_analyses(
+        self,
+        analyses: list[dict[str, Any]],
+        sources: list[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> int:
+        """Embed the files, classes and methods of analyzer results in one batch.
+
+        The ``embedding`` field of each file, class and method node is set in place.
+
+        Args:
+            analyses: Results from ``CodeAnalyzer.analyze_file``
+            sources: Source text of each analyzed file, in the same order
+            batch_size: Number of texts per model forward pass
+
+        Returns:
+            Number of nodes that received an embedding
+        """
+        nodes: list[Any] = []
+        texts: list[str] = []
+
+        for analysis, source in zip(analyses, sources, strict=True):
+            file_info = analysis["file"]
+            lines = source.split("\n")
+
+            nodes.append(file_info)
+            texts.append(self._preprocess_code_for_embedding(source, file_info.path))
+
+            methods_by_class: dict[str | None, list[str]] = {}
+            for method_info in analysis["methods"]:
+                methods_by_class.setdefault(method_info.class_name, []).append(method_info.name)
+
+            for class_info in analysis["classes"]:
+                class_code = "\n".join(lines[class_info.start_line - 1 : class_info.end_line])
+                nodes.append(class_info)
+                texts.append(
+                    self._prepare_class_text(
+                        class_code, class_info.name, class_info.docstring, methods_by_class.get(class_info.name)
+                    )
+                )
+
+            for method_info in analysis["methods"]:
+                method_code = "\n".join(lines[method_info.start_line - 1 : method_info.end_line])
+                nodes.append(method_info)
+                texts.append(self._prepare_function_text(method_code, method_info.name, method_info.docstring))
+
+        embedded = 0
+        for node, result in zip(nodes, self.generate_embeddings_batch(texts, batch_size), strict=True):
+            if result:
+                node.embedding = result.embedding
+                embedded += 1
+
+        return embedded
+
     def generate_file_embedding(self, file_content: str, file_path: str) -> EmbeddingResult | None:
         """Generate embedding for a code file.
 
@@ -254,71 +412,59 @@ class CodeEmbeddingGenerator:
 
         return "\n".join(text_parts)
 
-    def _get_cached_embedding(self, text_hash: str) -> EmbeddingResult | None:
+    def _get_cached_embedding(self, text: str, text_hash: str) -> EmbeddingResult | None:
         """Get cached embedding by text hash."""
-        cache_file = self.cache_dir / f"{text_hash}.json"
-
-        if not cache_file.exists():
+        if self.cache is None:
             return None
 
-        try:
-            with open(cache_file) as f:
-                data = json.load(f)
-
-            return EmbeddingResult(
-                text=data["text"],
-                embedding=data["embedding"],
-                model_name=data["model_name"],
-                dimensions=data["dimensions"],
-                created_at=datetime.fromisoformat(data["created_at"]),
-                text_hash=data["text_hash"],
-            )
-        except Exception as e:
-            logger.debug(f"Failed to load cached embedding: {e}")
+        vector = self.cache.get(text_hash)
+        if vector is None:
             return None
 
-    def _cache_embedding(self, result: EmbeddingResult) -> None:
-        """Cache embedding result."""
-        cache_file = self.cache_dir / f"{result.text_hash}.json"
+        return EmbeddingResult(
+            text=text,
+            embedding=vector.tolist(),
+            model_name=self.model_name,
+            dimensions=self.dimensions,
+            created_at=self.cache.get_created_at(text_hash) or datetime.now(),
+            text_hash=text_hash,
+        )
 
-        try:
-            data = {
-                "text": result.text,
-                "embedding": result.embedding,
-                "model_name": result.model_name,
-                "dimensions": result.dimensions,
-                "created_at": result.created_at.isoformat(),
-                "text_hash": result.text_hash,
-            }
-
-            with open(cache_file, "w") as f:
-                json.dump(data, f)
+    def _cache_embedding(self, text_hash: str, vector: Any) -> None:
+        """Cache an embedding vector."""
+        if self.cache is None:
+            return
 
+        try:
+            self.cache.put(text_hash, vector)
         except Exception as e:
             logger.debug(f"Failed to cache embedding: {e}")
 
     def clear_cache(self) -> None:
         """Clear the embedding cache."""
         try:
+            if self.cache is not None:
+                self.cache.clear()
+            # Remove per-hash JSON files written by earlier versions of the cache
             for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+                if cache_file.name != EmbeddingCache.META_FILE:
+                    cache_file.unlink()
             logger.info("Embedding cache cleared")
         except Exception as e:
             logger.error(f"Failed to clear cache: {e}")
 
     def get_cache_stats(self) -> dict[str, Any]:
-        """Get statistics about the embedding cache."""
+        """Get statistics about the embedding cache, including hits and misses."""
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in cache_files)
-
-            return {
-                "cached_embeddings": len(cache_files),
-                "cache_size_mb": total_size / (1024 * 1024),
-                "cache_directory": str(self.cache_dir),
-                "model_name": self.model_name,
-                "dimensions": self.dimensions,
-            }
+            stats = self.cache.stats() if self.cache is not None else {"cached_embeddings": 0}
+            stats.update(
+                {
+                    "cache_directory": str(self.cache_dir),
+                    "model_name": self.model_name,
+                    "dimensions": self.dimensions,
+                }
+            )
+            return stats
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
             return {}
@@ -327,16 +473,223 @@ class CodeEmbeddingGenerator:
 class SemanticCodeSearch:
     """Provides semantic search capabilities for code using vector embeddings."""
 
-    def __init__(self, graph_client, embedding_generator: CodeEmbeddingGenerator) -> None:
+    def __init__(
+        self,
+        graph_client,
+        embedding_generator: CodeEmbeddingGenerator,
+        local_index_dir: str | Path | None = None,
+    ) -> None:
         """Initialize semantic search system.
 
         Args:
             graph_client: Neo4j graph client
             embedding_generator: Code embedding generator
+            local_index_dir: Optional directory for in-process ANN indexes. When
+                set, nearest neighbours are found locally and Neo4j only hydrates
+                metadata for the hits, so Neo4j vector indexes are not required.
         """
         self.client = graph_client
         self.embedder = embedding_generator
 
+        self.local_index_dir = Path(local_index_dir) if local_index_dir else None
+        self.local_indexes: dict[str, LocalVectorIndex] = {}
+        if self.local_index_dir:
+            self._load_local_indexes()
+
+    def index_embeddings(self, batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE, reindex: bool = False) -> dict[str, int]:
+        """Generate and store embeddings for code files, classes and methods.
+
+        Embeddings for each node type are generated with batched model calls
+        and written back with batched ``UNWIND`` queries.
+
+        Args:
+            batch_size: Number of texts per model forward pass
+            reindex: Re-embed nodes that already have an embedding
+
+        Returns:
+            Number of embeddings written per node type
+        """
+        missing = "" if reindex else "WHERE n.embedding IS NULL"
+        sources: dict[str, list[str] | None] = {}
+        counts = {}
+
+        # Files
+        rows = self.client.execute_query(f"MATCH (n:CodeFile) {missing} RETURN elementId(n) AS id, n.path AS path")
+        changed_paths = {row["path"] for row in rows}
+        texts = []
+        for row in rows:
+            lines = self._read_source_lines(row["path"], sources)
+            texts.append(self.embedder._preprocess_code_for_embedding("\n".join(lines or []), row["path"]))
+        counts["files"] = self._write_embeddings(rows, texts, batch_size)
+
+        # Classes
+        rows = self.client.execute_query(
+            f"""
+            MATCH (n:Class) {missing}
+            OPTIONAL MATCH (n)-[:HAS_METHOD]->(m:Method)
+            RETURN elementId(n) AS id, n.name AS name, n.file_path AS file_path, n.docstring AS docstring,
+                   n.start_line AS start_line, n.end_line AS end_line, collect(m.name) AS methods
+            """
+        )
+        texts = [
+            self.embedder._prepare_class_text(
+                self._slice_source(row, sources), row["name"], row["docstring"], row["methods"]
+            )
+            for row in rows
+        ]
+        counts["classes"] = self._write_embeddings(rows, texts, batch_size)
+        changed_paths.update(row["file_path"] for row in rows)
+
+        # Methods
+        rows = self.client.execute_query(
+            f"""
+            MATCH (n:Method) {missing}
+            RETURN elementId(n) AS id, n.name AS name, n.file_path AS file_path, n.docstring AS docstring,
+                   n.start_line AS start_line, n.end_line AS end_line
+            """
+        )
+        texts = [
+            self.embedder._prepare_function_text(self._slice_source(row, sources), row["name"], row["docstring"])
+            for row in rows
+        ]
+        counts["methods"] = self._write_embeddings(rows, texts, batch_size)
+        changed_paths.update(row["file_path"] for row in rows)
+
+        if self.local_indexes:
+            if reindex:
+                self.build_local_index()
+            else:
+                self.sync_local_index(sorted(changed_paths))
+
+        logger.info(f"Indexed embeddings: {counts}")
+        return counts
+
+    def build_local_index(self) -> dict[str, int]:
+        """Rebuild the local ANN indexes from every embedding stored in Neo4j.
+
+        Returns:
+            Number of vectors indexed per node type
+        """
+        if not self.local_index_dir:
+            raise ValueError("local_index_dir is not configured")
+
+        counts = {}
+        for node_type, query in LOCAL_INDEX_QUERIES.items():
+            index = LocalVectorIndex(self.embedder.dimensions)
+            rows = self.client.execute_query(query, {"paths": None})
+            if rows:
+                index.add([row["key"] for row in rows], [row["embedding"] for row in rows])
+                index.train()
+            self.local_indexes[node_type] = index
+            counts[node_type] = len(index)
+
+        self._save_local_indexes()
+        logger.info(f"Built local vector index: {counts}")
+        return counts
+
+    def sync_local_index(self, file_paths: list[str]) -> None:
+        """Refresh the local ANN indexes for files that were added, changed or removed.
+
+        Entries for each path are dropped and re-read from Neo4j, so paths whose
+        nodes no longer exist are simply removed.
+
+        Args:
+            file_paths: ``CodeFile`` paths to refresh
+        """
+        if not self.local_indexes or not file_paths:
+            return
+
+        self.local_indexes["file"].remove(list(file_paths))
+        self.local_indexes["class"].remove_prefixes(file_paths)
+        self.local_indexes["method"].remove_prefixes(file_paths)
+
+        for node_type, query in LOCAL_INDEX_QUERIES.items():
+            rows = self.client.execute_query(query, {"paths": list(file_paths)})
+            if rows:
+                self.local_indexes[node_type].add([row["key"] for row in rows], [row["embedding"] for row in rows])
+
+        self._save_local_indexes()
+
+    def _load_local_indexes(self) -> None:
+        for node_type in LOCAL_INDEX_QUERIES:
+            path = self.local_index_dir / f"{node_type}.npz"
+            try:
+                self.local_indexes[node_type] = (
+                    LocalVectorIndex.load(path) if path.exists() else LocalVectorIndex(self.embedder.dimensions)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load local vector index {path}, starting empty: {e}")
+                self.local_indexes[node_type] = LocalVectorIndex(self.embedder.dimensions)
+
+    def _save_local_indexes(self) -> None:
+        for node_type, index in self.local_indexes.items():
+            index.save(self.local_index_dir / f"{node_type}.npz")
+
+    def _vector_source(
+        self, node_type: str, index_name: str, query_embedding: list[float], limit: int
+    ) -> tuple[str, dict]:
+        """Return the Cypher clause yielding ``node, score`` and its parameters.
+
+        With a local index the neighbours are found in-process and Neo4j only
+        matches the hit nodes; otherwise the Neo4j vector index is queried.
+        """
+        params: dict[str, Any] = {"embedding": query_embedding, "limit": limit}
+        index = self.local_indexes.get(node_type)
+        if index is None:
+            return f"CALL db.index.vector.queryNodes('{index_name}', $limit, $embedding)\nYIELD node, score", params
+
+        hits = []
+        for key, score in index.search(query_embedding, limit):
+            if node_type == "file":
+                hits.append({"path": key, "score": score})
+            elif node_type == "class":
+                file_path, name = key.rsplit("::", 1)
+                hits.append({"file_path": file_path, "name": name, "score": score})
+            else:
+                file_path, name, start_line = key.rsplit("::", 2)
+                hits.append({"file_path": file_path, "name": name, "start_line": int(start_line), "score": score})
+        params["hits"] = hits
+
+        match = {
+            "file": "MATCH (node:CodeFile {path: hit.path})",
+            "class": "MATCH (node:Class {file_path: hit.file_path, name: hit.name})",
+            "method": "MATCH (node:Method {file_path: hit.file_path, name: hit.name, start_line: hit.start_line})",
+        }[node_type]
+        return f"UNWIND $hits AS hit\n{match}\nWITH node, hit.score AS score", params
+
+    def _write_embeddings(self, rows: list[dict[str, Any]], texts: list[str], batch_size: int) -> int:
+        """Embed texts in batches and store each embedding on the node with the matching id."""
+        results = self.embedder.generate_embeddings_batch(texts, batch_size)
+        updates = [
+            {"id": row["id"], "embedding": result.embedding}
+            for row, result in zip(rows, results, strict=True)
+            if result
+        ]
+        if not updates:
+            return 0
+
+        return self.client.execute_write_batches(
+            "UNWIND $rows AS row MATCH (n) WHERE elementId(n) = row.id SET n.embedding = row.embedding",
+            updates,
+        )
+
+    @staticmethod
+    def _read_source_lines(path: str, sources: dict[str, list[str] | None]) -> list[str] | None:
+        """Read a source file once per indexing run."""
+        if path not in sources:
+            try:
+                sources[path] = Path(path).read_text(encoding="utf-8").split("\n")
+            except (OSError, UnicodeDecodeError):
+                sources[path] = None
+        return sources[path]
+
+    def _slice_source(self, row: dict[str, Any], sources: dict[str, list[str] | None]) -> str:
+        """Return the source lines of a class or method node, or "" if unavailable."""
+        lines = self._read_source_lines(row["file_path"], sources)
+        if not lines or not row["start_line"]:
+            return ""
+        return "\n".join(lines[row["start_line"] - 1 : row["end_line"]])
+
     def find_similar_code(self, query: str, context_type: str = "all", limit: int = 10) -> list[dict[str, Any]]:
         """Find semantically similar code using vector search.
 
@@ -380,6 +733,10 @@ class SemanticCodeSearch:
         Returns:
             list of similar files with scores
         """
+        if "file" in self.local_indexes and file_path in self.local_indexes["file"]:
+            file_embedding = self.local_indexes["file"].get(file_path).tolist()
+            return self._search_files(file_embedding, limit, exclude_path=file_path)
+
         # Get the file's embedding from the database
         cypher = """
         MATCH (f:CodeFile {path: $path})
@@ -399,9 +756,14 @@ class SemanticCodeSearch:
         self, query_embedding: list[float], limit: int, exclude_path: str | None = None
     ) -> list[dict[str, Any]]:
         """Search for similar files using vector similarity."""
-        cypher = """
-        CALL db.index.vector.queryNodes('code_file_embeddings', $limit, $embedding)
-        YIELD node, score
+        # The local index fetches one extra neighbour so excluding the reference file still fills the limit
+        source, params = self._vector_source("file", "code_file_embeddings", query_embedding, limit + 1)
+        params["limit"] = limit
+        params["exclude_path"] = exclude_path
+
+        cypher = f"""
+        {source}
+        WITH node, score
         WHERE ($exclude_path IS NULL OR node.path <> $exclude_path)
         MATCH (node)-[:CONTAINS]->(element)
         OPTIONAL MATCH (node)-[:IMPORTS]->(dep:CodeFile)
@@ -417,12 +779,6 @@ class SemanticCodeSearch:
         LIMIT $limit
         """
 
-        params = {
-            "embedding": query_embedding,
-            "limit": limit,
-            "exclude_path": exclude_path,
-        }
-
         try:
             return self.client.execute_query(cypher, params)
         except Exception as e:
@@ -431,9 +787,9 @@ class SemanticCodeSearch:
 
     def _search_classes(self, query_embedding: list[float], limit: int) -> list[dict[str, Any]]:
         """Search for similar classes using vector similarity."""
-        cypher = """
-        CALL db.index.vector.queryNodes('class_embeddings', $limit, $embedding)
-        YIELD node, score
+        source, params = self._vector_source("class", "class_embeddings", query_embedding, limit)
+        cypher = f"""
+        {source}
         MATCH (f:CodeFile)-[:CONTAINS]->(node)
         OPTIONAL MATCH (node)-[:HAS_METHOD]->(m:Method)
         RETURN
@@ -447,8 +803,6 @@ class SemanticCodeSearch:
         LIMIT $limit
         """
 
-        params = {"embedding": query_embedding, "limit": limit}
-
         try:
             return self.client.execute_query(cypher, params)
         except Exception as e:
@@ -457,9 +811,9 @@ class SemanticCodeSearch:
 
     def _search_methods(self, query_embedding: list[float], limit: int) -> list[dict[str, Any]]:
         """Search for similar methods using vector similarity."""
-        cypher = """
-        CALL db.index.vector.queryNodes('method_embeddings', $limit, $embedding)
-        YIELD node, score
+        source, params = self._vector_source("method", "method_embeddings", query_embedding, limit)
+        cypher = f"""
+        {source}
         MATCH (f:CodeFile)-[:CONTAINS]->(node)
         OPTIONAL MATCH (c:Class)-[:HAS_METHOD]->(node)
         RETURN
@@ -474,8 +828,6 @@ class SemanticCodeSearch:
         LIMIT $limit
         """
 
-        params = {"embedding": query_embedding, "limit": limit}
-
         try:
             return self.client.execute_query(cypher, params)
         except Exception as e:
@@ -547,13 +899,14 @@ class SemanticCodeSearch:
 
 
 def get_embedding_system(
-    graph_client, model_name: str = "all-MiniLM-L6-v2"
+    graph_client, model_name: str = "all-MiniLM-L6-v2", local_index_dir: str | Path | None = None
 ) -> tuple[CodeEmbeddingGenerator | None, SemanticCodeSearch | None]:
     """Factory function to create embedding system components.
 
     Args:
         graph_client: Neo4j graph client
         model_name: Sentence transformer model name
+        local_index_dir: Optional directory for in-process ANN indexes
 
     Returns:
         tuple of (embedding_generator, semantic_search) or (None, None) if unavailable
@@ -565,6 +918,6 @@ def get_embedding_system(
         return None, None
 
     embedding_generator = CodeEmbeddingGenerator(model_name)
-    semantic_search = SemanticCodeSearch(graph_client, embedding_generator)
+    semantic_search = SemanticCodeSearch(graph_client, embedding_generator, local_index_dir)
 
     return embedding_generator, semantic_search
@@ -1,24 +1,32 @@
 """Code Intelligence Manager - Main coordinator for code intelligence system."""
 
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Self
 
 logger = logging.getLogger(__name__)
 
+# Number of analyzed files whose embeddings are generated in one batch
+EMBEDDING_BATCH_FILES = 32
+
 
 class CodeIntelligenceManager:
     """Main manager for code intelligence system."""
 
-    def __init__(self: Self, graph_client, embedder=None) -> None:
+    def __init__(self: Self, graph_client, embedder=None, semantic_search=None) -> None:
         """Initialize the code intelligence manager.
 
         Args:
             graph_client: Neo4j graph client
-            embedder: Optional sentence transformer for embeddings
+            embedder: Optional ``CodeEmbeddingGenerator``; when set, files, classes
+                and methods are embedded in batches before they are stored
+            semantic_search: Optional ``SemanticCodeSearch``; its local ANN indexes
+                are refreshed for every file stored or removed
         """
         self.client = graph_client
         self.embedder = embedder
+        self.semantic_search = semantic_search
 
         # Import here to avoid circular imports
         from .analyzer import CodeAnalyzer
@@ -46,50 +54,248 @@ class CodeIntelligenceManager:
             if not analysis:
                 return False
 
+            self._embed_analyses([analysis])
+
             # Store in Neo4j
-            return self._store_analysis(analysis)
+            stored = self._store_analysis(analysis)
+            self._sync_local_index([analysis["file"].path])
+            return stored
 
         except Exception as e:
             logger.error(f"Failed to analyze and store file {file_path}: {e}")
             return False
 
-    def analyze_and_store_directory(self: Self, directory_path: Path, recursive: bool = True) -> dict[str, Any]:
-        """Analyze all files in a directory and store results."""
+    def analyze_and_store_directory(
+        self: Self,
+        directory_path: Path,
+        recursive: bool = True,
+        incremental: bool = False,
+        workers: int = 1,
+    ) -> dict[str, Any]:
+        """Analyze all files in a directory and store results.
+
+        Results are stored as they stream back from the analyzer, so with
+        ``workers`` > 1 the Neo4j writes overlap with parsing.
+
+        Args:
+            directory_path: Directory to analyze
+            recursive: Whether to include subdirectories
+            incremental: Only re-analyze files whose content differs from the
+                stored ``CodeFile`` node, and delete nodes for removed files
+            workers: Number of analysis processes (``0`` uses every CPU)
+
+        Returns:
+            Run statistics, including unchanged/changed/added/removed counts
+            when ``incremental`` is set
+        """
         results = {
             "files_processed": 0,
             "files_successful": 0,
             "files_failed": 0,
+            "files_unchanged": 0,
+            "files_changed": 0,
+            "files_added": 0,
+            "files_removed": 0,
             "errors": [],
         }
 
+        # Files whose nodes were stored or deleted, for the local ANN indexes
+        index_paths: set[str] = set()
+
         try:
-            # Analyze directory
-            analyses = self.analyzer.analyze_directory(directory_path, recursive)
-            results["files_processed"] = len(analyses)
-
-            # Store each analysis
-            for analysis in analyses:
-                try:
-                    if self._store_analysis(analysis):
-                        results["files_successful"] += 1
-                    else:
-                        results["files_failed"] += 1
-                except Exception as e:
-                    results["files_failed"] += 1
-                    results["errors"].append(str(e))
+            if incremental:
+                plan = self._plan_incremental_run(directory_path, recursive)
+                results["files_unchanged"] = len(plan["unchanged"])
+                results["files_changed"] = len(plan["changed"])
+                results["files_added"] = len(plan["added"])
+                results["files_removed"] = len(plan["removed"])
+
+                # Drop stale classes/methods/imports before re-storing changed files
+                changed_paths = [self.analyzer._get_relative_path(path) for path in plan["changed"]]
+                self._delete_file_contents(changed_paths + plan["removed"])
+                self._delete_file_nodes(plan["removed"])
+                self._touch_file_nodes(plan["touched"])
+                index_paths.update(changed_paths + plan["removed"])
+
+                file_paths = plan["changed"] + plan["added"]
+            else:
+                file_paths = self.analyzer.collect_files(directory_path, recursive)
+
+            # Store analyses as they are ready, in groups when embeddings are batched
+            group_size = EMBEDDING_BATCH_FILES if self.embedder else 1
+            pending: list[dict[str, Any]] = []
+            for analysis in self.analyzer.iter_analyze_files(file_paths, workers):
+                pending.append(analysis)
+                index_paths.add(analysis["file"].path)
+                if len(pending) >= group_size:
+                    self._store_analyses(pending, results)
+                    pending = []
+            if pending:
+                self._store_analyses(pending, results)
 
             logger.info(
                 f"Processed {results['files_processed']} files, "
                 f"{results['files_successful']} successful, "
                 f"{results['files_failed']} failed"
             )
+            if incremental:
+                logger.info(
+                    f"Incremental run: {results['files_unchanged']} unchanged, "
+                    f"{results['files_changed']} changed, "
+                    f"{results['files_added']} added, "
+                    f"{results['files_removed']} removed"
+                )
 
         except Exception as e:
             logger.error(f"Failed to analyze directory {directory_path}: {e}")
             results["errors"].append(str(e))
 
+        self._sync_local_index(sorted(index_paths))
         return results
 
+    def _plan_incremental_run(self: Self, directory_path: Path, recursive: bool) -> dict[str, list[Any]]:
+        """Classify files on disk against the stored ``CodeFile`` nodes.
+
+        Files whose mtime and size match the stored values are treated as
+        unchanged without being read; otherwise the content hash decides.
+        Unchanged files with a new mtime are returned in ``touched`` so their
+        stored mtime can be refreshed.
+        """
+        stored = self._get_stored_file_manifest(directory_path)
+        plan: dict[str, list[Any]] = {"unchanged": [], "changed": [], "added": [], "removed": [], "touched": []}
+
+        for file_path in self.analyzer.collect_files(directory_path, recursive):
+            relative_path = self.analyzer._get_relative_path(file_path)
+            record = stored.pop(relative_path, None)
+            if record is None:
+                plan["added"].append(file_path)
+                continue
+
+            stat = file_path.stat()
+            last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+            if record.get("last_modified") == last_modified and record.get("size_bytes") == stat.st_size:
+                plan["unchanged"].append(file_path)
+                continue
+
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not read {file_path}: {e}")
+                plan["changed"].append(file_path)
+                continue
+
+            if self.analyzer.compute_content_hash(content) == record.get("content_hash"):
+                plan["unchanged"].append(file_path)
+                plan["touched"].append({"path": relative_path, "last_modified": last_modified})
+            else:
+                plan["changed"].append(file_path)
+
+        # Whatever is left in the manifest no longer exists on disk
+        directory = self.analyzer._get_relative_path(directory_path)
+        for path in stored:
+            if recursive or str(Path(path).parent) == directory:
+                plan["removed"].append(path)
+
+        return plan
+
+    def _get_stored_file_manifest(self: Self, directory_path: Path) -> dict[str, dict[str, Any]]:
+        """Fetch path, hash, mtime and size of stored files under a directory."""
+        directory = self.analyzer._get_relative_path(directory_path)
+        prefix = "" if directory == "." else directory.rstrip("/") + "/"
+
+        cypher = """
+        MATCH (f:CodeFile)
+        WHERE f.path STARTS WITH $prefix
+        RETURN f.path as path, f.content_hash as content_hash,
+               f.last_modified as last_modified, f.size_bytes as size_bytes
+        """
+        records = self.client.execute_query(cypher, {"prefix": prefix})
+        if prefix:
+            return {record["path"]: record for record in records}
+
+        # An empty prefix matches every stored file; files indexed from outside
+        # the working directory were stored with absolute paths and are not ours
+        return {
+            record["path"]: record
+            for record in records
+            if not Path(record["path"]).is_absolute() and Path(record["path"]).parts[:1] != ("..",)
+        }
+
+    def _delete_file_contents(self: Self, paths: list[str]) -> None:
+        """Delete class, method and import nodes belonging to the given files."""
+        if not paths:
+            return
+        for label in ("Class", "Method", "Import"):
+            cypher = f"""
+            MATCH (n:{label})
+            WHERE n.file_path IN $paths
+            DETACH DELETE n
+            """
+            self.client.execute_query(cypher, {"paths": paths})
+
+    def _delete_file_nodes(self: Self, paths: list[str]) -> None:
+        """Delete ``CodeFile`` nodes for files that no longer exist."""
+        if not paths:
+            return
+        cypher = """
+        MATCH (f:CodeFile)
+        WHERE f.path IN $paths
+        DETACH DELETE f
+        """
+        self.client.execute_query(cypher, {"paths": paths})
+
+    def _touch_file_nodes(self: Self, rows: list[dict[str, Any]]) -> None:
+        """Refresh the stored mtime of files whose content did not change."""
+        if not rows:
+            return
+        cypher = """
+        UNWIND $rows AS row
+        MATCH (f:CodeFile {path: row.path})
+        SET f.last_modified = row.last_modified
+        """
+        self.client.execute_query(cypher, {"rows": rows})
+
+    def _store_analyses(self: Self, analyses: list[dict[str, Any]], results: dict[str, Any]) -> None:
+        """Embed a group of analyses in one batch, then store each one."""
+        self._embed_analyses(analyses)
+
+        for analysis in analyses:
+            results["files_processed"] += 1
+            try:
+                if self._store_analysis(analysis):
+                    results["files_successful"] += 1
+                else:
+                    results["files_failed"] += 1
+            except Exception as e:
+                results["files_failed"] += 1
+                results["errors"].append(str(e))
+
+    def _embed_analyses(self: Self, analyses: list[dict[str, Any]]) -> None:
+        """Set embeddings on the file, class and method nodes of the given analyses."""
+        if not self.embedder or not analyses:
+            return
+
+        sources = []
+        for analysis in analyses:
+            try:
+                sources.append(Path(analysis["file"].path).read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError):
+                sources.append("")
+
+        try:
+            self.embedder.embed_analyses(analyses, sources)
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings: {e}")
+
+    def _sync_local_index(self: Self, paths: list[str]) -> None:
+        """Refresh the semantic search's local ANN indexes for stored or removed files."""
+        if not self.semantic_search or not paths:
+            return
+        try:
+            self.semantic_search.sync_local_index(paths)
+        except Exception as e:
+            logger.error(f"Failed to sync local vector index: {e}")
+
     def _store_analysis(self: Self, analysis: dict[str, Any]) -> bool:
         """Store analysis results in Neo4j."""
         try:
@@ -129,6 +335,7 @@ class CodeIntelligenceManager:
             f.content_hash = $content_hash,
             f.language = $language,
             f.size_bytes = $size_bytes,
+            f.embedding = coalesce($embedding, f.embedding),
             f.updated_at = datetime()
         """
 
@@ -141,6 +348,7 @@ class CodeIntelligenceManager:
             "content_hash": file_info.content_hash,
             "language": file_info.language,
             "size_bytes": file_info.size_bytes,
+            "embedding": file_info.embedding,
         }
 
         self.client.execute_query(cypher, params)
@@ -155,6 +363,7 @@ class CodeIntelligenceManager:
             c.complexity = $complexity,
             c.docstring = $docstring,
             c.inheritance = $inheritance,
+            c.embedding = coalesce($embedding, c.embedding),
             c.updated_at = datetime()
         """
 
@@ -167,6 +376,7 @@ class CodeIntelligenceManager:
             "complexity": class_info.complexity,
             "docstring": class_info.docstring,
             "inheritance": class_info.inheritance,
+            "embedding": class_info.embedding,
         }
 
         self.client.execute_query(cypher, params)
@@ -182,6 +392,7 @@ class CodeIntelligenceManager:
             m.return_type = $return_type,
             m.docstring = $docstring,
             m.is_async = $is_async,
+            m.embedding = coalesce($embedding, m.embedding),
             m.updated_at = datetime()
         """
 
@@ -196,6 +407,7 @@ class CodeIntelligenceManager:
             "return_type": method_info.return_type,
             "docstring": method_info.docstring,
             "is_async": method_info.is_async,
+            "embedding": method_info.embedding,
         }
 
         self.client.execute_query(cypher, params)
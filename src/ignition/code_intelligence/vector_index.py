@@ -0,0 +1,309 @@
+"""In-process approximate nearest neighbour index for Code Intelligence embeddings.
+
+``LocalVectorIndex`` is an IVF (inverted file) index over L2-normalised float32
+vectors, so inner product equals cosine similarity. Vectors are clustered
+around k-means centroids; a query scores the centroids, scans only the
+``n_probe`` closest inverted lists and returns the top-k keys. Small indexes
+(below ``train_threshold`` vectors) are searched exhaustively, which is already
+sub-millisecond at that size.
+
+The index supports incremental add/remove by string key, retrains itself when
+it has grown well past the size it was trained at, and persists to a single
+``.npz`` file.
+"""
+
+import logging
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVectorIndex:
+    """IVF cosine-similarity index keyed by string identifiers."""
+
+    def __init__(
+        self,
+        dimensions: int,
+        n_probe: int = 16,
+        train_threshold: int = 2048,
+        initial_capacity: int = 1024,
+        seed: int = 0,
+    ) -> None:
+        """Create an empty index.
+
+        Args:
+            dimensions: Embedding width
+            n_probe: Number of inverted lists scanned per query
+            train_threshold: Minimum number of vectors before clustering is used
+            initial_capacity: Rows preallocated for vectors
+            seed: Random seed for k-means initialisation
+        """
+        self.dimensions = dimensions
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self.seed = seed
+
+        self._vectors = np.zeros((max(initial_capacity, 1), dimensions), dtype=np.float32)
+        self._live = np.zeros(len(self._vectors), dtype=bool)
+        self._assignments = np.full(len(self._vectors), -1, dtype=np.int32)
+        self._keys: list[str | None] = []
+        self._rows: dict[str, int] = {}
+
+        self._centroids: np.ndarray | None = None
+        self._lists: list[list[int]] = []
+        self._list_arrays: list[np.ndarray | None] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def keys(self) -> list[str]:
+        return list(self._rows)
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the normalised vector stored for a key."""
+        row = self._rows.get(key)
+        return None if row is None else self._vectors[row].copy()
+
+    def add(self, keys: list[str], vectors: Any) -> None:
+        """Add or replace vectors for the given keys."""
+        if not keys:
+            return
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dimensions))
+
+        # Deduplicate within the batch (last occurrence wins, like repeated add calls)
+        latest = {key: i for i, key in enumerate(keys)}
+        existing = [(self._rows[key], i) for key, i in latest.items() if key in self._rows]
+        new = [(key, i) for key, i in latest.items() if key not in self._rows]
+
+        if existing:
+            rows = np.array([row for row, _ in existing])
+            self._vectors[rows] = vectors[[i for _, i in existing]]
+            if self.is_trained:
+                for row in rows:
+                    self._unassign(int(row))
+                self._assign(rows)
+
+        if new:
+            start = len(self._keys)
+            self._ensure_capacity(start + len(new))
+            rows = np.arange(start, start + len(new))
+            self._vectors[rows] = vectors[[i for _, i in new]]
+            self._live[rows] = True
+            for key, _ in new:
+                self._rows[key] = len(self._keys)
+                self._keys.append(key)
+            if self.is_trained:
+                self._assign(rows)
+
+        if (not self.is_trained and len(self) >= self.train_threshold) or (
+            self.is_trained and len(self) > 4 * self._trained_size
+        ):
+            self.train()
+
+    def remove(self, keys: list[str]) -> int:
+        """Remove vectors by key, returning the number removed."""
+        removed = 0
+        for key in keys:
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            self._keys[row] = None
+            self._live[row] = False
+            if self.is_trained:
+                self._unassign(row)
+            removed += 1
+
+        # Reclaim space once removed rows outnumber live ones
+        if removed and len(self._keys) - len(self) > len(self):
+            self._compact()
+        return removed
+
+    def remove_prefixes(self, prefixes: Iterable[str], separator: str = "::") -> int:
+        """Remove every key whose part before the first ``separator`` is in ``prefixes``.
+
+        Keys are scanned once, so clearing many prefixes costs O(keys).
+        """
+        prefixes = set(prefixes)
+        return self.remove([key for key in self._rows if key.split(separator, 1)[0] in prefixes])
+
+    def search(self, query: Any, k: int = 10) -> list[tuple[str, float]]:
+        """Return up to ``k`` (key, cosine similarity) pairs, best first."""
+        if not self._rows or k <= 0:
+            return []
+        query = _normalize(np.asarray(query, dtype=np.float32).reshape(1, self.dimensions))[0]
+
+        if self.is_trained:
+            centroid_scores = self._centroids @ query
+            n_probe = min(self.n_probe, len(self._centroids))
+            probe = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+            candidates = np.concatenate([self._list_array(int(list_id)) for list_id in probe])
+        else:
+            candidates = np.flatnonzero(self._live[: len(self._keys)])
+
+        if len(candidates) == 0:
+            return []
+
+        scores = self._vectors[candidates] @ query
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._keys[candidates[i]], float(scores[i])) for i in top]
+
+    def train(self, n_lists: int | None = None, iterations: int = 10, sample_size: int = 32768) -> None:
+        """Cluster the live vectors with spherical k-means and rebuild the inverted lists.
+
+        Args:
+            n_lists: Number of clusters (default ``2 * sqrt(n)``)
+            iterations: Lloyd iterations
+            sample_size: Maximum number of vectors used to fit the centroids
+        """
+        self._compact()
+        n = len(self)
+        if n == 0:
+            return
+
+        n_lists = n_lists or int(np.clip(2 * np.sqrt(n), 1, 4096))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(self.seed)
+
+        vectors = self._vectors[:n]
+        sample = vectors[rng.choice(n, size=min(sample_size, n), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            # Re-seed empty clusters from random samples
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+            centroids = _normalize(sums)
+
+        self._centroids = centroids.astype(np.float32)
+        self._lists = [[] for _ in range(n_lists)]
+        self._list_arrays = [None] * n_lists
+        self._assignments[:] = -1
+        self._assign(np.arange(n))
+        self._trained_size = n
+
+        logger.debug(f"Trained vector index: {n} vectors, {n_lists} lists")
+
+    def save(self, path: Path) -> None:
+        """Persist the index to ``path`` (written atomically)."""
+        self._compact()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        n = len(self)
+
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                keys=np.array(self._keys[:n], dtype=str),
+                vectors=self._vectors[:n],
+                assignments=self._assignments[:n],
+                centroids=self._centroids if self.is_trained else np.empty((0, self.dimensions), np.float32),
+                config=np.array([self.dimensions, self.n_probe, self.train_threshold, self.seed, self._trained_size]),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LocalVectorIndex":
+        """Load an index written by ``save``."""
+        with np.load(Path(path)) as data:
+            dimensions, n_probe, train_threshold, seed, trained_size = (int(v) for v in data["config"])
+            keys = data["keys"].tolist()
+            index = cls(dimensions, n_probe, train_threshold, max(len(keys), 1), seed)
+
+            n = len(keys)
+            index._vectors[:n] = data["vectors"]
+            index._live[:n] = True
+            index._keys = keys
+            index._rows = {key: row for row, key in enumerate(keys)}
+
+            if len(data["centroids"]):
+                index._centroids = data["centroids"].astype(np.float32)
+                index._assignments[:n] = data["assignments"]
+                index._lists = [[] for _ in range(len(index._centroids))]
+                index._list_arrays = [None] * len(index._centroids)
+                for row, list_id in enumerate(index._assignments[:n].tolist()):
+                    index._lists[list_id].append(row)
+                index._trained_size = trained_size
+
+        return index
+
+    def _assign(self, rows: np.ndarray) -> None:
+        """Assign rows to their nearest centroid's inverted list."""
+        for start in range(0, len(rows), 8192):
+            chunk = rows[start : start + 8192]
+            labels = np.argmax(self._vectors[chunk] @ self._centroids.T, axis=1)
+            self._assignments[chunk] = labels
+            for row, list_id in zip(chunk.tolist(), labels.tolist(), strict=True):
+                self._lists[list_id].append(row)
+                self._list_arrays[list_id] = None
+
+    def _unassign(self, row: int) -> None:
+        list_id = int(self._assignments[row])
+        if list_id >= 0:
+            self._lists[list_id].remove(row)
+            self._list_arrays[list_id] = None
+            self._assignments[row] = -1
+
+    def _list_array(self, list_id: int) -> np.ndarray:
+        array = self._list_arrays[list_id]
+        if array is None:
+            array = np.array(self._lists[list_id], dtype=np.int64)
+            self._list_arrays[list_id] = array
+        return array
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        grow = capacity - len(self._vectors)
+        self._vectors = np.concatenate([self._vectors, np.zeros((grow, self.dimensions), np.float32)])
+        self._live = np.concatenate([self._live, np.zeros(grow, dtype=bool)])
+        self._assignments = np.concatenate([self._assignments, np.full(grow, -1, dtype=np.int32)])
+
+    def _compact(self) -> None:
+        """Drop removed rows so live vectors occupy rows ``0..len-1``."""
+        if len(self._keys) == len(self):
+            return
+
+        live_rows = np.flatnonzero(self._live[: len(self._keys)])
+        n = len(live_rows)
+        self._vectors[:n] = self._vectors[live_rows]
+        self._assignments[:n] = self._assignments[live_rows]
+        self._live[:] = False
+        self._live[:n] = True
+        self._assignments[n:] = -1
+        self._keys = [self._keys[row] for row in live_rows.tolist()]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+
+        if self.is_trained:
+            self._lists = [[] for _ in range(len(self._centroids))]
+            self._list_arrays = [None] * len(self._centroids)
+            for row, list_id in enumerate(self._assignments[:n].tolist()):
+                self._lists[list_id].append(row)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
@@ -0,0 +1,379 @@
+"""Connection pooling for the Database Connection Manager.
+
+A ``ConnectionPool`` holds the physical connections for one database
+configuration. Connections are checked out exclusively, returned to the pool
+instead of being closed, retired after sitting idle for ``idle_timeout``
+(while keeping ``min_size`` open) and health checked on checkout when they
+have not been verified within ``health_check_interval``.
+
+Each pooled connection carries a ``StatementCache``: a small LRU of prepared
+statement handles keyed by SQL text, so a query that is repeated on the same
+connection is parsed and planned once.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LATENCY_SAMPLES = 1000
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def latency_summary(samples: Iterable[float]) -> dict[str, float]:
+    """Summarise latency samples in milliseconds with nearest-rank percentiles."""
+    ordered = sorted(samples)
+    summary: dict[str, float] = {"samples": len(ordered)}
+    for percentile in LATENCY_PERCENTILES:
+        rank = max(0, -(-percentile * len(ordered) // 100) - 1)
+        summary[f"p{percentile}"] = round(ordered[rank], 3) if ordered else 0.0
+    summary["max"] = round(ordered[-1], 3) if ordered else 0.0
+    return summary
+
+
+class StatementCache:
+    """LRU cache of prepared statement handles for a single connection."""
+
+    def __init__(
+        self,
+        max_size: int,
+        prepare: Callable[[str], Any],
+        release: Callable[[Any], None] | None = None,
+    ) -> None:
+        """Initialize the statement cache.
+
+        Args:
+            max_size: Maximum number of prepared statements kept on the connection
+            prepare: Prepares a statement and returns its handle
+            release: Frees a handle evicted from the cache
+        """
+        self.max_size = max_size
+        self._prepare = prepare
+        self._release = release
+        self._statements: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def get(self, query: str) -> Any:
+        """Return the prepared handle for ``query``, preparing it on a miss."""
+        if query in self._statements:
+            self.hits += 1
+            self._statements.move_to_end(query)
+            return self._statements[query]
+
+        self.misses += 1
+        handle = self._prepare(query)
+        if self.max_size <= 0:
+            return handle
+
+        self._statements[query] = handle
+        while len(self._statements) > self.max_size:
+            _, evicted = self._statements.popitem(last=False)
+            self.evictions += 1
+            if self._release is not None:
+                try:
+                    self._release(evicted)
+                except Exception as e:
+                    logger.warning(f"Failed to release prepared statement: {e}")
+        return handle
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache size and hit/miss counters."""
+        return {
+            "size": len(self._statements),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+@dataclass(eq=False)
+class PooledConnection:
+    """A physical connection owned by a ``ConnectionPool``."""
+
+    connection: Any
+    created_at: float
+    last_used: float
+    last_checked: float
+    statements: StatementCache | None = None
+    lease_id: str | None = None
+    queries: int = 0
+    broken: bool = False
+    checked_out_at: float | None = field(default=None, repr=False)
+
+
+class ConnectionPool:
+    """Thread-safe pool of connections for one database configuration."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        *,
+        min_size: int = 1,
+        max_size: int = 5,
+        idle_timeout: float = 300.0,
+        acquire_timeout: float = 30.0,
+        health_check: Callable[[Any], bool] | None = None,
+        health_check_interval: float = 30.0,
+        statement_cache_size: int = 0,
+        prepare_statement: Callable[[Any, str], Any] | None = None,
+        release_statement: Callable[[Any, Any], None] | None = None,
+    ) -> None:
+        """Initialize the pool without opening any connections.
+
+        Args:
+            name: Pool name, normally the configuration name
+            factory: Opens a new physical connection
+            min_size: Connections kept open even when idle
+            max_size: Upper bound on open connections
+            idle_timeout: Seconds an idle connection above ``min_size`` is kept
+            acquire_timeout: Default seconds to wait for a free connection
+            health_check: Returns True when a connection is still usable
+            health_check_interval: Seconds between health checks of a connection
+            statement_cache_size: Prepared statements cached per connection
+            prepare_statement: Prepares SQL on a connection and returns a handle
+            release_statement: Frees a prepared handle on a connection
+        """
+        if max_size < 1:
+            raise ValueError(f"Pool '{name}' needs max_size >= 1, got {max_size}")
+        if not 0 <= min_size <= max_size:
+            raise ValueError(f"Pool '{name}' needs 0 <= min_size <= max_size, got {min_size} > {max_size}")
+
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self.statement_cache_size = statement_cache_size
+
+        self._factory = factory
+        self._health_check = health_check
+        self._prepare_statement = prepare_statement
+        self._release_statement = release_statement
+
+        self._available = threading.Condition()
+        self._idle: deque[PooledConnection] = deque()
+        self._connections: list[PooledConnection] = []
+        self._size = 0
+        self._closed = False
+
+        self._created = 0
+        self._retired = 0
+        self._timeouts = 0
+        self._health_check_failures = 0
+        self._wait_ms: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._query_ms: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def fill(self) -> None:
+        """Open connections until the pool holds ``min_size``."""
+        while True:
+            with self._available:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                pooled = self._open()
+            except Exception:
+                with self._available:
+                    self._size -= 1
+                raise
+            self.release(pooled)
+
+    def acquire(self, timeout: float | None = None) -> PooledConnection:
+        """Check out a connection, waiting up to ``timeout`` seconds for one to free up.
+
+        Raises:
+            TimeoutError: If no connection became available in time
+            RuntimeError: If the pool has been closed
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        while True:
+            with self._available:
+                expired = self._evict_idle_locked()
+                while not self._closed and not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise TimeoutError(
+                            f"Timed out after {timeout:.1f}s waiting for a connection from pool '{self.name}'"
+                        )
+                    self._available.wait(remaining)
+                if self._closed:
+                    raise RuntimeError(f"Connection pool '{self.name}' is closed")
+
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    self._size += 1
+            self._close_all(expired)
+
+            if pooled is None:
+                try:
+                    pooled = self._open()
+                except Exception:
+                    with self._available:
+                        self._size -= 1
+                        self._available.notify()
+                    raise
+            elif not self._is_healthy(pooled):
+                self._discard(pooled)
+                continue
+
+            now = time.time()
+            pooled.checked_out_at = now
+            pooled.last_used = now
+            with self._available:
+                self._wait_ms.append((time.perf_counter() - start) * 1000)
+            return pooled
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """Return a checked-out connection, closing it if broken or the pool is closed."""
+        pooled.lease_id = None
+        pooled.checked_out_at = None
+        if discard or pooled.broken or self._closed:
+            self._discard(pooled)
+            return
+
+        pooled.last_used = time.time()
+        with self._available:
+            self._idle.append(pooled)
+            expired = self._evict_idle_locked()
+            self._available.notify()
+        self._close_all(expired)
+
+    def prune(self) -> int:
+        """Close connections idle for longer than ``idle_timeout``; return how many."""
+        with self._available:
+            expired = self._evict_idle_locked()
+        self._close_all(expired)
+        return len(expired)
+
+    def record_query(self, elapsed_ms: float) -> None:
+        """Record the latency of one query run on a pooled connection."""
+        with self._available:
+            self._query_ms.append(elapsed_ms)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out connections close when released."""
+        with self._available:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._available.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    @property
+    def connections(self) -> list[PooledConnection]:
+        """Snapshot of every open connection, idle or checked out."""
+        with self._available:
+            return list(self._connections)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Pool occupancy, lifecycle counters, wait and query latency percentiles."""
+        with self._available:
+            statements = [pooled.statements for pooled in self._connections if pooled.statements is not None]
+            return {
+                "name": self.name,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "created": self._created,
+                "retired": self._retired,
+                "timeouts": self._timeouts,
+                "health_check_failures": self._health_check_failures,
+                "statement_cache_hits": sum(cache.hits for cache in statements),
+                "statement_cache_misses": sum(cache.misses for cache in statements),
+                "wait_ms": latency_summary(self._wait_ms),
+                "query_ms": latency_summary(self._query_ms),
+            }
+
+    def _open(self) -> PooledConnection:
+        """Open a physical connection; the caller has already reserved its slot."""
+        connection = self._factory()
+        now = time.time()
+        statements = None
+        if self._prepare_statement is not None:
+            release = None
+            if self._release_statement is not None:
+
+                def release(handle: Any) -> None:
+                    self._release_statement(connection, handle)
+
+            statements = StatementCache(
+                self.statement_cache_size,
+                lambda query: self._prepare_statement(connection, query),
+                release,
+            )
+
+        pooled = PooledConnection(
+            connection=connection, created_at=now, last_used=now, last_checked=now, statements=statements
+        )
+        with self._available:
+            self._connections.append(pooled)
+            self._created += 1
+        logger.debug(f"Opened connection {self._created} for pool '{self.name}'")
+        return pooled
+
+    def _is_healthy(self, pooled: PooledConnection) -> bool:
+        """Run the health check when the connection has not been verified recently."""
+        now = time.time()
+        if self._health_check is None or now - pooled.last_checked < self.health_check_interval:
+            return True
+        try:
+            healthy = bool(self._health_check(pooled.connection))
+        except Exception as e:
+            logger.warning(f"Health check failed for pool '{self.name}': {e}")
+            healthy = False
+        pooled.last_checked = now
+        if not healthy:
+            with self._available:
+                self._health_check_failures += 1
+        return healthy
+
+    def _evict_idle_locked(self) -> list[PooledConnection]:
+        """Detach idle connections past ``idle_timeout``, oldest first, down to ``min_size``."""
+        expired = []
+        cutoff = time.time() - self.idle_timeout
+        while self._idle and self._size > self.min_size and self._idle[0].last_used <= cutoff:
+            pooled = self._idle.popleft()
+            self._connections.remove(pooled)
+            self._size -= 1
+            self._retired += 1
+            expired.append(pooled)
+        return expired
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        """Remove a connection from the pool and close it."""
+        with self._available:
+            if pooled in self._connections:
+                self._connections.remove(pooled)
+                self._size -= 1
+                self._retired += 1
+            self._available.notify()
+        self._close_all([pooled])
+
+    def _close_all(self, connections: list[PooledConnection]) -> None:
+        for pooled in connections:
+            try:
+                pooled.connection.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled connection for '{self.name}': {e}")
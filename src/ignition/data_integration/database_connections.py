@@ -14,27 +14,99 @@ Supported Databases:
 
 Security Features:
 - Environment variable-based configuration
-- Connection pooling and timeout management
+- Connection pooling (min/max size, idle timeout, health checks) and timeout management
+- Per-connection prepared statement cache and batched result streaming
 - SSL/TLS support
 - Credential encryption
 """
 
+import itertools
 import logging
 import os
+import re
 import sqlite3
+import threading
 import time
-from contextlib import contextmanager
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 from dotenv import load_dotenv
 
+from .connection_pool import ConnectionPool, PooledConnection
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FETCH_BATCH_SIZE = 1000
+
+# Quoted literals and identifiers, pyformat placeholders (``%(name)s`` / ``%s``) and escaped percent signs
+_PYFORMAT_PLACEHOLDER = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|%\((\w+)\)s|%s|%%")
+# Statements PostgreSQL accepts in PREPARE (and MySQL prepares without side effects)
+_PREPARABLE_STATEMENT = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|VALUES|WITH)\b", re.IGNORECASE)
+
+
+def _to_positional(query: str, placeholder: Callable[[int], str]) -> tuple[str, list[str | int]]:
+    """Rewrite pyformat placeholders as numbered ones, returning the parameter keys in order.
+
+    Placeholders inside quoted literals are left alone; only their escaped percent signs are unescaped.
+    """
+    keys: list[str | int] = []
+
+    def replace(match: re.Match[str]) -> str:
+        token = match.group(0)
+        if token[0] in "'\"":
+            return token.replace("%%", "%")
+        if token == "%%":
+            return "%"
+        keys.append(match.group(1) if match.group(1) is not None else len(keys))
+        return placeholder(len(keys))
+
+    return _PYFORMAT_PLACEHOLDER.sub(replace, query), keys
+
+
+def _bind(keys: list[str | int], params: Mapping[str, Any] | Sequence[Any] | None) -> list[Any]:
+    """Order parameter values to match the keys returned by ``_to_positional``."""
+    if not keys:
+        return []
+    if params is None:
+        raise ValueError(f"Query expects {len(keys)} parameters but none were given")
+    return [params[key] for key in keys]
+
+
+def _cached_statement(pooled: PooledConnection, query: str, params: Mapping[str, Any] | Sequence[Any] | None) -> Any:
+    """Return the prepared handle of a parameterised query; queries without parameters run as written."""
+    if pooled.statements is None or params is None:
+        return None
+    return pooled.statements.get(query)
+
+
+def _fetch_dicts(cursor: Any) -> list[dict[str, Any]]:
+    """Fetch every row of a DB-API cursor as dicts, or the affected row count."""
+    if not cursor.description:
+        return [{"affected_rows": cursor.rowcount}]
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
+
+
+def _fetch_batches(cursor: Any, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield the rows of a DB-API cursor as dicts, ``batch_size`` rows per ``fetchmany``."""
+    columns = None
+    while rows := cursor.fetchmany(batch_size):
+        if columns is None:
+            columns = [column[0] for column in cursor.description]
+        yield [dict(zip(columns, row, strict=False)) for row in rows]
+
+
+def _batched(rows: Iterable[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
 
 class DatabaseType(Enum):
     """Supported database types."""
@@ -64,6 +136,11 @@ class DatabaseConfig:
     connection_timeout: int = 30
     pool_size: int = 5
     additional_params: dict[str, Any] = None
+    min_pool_size: int = 1
+    idle_timeout: float = 300.0
+    pool_timeout: float = 30.0
+    health_check_interval: float = 30.0
+    statement_cache_size: int = 64
 
     def __post_init__(self) -> None:
         if self.additional_params is None:
@@ -95,6 +172,50 @@ class DatabaseConnectionManager:
         """Initialize the database connection manager."""
         self.connections: dict[str, Any] = {}
         self.configs: dict[str, DatabaseConfig] = {}
+        self.pools: dict[str, ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+        self._connection_ids = itertools.count(1)
+        self._statement_ids = itertools.count(1)
+
+        self._connectors: dict[DatabaseType, Callable[[DatabaseConfig], Any]] = {
+            DatabaseType.NEO4J: self._create_neo4j_connection,
+            DatabaseType.POSTGRESQL: self._create_postgresql_connection,
+            DatabaseType.SUPABASE: self._create_postgresql_connection,
+            DatabaseType.SQLSERVER: self._create_sqlserver_connection,
+            DatabaseType.MYSQL: self._create_mysql_connection,
+            DatabaseType.SQLITE: self._create_sqlite_connection,
+            DatabaseType.INFLUXDB: self._create_influxdb_connection,
+        }
+        self._executors: dict[DatabaseType, Callable[..., list[dict[str, Any]]]] = {
+            DatabaseType.NEO4J: self._execute_neo4j_query,
+            DatabaseType.POSTGRESQL: self._execute_postgresql_query,
+            DatabaseType.SUPABASE: self._execute_postgresql_query,
+            DatabaseType.SQLSERVER: self._execute_sqlserver_query,
+            DatabaseType.MYSQL: self._execute_mysql_query,
+            DatabaseType.SQLITE: self._execute_sqlite_query,
+            DatabaseType.INFLUXDB: self._execute_influxdb_query,
+        }
+        self._iterators: dict[DatabaseType, Callable[..., Iterator[list[dict[str, Any]]]]] = {
+            DatabaseType.NEO4J: self._iter_neo4j_query,
+            DatabaseType.POSTGRESQL: self._iter_postgresql_query,
+            DatabaseType.SUPABASE: self._iter_postgresql_query,
+            DatabaseType.SQLSERVER: self._iter_cursor_query,
+            DatabaseType.MYSQL: self._iter_cursor_query,
+            DatabaseType.SQLITE: self._iter_sqlite_query,
+            DatabaseType.INFLUXDB: self._iter_influxdb_query,
+        }
+        self._statement_handlers: dict[DatabaseType, tuple[Callable[..., Any], Callable[..., None] | None]] = {
+            DatabaseType.POSTGRESQL: (self._prepare_postgresql_statement, self._deallocate_postgresql_statement),
+            DatabaseType.SUPABASE: (self._prepare_postgresql_statement, self._deallocate_postgresql_statement),
+            DatabaseType.SQLSERVER: (self._prepare_sqlserver_statement, self._close_sqlserver_statement),
+            DatabaseType.MYSQL: (self._prepare_mysql_statement, self._close_mysql_statement),
+            DatabaseType.SQLITE: (self._prepare_sqlite_statement, None),
+        }
+        self._health_checks: dict[DatabaseType, Callable[[Any], bool]] = {
+            DatabaseType.NEO4J: self._check_neo4j_connection,
+            DatabaseType.INFLUXDB: self._check_influxdb_connection,
+        }
+
         self._load_default_configs()
 
     def _load_default_configs(self) -> None:
@@ -182,12 +303,18 @@ class DatabaseConnectionManager:
             )
 
     def add_config(self, config_name: str, config: DatabaseConfig) -> None:
-        """Add a new database configuration."""
+        """Add a new database configuration, closing the pool of any configuration it replaces."""
+        self.close_pool(config_name)
         self.configs[config_name] = config
         logger.info(f"Added database configuration: {config_name}")
 
-    def connect(self, config_name: str) -> ConnectionResult:
-        """Connect to a database using the specified configuration."""
+    def connect(self, config_name: str, timeout: float | None = None) -> ConnectionResult:
+        """Check out a pooled connection using the specified configuration.
+
+        The pool for the configuration is created on first use. The returned
+        ``connection_id`` identifies this checkout; pass it to ``execute_query`` or
+        ``iter_query`` and hand the connection back with ``disconnect``.
+        """
         if config_name not in self.configs:
             return ConnectionResult(
                 success=False,
@@ -203,18 +330,22 @@ class DatabaseConnectionManager:
         start_time = time.time()
 
         try:
-            connection = self._create_connection(config)
+            pool = self._get_pool(config_name)
+            pooled = pool.acquire(timeout)
             connection_time = (time.time() - start_time) * 1000
 
-            # Store the connection
-            connection_id = f"{config_name}_{int(time.time())}"
+            connection_id = f"{config_name}_{next(self._connection_ids)}"
+            pooled.lease_id = connection_id
             self.connections[connection_id] = {
-                "connection": connection,
+                "connection": pooled.connection,
+                "pooled": pooled,
+                "pool": pool,
                 "config": config,
-                "created_at": time.time(),
+                "config_name": config_name,
+                "created_at": pooled.created_at,
             }
 
-            logger.info(f"Successfully connected to {config.db_type.value} database: {config.host}")
+            logger.debug(f"Checked out {connection_id} from {config.db_type.value} pool for {config.host}")
 
             return ConnectionResult(
                 success=True,
@@ -226,6 +357,7 @@ class DatabaseConnectionManager:
                 metadata={
                     "config_name": config_name,
                     "pool_size": config.pool_size,
+                    "min_pool_size": pool.min_size,
                     "ssl_enabled": config.ssl_enabled,
                 },
             )
@@ -244,22 +376,46 @@ class DatabaseConnectionManager:
                 error_message=str(e),
             )
 
+    def _get_pool(self, config_name: str) -> ConnectionPool:
+        """Return the pool for a configuration, creating it and opening ``min_pool_size`` connections."""
+        with self._pools_lock:
+            pool = self.pools.get(config_name)
+            if pool is not None:
+                return pool
+
+            config = self.configs[config_name]
+            prepare, release = self._statement_handlers.get(config.db_type, (None, None))
+            if config.statement_cache_size <= 0:
+                prepare = release = None
+
+            pool = ConnectionPool(
+                config_name,
+                lambda: self._create_connection(config),
+                min_size=min(config.min_pool_size, config.pool_size),
+                max_size=config.pool_size,
+                idle_timeout=config.idle_timeout,
+                acquire_timeout=config.pool_timeout,
+                health_check=self._health_checks.get(config.db_type, self._check_dbapi_connection),
+                health_check_interval=config.health_check_interval,
+                statement_cache_size=config.statement_cache_size,
+                prepare_statement=prepare,
+                release_statement=release,
+            )
+            pool.fill()
+            self.pools[config_name] = pool
+
+        logger.info(
+            f"Created {config.db_type.value} connection pool '{config_name}' "
+            f"({pool.min_size}-{pool.max_size} connections) for {config.host}"
+        )
+        return pool
+
     def _create_connection(self, config: DatabaseConfig) -> Any:
         """Create a database connection based on the configuration type."""
-        if config.db_type == DatabaseType.NEO4J:
-            return self._create_neo4j_connection(config)
-        elif config.db_type in [DatabaseType.POSTGRESQL, DatabaseType.SUPABASE]:
-            return self._create_postgresql_connection(config)
-        elif config.db_type == DatabaseType.SQLSERVER:
-            return self._create_sqlserver_connection(config)
-        elif config.db_type == DatabaseType.MYSQL:
-            return self._create_mysql_connection(config)
-        elif config.db_type == DatabaseType.SQLITE:
-            return self._create_sqlite_connection(config)
-        elif config.db_type == DatabaseType.INFLUXDB:
-            return self._create_influxdb_connection(config)
-        else:
+        connector = self._connectors.get(config.db_type)
+        if connector is None:
             raise ValueError(f"Unsupported database type: {config.db_type}")
+        return connector(config)
 
     def _create_neo4j_connection(self, config: DatabaseConfig) -> Any:
         """Create Neo4j connection."""
@@ -289,7 +445,6 @@ class DatabaseConnectionManager:
         """Create PostgreSQL/Supabase connection."""
         try:
             import psycopg2
-            from psycopg2 import pool
 
             connection_params = {
                 "host": config.host,
@@ -303,10 +458,7 @@ class DatabaseConnectionManager:
             if config.ssl_enabled:
                 connection_params["sslmode"] = "require"
 
-            # Create connection pool
-            connection_pool = psycopg2.pool.ThreadedConnectionPool(1, config.pool_size, **connection_params)
-
-            return connection_pool
+            return psycopg2.connect(**connection_params)
 
         except ImportError:
             raise ImportError("PostgreSQL driver not installed. Install with: pip install psycopg2-binary") from None
@@ -338,11 +490,8 @@ class DatabaseConnectionManager:
         """Create MySQL connection."""
         try:
             import mysql.connector
-            from mysql.connector import pooling
 
-            pool_config = {
-                "pool_name": f"mysql_pool_{int(time.time())}",
-                "pool_size": config.pool_size,
+            connection_params = {
                 "host": config.host,
                 "port": config.port,
                 "database": config.database,
@@ -352,22 +501,24 @@ class DatabaseConnectionManager:
             }
 
             if config.ssl_enabled:
-                pool_config["ssl_disabled"] = False
+                connection_params["ssl_disabled"] = False
 
-            connection_pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
-            return connection_pool
+            return mysql.connector.connect(**connection_params)
 
         except ImportError:
             raise ImportError("MySQL driver not installed. Install with: pip install mysql-connector-python") from None
 
     def _create_sqlite_connection(self, config: DatabaseConfig) -> Any:
         """Create SQLite connection."""
-        import sqlite3
-
         # For SQLite, the 'host' parameter is treated as the file path
         db_path = config.host if config.host != "localhost" else config.database
 
-        connection = sqlite3.connect(db_path, timeout=config.connection_timeout, check_same_thread=False)
+        connection = sqlite3.connect(
+            db_path,
+            timeout=config.connection_timeout,
+            check_same_thread=False,
+            cached_statements=max(config.statement_cache_size, 0),
+        )
 
         return connection
 
@@ -395,118 +546,266 @@ class DatabaseConnectionManager:
         except ImportError:
             raise ImportError("InfluxDB client not installed. Install with: pip install influxdb-client") from None
 
+    def _check_dbapi_connection(self, connection: Any) -> bool:
+        """Health check for DB-API connections."""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            return True
+        finally:
+            cursor.close()
+
+    def _check_neo4j_connection(self, driver: Any) -> bool:
+        """Health check for Neo4j drivers."""
+        driver.verify_connectivity()
+        return True
+
+    def _check_influxdb_connection(self, client: Any) -> bool:
+        """Health check for InfluxDB clients."""
+        return bool(client.ping())
+
+    def _prepare_postgresql_statement(self, connection: Any, query: str) -> tuple[str, list[str | int]] | None:
+        """PREPARE a statement server-side, returning its name and parameter keys.
+
+        Queries the server cannot prepare (for example ``IN %(ids)s`` bound to a
+        tuple, which psycopg2 expands client-side) get a None handle and keep
+        running through ``cursor.execute``. Inside a transaction the PREPARE runs
+        under a savepoint so its failure does not abort the caller's transaction.
+        """
+        if not _PREPARABLE_STATEMENT.match(query):
+            return None
+
+        sql, keys = _to_positional(query, lambda position: f"${position}")
+        name = f"ign_stmt_{next(self._statement_ids)}"
+        in_transaction = not getattr(connection, "autocommit", False)
+        with connection.cursor() as cursor:
+            if in_transaction:
+                cursor.execute("SAVEPOINT ign_prepare")
+            try:
+                cursor.execute(f"PREPARE {name} AS {sql}")
+            except Exception as e:
+                if in_transaction:
+                    cursor.execute("ROLLBACK TO SAVEPOINT ign_prepare")
+                logger.debug(f"Running statement unprepared, PREPARE failed: {e}")
+                return None
+            if in_transaction:
+                cursor.execute("RELEASE SAVEPOINT ign_prepare")
+        return name, keys
+
+    def _deallocate_postgresql_statement(self, connection: Any, handle: tuple[str, list[str | int]] | None) -> None:
+        """DEALLOCATE a statement evicted from the cache."""
+        if handle is not None:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DEALLOCATE {handle[0]}")
+
+    def _prepare_mysql_statement(self, connection: Any, query: str) -> tuple[Any, str, list[str | int]] | None:
+        """Open a prepared cursor for a statement, returning it with the positional SQL and keys."""
+        if not _PREPARABLE_STATEMENT.match(query):
+            return None
+
+        sql, keys = _to_positional(query, lambda _position: "%s")
+        return connection.cursor(prepared=True), sql, keys
+
+    def _close_mysql_statement(self, _connection: Any, handle: tuple[Any, str, list[str | int]] | None) -> None:
+        """Close the prepared cursor of a statement evicted from the cache."""
+        if handle is not None:
+            handle[0].close()
+
+    def _prepare_sqlserver_statement(self, connection: Any, _query: str) -> Any:
+        """Open a cursor dedicated to one statement; pyodbc reuses its prepared plan on re-execution."""
+        return connection.cursor()
+
+    def _close_sqlserver_statement(self, _connection: Any, cursor: Any) -> None:
+        """Close the cursor of a statement evicted from the cache."""
+        cursor.close()
+
+    def _prepare_sqlite_statement(self, _connection: Any, query: str) -> str:
+        """SQLite compiles statements into the driver's own LRU, sized to ``statement_cache_size``."""
+        return query
+
     def execute_query(
         self, connection_id: str, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        """Execute a query on the specified connection."""
-        if connection_id not in self.connections:
-            raise ValueError(f"Connection '{connection_id}' not found")
+        """Execute a query on a checked-out connection and return every row.
+
+        Successful statements are committed and failed ones rolled back, so the
+        connection returns to its pool without an open transaction.
+        """
+        lease = self._get_lease(connection_id)
+        pooled, config = lease["pooled"], lease["config"]
+        executor = self._executors.get(config.db_type)
+        if executor is None:
+            raise ValueError(f"Query execution not supported for {config.db_type}")
+
+        start = time.perf_counter()
+        try:
+            results = executor(pooled, query, params)
+            self._commit(pooled)
+            return results
 
-        conn_info = self.connections[connection_id]
-        connection = conn_info["connection"]
-        config = conn_info["config"]
+        except Exception as e:
+            self._rollback(pooled)
+            logger.error(f"Query execution failed on {config.db_type}: {e}")
+            raise
 
+        finally:
+            pooled.queries += 1
+            lease["pool"].record_query((time.perf_counter() - start) * 1000)
+
+    def iter_query(
+        self,
+        connection_id: str,
+        query: str,
+        params: dict[str, Any] | None = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream the rows of a query as batches of at most ``batch_size`` dicts.
+
+        Rows are fetched from the driver one batch at a time (through a server-side
+        cursor on PostgreSQL) rather than materialised up front. The query latency
+        recorded for the pool is the time to the first batch.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        lease = self._get_lease(connection_id)
+        config = lease["config"]
+        iterate = self._iterators.get(config.db_type)
+        if iterate is None:
+            raise ValueError(f"Query streaming not supported for {config.db_type}")
+
+        return self._iterate_batches(lease, iterate, query, params, batch_size)
+
+    def _iterate_batches(
+        self,
+        lease: dict[str, Any],
+        iterate: Callable[..., Iterator[list[dict[str, Any]]]],
+        query: str,
+        params: dict[str, Any] | None,
+        batch_size: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        pooled, pool, config = lease["pooled"], lease["pool"], lease["config"]
+        start = time.perf_counter()
+        recorded = completed = False
         try:
-            if config.db_type == DatabaseType.NEO4J:
-                return self._execute_neo4j_query(connection, query, params)
-            elif config.db_type in [DatabaseType.POSTGRESQL, DatabaseType.SUPABASE]:
-                return self._execute_postgresql_query(connection, query, params)
-            elif config.db_type == DatabaseType.SQLSERVER:
-                return self._execute_sqlserver_query(connection, query, params)
-            elif config.db_type == DatabaseType.MYSQL:
-                return self._execute_mysql_query(connection, query, params)
-            elif config.db_type == DatabaseType.SQLITE:
-                return self._execute_sqlite_query(connection, query, params)
-            elif config.db_type == DatabaseType.INFLUXDB:
-                return self._execute_influxdb_query(connection, query, params)
-            else:
-                raise ValueError(f"Query execution not supported for {config.db_type}")
+            with closing(iterate(pooled, query, params, batch_size)) as batches:
+                for batch in batches:
+                    if not recorded:
+                        pool.record_query((time.perf_counter() - start) * 1000)
+                        recorded = True
+                    yield batch
+            self._commit(pooled)
+            completed = True
 
         except Exception as e:
-            logger.error(f"Query execution failed on {config.db_type}: {e}")
+            logger.error(f"Query streaming failed on {config.db_type}: {e}")
             raise
 
+        finally:
+            if not completed:
+                self._rollback(pooled)
+            if not recorded:
+                pool.record_query((time.perf_counter() - start) * 1000)
+            pooled.queries += 1
+
+    def _get_lease(self, connection_id: str) -> dict[str, Any]:
+        if connection_id not in self.connections:
+            raise ValueError(f"Connection '{connection_id}' not found")
+        return self.connections[connection_id]
+
+    def _commit(self, pooled: PooledConnection) -> None:
+        commit = getattr(pooled.connection, "commit", None)
+        if commit is not None:
+            commit()
+
+    def _rollback(self, pooled: PooledConnection) -> None:
+        """Roll back after a failure; a connection that cannot roll back is retired on release."""
+        rollback = getattr(pooled.connection, "rollback", None)
+        if rollback is None:
+            return
+        try:
+            rollback()
+        except Exception as e:
+            pooled.broken = True
+            logger.warning(f"Rollback failed, retiring connection: {e}")
+
     def _execute_neo4j_query(
-        self, driver: Any, query: str, params: dict[str, Any] | None = None
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
         """Execute Neo4j query."""
-        with driver.session() as session:
+        with pooled.connection.session() as session:
             result = session.run(query, params or {})
             return [record.data() for record in result]
 
     def _execute_postgresql_query(
-        self, pool: Any, query: str, params: dict[str, Any] | None = None
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        """Execute PostgreSQL query."""
-        connection = pool.getconn()
-        try:
-            with connection.cursor() as cursor:
+        """Execute PostgreSQL query through a cached server-side prepared statement."""
+        handle = _cached_statement(pooled, query, params)
+        with pooled.connection.cursor() as cursor:
+            if handle is None:
                 cursor.execute(query, params)
-                if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
-                    return [dict(zip(columns, row, strict=False)) for row in rows]
-                else:
-                    return [{"affected_rows": cursor.rowcount}]
-        finally:
-            pool.putconn(connection)
+            else:
+                name, keys = handle
+                values = _bind(keys, params)
+                arguments = f" ({', '.join(['%s'] * len(values))})" if values else ""
+                cursor.execute(f"EXECUTE {name}{arguments}", values)
+            return _fetch_dicts(cursor)
 
     def _execute_sqlserver_query(
-        self, connection: Any, query: str, params: dict[str, Any] | None = None
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        """Execute SQL Server query."""
-        cursor = connection.cursor()
+        """Execute SQL Server query on the statement's cached cursor."""
+        cursor = pooled.statements.get(query) if pooled.statements is not None else None
+        owned = cursor is None
+        if owned:
+            cursor = pooled.connection.cursor()
         try:
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-
-            if cursor.description:
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                return [dict(zip(columns, row, strict=False)) for row in rows]
-            else:
-                return [{"affected_rows": cursor.rowcount}]
+            return _fetch_dicts(cursor)
         finally:
-            cursor.close()
+            if owned:
+                cursor.close()
 
-    def _execute_mysql_query(self, pool: Any, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Execute MySQL query."""
-        connection = pool.get_connection()
+    def _execute_mysql_query(
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute MySQL query through a cached prepared cursor."""
+        handle = _cached_statement(pooled, query, params)
+        if handle is not None:
+            cursor, sql, keys = handle
+            cursor.execute(sql, tuple(_bind(keys, params)))
+            return _fetch_dicts(cursor)
+
+        cursor = pooled.connection.cursor()
         try:
-            cursor = connection.cursor(dictionary=True)
             cursor.execute(query, params)
-
-            if cursor.description:
-                return cursor.fetchall()
-            else:
-                return [{"affected_rows": cursor.rowcount}]
+            return _fetch_dicts(cursor)
         finally:
             cursor.close()
-            connection.close()
 
     def _execute_sqlite_query(
-        self, connection: Any, query: str, params: dict[str, Any] | None = None
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
         """Execute SQLite query."""
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
+        if pooled.statements is not None:
+            pooled.statements.get(query)
+        cursor = pooled.connection.execute(query, params or {})
         try:
-            cursor.execute(query, params or {})
-            if cursor.description:
-                return [dict(row) for row in cursor.fetchall()]
-            else:
-                return [{"affected_rows": cursor.rowcount}]
+            return _fetch_dicts(cursor)
         finally:
             cursor.close()
 
     def _execute_influxdb_query(
-        self, client: Any, query: str, params: dict[str, Any] | None = None
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        """Execute InfluxDB query."""
-        query_api = client.query_api()
-        tables = query_api.query(query)
+        """Execute InfluxDB Flux query, binding ``params`` as Flux parameters."""
+        query_api = pooled.connection.query_api()
+        tables = query_api.query(query, params=params)
 
         results = []
         for table in tables:
@@ -515,38 +814,80 @@ class DatabaseConnectionManager:
 
         return results
 
+    def _iter_neo4j_query(
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None, batch_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream Neo4j records, pulling ``batch_size`` records per fetch."""
+        with pooled.connection.session(fetch_size=batch_size) as session:
+            result = session.run(query, params or {})
+            yield from _batched((record.data() for record in result), batch_size)
+
+    def _iter_postgresql_query(
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None, batch_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream PostgreSQL rows through a named (server-side) cursor."""
+        with pooled.connection.cursor(name=f"ign_cursor_{next(self._statement_ids)}") as cursor:
+            cursor.itersize = batch_size
+            cursor.execute(query, params)
+            yield from _fetch_batches(cursor, batch_size)
+
+    def _iter_cursor_query(
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None, batch_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream rows from an unbuffered DB-API cursor (SQL Server, MySQL)."""
+        cursor = pooled.connection.cursor()
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            yield from _fetch_batches(cursor, batch_size)
+        finally:
+            cursor.close()
+
+    def _iter_sqlite_query(
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None, batch_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream SQLite rows with ``fetchmany``."""
+        cursor = pooled.connection.execute(query, params or {})
+        try:
+            yield from _fetch_batches(cursor, batch_size)
+        finally:
+            cursor.close()
+
+    def _iter_influxdb_query(
+        self, pooled: PooledConnection, query: str, params: dict[str, Any] | None, batch_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream InfluxDB records from the query stream API, binding ``params`` as Flux parameters."""
+        records = pooled.connection.query_api().query_stream(query, params=params)
+        yield from _batched((record.values for record in records), batch_size)
+
     def disconnect(self, connection_id: str) -> bool:
-        """Disconnect from a database."""
-        if connection_id not in self.connections:
+        """Return a checked-out connection to its pool."""
+        lease = self.connections.pop(connection_id, None)
+        if lease is None:
             return False
 
-        try:
-            conn_info = self.connections[connection_id]
-            connection = conn_info["connection"]
-            config = conn_info["config"]
-
-            if config.db_type == DatabaseType.NEO4J:
-                connection.close()
-            elif config.db_type in [DatabaseType.POSTGRESQL, DatabaseType.SUPABASE]:
-                connection.closeall()
-            elif config.db_type == DatabaseType.SQLSERVER:
-                connection.close()
-            elif config.db_type == DatabaseType.MYSQL:
-                # MySQL connection pool doesn't need explicit closing
-                pass
-            elif config.db_type == DatabaseType.SQLITE or config.db_type == DatabaseType.INFLUXDB:
-                connection.close()
-
-            del self.connections[connection_id]
-            logger.info(f"Disconnected from {config.db_type.value} database")
-            return True
+        lease["pool"].release(lease["pooled"])
+        logger.debug(f"Returned {connection_id} to the {lease['config'].db_type.value} pool")
+        return True
 
-        except Exception as e:
-            logger.error(f"Error disconnecting: {e}")
+    def close_pool(self, config_name: str) -> bool:
+        """Close a configuration's pool, returning its checkouts and closing every connection."""
+        with self._pools_lock:
+            pool = self.pools.pop(config_name, None)
+        if pool is None:
             return False
 
+        for connection_id, lease in list(self.connections.items()):
+            if lease["pool"] is pool:
+                self.disconnect(connection_id)
+        pool.close()
+        logger.info(f"Closed connection pool '{config_name}'")
+        return True
+
     def disconnect_all(self) -> int:
-        """Disconnect from all databases."""
+        """Return every checked-out connection and close all pools."""
         connection_ids = list(self.connections.keys())
         disconnected_count = 0
 
@@ -554,32 +895,53 @@ class DatabaseConnectionManager:
             if self.disconnect(connection_id):
                 disconnected_count += 1
 
+        for config_name in list(self.pools):
+            self.close_pool(config_name)
+
         return disconnected_count
 
     def get_connection_info(self, connection_id: str) -> dict[str, Any] | None:
-        """Get information about a specific connection."""
+        """Get information about a checked-out connection."""
         if connection_id not in self.connections:
             return None
 
-        conn_info = self.connections[connection_id]
-        config = conn_info["config"]
+        lease = self.connections[connection_id]
+        return self._describe_connection(lease["config_name"], lease["pooled"], lease["pool"].stats)
+
+    def list_connections(self) -> list[dict[str, Any]]:
+        """List every pooled connection, idle or checked out, with its pool's wait and query latencies."""
+        connections = []
+        for config_name, pool in list(self.pools.items()):
+            stats = pool.stats
+            for pooled in pool.connections:
+                connections.append(self._describe_connection(config_name, pooled, stats))
+        return connections
+
+    def _describe_connection(
+        self, config_name: str, pooled: PooledConnection, pool_stats: dict[str, Any]
+    ) -> dict[str, Any]:
+        config = self.configs[config_name]
+        now = time.time()
+        in_use = pooled.lease_id is not None
 
         return {
-            "connection_id": connection_id,
+            "connection_id": pooled.lease_id,
+            "config_name": config_name,
             "db_type": config.db_type.value,
             "host": config.host,
             "port": config.port,
             "database": config.database,
             "username": config.username,
             "ssl_enabled": config.ssl_enabled,
-            "created_at": conn_info["created_at"],
-            "age_seconds": time.time() - conn_info["created_at"],
+            "created_at": pooled.created_at,
+            "age_seconds": now - pooled.created_at,
+            "state": "in_use" if in_use else "idle",
+            "idle_seconds": 0.0 if in_use else now - pooled.last_used,
+            "queries": pooled.queries,
+            "statement_cache": pooled.statements.stats if pooled.statements is not None else None,
+            "pool": pool_stats,
         }
 
-    def list_connections(self) -> list[dict[str, Any]]:
-        """List all active connections."""
-        return [self.get_connection_info(conn_id) for conn_id in self.connections]
-
     def list_configurations(self) -> list[str]:
         """List all available database configurations."""
         return list(self.configs.keys())
@@ -599,6 +961,7 @@ class DatabaseConnectionManager:
             "username": config.username,
             "ssl_enabled": config.ssl_enabled,
             "pool_size": config.pool_size,
+            "min_pool_size": config.min_pool_size,
         }
 
     def test_connection(self, config_name: str) -> dict[str, Any]:
@@ -618,16 +981,7 @@ class DatabaseConnectionManager:
             connection_time = (time.time() - start_time) * 1000
 
             # Close the test connection immediately
-            if config.db_type == DatabaseType.NEO4J:
-                connection.close()
-            elif config.db_type in [DatabaseType.POSTGRESQL, DatabaseType.SUPABASE]:
-                connection.closeall()
-            elif (
-                config.db_type == DatabaseType.SQLSERVER
-                or config.db_type == DatabaseType.SQLITE
-                or config.db_type == DatabaseType.INFLUXDB
-            ):
-                connection.close()
+            connection.close()
 
             return {
                 "success": True,
@@ -646,9 +1000,13 @@ class DatabaseConnectionManager:
             }
 
     @contextmanager
-    def get_connection(self, config_name: str) -> None:
-        """Context manager for database connections."""
-        result = self.connect(config_name)
+    def get_connection(self, config_name: str, timeout: float | None = None) -> Iterator[str]:
+        """Check a pooled connection out for the duration of a ``with`` block.
+
+        Yields the connection id to pass to ``execute_query`` or ``iter_query``; the
+        connection goes back to the pool when the block exits.
+        """
+        result = self.connect(config_name, timeout)
         if not result.success:
             raise RuntimeError(f"Failed to connect: {result.error_message}")
 
@@ -70,14 +70,19 @@ class TimeRange:
         if historian_type == HistorianType.INFLUXDB:
             return f"time >= '{self.start_time.isoformat()}' AND time <= '{self.end_time.isoformat()}'"
         elif historian_type == HistorianType.TIMESCALEDB:
-            return f"timestamp >= '{self.start_time.isoformat()}' AND timestamp <= '{self.end_time.isoformat()}'"
+            # Fixed microsecond precision so bounds compare like stored text timestamps
+            start = self.start_time.isoformat(timespec="microseconds")
+            end = self.end_time.isoformat(timespec="microseconds")
+            return f"timestamp >= '{start}' AND timestamp <= '{end}'"
         elif historian_type == HistorianType.IGNITION_HISTORIAN:
             # Ignition uses milliseconds since epoch
             start_ms = int(self.start_time.timestamp() * 1000)
             end_ms = int(self.end_time.timestamp() * 1000)
             return f"t_stamp >= {start_ms} AND t_stamp <= {end_ms}"
         else:
-            return f"timestamp >= '{self.start_time.isoformat()}' AND timestamp <= '{self.end_time.isoformat()}'"
+            start = self.start_time.isoformat(timespec="microseconds")
+            end = self.end_time.isoformat(timespec="microseconds")
+            return f"timestamp >= '{start}' AND timestamp <= '{end}'"
 
     def duration_hours(self) -> float:
         """Get duration in hours."""
@@ -4,15 +4,31 @@
 This module provides comprehensive backup and restore functionality for the Neo4j
 learning system database, including automated backup creation, restoration for
 new installations, and lifecycle management.
+
+Backups are written as gzip-compressed JSON Lines: a metadata header record
+followed by one record per node and per relationship. Extraction pages through
+the database with elementId cursors and restore replays the file with batched
+``UNWIND`` writes, so memory use stays flat regardless of graph size. Legacy
+single-document ``.json`` backups can still be listed and restored.
 """
 
+import gzip
 import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from src.ignition.graph.client import IgnitionGraphClient
 
+BACKUP_FORMAT_VERSION = "2.0.0"
+
+# Temporary label/property used to resolve relationship endpoints during restore
+IMPORT_LABEL = "_BackupImport"
+IMPORT_ID_PROPERTY = "_import_id"
+IMPORT_INDEX_NAME = "backup_import_id"
+
 
 class Neo4jBackupManager:
     """Manages Neo4j database backups for the IGN Scripts learning system."""
@@ -29,8 +45,11 @@ class Neo4jBackupManager:
 
         # Configuration
         self.max_backups = 1  # Only keep the most recent backup
-        self.backup_file_pattern = "ign_scripts_db_backup_{timestamp}.json"
+        self.backup_file_pattern = "ign_scripts_db_backup_{timestamp}.jsonl.gz"
+        self.backup_glob_patterns = ["ign_scripts_db_backup_*.jsonl.gz", "ign_scripts_db_backup_*.json"]
         self.metadata_file = "backup_metadata.json"
+        self.page_size = 5000  # Records fetched per extraction query
+        self.batch_size = 1000  # Rows per UNWIND transaction during restore
 
     def create_full_backup(self, reason: str = "Manual backup") -> tuple[bool, str]:
         """Create a full database backup.
@@ -52,26 +71,41 @@ class Neo4jBackupManager:
             if not self.client.is_connected and not self.client.connect():
                 return False, "Failed to connect to Neo4j database"
 
-            # Extract all data from the database
-            backup_data = self._extract_database_data()
+            statistics = self._get_database_statistics()
 
             # Create metadata
             metadata = {
                 "timestamp": timestamp,
                 "datetime": datetime.now().isoformat(),
                 "reason": reason,
-                "node_count": backup_data.get("statistics", {}).get("node_count", 0),
-                "relationship_count": backup_data.get("statistics", {}).get("relationship_count", 0),
-                "version": "1.0.0",
+                "node_count": statistics.get("node_count", 0),
+                "relationship_count": statistics.get("relationship_count", 0),
+                "version": BACKUP_FORMAT_VERSION,
                 "backup_type": "full",
+                "format": "jsonl.gz",
                 "source": "IGN Scripts Learning System",
             }
 
-            # Save backup data
-            backup_content = {"metadata": metadata, "data": backup_data}
+            # Stream records to a partial file and only publish it once complete
+            partial_path = backup_path.with_name(backup_path.name + ".partial")
+            counts = {"node": 0, "relationship": 0}
+            try:
+                with gzip.open(partial_path, "wt", encoding="utf-8") as f:
+                    header = {"kind": "metadata", "metadata": metadata, "statistics": statistics}
+                    f.write(json.dumps(header, default=str) + "\n")
+
+                    for record in self._extract_database_data():
+                        f.write(json.dumps(record, default=str) + "\n")
+                        counts[record["kind"]] += 1
+            except Exception:
+                partial_path.unlink(missing_ok=True)
+                raise
+
+            partial_path.replace(backup_path)
 
-            with open(backup_path, "w", encoding="utf-8") as f:
-                json.dump(backup_content, f, indent=2, default=str)
+            metadata["node_count"] = counts["node"]
+            metadata["relationship_count"] = counts["relationship"]
+            print(f"Extracted {counts['node']} nodes and {counts['relationship']} relationships")
 
             # Update backup metadata file
             self._update_backup_metadata(backup_filename, metadata)
@@ -109,12 +143,7 @@ class Neo4jBackupManager:
 
             print(f"Restoring from backup: {backup_file}")
 
-            # Load backup data
-            with open(backup_path, encoding="utf-8") as f:
-                backup_content = json.load(f)
-
-            metadata = backup_content.get("metadata", {})
-            data = backup_content.get("data", {})
+            metadata = self._read_backup_header(backup_path).get("metadata", {})
 
             print(f"Backup info: {metadata.get('datetime')} - {metadata.get('reason')}")
             print(f"Data: {metadata.get('node_count', 0)} nodes, {metadata.get('relationship_count', 0)} relationships")
@@ -127,7 +156,7 @@ class Neo4jBackupManager:
             self._clear_database()
 
             # Restore data
-            success = self._restore_database_data(data)
+            success = self._restore_database_data(self._iter_backup_records(backup_path))
 
             if success:
                 print("✅ Database restored successfully")
@@ -183,17 +212,15 @@ class Neo4jBackupManager:
                 print(f"❌ Failed to read backup metadata: {e}")
 
         # Also scan directory for backup files
-        for backup_file in self.backup_dir.glob("ign_scripts_db_backup_*.json"):
+        for backup_file in self._iter_backup_files():
             filename = backup_file.name
             # Check if already in metadata
             if not any(b.get("filename") == filename for b in backups):
                 try:
-                    with open(backup_file, encoding="utf-8") as f:
-                        content = json.load(f)
-                        metadata = content.get("metadata", {})
-                        metadata["filename"] = filename
-                        metadata["file_size"] = backup_file.stat().st_size
-                        backups.append(metadata)
+                    metadata = self._read_backup_header(backup_file).get("metadata", {})
+                    metadata["filename"] = filename
+                    metadata["file_size"] = backup_file.stat().st_size
+                    backups.append(metadata)
                 except Exception:
                     pass
 
@@ -215,10 +242,7 @@ class Neo4jBackupManager:
             if not backup_path.exists():
                 return None
 
-            with open(backup_path, encoding="utf-8") as f:
-                content = json.load(f)
-
-            info = content.get("metadata", {})
+            info = self._read_backup_header(backup_path).get("metadata", {})
             info["filename"] = backup_file
             info["file_size"] = backup_path.stat().st_size
             info["file_path"] = str(backup_path)
@@ -229,119 +253,197 @@ class Neo4jBackupManager:
             print(f"❌ Failed to get backup info: {e}")
             return None
 
-    def _extract_database_data(self) -> dict[str, Any]:
-        """Extract all data from the Neo4j database."""
-        data: dict[str, Any] = {"nodes": [], "relationships": [], "statistics": {}}
-
-        try:
-            # Extract all nodes
-            node_query = """
-            MATCH (n)
-            RETURN n, labels(n) as labels, elementId(n) as node_id
-            """
-            nodes_result = self.client.execute_query(node_query)
-
-            for record in nodes_result:
-                # Extract node properties - node is already a dictionary
-                node = record["n"]
-                node_data = node.copy() if isinstance(node, dict) else {}
-                node_data["_labels"] = record["labels"]
-                node_data["_id"] = record["node_id"]
-                data["nodes"].append(node_data)
-
-            # Extract all relationships
-            rel_query = """
-            MATCH (a)-[r]->(b)
-            RETURN r, type(r) as rel_type, elementId(r) as rel_id,
-                   elementId(a) as start_id, elementId(b) as end_id
-            """
-            rels_result = self.client.execute_query(rel_query)
-
-            for record in rels_result:
-                # Extract relationship properties - relationship is already a dictionary
-                rel = record["r"]
-                rel_data = rel.copy() if isinstance(rel, dict) else {}
-                rel_data["_type"] = record["rel_type"]
-                rel_data["_id"] = record["rel_id"]
-                rel_data["_start_id"] = record["start_id"]
-                rel_data["_end_id"] = record["end_id"]
-                data["relationships"].append(rel_data)
+    def _extract_database_data(self) -> Iterator[dict[str, Any]]:
+        """Stream all nodes, then all relationships, as backup records.
 
-            # Get statistics
-            data["statistics"] = self._get_database_statistics()
+        Each query fetches at most ``page_size`` records, resuming after the
+        last elementId seen, so only one page is ever held in memory.
+        """
+        node_query = """
+        MATCH (n)
+        WHERE $cursor IS NULL OR elementId(n) > $cursor
+        WITH n ORDER BY elementId(n) LIMIT $limit
+        RETURN elementId(n) AS node_id, labels(n) AS labels, properties(n) AS props
+        """
+        rel_query = """
+        MATCH (a)-[r]->(b)
+        WHERE $cursor IS NULL OR elementId(r) > $cursor
+        WITH a, r, b ORDER BY elementId(r) LIMIT $limit
+        RETURN elementId(r) AS rel_id, type(r) AS rel_type, properties(r) AS props,
+               elementId(a) AS start_id, elementId(b) AS end_id
+        """
 
-            print(f"Extracted {len(data['nodes'])} nodes and {len(data['relationships'])} relationships")
+        try:
+            for record in self._paged_query(node_query, "node_id"):
+                yield {
+                    "kind": "node",
+                    "id": record["node_id"],
+                    "labels": record["labels"],
+                    "properties": record["props"],
+                }
+
+            for record in self._paged_query(rel_query, "rel_id"):
+                yield {
+                    "kind": "relationship",
+                    "id": record["rel_id"],
+                    "type": record["rel_type"],
+                    "start_id": record["start_id"],
+                    "end_id": record["end_id"],
+                    "properties": record["props"],
+                }
 
         except Exception as e:
             print(f"❌ Failed to extract database data: {e}")
             raise
 
-        return data
-
-    def _restore_database_data(self, data: dict[str, Any]) -> bool:
-        """Restore data to the Neo4j database."""
+    def _paged_query(self, query: str, cursor_key: str) -> Iterator[dict[str, Any]]:
+        """Run a keyset-paginated query until it returns a short page."""
+        cursor = None
+        while True:
+            page = self.client.execute_query(query, {"cursor": cursor, "limit": self.page_size})
+            yield from page
+            if len(page) < self.page_size:
+                return
+            cursor = page[-1][cursor_key]
+
+    def _restore_database_data(self, records: Iterable[dict[str, Any]]) -> bool:
+        """Restore streamed backup records into the Neo4j database."""
         try:
-            # Create nodes first
-            nodes = data.get("nodes", [])
-            node_id_mapping = {}  # Map old IDs to new nodes
-
-            print(f"Restoring {len(nodes)} nodes...")
-            for node_data in nodes:
-                old_id = node_data.pop("_id", None)
-                labels = node_data.pop("_labels", [])
-
-                # Create node with labels
-                labels_str = ":".join(labels) if labels else "Node"
-                create_query = f"CREATE (n:{labels_str} $props) RETURN elementId(n) as new_id"
-
-                result = self.client.execute_query(create_query, {"props": node_data})
-                if result:
-                    new_id = result[0]["new_id"]
-                    node_id_mapping[old_id] = new_id
-
-            # Create relationships
-            relationships = data.get("relationships", [])
-            print(f"Restoring {len(relationships)} relationships...")
-
-            for rel_data in relationships:
-                old_start_id = rel_data.pop("_start_id", None)
-                old_end_id = rel_data.pop("_end_id", None)
-                rel_type = rel_data.pop("_type", "RELATED")
-                rel_data.pop("_id", None)  # Remove old relationship ID
-
-                # Map to new node IDs
-                new_start_id = node_id_mapping.get(old_start_id)
-                new_end_id = node_id_mapping.get(old_end_id)
-
-                if new_start_id is not None and new_end_id is not None:
-                    create_rel_query = f"""
-                    MATCH (a), (b)
-                    WHERE elementId(a) = $start_id AND elementId(b) = $end_id
-                    CREATE (a)-[r:{rel_type}]->(b)
-                    SET r = $props
-                    """
-
-                    self.client.execute_query(
-                        create_rel_query,
-                        {
-                            "start_id": new_start_id,
-                            "end_id": new_end_id,
-                            "props": rel_data,
-                        },
-                    )
-
-            print("✅ Database data restored successfully")
+            nodes, relationships, _ = self._restore_records(records, preserve_labels=[], merge=False)
+            print(f"✅ Database data restored successfully: {nodes} nodes, {relationships} relationships")
             return True
 
         except Exception as e:
             print(f"❌ Failed to restore database data: {e}")
             return False
 
+    def _restore_records(
+        self, records: Iterable[dict[str, Any]], preserve_labels: list[str], merge: bool
+    ) -> tuple[int, int, int]:
+        """Replay backup records with batched UNWIND writes.
+
+        Restored nodes carry a temporary label and import-id property, indexed
+        for the duration of the restore, so relationship endpoints resolve with
+        an index lookup instead of a scan. Nodes with a preserved label are
+        skipped, which also skips any relationship touching them. A failed
+        batch raises, so a partial restore is never reported as complete.
+
+        Args:
+            records: Backup records (header records are ignored)
+            preserve_labels: Labels whose nodes must not be restored
+            merge: MERGE named nodes and relationships instead of CREATE
+
+        Returns:
+            tuple of (nodes_restored, relationships_restored, nodes_preserved)
+        """
+        preserved = set(preserve_labels)
+        node_buffers: dict[tuple[tuple[str, ...], bool], list[dict[str, Any]]] = defaultdict(list)
+        rel_buffers: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        counts = {"node": 0, "relationship": 0, "preserved": 0}
+
+        self.client.execute_write_query(
+            f"CREATE INDEX {IMPORT_INDEX_NAME} IF NOT EXISTS FOR (n:{IMPORT_LABEL}) ON (n.{IMPORT_ID_PROPERTY})"
+        )
+        self.client.execute_query("CALL db.awaitIndexes()")
+
+        try:
+            print("Restoring nodes and relationships...")
+            for record in records:
+                kind = record.get("kind")
+                if kind == "node":
+                    labels = tuple(record.get("labels") or ())
+                    if preserved.intersection(labels):
+                        counts["preserved"] += 1
+                        continue
+                    props = record.get("properties") or {}
+                    # Unlabelled nodes are recreated without a label, so there is nothing to merge on
+                    key = (labels, merge and bool(labels) and "name" in props)
+                    node_buffers[key].append({"id": record["id"], "props": props})
+                    if len(node_buffers[key]) >= self.batch_size:
+                        counts["node"] += self._write_node_batch(*key, node_buffers.pop(key))
+
+                elif kind == "relationship":
+                    # All nodes precede relationships in a backup, so flush them first
+                    for key in list(node_buffers):
+                        counts["node"] += self._write_node_batch(*key, node_buffers.pop(key))
+                    rel_type = record.get("type") or "RELATED"
+                    rel_buffers[rel_type].append(
+                        {
+                            "start_id": record["start_id"],
+                            "end_id": record["end_id"],
+                            "props": record.get("properties") or {},
+                        }
+                    )
+                    if len(rel_buffers[rel_type]) >= self.batch_size:
+                        counts["relationship"] += self._write_relationship_batch(
+                            rel_type, rel_buffers.pop(rel_type), merge
+                        )
+
+            for key in list(node_buffers):
+                counts["node"] += self._write_node_batch(*key, node_buffers.pop(key))
+            for rel_type in list(rel_buffers):
+                counts["relationship"] += self._write_relationship_batch(rel_type, rel_buffers.pop(rel_type), merge)
+
+        finally:
+            self._remove_import_markers()
+
+        return counts["node"], counts["relationship"], counts["preserved"]
+
+    def _write_node_batch(self, labels: tuple[str, ...], merge_on_name: bool, rows: list[dict[str, Any]]) -> int:
+        """Write one batch of nodes sharing the same label set, raising if it fails."""
+        labels_str = "".join(f":{_quote_identifier(label)}" for label in labels)
+        write_clause = f"MERGE (n{labels_str} {{name: row.props.name}})" if merge_on_name else f"CREATE (n{labels_str})"
+
+        query = f"""
+        UNWIND $rows AS row
+        {write_clause}
+        SET n = row.props
+        SET n:{IMPORT_LABEL}, n.{IMPORT_ID_PROPERTY} = row.id
+        """
+        return self.client.execute_write_batches(query, rows, self.batch_size, raise_on_error=True)
+
+    def _write_relationship_batch(self, rel_type: str, rows: list[dict[str, Any]], merge: bool) -> int:
+        """Write one batch of relationships of the same type, returning how many found both endpoints."""
+        write_clause = "MERGE" if merge else "CREATE"
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (a:{IMPORT_LABEL} {{{IMPORT_ID_PROPERTY}: row.start_id}})
+        MATCH (b:{IMPORT_LABEL} {{{IMPORT_ID_PROPERTY}: row.end_id}})
+        {write_clause} (a)-[r:{_quote_identifier(rel_type)}]->(b)
+        SET r = row.props
+        RETURN count(r) AS written
+        """
+        return self.client.execute_write_batches(query, rows, self.batch_size, raise_on_error=True, count_key="written")
+
+    def _remove_import_markers(self) -> None:
+        """Strip the temporary import label/property in batches and drop the index."""
+        cleanup_query = f"""
+        MATCH (n:{IMPORT_LABEL})
+        WITH n LIMIT $limit
+        REMOVE n:{IMPORT_LABEL}, n.{IMPORT_ID_PROPERTY}
+        RETURN count(n) AS removed
+        """
+        while True:
+            result = self.client.execute_query(cleanup_query, {"limit": self.batch_size * 10})
+            if not result or result[0]["removed"] == 0:
+                break
+
+        self.client.execute_write_query(f"DROP INDEX {IMPORT_INDEX_NAME} IF EXISTS")
+
     def _clear_database(self) -> None:
-        """Clear all data from the database."""
+        """Clear all data from the database in bounded transactions."""
         try:
             print("Clearing existing database...")
-            self.client.execute_query("MATCH (n) DETACH DELETE n")
+            clear_query = """
+            MATCH (n)
+            WITH n LIMIT $limit
+            DETACH DELETE n
+            RETURN count(n) AS deleted
+            """
+            while True:
+                result = self.client.execute_query(clear_query, {"limit": self.batch_size * 10})
+                if not result or result[0]["deleted"] == 0:
+                    break
             print("✅ Database cleared")
         except Exception as e:
             print(f"❌ Failed to clear database: {e}")
@@ -386,11 +488,7 @@ class Neo4jBackupManager:
             return {}
 
         try:
-            backup_path = self.backup_dir / latest_backup
-            with open(backup_path, encoding="utf-8") as f:
-                content = json.load(f)
-
-            return content.get("data", {}).get("statistics", {})
+            return self._read_backup_header(self.backup_dir / latest_backup).get("statistics", {})
 
         except Exception:
             return {}
@@ -465,10 +563,61 @@ class Neo4jBackupManager:
         with open(metadata_file, "w", encoding="utf-8") as f:
             json.dump(all_metadata, f, indent=2, default=str)
 
+    def _iter_backup_files(self) -> Iterator[Path]:
+        """Yield backup files in both the streamed and legacy formats."""
+        for pattern in self.backup_glob_patterns:
+            yield from self.backup_dir.glob(pattern)
+
+    def _read_backup_header(self, backup_path: Path) -> dict[str, Any]:
+        """Read only the metadata and statistics of a backup file."""
+        if backup_path.name.endswith(".jsonl.gz"):
+            with gzip.open(backup_path, "rt", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+            return {"metadata": header.get("metadata", {}), "statistics": header.get("statistics", {})}
+
+        with open(backup_path, encoding="utf-8") as f:
+            content = json.load(f)
+        return {"metadata": content.get("metadata", {}), "statistics": content.get("data", {}).get("statistics", {})}
+
+    def _iter_backup_records(self, backup_path: Path) -> Iterator[dict[str, Any]]:
+        """Stream node and relationship records from a backup file.
+
+        Legacy ``.json`` backups are loaded whole and converted to the record
+        format; ``.jsonl.gz`` backups are read one line at a time.
+        """
+        if backup_path.name.endswith(".jsonl.gz"):
+            with gzip.open(backup_path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+
+        with open(backup_path, encoding="utf-8") as f:
+            data = json.load(f).get("data", {})
+
+        for node in data.get("nodes", []):
+            props = dict(node)
+            yield {
+                "kind": "node",
+                "id": props.pop("_id", None),
+                "labels": props.pop("_labels", []),
+                "properties": props,
+            }
+        for rel in data.get("relationships", []):
+            props = dict(rel)
+            props.pop("_id", None)
+            yield {
+                "kind": "relationship",
+                "type": props.pop("_type", "RELATED"),
+                "start_id": props.pop("_start_id", None),
+                "end_id": props.pop("_end_id", None),
+                "properties": props,
+            }
+
     def _cleanup_old_backups(self) -> None:
         """Remove old backup files, keeping only the most recent."""
         backups = sorted(
-            self.backup_dir.glob("ign_scripts_db_backup_*.json"),
+            self._iter_backup_files(),
             key=lambda x: x.stat().st_mtime,
             reverse=True,
         )
@@ -510,12 +659,7 @@ class Neo4jBackupManager:
             print(f"Selective restore from backup: {backup_file}")
             print(f"Preserving existing data for labels: {preserve_labels}")
 
-            # Load backup data
-            with open(backup_path, encoding="utf-8") as f:
-                backup_content = json.load(f)
-
-            metadata = backup_content.get("metadata", {})
-            data = backup_content.get("data", {})
+            metadata = self._read_backup_header(backup_path).get("metadata", {})
 
             print(f"Backup info: {metadata.get('datetime')} - {metadata.get('reason')}")
             print(f"Data: {metadata.get('node_count', 0)} nodes, {metadata.get('relationship_count', 0)} relationships")
@@ -531,7 +675,7 @@ class Neo4jBackupManager:
             )
 
             # Restore data selectively
-            success = self._selective_restore_database_data(data, preserve_labels)
+            success = self._selective_restore_database_data(self._iter_backup_records(backup_path), preserve_labels)
 
             if success:
                 # Get final statistics
@@ -549,97 +693,14 @@ class Neo4jBackupManager:
             print(f"❌ {error_msg}")
             return False, error_msg
 
-    def _selective_restore_database_data(self, data: dict[str, Any], preserve_labels: list[str]) -> bool:
-        """Restore data to the Neo4j database while preserving specified node types."""
+    def _selective_restore_database_data(self, records: Iterable[dict[str, Any]], preserve_labels: list[str]) -> bool:
+        """Restore streamed records while preserving specified node types."""
         try:
-            nodes = data.get("nodes", [])
-            relationships = data.get("relationships", [])
-
-            # Filter nodes to restore (exclude preserved labels)
-            nodes_to_restore = []
-            preserved_node_count = 0
-
-            for node_data in nodes:
-                node_labels = node_data.get("_labels", [])
-                # Check if any of the node's labels should be preserved
-                should_preserve = any(label in preserve_labels for label in node_labels)
-
-                if not should_preserve:
-                    nodes_to_restore.append(node_data)
-                else:
-                    preserved_node_count += 1
-
-            print(f"Restoring {len(nodes_to_restore)} nodes (preserving {preserved_node_count} existing nodes)...")
-
-            # Create nodes with MERGE to avoid duplicates
-            node_id_mapping = {}
-
-            for node_data in nodes_to_restore:
-                old_id = node_data.pop("_id", None)
-                labels = node_data.pop("_labels", [])
-
-                if not labels:
-                    continue
-
-                # Use MERGE with name as unique identifier if available
-                name = node_data.get("name")
-                if name:
-                    # Create node with labels using MERGE
-                    labels_str = ":".join(labels)
-                    merge_query = f"""
-                    MERGE (n:{labels_str} {{name: $name}})
-                    SET n = $props
-                    RETURN elementId(n) as new_id
-                    """
-
-                    result = self.client.execute_query(merge_query, {"name": name, "props": node_data})
-                else:
-                    # Create node without name constraint
-                    labels_str = ":".join(labels)
-                    create_query = f"CREATE (n:{labels_str} $props) RETURN elementId(n) as new_id"
-
-                    result = self.client.execute_query(create_query, {"props": node_data})
-
-                if result:
-                    new_id = result[0]["new_id"]
-                    node_id_mapping[old_id] = new_id
-
-            # Create relationships for restored nodes
-            print("Restoring relationships...")
-            relationships_restored = 0
-
-            for rel_data in relationships:
-                old_start_id = rel_data.pop("_start_id", None)
-                old_end_id = rel_data.pop("_end_id", None)
-                rel_type = rel_data.pop("_type", "RELATED")
-                rel_data.pop("_id", None)
-
-                # Only restore relationships where both nodes were restored
-                new_start_id = node_id_mapping.get(old_start_id)
-                new_end_id = node_id_mapping.get(old_end_id)
-
-                if new_start_id is not None and new_end_id is not None:
-                    # Use MERGE to avoid duplicate relationships
-                    merge_rel_query = f"""
-                    MATCH (a), (b)
-                    WHERE elementId(a) = $start_id AND elementId(b) = $end_id
-                    MERGE (a)-[r:{rel_type}]->(b)
-                    SET r = $props
-                    """
-
-                    self.client.execute_query(
-                        merge_rel_query,
-                        {
-                            "start_id": new_start_id,
-                            "end_id": new_end_id,
-                            "props": rel_data,
-                        },
-                    )
-                    relationships_restored += 1
-
-            print(
-                f"✅ Selective restore completed: {len(nodes_to_restore)} nodes, {relationships_restored} relationships"
+            nodes, relationships, preserved = self._restore_records(
+                records, preserve_labels=preserve_labels, merge=True
             )
+            print(f"✅ Selective restore completed: {nodes} nodes, {relationships} relationships")
+            print(f"Preserved {preserved} existing nodes")
             return True
 
         except Exception as e:
@@ -647,6 +708,11 @@ class Neo4jBackupManager:
             return False
 
 
+def _quote_identifier(name: str) -> str:
+    """Backtick-quote a label or relationship type for use in Cypher."""
+    return "`" + name.replace("`", "``") + "`"
+
+
 def create_initial_backup() -> None:
     """Create an initial backup for distribution with the application."""
     print("🚀 Creating initial backup for application distribution...")
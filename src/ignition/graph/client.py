@@ -6,6 +6,8 @@ and updating the Ignition knowledge graph.
 
 import logging
 import os
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from typing import Any
 
@@ -21,6 +23,9 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Default number of rows sent per UNWIND batch by the bulk write methods
+DEFAULT_WRITE_BATCH_SIZE = 500
+
 
 class IgnitionGraphClient:
     """Client for interacting with the Ignition knowledge graph database."""
@@ -30,6 +35,7 @@ class IgnitionGraphClient:
         uri: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        batch_size: int | None = None,
     ):
         """Initialize the graph database client.
 
@@ -37,10 +43,12 @@ class IgnitionGraphClient:
             uri: Neo4j connection URI (defaults to NEO4J_URI env var)
             username: Database username (defaults to NEO4J_USERNAME env var)
             password: Database password (defaults to NEO4J_PASSWORD env var)
+            batch_size: Rows per UNWIND batch for bulk writes (defaults to NEO4J_WRITE_BATCH_SIZE env var)
         """
         self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.username = username or os.getenv("NEO4J_USERNAME", "neo4j")
         self.password = password or os.getenv("NEO4J_PASSWORD", "ignition-graph")
+        self.batch_size = batch_size or int(os.getenv("NEO4J_WRITE_BATCH_SIZE", str(DEFAULT_WRITE_BATCH_SIZE)))
         self.driver = None
         self._connected = False
 
@@ -182,6 +190,119 @@ class IgnitionGraphClient:
             logger.error(f"Failed to create relationship: {e}")
             return False
 
+    def execute_write_batches(
+        self,
+        query: str,
+        rows: list[dict[str, Any]],
+        batch_size: int | None = None,
+        parameters: dict[str, Any] | None = None,
+        raise_on_error: bool = False,
+        count_key: str | None = None,
+    ) -> int:
+        """Execute an ``UNWIND $rows`` write query over rows in fixed-size batches.
+
+        All batches share one session and each batch runs in its own write
+        transaction, so a failing batch does not roll back the ones before it.
+
+        Args:
+            query: Cypher query that consumes the ``$rows`` parameter
+            rows: Row dictionaries to send
+            batch_size: Rows per transaction (defaults to the client batch size)
+            parameters: Extra parameters passed with every batch
+            raise_on_error: Re-raise a failing batch instead of logging it and moving on
+            count_key: Column of the query's single result row holding the number
+                of rows it wrote, for writes that may not match every row
+
+        Returns:
+            Number of rows written successfully
+        """
+        size = batch_size or self.batch_size
+        written = 0
+
+        with self.session() as session:
+            for batch in _chunked(rows, size):
+                params = dict(parameters or {})
+                params["rows"] = batch
+                try:
+                    if count_key is None:
+                        session.execute_write(lambda tx, p=params: tx.run(query, p).consume())
+                        written += len(batch)
+                    else:
+                        record = session.execute_write(lambda tx, p=params: tx.run(query, p).single())
+                        written += record[count_key] if record is not None else 0
+                except Exception as e:
+                    logger.error(f"Batch write of {len(batch)} rows failed: {e}")
+                    logger.error(f"Query: {query}")
+                    if raise_on_error:
+                        raise
+
+        return written
+
+    def create_nodes_bulk(self, nodes: Iterable[GraphNode], batch_size: int | None = None) -> int:
+        """Create or update many nodes using batched ``UNWIND`` MERGE queries.
+
+        Nodes are grouped by label and merged on ``name``, matching the
+        semantics of :meth:`create_node`.
+
+        Args:
+            nodes: GraphNodes to create
+            batch_size: Rows per transaction (defaults to the client batch size)
+
+        Returns:
+            Number of nodes written successfully
+        """
+        rows_by_label: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for node in nodes:
+            rows_by_label[node.node_type.value].append(node.properties)
+
+        written = 0
+        for label, rows in rows_by_label.items():
+            query = f"UNWIND $rows AS row MERGE (n:{label} {{name: row.name}}) SET n += row"
+            written += self.execute_write_batches(query, rows, batch_size)
+            logger.debug(f"Bulk created {len(rows)} {label} nodes")
+
+        return written
+
+    def create_relationships_bulk(
+        self, relationships: Iterable[GraphRelationship], batch_size: int | None = None
+    ) -> int:
+        """Create many relationships using batched ``UNWIND`` queries.
+
+        Relationships are grouped by source label, relationship type and
+        target label so every batch is a single parameterised query.
+
+        Args:
+            relationships: GraphRelationships to create
+            batch_size: Rows per transaction (defaults to the client batch size)
+
+        Returns:
+            Number of relationships written successfully
+        """
+        rows_by_key: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
+        for rel in relationships:
+            key = (rel.from_node_type.value, rel.relationship_type.value, rel.to_node_type.value)
+            rows_by_key[key].append(
+                {
+                    "from_name": rel.from_name,
+                    "to_name": rel.to_name,
+                    "properties": rel.properties or {},
+                }
+            )
+
+        written = 0
+        for (from_label, rel_type, to_label), rows in rows_by_key.items():
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (a:{from_label} {{name: row.from_name}})
+            MATCH (b:{to_label} {{name: row.to_name}})
+            CREATE (a)-[r:{rel_type}]->(b)
+            SET r += row.properties
+            """
+            written += self.execute_write_batches(query, rows, batch_size)
+            logger.debug(f"Bulk created {len(rows)} {from_label}-[{rel_type}]->{to_label} relationships")
+
+        return written
+
     def setup_schema(self) -> bool:
         """Set up database constraints and indexes.
 
@@ -330,3 +451,10 @@ class IgnitionGraphClient:
             health["errors"].append(f"Connection failed: {e}")
 
         return health
+
+
+def _chunked(rows: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield successive slices of at most ``size`` rows."""
+    size = max(size, 1)
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
@@ -76,45 +76,18 @@ class EnhancedIgnitionGraphPopulator:
         try:
             logger.info("Loading comprehensive Ignition system functions...")
 
-            # Load device functions
-            device_functions = self._get_device_functions()
-            for func_data in device_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load navigation functions
-            nav_functions = self._get_navigation_functions()
-            for func_data in nav_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load file functions
-            file_functions = self._get_file_functions()
-            for func_data in file_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load security functions
-            security_functions = self._get_security_functions()
-            for func_data in security_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load math functions
-            math_functions = self._get_math_functions()
-            for func_data in math_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load network functions
-            net_functions = self._get_network_functions()
-            for func_data in net_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load dataset functions
-            dataset_functions = self._get_dataset_functions()
-            for func_data in dataset_functions:
-                self._create_function_with_relationships(func_data)
-
-            # Load Task 1: Extended tag system functions
-            task_1_functions = get_tag_system_extended()
-            for func_data in task_1_functions:
-                self._create_function_with_relationships(func_data)
+            functions = [
+                *self._get_device_functions(),
+                *self._get_navigation_functions(),
+                *self._get_file_functions(),
+                *self._get_security_functions(),
+                *self._get_math_functions(),
+                *self._get_network_functions(),
+                *self._get_dataset_functions(),
+                # Task 1: Extended tag system functions
+                *get_tag_system_extended(),
+            ]
+            self._create_functions_with_relationships(functions)
 
             logger.info("Successfully loaded comprehensive Ignition functions including Task 1")
             return True
@@ -125,37 +98,45 @@ class EnhancedIgnitionGraphPopulator:
 
     def _create_function_with_relationships(self, func_data: dict[str, Any]) -> bool:
         """Helper to create function node and its relationships."""
+        return self._create_functions_with_relationships([func_data])
+
+    def _create_functions_with_relationships(self, functions: list[dict[str, Any]]) -> bool:
+        """Create function nodes and their relationships with bulk writes."""
         try:
-            # Create function node
-            node = GraphNode(NodeType.FUNCTION, func_data)
-            if not self.client.create_node(node):
-                logger.warning(f"Failed to create function node: {func_data.get('name', 'unknown')}")
-                return False
+            nodes = [GraphNode(NodeType.FUNCTION, func_data) for func_data in functions]
+            written = self.client.create_nodes_bulk(nodes)
+            if written != len(nodes):
+                logger.warning(f"Only {written} of {len(nodes)} function nodes were created")
+
+            relationships: list[GraphRelationship] = []
+            for func_data in functions:
+                func_name = func_data["name"]
+
+                # Function-context relationships
+                for context in func_data.get("contexts", []):
+                    relationships.append(
+                        GraphRelationship(
+                            from_node_type=NodeType.FUNCTION,
+                            to_node_type=NodeType.CONTEXT,
+                            relationship_type=RelationshipType.AVAILABLE_IN,
+                            from_name=func_name,
+                            to_name=context,
+                        )
+                    )
 
-            # Create function-context relationships
-            func_name = func_data["name"]
-            for context in func_data.get("contexts", []):
-                relationship = GraphRelationship(
-                    from_node_type=NodeType.FUNCTION,
-                    to_node_type=NodeType.CONTEXT,
-                    relationship_type=RelationshipType.AVAILABLE_IN,
-                    from_name=func_name,
-                    to_name=context,
+                # Function-category relationship
+                relationships.append(
+                    GraphRelationship(
+                        from_node_type=NodeType.FUNCTION,
+                        to_node_type=NodeType.CATEGORY,
+                        relationship_type=RelationshipType.BELONGS_TO,
+                        from_name=func_name,
+                        to_name=func_data.get("category", "util"),
+                    )
                 )
-                self.client.create_relationship(relationship)
-
-            # Create function-category relationships
-            category = func_data.get("category", "util")
-            relationship = GraphRelationship(
-                from_node_type=NodeType.FUNCTION,
-                to_node_type=NodeType.CATEGORY,
-                relationship_type=RelationshipType.BELONGS_TO,
-                from_name=func_name,
-                to_name=category,
-            )
-            self.client.create_relationship(relationship)
 
-            return True
+            self.client.create_relationships_bulk(relationships)
+            return written == len(nodes)
 
         except Exception as e:
             logger.error(f"Failed to create function with relationships: {e}")
@@ -586,22 +567,22 @@ class EnhancedIgnitionGraphPopulator:
 
             # Load context variables
             context_variables = self._get_context_variables()
-            for var_data in context_variables:
-                node = GraphNode(NodeType.PARAMETER, var_data)
-                if not self.client.create_node(node):
-                    continue
-
-                # Create script type -> parameter relationships
-                var_name = var_data["name"]
-                for script_type in var_data.get("available_in", []):
-                    relationship = GraphRelationship(
-                        from_node_type=NodeType.SCRIPT_TYPE,
-                        to_node_type=NodeType.PARAMETER,
-                        relationship_type=RelationshipType.PROVIDES,
-                        from_name=script_type,
-                        to_name=var_name,
-                    )
-                    self.client.create_relationship(relationship)
+            nodes = [GraphNode(NodeType.PARAMETER, var_data) for var_data in context_variables]
+            self.client.create_nodes_bulk(nodes)
+
+            # Create script type -> parameter relationships
+            relationships = [
+                GraphRelationship(
+                    from_node_type=NodeType.SCRIPT_TYPE,
+                    to_node_type=NodeType.PARAMETER,
+                    relationship_type=RelationshipType.PROVIDES,
+                    from_name=script_type,
+                    to_name=var_data["name"],
+                )
+                for var_data in context_variables
+                for script_type in var_data.get("available_in", [])
+            ]
+            self.client.create_relationships_bulk(relationships)
 
             logger.info("Successfully loaded advanced features")
             return True
@@ -67,7 +67,8 @@ class IgnitionGraphPopulator:
     def _create_context_nodes(self) -> bool:
         """Create Context nodes."""
         try:
-            return all(self.client.create_node(node) for node in IgnitionGraphSchema.create_context_nodes())
+            nodes = IgnitionGraphSchema.create_context_nodes()
+            return self.client.create_nodes_bulk(nodes) == len(nodes)
         except Exception as e:
             logger.error(f"Failed to create context nodes: {e}")
             return False
@@ -75,7 +76,8 @@ class IgnitionGraphPopulator:
     def _create_script_type_nodes(self) -> bool:
         """Create ScriptType nodes."""
         try:
-            return all(self.client.create_node(node) for node in IgnitionGraphSchema.create_script_type_nodes())
+            nodes = IgnitionGraphSchema.create_script_type_nodes()
+            return self.client.create_nodes_bulk(nodes) == len(nodes)
         except Exception as e:
             logger.error(f"Failed to create script type nodes: {e}")
             return False
@@ -83,7 +85,8 @@ class IgnitionGraphPopulator:
     def _create_category_nodes(self) -> bool:
         """Create Category nodes."""
         try:
-            return all(self.client.create_node(node) for node in IgnitionGraphSchema.create_category_nodes())
+            nodes = IgnitionGraphSchema.create_category_nodes()
+            return self.client.create_nodes_bulk(nodes) == len(nodes)
         except Exception as e:
             logger.error(f"Failed to create category nodes: {e}")
             return False
@@ -104,19 +107,18 @@ class IgnitionGraphPopulator:
                 "SessionShutdown": "Perspective",
             }
 
-            for script_type, context in script_context_map.items():
-                relationship = GraphRelationship(
+            relationships = [
+                GraphRelationship(
                     from_node_type=NodeType.SCRIPT_TYPE,
                     to_node_type=NodeType.CONTEXT,
                     relationship_type=RelationshipType.COMPATIBLE_WITH,
                     from_name=script_type,
                     to_name=context,
                 )
+                for script_type, context in script_context_map.items()
+            ]
 
-                if not self.client.create_relationship(relationship):
-                    return False
-
-            return True
+            return self.client.create_relationships_bulk(relationships) == len(relationships)
 
         except Exception as e:
             logger.error(f"Failed to create context-script relationships: {e}")
@@ -134,41 +136,42 @@ class IgnitionGraphPopulator:
             functions_data = self._get_ignition_functions_data()
 
             # Create function nodes
-            for func_data in functions_data:
-                node = GraphNode(NodeType.FUNCTION, func_data)
-                if not self.client.create_node(node):
-                    logger.warning(f"Failed to create function node: {func_data.get('name', 'unknown')}")
+            nodes = [GraphNode(NodeType.FUNCTION, func_data) for func_data in functions_data]
+            written = self.client.create_nodes_bulk(nodes)
+            if written != len(nodes):
+                logger.warning(f"Only {written} of {len(nodes)} function nodes were created")
 
-            # Create function-context relationships
+            relationships: list[GraphRelationship] = []
+
+            # Function-context relationships
             for func_data in functions_data:
                 func_name = func_data["name"]
                 for context in func_data.get("contexts", []):
-                    relationship = GraphRelationship(
-                        from_node_type=NodeType.FUNCTION,
-                        to_node_type=NodeType.CONTEXT,
-                        relationship_type=RelationshipType.AVAILABLE_IN,
-                        from_name=func_name,
-                        to_name=context,
+                    relationships.append(
+                        GraphRelationship(
+                            from_node_type=NodeType.FUNCTION,
+                            to_node_type=NodeType.CONTEXT,
+                            relationship_type=RelationshipType.AVAILABLE_IN,
+                            from_name=func_name,
+                            to_name=context,
+                        )
                     )
 
-                    if not self.client.create_relationship(relationship):
-                        logger.warning(f"Failed to create function-context relationship: {func_name} -> {context}")
-
-            # Create function-category relationships
+            # Function-category relationships
             for func_data in functions_data:
-                func_name = func_data["name"]
-                category = func_data.get("category", "util")
-
-                relationship = GraphRelationship(
-                    from_node_type=NodeType.FUNCTION,
-                    to_node_type=NodeType.CATEGORY,
-                    relationship_type=RelationshipType.BELONGS_TO,
-                    from_name=func_name,
-                    to_name=category,
+                relationships.append(
+                    GraphRelationship(
+                        from_node_type=NodeType.FUNCTION,
+                        to_node_type=NodeType.CATEGORY,
+                        relationship_type=RelationshipType.BELONGS_TO,
+                        from_name=func_data["name"],
+                        to_name=func_data.get("category", "util"),
+                    )
                 )
 
-                if not self.client.create_relationship(relationship):
-                    logger.warning(f"Failed to create function-category relationship: {func_name} -> {category}")
+            written = self.client.create_relationships_bulk(relationships)
+            if written != len(relationships):
+                logger.warning(f"Only {written} of {len(relationships)} function relationships were created")
 
             logger.info(f"Successfully loaded {len(functions_data)} Ignition functions")
             return True
@@ -475,43 +478,42 @@ class IgnitionGraphPopulator:
             templates_data = self._get_templates_data()
 
             # Create template nodes
-            for template_data in templates_data:
-                node = GraphNode(NodeType.TEMPLATE, template_data)
-                if not self.client.create_node(node):
-                    logger.warning(f"Failed to create template node: {template_data.get('name', 'unknown')}")
+            nodes = [GraphNode(NodeType.TEMPLATE, template_data) for template_data in templates_data]
+            written = self.client.create_nodes_bulk(nodes)
+            if written != len(nodes):
+                logger.warning(f"Only {written} of {len(nodes)} template nodes were created")
 
-            # Create template-context relationships
-            for template_data in templates_data:
-                template_name = template_data["name"]
-                context = template_data.get("context", "Gateway")
+            relationships: list[GraphRelationship] = []
 
-                relationship = GraphRelationship(
-                    from_node_type=NodeType.TEMPLATE,
-                    to_node_type=NodeType.CONTEXT,
-                    relationship_type=RelationshipType.COMPATIBLE_WITH,
-                    from_name=template_name,
-                    to_name=context,
+            # Template-context relationships
+            for template_data in templates_data:
+                relationships.append(
+                    GraphRelationship(
+                        from_node_type=NodeType.TEMPLATE,
+                        to_node_type=NodeType.CONTEXT,
+                        relationship_type=RelationshipType.COMPATIBLE_WITH,
+                        from_name=template_data["name"],
+                        to_name=template_data.get("context", "Gateway"),
+                    )
                 )
 
-                if not self.client.create_relationship(relationship):
-                    logger.warning(f"Failed to create template-context relationship: {template_name} -> {context}")
-
-            # Create template-function relationships (based on functions used)
+            # Template-function relationships (based on functions used)
             for template_data in templates_data:
                 template_name = template_data["name"]
                 for func_name in template_data.get("uses_functions", []):
-                    relationship = GraphRelationship(
-                        from_node_type=NodeType.TEMPLATE,
-                        to_node_type=NodeType.FUNCTION,
-                        relationship_type=RelationshipType.USES,
-                        from_name=template_name,
-                        to_name=func_name,
+                    relationships.append(
+                        GraphRelationship(
+                            from_node_type=NodeType.TEMPLATE,
+                            to_node_type=NodeType.FUNCTION,
+                            relationship_type=RelationshipType.USES,
+                            from_name=template_name,
+                            to_name=func_name,
+                        )
                     )
 
-                    if not self.client.create_relationship(relationship):
-                        logger.warning(
-                            f"Failed to create template-function relationship: {template_name} -> {func_name}"
-                        )
+            written = self.client.create_relationships_bulk(relationships)
+            if written != len(relationships):
+                logger.warning(f"Only {written} of {len(relationships)} template relationships were created")
 
             logger.info(f"Successfully loaded {len(templates_data)} templates")
             return True
@@ -13,6 +13,7 @@ from .kafka_adapter import KafkaAdapter
 from .mqtt_adapter import MQTTAdapter
 from .opcua_adapter import OPCUAAdapter
 from .rest_adapter import RESTAdapter
+from .streaming import OverflowPolicy, StreamBuffer, StreamStatistics
 from .timeseries_adapter import TimeSeriesAdapter
 
 __all__ = [
@@ -24,6 +25,9 @@ __all__ = [
     "KafkaAdapter",
     "MQTTAdapter",
     "OPCUAAdapter",
+    "OverflowPolicy",
     "RESTAdapter",
+    "StreamBuffer",
+    "StreamStatistics",
     "TimeSeriesAdapter",
 ]
@@ -1,11 +1,16 @@
 """Base adapter class for data source connections."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import suppress
 from typing import Any
 
 from ignition.modules.data_integration.integration_module import DataSourceConfig
 
+from .streaming import OverflowPolicy, StreamBuffer
+
 
 class BaseDataAdapter(ABC):
     """Base class for all data source adapters.
@@ -24,6 +29,7 @@ class BaseDataAdapter(ABC):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._connected = False
         self._connection = None
+        self._streams: list[StreamBuffer] = []
 
     @property
     def is_connected(self) -> bool:
@@ -91,6 +97,65 @@ class BaseDataAdapter(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        query: dict[str, Any] | None = None,
+        *,
+        batch_size: int | None = None,
+        batch_window: float = 0.05,
+        max_queue_size: int = 10000,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream data from the data source as micro-batches.
+
+        Records are queued in a bounded buffer so a slow consumer never stalls the
+        producer; when the buffer is full the overflow policy applies.
+
+        Args:
+            query: Optional query parameters for streaming
+            batch_size: Maximum records per batch (defaults to ``config.batch_size``)
+            batch_window: Seconds to wait after the first record for a batch to fill
+            max_queue_size: Maximum records buffered between producer and consumer
+            overflow: Drop the oldest record, coalesce per node, or block the producer
+
+        Yields:
+            Lists of data records
+        """
+        buffer = StreamBuffer(
+            max_size=max_queue_size,
+            batch_size=batch_size or self.config.batch_size,
+            batch_window=batch_window,
+            overflow=overflow,
+        )
+        self._streams.append(buffer)
+        producer = asyncio.create_task(self._run_stream_producer(buffer, query))
+
+        try:
+            async for batch in buffer.batches():
+                yield batch
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+            buffer.close()
+            self._streams.remove(buffer)
+
+    async def _run_stream_producer(self, buffer: StreamBuffer, query: dict[str, Any] | None) -> None:
+        try:
+            await self._produce_stream(buffer, query)
+        except Exception as e:
+            self.logger.error(f"Stream producer error: {e}")
+        finally:
+            buffer.close()
+
+    async def _produce_stream(self, buffer: StreamBuffer, query: dict[str, Any] | None) -> None:
+        """Feed records into ``buffer`` until the stream ends.
+
+        The default bridges the callback based ``stream_data``; adapters with a
+        native subscription mechanism override this to enqueue directly.
+        """
+        await self.stream_data(buffer.put, query)
+
     async def __aenter__(self) -> Any:
         """Async context manager entry."""
         await self.connect()
@@ -130,6 +195,7 @@ class BaseDataAdapter(ABC):
             "source_id": self.config.source_id,
             "source_type": self.config.source_type,
             "connected": self._connected,
+            "streams": [buffer.stats.to_dict() for buffer in self._streams],
             "connection_params": {
                 k: v
                 for k, v in self.config.connection_params.items()
@@ -1,11 +1,13 @@
 """OPC-UA data source adapter."""
 
 import asyncio
+from contextlib import suppress
 from typing import Any
 
 from ignition.opcua import IgnitionOPCUAClient
 
 from .base_adapter import BaseDataAdapter
+from .streaming import OverflowPolicy, StreamBuffer
 
 
 class OPCUAAdapter(BaseDataAdapter):
@@ -19,6 +21,7 @@ class OPCUAAdapter(BaseDataAdapter):
         """Initialize OPC-UA adapter."""
         super().__init__(config)
         self._client = None
+        self._disconnected = asyncio.Event()
 
     async def connect(self) -> bool:
         """Connect to OPC-UA server."""
@@ -44,6 +47,7 @@ class OPCUAAdapter(BaseDataAdapter):
             success = await self._client.connect(**connect_kwargs)
             if success:
                 self._connected = True
+                self._disconnected.clear()
                 self.logger.info(f"Connected to OPC-UA server: {url}")
                 return True
             else:
@@ -61,6 +65,7 @@ class OPCUAAdapter(BaseDataAdapter):
                 await self._client.disconnect()
                 self._client = None
                 self._connected = False
+                self._disconnected.set()
                 self.logger.info("Disconnected from OPC-UA server")
             return True
         except Exception as e:
@@ -187,50 +192,66 @@ class OPCUAAdapter(BaseDataAdapter):
             return False
 
     async def stream_data(self, callback: callable, query: dict[str, Any] | None = None) -> None:
-        """Stream data from OPC-UA server using subscriptions."""
-        if not self._client or not self._connected:
+        """Stream data from OPC-UA server using subscriptions.
+
+        Records are awaited through ``callback`` one at a time; changes that arrive
+        while the callback is busy are coalesced to the newest value per node.
+        """
+        async for batch in self.stream(query, overflow=OverflowPolicy.COALESCE):
+            for record in batch:
+                try:
+                    await callback(record)
+                except Exception as e:
+                    self.logger.error(f"Callback error for node {record['node_id']}: {e}")
+
+    async def _produce_stream(self, buffer: StreamBuffer, query: dict[str, Any] | None) -> None:
+        """Subscribe to the queried nodes and enqueue every data change until disconnect."""
+        client = self._client
+        if not client or not self._connected:
             self.logger.error("OPC-UA client not connected")
             return
 
-        try:
-            # Subscribe to nodes for real-time updates
-            node_ids = query.get("node_ids", []) if query else []
-            if isinstance(node_ids, str):
-                node_ids = [node_ids]
+        node_ids = query.get("node_ids", []) if query else []
+        if isinstance(node_ids, str):
+            node_ids = [node_ids]
 
-            if not node_ids:
-                self.logger.warning("No node IDs specified for streaming")
-                return
+        if not node_ids:
+            self.logger.warning("No node IDs specified for streaming")
+            return
 
-            def data_change_callback(node_id: str, value: Any) -> None:
-                """Handle data change notifications."""
-                try:
-                    data_record = {
-                        "node_id": node_id,
-                        "value": value,
-                        "timestamp": asyncio.get_event_loop().time(),
-                        "source_type": "opcua",
-                        "source_id": self.config.source_id,
-                    }
-                    # Schedule the async callback
-                    task = asyncio.create_task(callback(data_record))
-                    # Store reference to prevent garbage collection
-                    task.add_done_callback(lambda _: None)
-                except Exception as e:
-                    self.logger.error(f"Callback error for node {node_id}: {e}")
+        loop = asyncio.get_running_loop()
+        source_id = self.config.source_id
 
-            # Create subscription
-            interval = query.get("interval", 1000.0) if query else 1000.0
-            subscription_id = await self._client.subscribe_nodes(node_ids, data_change_callback, interval)
+        def make_record(node_id: str, value: Any) -> dict[str, Any]:
+            return {
+                "node_id": node_id,
+                "value": value,
+                "timestamp": loop.time(),
+                "source_type": "opcua",
+                "source_id": source_id,
+            }
 
-            self.logger.info(f"Created OPC-UA subscription {subscription_id} for {len(node_ids)} nodes")
+        if buffer.overflow is OverflowPolicy.BLOCK:
+            # An awaited handler holds back notification delivery while the queue is full
 
-            # Keep streaming until disconnected
-            while self._connected:
-                await asyncio.sleep(1)
+            async def data_change_callback(node_id: str, value: Any) -> None:
+                await buffer.put(make_record(node_id, value))
 
-        except Exception as e:
-            self.logger.error(f"OPC-UA streaming error: {e}")
+        else:
+
+            def data_change_callback(node_id: str, value: Any) -> None:
+                buffer.offer(make_record(node_id, value))
+
+        interval = query.get("interval", 1000.0)
+        subscription_id = await client.subscribe_nodes(node_ids, data_change_callback, interval)
+        self.logger.info(f"Created OPC-UA subscription {subscription_id} for {len(node_ids)} nodes")
+
+        try:
+            await self._disconnected.wait()
+        finally:
+            if self._connected:
+                with suppress(Exception):
+                    await client.unsubscribe(subscription_id)
 
     def validate_config(self) -> bool:
         """Validate OPC-UA specific configuration."""
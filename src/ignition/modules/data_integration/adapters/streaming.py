@@ -0,0 +1,199 @@
+"""Bounded micro-batching buffer for streaming data source adapters.
+
+Producers (subscription callbacks) push records into a bounded ``asyncio.Queue``;
+consumers iterate over micro-batches closed by size or by a time window. When the
+queue is full the configured overflow policy decides whether the oldest record is
+dropped, records for the same key are coalesced, or the producer waits.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream inside the queue so a waiting consumer wakes up
+_END_OF_STREAM = object()
+
+
+class OverflowPolicy(Enum):
+    """What a full stream buffer does with a new record."""
+
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued record
+    COALESCE = "coalesce"  # Keep only the newest pending record per key
+    BLOCK = "block"  # Make the producer wait for space
+
+
+@dataclass
+class StreamStatistics:
+    """Counters for one stream buffer."""
+
+    received: int = 0
+    delivered: int = 0
+    batches: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    blocked: int = 0
+    max_depth: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert statistics to dictionary."""
+        return {
+            "received": self.received,
+            "delivered": self.delivered,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "blocked": self.blocked,
+            "max_depth": self.max_depth,
+        }
+
+
+class StreamBuffer:
+    """Bounded queue of data records delivered as size/time windowed micro-batches.
+
+    With ``OverflowPolicy.COALESCE`` the queue holds keys rather than records: a
+    newer record for a key that is still pending replaces it in place, so a
+    fast-changing tag costs one queue slot however often it changes.
+
+    Args:
+        max_size: Maximum number of queued records (or pending keys when coalescing)
+        batch_size: Maximum records per delivered batch
+        batch_window: Seconds to wait after the first record for a batch to fill
+        overflow: Policy applied when the queue is full
+        key: Record field identifying the source for coalescing
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        batch_size: int = 1000,
+        batch_window: float = 0.05,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        key: str = "node_id",
+    ):
+        if max_size < 1 or batch_size < 1:
+            raise ValueError("max_size and batch_size must be at least 1")
+        if batch_window < 0:
+            raise ValueError("batch_window cannot be negative")
+
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.overflow = OverflowPolicy(overflow)
+        self.key = key
+        self.stats = StreamStatistics()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._pending: dict[Any, dict[str, Any]] = {}
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer side has finished."""
+        return self._closed
+
+    def qsize(self) -> int:
+        """Number of records waiting to be delivered."""
+        return self._queue.qsize()
+
+    def offer(self, record: dict[str, Any]) -> bool:
+        """Queue a record without waiting.
+
+        Returns:
+            False if the record was rejected because the queue is full under
+            ``OverflowPolicy.BLOCK`` (use ``put`` to wait instead), True otherwise
+        """
+        if self._closed:
+            return False
+        self.stats.received += 1
+
+        if self.overflow is OverflowPolicy.COALESCE:
+            record_key = record.get(self.key)
+            if record_key in self._pending:
+                self._pending[record_key] = record
+                self.stats.coalesced += 1
+                return True
+            item = record_key
+        else:
+            item = record
+
+        if self._queue.full():
+            if self.overflow is OverflowPolicy.BLOCK:
+                self.stats.dropped += 1
+                return False
+            self._drop_oldest()
+
+        if self.overflow is OverflowPolicy.COALESCE:
+            self._pending[item] = record
+        self._queue.put_nowait(item)
+        self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+        return True
+
+    async def put(self, record: dict[str, Any]) -> None:
+        """Queue a record, waiting for space under ``OverflowPolicy.BLOCK``."""
+        if self.overflow is not OverflowPolicy.BLOCK or not self._queue.full():
+            self.offer(record)
+            return
+        if self._closed:
+            return
+
+        self.stats.received += 1
+        self.stats.blocked += 1
+        await self._queue.put(record)
+        self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+
+    def _drop_oldest(self) -> None:
+        item = self._queue.get_nowait()
+        if self.overflow is OverflowPolicy.COALESCE:
+            self._pending.pop(item, None)
+        self.stats.dropped += 1
+
+    def close(self) -> None:
+        """Stop accepting records; the consumer drains what is queued and stops."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._queue.full():
+            self._queue.put_nowait(_END_OF_STREAM)
+
+    def _take(self, item: Any) -> dict[str, Any] | None:
+        if item is _END_OF_STREAM:
+            return None
+        if self.overflow is OverflowPolicy.COALESCE:
+            return self._pending.pop(item)
+        return item
+
+    async def batches(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield micro-batches until the buffer is closed and drained."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._closed and self._queue.empty():
+                return
+            first = self._take(await self._queue.get())
+            if first is None:
+                continue
+
+            batch = [first]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                if not self._queue.empty():
+                    record = self._take(self._queue.get_nowait())
+                    if record is not None:
+                        batch.append(record)
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0 or self._closed:
+                    break
+                try:
+                    record = self._take(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+                if record is not None:
+                    batch.append(record)
+
+            self.stats.batches += 1
+            self.stats.delivered += len(batch)
+            yield batch
@@ -1,40 +1,513 @@
-"""Time-series database adapter (placeholder implementation)."""
+"""Time-series database adapter (InfluxDB, TimescaleDB and a SQLite stand-in).
 
+Points are handled as columns: timestamps, tag names, values and optional
+quality codes. Writes are split into chunks of ``config.batch_size`` points,
+encoded as InfluxDB line protocol or PostgreSQL ``COPY`` CSV (parameterised
+inserts for SQLite), and retried with exponential backoff. Reads run queries
+built by ``HistorianQueryGenerator`` and stream the result page by page as
+dictionaries of NumPy column arrays.
+"""
+
+import asyncio
+import csv
+import io
+import sqlite3
+import uuid
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
+from ignition.data_integration.historian_queries import (
+    AggregationType,
+    HistorianQueryGenerator,
+    HistorianType,
+    QueryOptions,
+    TagFilter,
+    TimeRange,
+    TimeUnit,
+)
+
 from .base_adapter import BaseDataAdapter
 
+# Table and column layout expected by HistorianQueryGenerator for SQL historians
+HISTORIAN_TABLE = "historian_data"
+HISTORIAN_COLUMNS = ("timestamp", "tag_name", "value", "quality")
+TIMESTAMP_COLUMNS = ("timestamp", "time", "time_bucket")
+
+DEFAULT_PAGE_SIZE = 10000
+RETRY_BACKOFF_SECONDS = 0.1
+
+# Backend used when connection_params has no explicit "backend"
+BACKENDS_BY_SOURCE_TYPE = {
+    "sqlite": "sqlite",
+    "timescaledb": "timescaledb",
+    "influxdb": "influxdb",
+}
+
+_BUCKET_UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,  # Approximate, as in HistorianQueryGenerator
+    "year": 31536000,
+}
+
+
+def to_datetime64(timestamps: Any) -> np.ndarray:
+    """Convert timestamps to a ``datetime64[us]`` array.
+
+    Accepts datetime64 arrays, epoch seconds, ``datetime`` objects (timezone-aware
+    values are converted to naive UTC) and ISO-8601 strings.
+    """
+    if isinstance(timestamps, np.ndarray) and np.issubdtype(timestamps.dtype, np.datetime64):
+        return timestamps.astype("datetime64[us]")
+
+    array = np.asarray(timestamps)
+    if np.issubdtype(array.dtype, np.number):
+        return (array.astype(float) * 1e6).astype(np.int64).view("datetime64[us]")
+    if array.size and isinstance(array.flat[0], datetime) and array.flat[0].tzinfo is not None:
+        return to_datetime64(np.fromiter((value.timestamp() for value in array.flat), dtype=float, count=array.size))
+    return array.astype("datetime64[us]")
+
+
+def _escape_line_protocol(value: str, measurement: bool = False) -> str:
+    escaped = value.replace("\\", "\\\\").replace(",", "\\,").replace(" ", "\\ ")
+    return escaped if measurement else escaped.replace("=", "\\=")
+
+
+def encode_line_protocol(
+    measurement: str,
+    timestamps: np.ndarray,
+    tag_names: Sequence[str],
+    values: np.ndarray,
+    quality: np.ndarray | None = None,
+) -> str:
+    """Encode points as InfluxDB line protocol with nanosecond timestamps.
+
+    Each point becomes ``measurement,tag_name=<tag> value=<v>[,quality=<q>i] <ns>``.
+    Points with a NaN value are skipped because line protocol has no NaN.
+    """
+    prefix = _escape_line_protocol(measurement, measurement=True) + ",tag_name="
+    escaped_tags: dict[str, str] = {}
+    nanoseconds = to_datetime64(timestamps).astype("datetime64[ns]").view(np.int64).tolist()
+    value_list = np.asarray(values, dtype=float).tolist()
+    quality_list = None if quality is None else np.asarray(quality, dtype=np.int64).tolist()
+
+    lines = []
+    for i, (tag, value, ns) in enumerate(zip(tag_names, value_list, nanoseconds, strict=True)):
+        if value != value:
+            continue
+        escaped = escaped_tags.get(tag)
+        if escaped is None:
+            escaped = escaped_tags[tag] = _escape_line_protocol(tag)
+        if quality_list is None:
+            lines.append(f"{prefix}{escaped} value={value!r} {ns}")
+        else:
+            lines.append(f"{prefix}{escaped} value={value!r},quality={quality_list[i]}i {ns}")
+    return "\n".join(lines)
+
+
+def encode_copy_csv(
+    timestamps: np.ndarray,
+    tag_names: Sequence[str],
+    values: np.ndarray,
+    quality: np.ndarray | None = None,
+) -> str:
+    """Encode points as CSV rows for ``COPY historian_data (...) FROM STDIN WITH (FORMAT csv)``.
+
+    Timestamps are ISO-8601 with microseconds; NaN values become NULL.
+    """
+    iso = np.datetime_as_string(to_datetime64(timestamps), unit="us").tolist()
+    value_array = np.asarray(values, dtype=float)
+    value_list = np.where(np.isnan(value_array), None, value_array).tolist()
+    columns = [iso, list(tag_names), value_list]
+    if quality is not None:
+        columns.append(np.asarray(quality, dtype=np.int64).tolist())
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(zip(*columns, strict=True))
+    return buffer.getvalue()
+
+
+def _sqlite_time_bucket(bucket: str, timestamp: str) -> str | None:
+    """SQLite implementation of TimescaleDB ``time_bucket('<n> <unit>s', ts)``."""
+    if timestamp is None:
+        return None
+    count, unit = bucket.split()
+    width = int(count) * _BUCKET_UNIT_SECONDS[unit.rstrip("s")]
+    moment = datetime.fromisoformat(timestamp)
+    seconds = int((moment - datetime(1970, 1, 1)).total_seconds()) // width * width
+    return (datetime(1970, 1, 1) + timedelta(seconds=seconds)).isoformat()
+
+
+def _as_datetime(value: datetime | str) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _append_async(records: list[dict[str, Any]]) -> Callable[[dict[str, Any]], Any]:
+    async def append(record: dict[str, Any]) -> None:
+        records.append(record)
+
+    return append
+
+
+def _column_to_array(name: str, values: Sequence[Any]) -> np.ndarray:
+    if name in TIMESTAMP_COLUMNS:
+        return to_datetime64(values)
+    array = np.array(values)
+    if array.dtype == object:
+        try:
+            return array.astype(float)
+        except (TypeError, ValueError):
+            return array
+    return array
+
 
 class TimeSeriesAdapter(BaseDataAdapter):
-    """Time-series database adapter (InfluxDB, TimescaleDB, etc.)."""
+    """Time-series database adapter (InfluxDB, TimescaleDB, etc.).
+
+    The backend is taken from ``connection_params["backend"]`` or the source type:
+    ``"timescaledb"`` (psycopg2), ``"influxdb"`` (influxdb-client, writes only) or
+    ``"sqlite"``, a local stand-in with the TimescaleDB ``historian_data`` layout
+    and a ``time_bucket`` function so generated queries run unchanged.
+    """
+
+    def __init__(self, config) -> None:
+        """Initialize time-series adapter."""
+        super().__init__(config)
+        self.backend = config.connection_params.get("backend") or BACKENDS_BY_SOURCE_TYPE.get(config.source_type.value)
+        historian_type = HistorianType.INFLUXDB if self.backend == "influxdb" else HistorianType.TIMESCALEDB
+        self._query_generator = HistorianQueryGenerator(historian_type)
+        self._write_stats = {"points_written": 0, "chunks_written": 0, "retries": 0, "failed_chunks": 0}
 
     async def connect(self) -> bool:
-        self._connected = True
-        self.logger.info(f"Connected to time-series DB: {self.config.source_id}")
-        return True
+        """Connect to the time-series database."""
+        try:
+            if self.backend == "sqlite":
+                self._connection = await asyncio.to_thread(self._connect_sqlite)
+            elif self.backend == "timescaledb":
+                self._connection = await asyncio.to_thread(self._connect_timescaledb)
+            elif self.backend == "influxdb":
+                self._connection = await asyncio.to_thread(self._connect_influxdb)
+            else:
+                self.logger.error(f"Unsupported time-series backend: {self.backend}")
+                return False
+
+            self._connected = True
+            self.logger.info(f"Connected to time-series DB ({self.backend}): {self.config.source_id}")
+            return True
+
+        except ImportError as e:
+            self.logger.error(f"Time-series driver not installed: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Time-series connection error: {e}")
+            return False
+
+    def _connect_sqlite(self) -> sqlite3.Connection:
+        params = self.config.connection_params
+        connection = sqlite3.connect(
+            params.get("database", ":memory:"), timeout=self.config.timeout, check_same_thread=False
+        )
+        connection.create_function("time_bucket", 2, _sqlite_time_bucket, deterministic=True)
+        if params.get("create_schema", True):
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {HISTORIAN_TABLE} "
+                "(timestamp TEXT NOT NULL, tag_name TEXT NOT NULL, value REAL, quality INTEGER)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {HISTORIAN_TABLE}_tag_time ON {HISTORIAN_TABLE} (tag_name, timestamp)"
+            )
+            connection.commit()
+        return connection
+
+    def _connect_timescaledb(self) -> Any:
+        import psycopg2
+
+        params = self.config.connection_params
+        return psycopg2.connect(
+            host=params.get("host", "localhost"),
+            port=params.get("port", 5432),
+            dbname=params.get("database"),
+            user=params.get("username") or params.get("user"),
+            password=params.get("password"),
+            connect_timeout=self.config.timeout,
+        )
+
+    def _connect_influxdb(self) -> Any:
+        from influxdb_client import InfluxDBClient
+
+        params = self.config.connection_params
+        client = InfluxDBClient(
+            url=params["url"], token=params.get("token", ""), org=params.get("org"), timeout=self.config.timeout * 1000
+        )
+        client.ping()
+        return client
 
     async def disconnect(self) -> bool:
-        self._connected = False
-        return True
+        """Disconnect from the time-series database."""
+        try:
+            if self._connection is not None:
+                await asyncio.to_thread(self._connection.close)
+                self._connection = None
+            self._connected = False
+            self.logger.info("Disconnected from time-series DB")
+            return True
+        except Exception as e:
+            self.logger.error(f"Time-series disconnection error: {e}")
+            return False
 
     async def test_connection(self) -> bool:
-        return self._connected
+        """Test the time-series database connection."""
+        if not self._connected:
+            return False
+        try:
+            if self.backend == "influxdb":
+                return bool(await asyncio.to_thread(self._connection.ping))
+            await asyncio.to_thread(self._execute_probe)
+            return True
+        except Exception as e:
+            self.logger.error(f"Time-series connection test error: {e}")
+            return False
 
-    async def read_data(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        return [
-            {
-                "measurement": "process_values",
-                "time": "2024-01-15T10:30:00Z",
-                "fields": {"temperature": 23.4, "pressure": 1013.25},
-                "tags": {"location": "reactor_1", "unit": "celsius"},
-                "source_type": "timeseries",
-                "source_id": self.config.source_id,
-            }
-        ]
+    def _execute_probe(self) -> None:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+
+    # Writes
+
+    async def write_points(
+        self,
+        timestamps: Any,
+        tag_names: Sequence[str],
+        values: Any,
+        quality: Any | None = None,
+    ) -> int:
+        """Write columnar points in chunks of ``config.batch_size``.
+
+        Args:
+            timestamps: datetime64 array, epoch seconds, datetimes or ISO strings
+            tag_names: Tag name of each point
+            values: Numeric value of each point
+            quality: Optional integer quality code of each point
+
+        Returns:
+            Number of points written; chunks that still fail after
+            ``config.retry_attempts`` retries are skipped and counted as failed
+        """
+        if not self._connected:
+            self.logger.error("Time-series DB not connected")
+            return 0
+
+        timestamps = to_datetime64(timestamps)
+        values = np.asarray(values, dtype=float)
+        tag_names = list(tag_names)
+        quality = None if quality is None else np.asarray(quality, dtype=np.int64)
+        if not len(timestamps) == len(tag_names) == len(values) or (
+            quality is not None and len(quality) != len(values)
+        ):
+            raise ValueError("Point columns must all have the same length")
+
+        writer = {
+            "sqlite": self._write_sqlite_chunk,
+            "timescaledb": self._write_copy_chunk,
+            "influxdb": self._write_line_protocol_chunk,
+        }[self.backend]
+
+        written = 0
+        chunk_size = max(1, self.config.batch_size)
+        for start in range(0, len(values), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            chunk_quality = None if quality is None else quality[chunk]
+            if await self._write_chunk_with_retry(
+                writer, timestamps[chunk], tag_names[chunk], values[chunk], chunk_quality
+            ):
+                written += len(values[chunk])
+        return written
+
+    async def _write_chunk_with_retry(self, writer: Callable[..., None], *chunk: Any) -> bool:
+        attempts = 1 + max(0, self.config.retry_attempts)
+        for attempt in range(attempts):
+            try:
+                await asyncio.to_thread(writer, *chunk)
+                self._write_stats["chunks_written"] += 1
+                self._write_stats["points_written"] += len(chunk[2])
+                return True
+            except Exception as e:
+                if attempt == attempts - 1:
+                    self._write_stats["failed_chunks"] += 1
+                    self.logger.error(f"Time-series chunk write failed after {attempts} attempts: {e}")
+                    return False
+                self._write_stats["retries"] += 1
+                self.logger.warning(f"Time-series chunk write failed (attempt {attempt + 1}/{attempts}): {e}")
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+        return False
+
+    def _write_sqlite_chunk(
+        self, timestamps: np.ndarray, tag_names: list[str], values: np.ndarray, quality: np.ndarray | None
+    ) -> None:
+        iso = np.datetime_as_string(timestamps, unit="us").tolist()
+        value_list = np.where(np.isnan(values), None, values).tolist()
+        quality_list = [None] * len(iso) if quality is None else quality.tolist()
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {HISTORIAN_TABLE} ({', '.join(HISTORIAN_COLUMNS)}) VALUES (?, ?, ?, ?)",
+                zip(iso, tag_names, value_list, quality_list, strict=True),
+            )
+
+    def _write_copy_chunk(
+        self, timestamps: np.ndarray, tag_names: list[str], values: np.ndarray, quality: np.ndarray | None
+    ) -> None:
+        columns = HISTORIAN_COLUMNS if quality is not None else HISTORIAN_COLUMNS[:3]
+        payload = io.StringIO(encode_copy_csv(timestamps, tag_names, values, quality))
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {HISTORIAN_TABLE} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", payload
+                )
+            self._connection.commit()
+        except Exception:
+            self._connection.rollback()
+            raise
+
+    def _write_line_protocol_chunk(
+        self, timestamps: np.ndarray, tag_names: list[str], values: np.ndarray, quality: np.ndarray | None
+    ) -> None:
+        from influxdb_client import WritePrecision
+        from influxdb_client.client.write_api import SYNCHRONOUS
+
+        params = self.config.connection_params
+        body = encode_line_protocol(params.get("measurement", HISTORIAN_TABLE), timestamps, tag_names, values, quality)
+        write_api = self._connection.write_api(write_options=SYNCHRONOUS)
+        write_api.write(bucket=params["bucket"], org=params.get("org"), record=body, write_precision=WritePrecision.NS)
 
     async def write_data(self, data: list[dict[str, Any]]) -> bool:
-        self.logger.info(f"Wrote {len(data)} time-series points")
-        return True
+        """Write point records with ``timestamp`` (or ``time``), ``tag_name``, ``value`` and optional ``quality``."""
+        if not data:
+            return True
+        try:
+            quality = [record.get("quality", 0) for record in data] if "quality" in data[0] else None
+            written = await self.write_points(
+                [record.get("timestamp", record.get("time")) for record in data],
+                [record["tag_name"] for record in data],
+                [record["value"] for record in data],
+                quality,
+            )
+            self.logger.info(f"Wrote {written}/{len(data)} time-series points")
+            return written == len(data)
+        except Exception as e:
+            self.logger.error(f"Time-series write error: {e}")
+            return False
+
+    # Reads
+
+    def build_query(self, query: dict[str, Any] | None = None) -> str:
+        """Build a historian query from ``query`` parameters.
+
+        Supported keys: ``sql`` (used verbatim), ``tags``, ``start_time``/``end_time``
+        (datetimes or ISO strings, default the last hour), ``limit``, ``order_desc``,
+        ``include_quality`` and, for aggregated data, ``aggregation``, ``interval``
+        and ``time_unit``.
+        """
+        query = query or {}
+        if "sql" in query:
+            return query["sql"]
+
+        end_time = _as_datetime(query.get("end_time") or datetime.now())
+        start_time = _as_datetime(query.get("start_time") or end_time - timedelta(hours=1))
+        time_range = TimeRange(start_time=start_time, end_time=end_time)
+        tags = [TagFilter(tag_name=tag) for tag in query.get("tags", [])]
+        options = QueryOptions(
+            limit=query.get("limit"),
+            order_desc=query.get("order_desc", False),
+            include_quality=query.get("include_quality", True),
+        )
+
+        if "aggregation" in query:
+            return self._query_generator.generate_aggregated_query(
+                tags,
+                time_range,
+                AggregationType(query["aggregation"]),
+                str(query.get("interval", 1)),
+                TimeUnit(query.get("time_unit", "m")),
+                options,
+            )
+        return self._query_generator.generate_raw_data_query(tags, time_range, options)
+
+    async def read_blocks(
+        self, query: dict[str, Any] | None = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[dict[str, np.ndarray]]:
+        """Stream query results page by page as columnar blocks.
+
+        Args:
+            query: Query parameters (see ``build_query``)
+            page_size: Maximum rows per block
+
+        Yields:
+            Dictionaries mapping column name to a NumPy array; timestamp columns
+            are ``datetime64[us]`` and numeric columns float64 with NaN for NULL
+        """
+        if not self._connected:
+            self.logger.error("Time-series DB not connected")
+            return
+        if self.backend == "influxdb":
+            self.logger.error("Block reads are only supported for SQL time-series backends")
+            return
+
+        cursor = await asyncio.to_thread(self._open_cursor, self.build_query(query))
+        try:
+            while True:
+                rows = await asyncio.to_thread(cursor.fetchmany, page_size)
+                if not rows:
+                    break
+                names = [column[0] for column in cursor.description]
+                yield {
+                    name: _column_to_array(name, column)
+                    for name, column in zip(names, zip(*rows, strict=True), strict=True)
+                }
+        finally:
+            await asyncio.to_thread(cursor.close)
+
+    def _open_cursor(self, sql: str) -> Any:
+        if self.backend == "timescaledb":
+            # Server-side cursor: rows are transferred one page per fetchmany
+            cursor = self._connection.cursor(name=f"ts_read_{uuid.uuid4().hex}")
+        else:
+            cursor = self._connection.cursor()
+        cursor.execute(sql)
+        return cursor
+
+    async def read_data(self, query: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Read data from the time-series database as records."""
+        try:
+            records = []
+            await self.stream_data(_append_async(records), query)
+            return records
+        except Exception as e:
+            self.logger.error(f"Time-series read error: {e}")
+            return []
 
     async def stream_data(self, callback: callable, query: dict[str, Any] | None = None) -> None:
-        pass
+        """Stream the query result record by record to ``callback``."""
+        async for block in self.read_blocks(query):
+            names = list(block)
+            for row in zip(*(block[name].tolist() for name in names), strict=True):
+                record = dict(zip(names, row, strict=True))
+                record["source_type"] = "timeseries"
+                record["source_id"] = self.config.source_id
+                await callback(record)
+
+    def get_connection_info(self) -> dict[str, Any]:
+        """Get connection information including write statistics."""
+        info = super().get_connection_info()
+        info["backend"] = self.backend
+        info["write_stats"] = dict(self._write_stats)
+        return info
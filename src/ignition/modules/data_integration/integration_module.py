@@ -10,12 +10,14 @@ Version: 1.0.0
 """
 
 import asyncio
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+import numpy as np
 from dotenv import load_dotenv
 
 from ignition.modules.core.abstract_module import (
@@ -614,9 +616,20 @@ class DataIntegrationModule(AbstractIgnitionModule):
         ]
 
     def _inject_metadata(
-        self, data: list[dict[str, Any]], variable_mappings: dict[str, VariableMetadata]
-    ) -> list[dict[str, Any]]:
-        """Inject metadata into data points."""
+        self,
+        data: list[dict[str, Any]] | Mapping[str, np.ndarray],
+        variable_mappings: dict[str, VariableMetadata],
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Inject metadata into data points.
+
+        ``data`` is either a list of records or a columnar block (column name to
+        array, as yielded by the adapters' ``read_blocks``). A block is annotated
+        once per column: ``metadata`` describes each mapped column and
+        ``<column>_normalized`` arrays are computed in one vectorised step.
+        """
+        if isinstance(data, Mapping):
+            return self._inject_block_metadata(data, variable_mappings)
+
         enhanced_data = []
 
         for record in data:
@@ -628,18 +641,7 @@ class DataIntegrationModule(AbstractIgnitionModule):
                     metadata = variable_mappings[variable_name]
 
                     # Add variable metadata
-                    enhanced_record["metadata"][variable_name] = {
-                        "type": metadata.variable_type.value,
-                        "engineering_units": metadata.engineering_units,
-                        "range_high": metadata.range_high,
-                        "range_low": metadata.range_low,
-                        "max_value": metadata.max_value,
-                    }
-
-                    # Add PV-specific metadata
-                    if metadata.variable_type == VariableType.PV:
-                        enhanced_record["metadata"][variable_name]["is_primary_pv"] = metadata.is_primary_pv
-                        enhanced_record["metadata"][variable_name]["is_secondary_pv"] = metadata.is_secondary_pv
+                    enhanced_record["metadata"][variable_name] = self._variable_metadata(metadata)
 
                     # Add normalization if max_value is available
                     if metadata.max_value and isinstance(value, int | float):
@@ -649,6 +651,41 @@ class DataIntegrationModule(AbstractIgnitionModule):
 
         return enhanced_data
 
+    def _inject_block_metadata(
+        self, block: Mapping[str, np.ndarray], variable_mappings: dict[str, VariableMetadata]
+    ) -> dict[str, Any]:
+        """Inject metadata into a columnar block without building per-row records."""
+        enhanced_block: dict[str, Any] = dict(block)
+        enhanced_block["metadata"] = {}
+
+        for variable_name, column in block.items():
+            if variable_name in variable_mappings and variable_name != "metadata":
+                metadata = variable_mappings[variable_name]
+                enhanced_block["metadata"][variable_name] = self._variable_metadata(metadata)
+
+                values = np.asarray(column)
+                if metadata.max_value and np.issubdtype(values.dtype, np.number):
+                    enhanced_block[f"{variable_name}_normalized"] = values / metadata.max_value
+
+        return enhanced_block
+
+    def _variable_metadata(self, metadata: VariableMetadata) -> dict[str, Any]:
+        """Describe a mapped variable, including PV-specific flags."""
+        description = {
+            "type": metadata.variable_type.value,
+            "engineering_units": metadata.engineering_units,
+            "range_high": metadata.range_high,
+            "range_low": metadata.range_low,
+            "max_value": metadata.max_value,
+        }
+
+        # Add PV-specific metadata
+        if metadata.variable_type == VariableType.PV:
+            description["is_primary_pv"] = metadata.is_primary_pv
+            description["is_secondary_pv"] = metadata.is_secondary_pv
+
+        return description
+
     def _prepare_json_for_model(self, data: list[dict[str, Any]]) -> dict[str, Any]:
         """Prepare data in JSON format for model ingestion."""
         config = self.config_manager.config.get("json_output", {})
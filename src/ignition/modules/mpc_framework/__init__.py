@@ -13,6 +13,7 @@ Following crawl_mcp.py methodology:
 
 Key Components:
 - Production MPC Controller with real-time optimization
+- Vectorised MPC Controller Bank for hundreds of loops per process
 - Safety System Integration with emergency procedures
 - Alarm Management System with escalation
 - Performance Monitoring with analytics
@@ -44,6 +45,7 @@ from .control_strategies import (
     get_available_strategies,
     validate_control_strategies_environment,
 )
+from .mpc_bank import MPCControllerBank
 from .mpc_cli import MPCFrameworkCLI
 from .mpc_controller import ProductionMPCController
 from .performance_monitor import ProductionPerformanceMonitor
@@ -53,6 +55,7 @@ from .safety_system import ProductionSafetySystem
 __all__ = [
     "ControlStrategy",
     "ControlStrategyConfig",
+    "MPCControllerBank",
     "MPCFrameworkCLI",
     "ProductionAlarmManager",
     "ProductionMPCController",
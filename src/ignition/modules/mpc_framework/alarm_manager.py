@@ -16,8 +16,11 @@ Version: 14.0.0
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import os
+from collections import deque
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
@@ -282,10 +285,20 @@ class ProductionAlarmManager:
     _processing_task: asyncio.Task | None = field(default=None, init=False)
 
     # Alarm storage
+    _definitions: dict[str, AlarmDefinition] = field(default_factory=dict, init=False)
     _active_alarms: dict[str, AlarmInstance] = field(default_factory=dict, init=False)
-    _alarm_history: list[AlarmInstance] = field(default_factory=list, init=False)
+    _alarm_history: deque[AlarmInstance] = field(default_factory=deque, init=False)
     _suppressed_alarms: set[str] = field(default_factory=set, init=False)
 
+    # Deadline scheduling: (escalation deadline timestamp, sequence, alarm) min-heap
+    _escalation_queue: list[tuple[float, int, AlarmInstance]] = field(
+        default_factory=list, init=False
+    )
+    _queue_sequence: itertools.count = field(
+        default_factory=itertools.count, init=False
+    )
+    _wakeup: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+
     # Event handlers
     _alarm_handlers: list[Callable] = field(default_factory=list, init=False)
     _notification_handlers: dict[NotificationMethod, Callable] = field(
@@ -294,6 +307,8 @@ class ProductionAlarmManager:
 
     # Analytics
     _alarm_statistics: dict[str, Any] = field(default_factory=dict, init=False)
+    _resolution_minutes_total: float = field(default=0.0, init=False)
+    _escalated_active: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
         """Initialize alarm manager after creation."""
@@ -319,18 +334,21 @@ class ProductionAlarmManager:
             logger.info("✅ Alarm configuration validation passed")
 
             # Step 3: Initialize alarm definitions
-            for definition in self.config.alarm_definitions:
-                logger.info(f"✅ Alarm definition loaded: {definition.name}")
+            self._definitions = {
+                definition.alarm_id: definition
+                for definition in self.config.alarm_definitions
+            }
+            logger.info(f"✅ Alarm definitions loaded: {len(self._definitions)}")
 
             # Step 4: Initialize notification handlers
             await self._initialize_notification_handlers()
 
-            # Step 5: Start alarm processing
-            await self._start_processing()
-
-            # Step 6: Initialize analytics
+            # Step 5: Initialize analytics
             await self._initialize_analytics()
 
+            # Step 6: Start alarm processing
+            await self._start_processing()
+
             self._initialized = True
             logger.info("✅ Production Alarm Manager initialized successfully")
 
@@ -373,27 +391,33 @@ class ProductionAlarmManager:
 
     async def _start_processing(self) -> None:
         """Start alarm processing task."""
+        self._wakeup = asyncio.Event()
         self._processing_task = asyncio.create_task(self._processing_loop())
         self._processing_active = True
         logger.info("✅ Alarm processing started")
 
     async def _processing_loop(self) -> None:
-        """Main alarm processing loop."""
+        """Main alarm processing loop.
+
+        Sleeps until the earliest escalation or retention deadline, or until a
+        state change schedules an earlier one, instead of polling.
+        """
         while self._processing_active:
             try:
-                # Process escalations
+                self._wakeup.clear()
+
+                # Process due escalations
                 await self._process_escalations()
 
                 # Process notifications
                 await self._process_notifications()
 
-                # Update analytics
-                await self._update_analytics()
-
                 # Cleanup old alarms
                 await self._cleanup_old_alarms()
 
-                await asyncio.sleep(10)  # Process every 10 seconds
+                delay = self._seconds_until_next_deadline()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
 
             except asyncio.CancelledError:
                 logger.info("Alarm processing loop cancelled")
@@ -402,6 +426,35 @@ class ProductionAlarmManager:
                 logger.error(f"Alarm processing error: {e}")
                 await asyncio.sleep(10)
 
+    def _next_deadline(self) -> float | None:
+        """Timestamp of the earliest pending escalation or retention event."""
+        deadlines = []
+        if self.config.enable_escalation and self._escalation_queue:
+            deadlines.append(self._escalation_queue[0][0])
+        if self._alarm_history:
+            retention = timedelta(days=self.config.alarm_retention_days)
+            oldest = self._alarm_history[0].cleared_at
+            deadlines.append((oldest + retention).timestamp())
+        return min(deadlines, default=None)
+
+    def _seconds_until_next_deadline(self) -> float | None:
+        """Seconds to sleep before the next event, or None when nothing is scheduled."""
+        deadline = self._next_deadline()
+        if deadline is None:
+            return None
+        return max(deadline - datetime.now().timestamp(), 0.0)
+
+    def _schedule_escalation(self, alarm: AlarmInstance, deadline: float) -> None:
+        """Queue an escalation check for ``alarm`` at ``deadline`` (epoch seconds)."""
+        if not self.config.enable_escalation:
+            return
+
+        heapq.heappush(
+            self._escalation_queue, (deadline, next(self._queue_sequence), alarm)
+        )
+        if self._escalation_queue[0][2] is alarm:
+            self._wakeup.set()
+
     async def _initialize_analytics(self) -> None:
         """Initialize alarm analytics."""
         self._alarm_statistics = {
@@ -415,9 +468,69 @@ class ProductionAlarmManager:
             "average_resolution_time": 0.0,
             "escalation_rate": 0.0,
         }
+        self._resolution_minutes_total = 0.0
+        self._escalated_active = 0
 
         logger.info("✅ Alarm analytics initialized")
 
+    def _record_transition(
+        self, event: str, alarm: AlarmInstance, previous_state: AlarmState | None = None
+    ) -> None:
+        """Update alarm statistics incrementally for one state transition.
+
+        Args:
+            event: One of created, acknowledged, suppressed, escalated, cleared, expired
+            alarm: The alarm that changed
+            previous_state: State before the transition, where relevant
+        """
+        stats = self._alarm_statistics
+        priority = alarm.priority.name
+        category = alarm.definition.category
+
+        if event == "created":
+            stats["total_alarms"] += 1
+            stats["active_alarms"] += 1
+            stats["by_priority"][priority] += 1
+            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
+        elif event == "acknowledged":
+            stats["acknowledged_alarms"] += 1
+        elif event == "suppressed":
+            if previous_state == AlarmState.ACKNOWLEDGED:
+                stats["acknowledged_alarms"] -= 1
+        elif event == "escalated":
+            if alarm.escalation_level == 1:
+                self._escalated_active += 1
+        elif event == "cleared":
+            stats["active_alarms"] -= 1
+            stats["cleared_alarms"] += 1
+            stats["by_priority"][priority] -= 1
+            stats["by_category"][category] -= 1
+            if previous_state == AlarmState.ACKNOWLEDGED:
+                stats["acknowledged_alarms"] -= 1
+            if alarm.escalation_level > 0:
+                self._escalated_active -= 1
+            self._resolution_minutes_total += self._resolution_minutes(alarm)
+        elif event == "expired":
+            stats["total_alarms"] -= 1
+            stats["cleared_alarms"] -= 1
+            self._resolution_minutes_total -= self._resolution_minutes(alarm)
+
+        stats["suppressed_alarms"] = len(self._suppressed_alarms)
+        stats["average_resolution_time"] = (
+            self._resolution_minutes_total / stats["cleared_alarms"]
+            if stats["cleared_alarms"]
+            else 0.0
+        )
+        stats["escalation_rate"] = (
+            self._escalated_active / stats["active_alarms"] * 100
+            if stats["active_alarms"]
+            else 0.0
+        )
+
+    @staticmethod
+    def _resolution_minutes(alarm: AlarmInstance) -> float:
+        return (alarm.cleared_at - alarm.created_at).total_seconds() / 60
+
     async def create_alarm(
         self,
         alarm_id: str,
@@ -431,12 +544,7 @@ class ProductionAlarmManager:
 
         try:
             # Find alarm definition
-            definition = None
-            for def_item in self.config.alarm_definitions:
-                if def_item.alarm_id == alarm_id:
-                    definition = def_item
-                    break
-
+            definition = self._definitions.get(alarm_id)
             if not definition:
                 return {
                     "success": False,
@@ -465,8 +573,13 @@ class ProductionAlarmManager:
                 tags=tags or {},
             )
 
-            # Add to active alarms
+            # Add to active alarms and schedule the first escalation
             self._active_alarms[alarm_id] = alarm_instance
+            self._record_transition("created", alarm_instance)
+            self._schedule_escalation(
+                alarm_instance,
+                current_time.timestamp() + definition.escalation_timeout_minutes * 60,
+            )
 
             # Trigger event handlers
             for handler in self._alarm_handlers:
@@ -514,6 +627,8 @@ class ProductionAlarmManager:
             alarm.acknowledged_by = user
             alarm.acknowledgment_comment = comment
             alarm.last_updated = datetime.now()
+            self._suppressed_alarms.discard(alarm_id)
+            self._record_transition("acknowledged", alarm)
 
             # Trigger event handlers
             for handler in self._alarm_handlers:
@@ -542,15 +657,20 @@ class ProductionAlarmManager:
 
         try:
             alarm = self._active_alarms[alarm_id]
+            previous_state = alarm.state
 
             # Update alarm state
             alarm.state = AlarmState.CLEARED
             alarm.cleared_at = datetime.now()
             alarm.last_updated = datetime.now()
 
-            # Move to history
+            # Move to history; a pending escalation entry is dropped when popped
             self._alarm_history.append(alarm)
             del self._active_alarms[alarm_id]
+            self._suppressed_alarms.discard(alarm_id)
+            self._record_transition("cleared", alarm, previous_state)
+            if len(self._alarm_history) == 1:
+                self._wakeup.set()  # First retention deadline
 
             # Trigger event handlers
             for handler in self._alarm_handlers:
@@ -586,11 +706,13 @@ class ProductionAlarmManager:
                 }
 
             # Update alarm state
+            previous_state = alarm.state
             alarm.state = AlarmState.SUPPRESSED
             alarm.last_updated = datetime.now()
 
             # Add to suppressed set
             self._suppressed_alarms.add(alarm_id)
+            self._record_transition("suppressed", alarm, previous_state)
 
             logger.info(f"🔇 Alarm suppressed: {alarm.definition.name} by {user}")
 
@@ -678,27 +800,48 @@ class ProductionAlarmManager:
         # In real implementation, this would make actual voice calls
         logger.info(f"📞 Voice notification sent for alarm: {alarm.definition.name}")
 
-    async def _process_escalations(self) -> None:
-        """Process alarm escalations."""
+    async def _process_escalations(self, now: float | None = None) -> int:
+        """Escalate alarms whose escalation deadline has passed.
+
+        Alarms still ACTIVE at their deadline escalate one level and are
+        rescheduled one escalation timeout later. Entries for alarms that were
+        acknowledged, suppressed or cleared in the meantime are discarded.
+
+        Args:
+            now: Current time as epoch seconds (defaults to the wall clock)
+
+        Returns:
+            Number of alarms escalated
+        """
         if not self.config.enable_escalation:
-            return
+            return 0
 
-        current_time = datetime.now()
+        now = datetime.now().timestamp() if now is None else now
+        queue = self._escalation_queue
+        escalated = 0
 
-        for alarm in self._active_alarms.values():
-            if alarm.state != AlarmState.ACTIVE:
+        while queue and queue[0][0] <= now:
+            deadline, _, alarm = heapq.heappop(queue)
+            if (
+                self._active_alarms.get(alarm.alarm_id) is not alarm
+                or alarm.state != AlarmState.ACTIVE
+            ):
                 continue
 
-            # Check escalation timeout
-            time_since_created = (current_time - alarm.created_at).total_seconds() / 60
-            if time_since_created >= alarm.definition.escalation_timeout_minutes:
-                await self._escalate_alarm(alarm)
+            await self._escalate_alarm(alarm)
+            escalated += 1
+            self._schedule_escalation(
+                alarm, deadline + alarm.definition.escalation_timeout_minutes * 60
+            )
+
+        return escalated
 
     async def _escalate_alarm(self, alarm: AlarmInstance) -> None:
         """Escalate alarm to higher priority or next level."""
         try:
             alarm.escalation_level += 1
             alarm.last_updated = datetime.now()
+            self._record_transition("escalated", alarm)
 
             # Find escalation rules and send additional notifications
             for rule in self.config.notification_rules:
@@ -718,60 +861,24 @@ class ProductionAlarmManager:
         # Implementation for processing notification queue
         pass
 
-    async def _update_analytics(self) -> None:
-        """Update alarm analytics."""
-        try:
-            # Update basic statistics
-            self._alarm_statistics["total_alarms"] = len(self._active_alarms) + len(
-                self._alarm_history
-            )
-            self._alarm_statistics["active_alarms"] = len(self._active_alarms)
-            self._alarm_statistics["acknowledged_alarms"] = len(
-                [
-                    a
-                    for a in self._active_alarms.values()
-                    if a.state == AlarmState.ACKNOWLEDGED
-                ]
-            )
-            self._alarm_statistics["suppressed_alarms"] = len(self._suppressed_alarms)
-
-            # Update priority distribution
-            for alarm in self._active_alarms.values():
-                self._alarm_statistics["by_priority"][alarm.priority.name] += 1
-
-            # Calculate average resolution time
-            resolved_alarms = [a for a in self._alarm_history if a.cleared_at]
-            if resolved_alarms:
-                resolution_times = [
-                    (a.cleared_at - a.created_at).total_seconds() / 60
-                    for a in resolved_alarms
-                    if a.cleared_at
-                ]
-                self._alarm_statistics["average_resolution_time"] = sum(
-                    resolution_times
-                ) / len(resolution_times)
-
-            # Calculate escalation rate
-            escalated_alarms = len(
-                [a for a in self._active_alarms.values() if a.escalation_level > 0]
-            )
-            total_alarms = len(self._active_alarms)
-            self._alarm_statistics["escalation_rate"] = (
-                (escalated_alarms / total_alarms * 100) if total_alarms > 0 else 0.0
-            )
+    async def _cleanup_old_alarms(self, now: datetime | None = None) -> int:
+        """Drop cleared alarms past the retention period from the history.
 
-        except Exception as e:
-            logger.error(f"Analytics update error: {e}")
+        History is appended in clearing order, so expired alarms are always at
+        the front.
 
-    async def _cleanup_old_alarms(self) -> None:
-        """Clean up old alarm history."""
-        cutoff_time = datetime.now() - timedelta(days=self.config.alarm_retention_days)
+        Returns:
+            Number of alarms removed
+        """
+        now = now or datetime.now()
+        cutoff_time = now - timedelta(days=self.config.alarm_retention_days)
 
-        self._alarm_history = [
-            alarm
-            for alarm in self._alarm_history
-            if alarm.cleared_at and alarm.cleared_at > cutoff_time
-        ]
+        removed = 0
+        history = self._alarm_history
+        while history and history[0].cleared_at <= cutoff_time:
+            self._record_transition("expired", history.popleft())
+            removed += 1
+        return removed
 
     def add_alarm_handler(self, handler: Callable) -> None:
         """Add alarm event handler."""
@@ -839,6 +946,7 @@ class ProductionAlarmManager:
             self._active_alarms.clear()
             self._alarm_history.clear()
             self._suppressed_alarms.clear()
+            self._escalation_queue.clear()
             self._alarm_handlers.clear()
             self._notification_handlers.clear()
 
@@ -0,0 +1,216 @@
+"""Compact per-metric history storage for the Performance Monitor - Phase 14.
+
+Each metric is held in a ``MetricRingBuffer``: two float64 NumPy arrays of
+timestamps and values used as a circular buffer, growing by doubling up to a
+fixed capacity and evicting by age or when full. Attached ``RollingStatistics``
+windows keep running sums so the mean, variance and least-squares slope over
+the last N samples are available in O(1) per sample. The sums are taken over
+values minus a per-window shift so that metrics sitting at a large offset do
+not lose their variance to cancellation.
+
+Author: IGN Scripts Development Team
+Version: 14.0.0
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+# Windows are recomputed from the raw samples this often to cancel float drift
+REBASE_INTERVAL = 4096
+
+
+class RollingStatistics:
+    """Running mean, variance and slope over the most recent ``size`` samples.
+
+    Samples are indexed 0..n-1 from oldest to newest inside the window, so the
+    slope matches a least-squares fit of value against sample number. The
+    ``sum_*`` fields accumulate ``value - shift``, where ``shift`` is the first
+    sample of an empty window or the window mean at the last ``reset``.
+    """
+
+    __slots__ = ("count", "shift", "size", "sum_iy", "sum_y", "sum_yy")
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("Window size must be at least 1")
+        self.size = size
+        self.count = 0
+        self.shift = 0.0
+        self.sum_y = 0.0
+        self.sum_yy = 0.0
+        self.sum_iy = 0.0
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.size
+
+    def push(self, value: float, leaving: float | None = None) -> None:
+        """Add the newest sample, first dropping ``leaving`` if the window is full."""
+        if leaving is not None:
+            self.pop_front(leaving)
+        if self.count == 0:
+            self.shift = value
+        value -= self.shift
+        self.sum_iy += self.count * value
+        self.sum_y += value
+        self.sum_yy += value * value
+        self.count += 1
+
+    def pop_front(self, value: float) -> None:
+        """Remove the oldest sample (``value``) and shift the remaining indices down by one."""
+        self.count -= 1
+        value -= self.shift
+        self.sum_y -= value
+        self.sum_yy -= value * value
+        self.sum_iy -= self.sum_y
+        if self.count == 0:
+            self.sum_y = self.sum_yy = self.sum_iy = 0.0
+
+    def reset(self, values: np.ndarray) -> None:
+        """Recompute the sums exactly from the window's samples, oldest first, around their mean."""
+        self.count = len(values)
+        self.shift = float(values.mean()) if self.count else 0.0
+        deviations = values - self.shift
+        self.sum_y = float(deviations.sum())
+        self.sum_yy = float(deviations @ deviations)
+        self.sum_iy = float(np.arange(self.count) @ deviations)
+
+    @property
+    def total(self) -> float:
+        """Sum of the samples in the window."""
+        return self.shift * self.count + self.sum_y
+
+    @property
+    def mean(self) -> float:
+        return self.shift + self.sum_y / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), matching ``statistics.variance``."""
+        if self.count < 2:
+            return 0.0
+        return max(self.sum_yy - self.sum_y * self.sum_y / self.count, 0.0) / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    @property
+    def slope(self) -> float:
+        """Least-squares slope of value against sample index."""
+        n = self.count
+        if n < 2:
+            return 0.0
+        sxx = n * (n * n - 1) / 12.0
+        sxy = self.sum_iy - (n - 1) / 2.0 * self.sum_y
+        return sxy / sxx
+
+
+class MetricRingBuffer:
+    """Fixed-capacity circular buffer of (timestamp, value) samples for one metric.
+
+    Args:
+        capacity: Maximum number of samples kept; the oldest is evicted when full
+        windows: Sizes of the rolling statistics windows to maintain
+        initial_capacity: Allocated slots before the first growth
+    """
+
+    def __init__(self, capacity: int, windows: Iterable[int] = (), initial_capacity: int = 64) -> None:
+        self.windows = {size: RollingStatistics(size) for size in sorted(set(windows))}
+        if self.windows and capacity < max(self.windows):
+            raise ValueError(f"Capacity {capacity} is smaller than the largest window {max(self.windows)}")
+        self.capacity = capacity
+        allocated = max(1, min(initial_capacity, capacity))
+        self._timestamps = np.empty(allocated)
+        self._values = np.empty(allocated)
+        self._start = 0
+        self._size = 0
+        self._appended = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._timestamps.nbytes + self._values.nbytes
+
+    def _position(self, offset: int) -> int:
+        """Array slot for the ``offset``-th oldest sample."""
+        return (self._start + offset) % len(self._values)
+
+    def _grow(self) -> None:
+        """Double the allocation (up to capacity), unrolling the ring into the new arrays."""
+        allocated = min(len(self._values) * 2, self.capacity)
+        self._timestamps = np.concatenate([self.timestamps(), np.empty(allocated - self._size)])
+        self._values = np.concatenate([self.values(), np.empty(allocated - self._size)])
+        self._start = 0
+
+    def _drop_oldest(self) -> None:
+        oldest = float(self._values[self._start])
+        for window in self.windows.values():
+            if window.count == self._size:
+                window.pop_front(oldest)
+        self._start = self._position(1)
+        self._size -= 1
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting the oldest one when the buffer is at capacity."""
+        if self._size == len(self._values):
+            if self._size < self.capacity:
+                self._grow()
+            else:
+                self._drop_oldest()
+
+        slot = self._position(self._size)
+        self._timestamps[slot] = timestamp
+        self._values[slot] = value
+        self._size += 1
+        self._appended += 1
+
+        for size, window in self.windows.items():
+            leaving = float(self._values[self._position(self._size - 1 - size)]) if window.full else None
+            window.push(value, leaving)
+
+        if self._appended % REBASE_INTERVAL == 0:
+            for size, window in self.windows.items():
+                window.reset(self.values(size))
+
+    def evict_older_than(self, cutoff: float) -> int:
+        """Drop samples with timestamps before ``cutoff``; return how many were removed."""
+        removed = 0
+        while self._size and self._timestamps[self._start] < cutoff:
+            self._drop_oldest()
+            removed += 1
+        return removed
+
+    def window(self, size: int) -> RollingStatistics:
+        """Return the rolling statistics for a configured window size."""
+        return self.windows[size]
+
+    def latest(self) -> float:
+        if not self._size:
+            raise IndexError("Metric buffer is empty")
+        return float(self._values[self._position(self._size - 1)])
+
+    def _ordered(self, array: np.ndarray, last_n: int | None) -> np.ndarray:
+        count = self._size if last_n is None else min(last_n, self._size)
+        first = self._position(self._size - count)
+        end = first + count
+        if end <= len(array):
+            return array[first:end].copy()
+        return np.concatenate([array[first:], array[: end - len(array)]])
+
+    def values(self, last_n: int | None = None) -> np.ndarray:
+        """Values in chronological order, optionally only the most recent ``last_n``."""
+        return self._ordered(self._values, last_n)
+
+    def timestamps(self, last_n: int | None = None) -> np.ndarray:
+        """Timestamps (seconds since the epoch) in chronological order."""
+        return self._ordered(self._timestamps, last_n)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+        for window in self.windows.values():
+            window.reset(np.empty(0))
@@ -18,6 +18,7 @@ Version: 14.0.0
 import asyncio
 import logging
 import os
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -28,6 +29,7 @@ from typing import Any
 import numpy as np
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
 from scipy.optimize import minimize
 
 # Load environment variables
@@ -36,6 +38,18 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Weight on successive control moves inside the control horizon
+MOVE_SUPPRESSION_WEIGHT = 0.1
+
+# Upper edges (ms) of the per-cycle latency histogram buckets
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0)
+
+MPC_SOLVERS = ("condensed_qp", "slsqp")
+
+# Kalman filter tuning shared by the single-loop controller and the bank
+PROCESS_NOISE_VARIANCE = 0.01
+MEASUREMENT_NOISE_VARIANCE = 0.1
+
 
 class ModelType(Enum):
     """Process model types."""
@@ -191,6 +205,17 @@ class MPCConfiguration(BaseModel):
     convergence_tolerance: float = Field(
         default=1e-6, gt=0, description="Convergence tolerance"
     )
+    solver: str = Field(
+        default="condensed_qp",
+        description="Optimizer (condensed_qp, slsqp); slsqp is also the QP fallback",
+    )
+
+    @field_validator("solver")
+    @classmethod
+    def validate_solver(cls, v: str) -> str:
+        if v not in MPC_SOLVERS:
+            raise ValueError(f"Solver must be one of: {list(MPC_SOLVERS)}")
+        return v
 
     @field_validator("control_horizon")
     @classmethod
@@ -223,6 +248,122 @@ def format_mpc_error(error: Exception, context: str = "") -> str:
         return f"MPC controller error in {context}: {error!s}"
 
 
+def _weight_matrix(weights: list[list[float]], size: int) -> np.ndarray:
+    """Return ``weights`` as a ``size`` x ``size`` matrix, scaling identity by the first entry if shapes differ."""
+    matrix = np.atleast_2d(np.asarray(weights, dtype=float))
+    if matrix.shape != (size, size):
+        return matrix[0, 0] * np.eye(size)
+    return matrix
+
+
+def build_model_matrices(model: ProcessModel) -> dict[str, np.ndarray]:
+    """Return the discrete state-space matrices (A, B, C, D) for a process model."""
+    matrices: dict[str, np.ndarray] = {}
+
+    if model.model_type == "FOPDT":
+        # First Order Plus Dead Time model
+        gain = model.parameters["gain"]
+        tau = model.parameters["time_constant"]
+        model.parameters.get("dead_time", 0.0)
+
+        # Direct discrete-time approximation for FOPDT
+        # G(z) = K * (1-a) * z^(-d) / (z - a)
+        # where a = exp(-dt/tau), K = gain, d = delay/dt
+        dt = model.sample_time
+        a = np.exp(-dt / tau)
+        K = gain * (1 - a)
+
+        # Simple first-order discrete state space model
+        # x[k+1] = a * x[k] + K * u[k]
+        # y[k] = x[k]
+        # Note: Dead time handling would require additional states in full implementation
+
+        matrices["A"] = np.array([[a]])
+        matrices["B"] = np.array([[K]])
+        matrices["C"] = np.array([[1.0]])
+        matrices["D"] = np.array([[0.0]])
+
+    elif model.model_type == "StateSpace":
+        # Direct state space matrices (should be provided in parameters)
+        matrices["A"] = np.array(model.parameters.get("A", [[1.0]]))
+        matrices["B"] = np.array(model.parameters.get("B", [[1.0]]))
+        matrices["C"] = np.array(model.parameters.get("C", [[1.0]]))
+        matrices["D"] = np.array(model.parameters.get("D", [[0.0]]))
+
+    return matrices
+
+
+def build_condensed_qp(
+    A: np.ndarray, B: np.ndarray, C: np.ndarray, config: MPCConfiguration
+) -> dict[str, Any]:
+    """Precompute the condensed (dense) QP for a linear state-space model.
+
+    Stacks the outputs over the prediction horizon as ``Y = Φ x0 + Γ U``, where
+    ``U`` holds the control horizon's moves and the last move is held until the
+    end of the prediction horizon. The cost
+
+        Σ (r - y_k)' Q (r - y_k) + Σ u_j' R u_j + w Σ |u_j - u_{j-1}|²
+
+    then becomes ``½ U' H U + (F x0 - G r)' U`` plus a constant, so each cycle
+    only needs a matrix-vector product to form the linear term.
+
+    Args:
+        A: State transition matrix (nx x nx)
+        B: Input matrix (nx x nu)
+        C: Output matrix (ny x nx)
+        config: MPC configuration providing horizons and weights
+
+    Returns:
+        Dictionary with ``phi``, ``gamma``, ``hessian``, ``state_gain`` (F),
+        ``setpoint_gain`` (G), ``cholesky`` (factor of H, or None when H is not
+        positive definite) and the input/output dimensions.
+    """
+    n_pred = config.prediction_horizon
+    n_ctrl = config.control_horizon
+    nx, nu = B.shape
+    ny = C.shape[0]
+
+    # Φ rows are C A^k for k = 1..Np; Markov parameters C A^j B drive Γ
+    phi = np.empty((n_pred * ny, nx))
+    markov = np.empty((n_pred, ny, nu))
+    power = np.eye(nx)
+    for k in range(n_pred):
+        markov[k] = C @ power @ B
+        power = A @ power
+        phi[k * ny : (k + 1) * ny] = C @ power
+
+    gamma = np.zeros((n_pred * ny, n_ctrl * nu))
+    for k in range(n_pred):
+        rows = slice(k * ny, (k + 1) * ny)
+        for i in range(k + 1):
+            j = min(i, n_ctrl - 1)
+            gamma[rows, j * nu : (j + 1) * nu] += markov[k - i]
+
+    q_bar = np.kron(np.eye(n_pred), _weight_matrix(config.Q, ny))
+    r_bar = np.kron(np.eye(n_ctrl), _weight_matrix(config.R, nu))
+    moves = np.kron(np.eye(n_ctrl) - np.eye(n_ctrl, k=-1), np.eye(nu))[nu:]
+
+    gamma_q = gamma.T @ q_bar
+    hessian = 2.0 * (gamma_q @ gamma + r_bar + MOVE_SUPPRESSION_WEIGHT * moves.T @ moves)
+    hessian = 0.5 * (hessian + hessian.T)
+
+    try:
+        cholesky = cho_factor(hessian)
+    except LinAlgError:
+        cholesky = None
+
+    return {
+        "phi": phi,
+        "gamma": gamma,
+        "hessian": hessian,
+        "state_gain": 2.0 * gamma_q @ phi,
+        "setpoint_gain": 2.0 * gamma_q @ np.tile(np.eye(ny), (n_pred, 1)),
+        "cholesky": cholesky,
+        "n_inputs": nu,
+        "n_outputs": ny,
+    }
+
+
 # Step 5: Progressive Complexity (crawl_mcp.py methodology)
 @dataclass
 class MPCTestResult:
@@ -245,6 +386,8 @@ class ProductionMPCController:
     # Runtime state
     _initialized: bool = field(default=False, init=False)
     _model_matrices: dict[str, np.ndarray] = field(default_factory=dict, init=False)
+    _qp_matrices: dict[str, Any] = field(default_factory=dict, init=False)
+    _last_solution: np.ndarray | None = field(default=None, init=False)
     _state_estimator: dict[str, Any] = field(default_factory=dict, init=False)
 
     # Control history
@@ -254,6 +397,9 @@ class ProductionMPCController:
 
     # Performance metrics
     _performance_metrics: dict[str, float] = field(default_factory=dict, init=False)
+    _latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1), init=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize MPC controller after creation."""
@@ -290,7 +436,11 @@ class ProductionMPCController:
                 "average_computation_time": 0.0,
                 "optimization_failures": 0,
                 "constraint_violations": 0,
+                "qp_solves": 0,
+                "qp_fallbacks": 0,
+                "max_computation_time": 0.0,
             }
+            self._latency_histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
 
             self._initialized = True
             logger.info("✅ Production MPC Controller initialized successfully")
@@ -315,35 +465,16 @@ class ProductionMPCController:
         """Initialize process model matrices."""
         model = self.config.process_model
 
-        if model.model_type == "FOPDT":
-            # First Order Plus Dead Time model
-            gain = model.parameters["gain"]
-            tau = model.parameters["time_constant"]
-            model.parameters.get("dead_time", 0.0)
-
-            # Direct discrete-time approximation for FOPDT
-            # G(z) = K * (1-a) * z^(-d) / (z - a)
-            # where a = exp(-dt/tau), K = gain, d = delay/dt
-            dt = model.sample_time
-            a = np.exp(-dt / tau)
-            K = gain * (1 - a)
-
-            # Simple first-order discrete state space model
-            # x[k+1] = a * x[k] + K * u[k]
-            # y[k] = x[k]
-            # Note: Dead time handling would require additional states in full implementation
-
-            self._model_matrices["A"] = np.array([[a]])
-            self._model_matrices["B"] = np.array([[K]])
-            self._model_matrices["C"] = np.array([[1.0]])
-            self._model_matrices["D"] = np.array([[0.0]])
-
-        elif model.model_type == "StateSpace":
-            # Direct state space matrices (should be provided in parameters)
-            self._model_matrices["A"] = np.array(model.parameters.get("A", [[1.0]]))
-            self._model_matrices["B"] = np.array(model.parameters.get("B", [[1.0]]))
-            self._model_matrices["C"] = np.array(model.parameters.get("C", [[1.0]]))
-            self._model_matrices["D"] = np.array(model.parameters.get("D", [[0.0]]))
+        self._model_matrices.update(build_model_matrices(model))
+
+        # Prediction matrices and Hessian only depend on the model and config
+        self._qp_matrices = build_condensed_qp(
+            self._model_matrices["A"],
+            self._model_matrices["B"],
+            self._model_matrices["C"],
+            self.config,
+        )
+        self._last_solution = None
 
         logger.info(f"✅ Process model initialized: {model.model_type}")
 
@@ -355,8 +486,8 @@ class ProductionMPCController:
         self._state_estimator = {
             "current_state": np.zeros(n_states),
             "state_covariance": np.eye(n_states),
-            "process_noise": np.eye(n_states) * 0.01,
-            "measurement_noise": 0.1,
+            "process_noise": np.eye(n_states) * PROCESS_NOISE_VARIANCE,
+            "measurement_noise": MEASUREMENT_NOISE_VARIANCE,
         }
 
         logger.info(
@@ -370,7 +501,7 @@ class ProductionMPCController:
         if not self._initialized:
             return {"success": False, "error": "MPC controller not initialized"}
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
             # Update state estimate
@@ -394,13 +525,8 @@ class ProductionMPCController:
                 self._setpoint_history = self._setpoint_history[-max_history:]
 
             # Update performance metrics
-            computation_time = (datetime.now() - start_time).total_seconds()
-            self._performance_metrics["total_computations"] += 1
-            self._performance_metrics["average_computation_time"] = (
-                self._performance_metrics["average_computation_time"]
-                * (self._performance_metrics["total_computations"] - 1)
-                + computation_time
-            ) / self._performance_metrics["total_computations"]
+            computation_time = time.perf_counter() - start_time
+            self._record_latency(computation_time)
 
             return {
                 "success": True,
@@ -445,13 +571,104 @@ class ProductionMPCController:
             np.eye(len(x_pred)) - K @ C
         ) @ P_pred
 
+    def _record_latency(self, computation_time: float) -> None:
+        """Update running averages and the latency histogram for one cycle."""
+        metrics = self._performance_metrics
+        metrics["total_computations"] += 1
+        metrics["average_computation_time"] = (
+            metrics["average_computation_time"] * (metrics["total_computations"] - 1)
+            + computation_time
+        ) / metrics["total_computations"]
+        metrics["max_computation_time"] = max(
+            metrics["max_computation_time"], computation_time
+        )
+
+        latency_ms = computation_time * 1000
+        bucket = next(
+            (i for i, edge in enumerate(LATENCY_BUCKETS_MS) if latency_ms <= edge),
+            len(LATENCY_BUCKETS_MS),
+        )
+        self._latency_histogram[bucket] += 1
+
+    def _input_bounds(self, n_inputs: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return per-input lower and upper bounds, repeating the configured values if needed."""
+        constraints = self.config.constraints
+        lower = np.resize(np.asarray(constraints.u_min or [-np.inf], dtype=float), n_inputs)
+        upper = np.resize(np.asarray(constraints.u_max or [np.inf], dtype=float), n_inputs)
+        return lower, upper
+
     async def _solve_mpc_optimization(
         self, current_output: float, setpoint: float
     ) -> float:
-        """Solve MPC optimization problem."""
-        # Simplified MPC optimization
-        # In a full implementation, this would use a proper QP solver
+        """Solve MPC optimization problem.
+
+        Uses the precomputed condensed QP unless the SLSQP solver is configured,
+        and falls back to SLSQP when the QP solve fails.
+        """
+        if self.config.solver == "condensed_qp" and self._qp_matrices:
+            try:
+                control = self._solve_condensed_qp(setpoint)
+                self._performance_metrics["qp_solves"] += 1
+                return control
+            except (LinAlgError, RuntimeError, ValueError) as e:
+                logger.warning(f"Condensed QP failed, falling back to SLSQP: {e}")
+                self._performance_metrics["qp_fallbacks"] += 1
+                self._last_solution = None
+
+        return self._solve_slsqp(setpoint)
+
+    def _solve_condensed_qp(self, setpoint: float) -> float:
+        """Solve the box-constrained condensed QP, warm-started from the previous cycle."""
+        qp = self._qp_matrices
+        nu = qp["n_inputs"]
+        n_ctrl = self.config.control_horizon
+        x_current = np.ravel(self._state_estimator["current_state"])
+        reference = np.full(qp["n_outputs"], setpoint, dtype=float)
+
+        hessian = qp["hessian"]
+        linear = qp["state_gain"] @ x_current - qp["setpoint_gain"] @ reference
+
+        lower, upper = self._input_bounds(nu)
+        lower = np.tile(lower, n_ctrl)
+        upper = np.tile(upper, n_ctrl)
+
+        # The unconstrained optimum is exact whenever it already satisfies the bounds
+        if qp["cholesky"] is not None:
+            solution = cho_solve(qp["cholesky"], -linear)
+            if np.all(solution >= lower) and np.all(solution <= upper):
+                self._last_solution = solution
+                return float(solution[0])
+
+        # Shift the previous solution one step and repeat its last move
+        if self._last_solution is not None:
+            u_init = np.concatenate([self._last_solution[nu:], self._last_solution[-nu:]])
+        else:
+            u_init = np.zeros(n_ctrl * nu)
+        u_init = np.clip(u_init, lower, upper)
+
+        def objective(u: np.ndarray) -> tuple[float, np.ndarray]:
+            gradient = hessian @ u + linear
+            return float(0.5 * u @ (gradient + linear)), gradient
+
+        result = minimize(
+            objective,
+            u_init,
+            method="L-BFGS-B",
+            jac=True,
+            bounds=list(zip(lower, upper, strict=True)),
+            options={
+                "maxiter": self.config.max_iterations,
+                "ftol": self.config.convergence_tolerance,
+            },
+        )
+        if not result.success:
+            raise RuntimeError(f"QP did not converge: {result.message}")
+
+        self._last_solution = result.x
+        return float(result.x[0])
 
+    def _solve_slsqp(self, setpoint: float) -> float:
+        """Solve the MPC problem by simulating the model inside an SLSQP objective."""
         # Get model matrices
         A = self._model_matrices["A"]
         B = self._model_matrices["B"]
@@ -460,21 +677,14 @@ class ProductionMPCController:
         # Current state
         x_current = self._state_estimator["current_state"]
 
-        # Prediction matrices (simplified for 1D case)
-        A.shape[0]
-        B.shape[1]
-
         # Simple optimization: minimize tracking error + control effort
         def objective(u_sequence):
             cost = 0.0
             x = x_current.copy()
 
-            for k in range(self.config.control_horizon):
-                # State update
-                if k < len(u_sequence):
-                    u = u_sequence[k]
-                else:
-                    u = u_sequence[-1]  # Hold last control
+            for k in range(self.config.prediction_horizon):
+                # State update, holding the last move beyond the control horizon
+                u = u_sequence[min(k, len(u_sequence) - 1)]
 
                 x = A @ x + B @ np.array([u])
                 y = (C @ x)[0]
@@ -483,13 +693,14 @@ class ProductionMPCController:
                 tracking_error = setpoint - y
                 cost += self.config.Q[0][0] * tracking_error**2
 
-                # Control effort cost
-                cost += self.config.R[0][0] * u**2
+                if k < len(u_sequence):
+                    # Control effort cost
+                    cost += self.config.R[0][0] * u**2
 
-                # Control change cost (if not first step)
-                if k > 0:
-                    du = u - u_sequence[k - 1]
-                    cost += 0.1 * du**2
+                    # Control change cost (if not first step)
+                    if k > 0:
+                        du = u - u_sequence[k - 1]
+                        cost += MOVE_SUPPRESSION_WEIGHT * du**2
 
             return cost
 
@@ -497,24 +708,8 @@ class ProductionMPCController:
         u_init = np.zeros(self.config.control_horizon)
 
         # Constraints
-        bounds = []
-
-        for _k in range(self.config.control_horizon):
-            # Control bounds
-            bounds.append(
-                (
-                    (
-                        self.config.constraints.u_min[0]
-                        if self.config.constraints.u_min
-                        else -np.inf
-                    ),
-                    (
-                        self.config.constraints.u_max[0]
-                        if self.config.constraints.u_max
-                        else np.inf
-                    ),
-                )
-            )
+        lower, upper = self._input_bounds(1)
+        bounds = [(lower[0], upper[0])] * self.config.control_horizon
 
         # Solve optimization
         try:
@@ -585,10 +780,16 @@ class ProductionMPCController:
         else:
             tracking_stats = {"message": "Insufficient data for tracking analysis"}
 
+        # Per-cycle latency histogram, keyed by bucket upper edge
+        labels = [f"<={edge:g}ms" for edge in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]:g}ms")
+        latency_histogram = dict(zip(labels, self._latency_histogram, strict=True))
+
         return {
             "control_statistics": control_stats,
             "tracking_performance": tracking_stats,
             "system_performance": self._performance_metrics.copy(),
+            "latency_histogram": latency_histogram,
             "data_points": len(self._control_history),
         }
 
@@ -617,6 +818,8 @@ class ProductionMPCController:
         try:
             # Clear matrices and history
             self._model_matrices.clear()
+            self._qp_matrices.clear()
+            self._last_solution = None
             self._state_estimator.clear()
             self._control_history.clear()
             self._output_history.clear()
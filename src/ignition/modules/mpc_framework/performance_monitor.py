@@ -18,7 +18,7 @@ Version: 14.0.0
 import asyncio
 import logging
 import os
-import statistics
+from collections import deque
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
@@ -30,12 +30,19 @@ import numpy as np
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 
+from .metric_store import MetricRingBuffer
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sample windows used by the KPI averages and the trend analytics
+KPI_WINDOW = 100
+TREND_WINDOW = 50
+MIN_TREND_SAMPLES = 10
+
 
 class PerformanceMetric(Enum):
     """Performance metric types."""
@@ -172,6 +179,9 @@ class PerformanceConfiguration(BaseModel):
     data_retention_days: int = Field(
         default=30, ge=1, description="Data retention period"
     )
+    max_samples_per_metric: int = Field(
+        default=3600, ge=KPI_WINDOW, description="History capacity per metric"
+    )
 
     # Thresholds and KPIs
     performance_thresholds: list[PerformanceThreshold] = Field(
@@ -241,11 +251,13 @@ class ProductionPerformanceMonitor:
     _monitoring_task: asyncio.Task | None = field(default=None, init=False)
 
     # Data storage
-    _performance_data: dict[str, list[PerformanceDataPoint]] = field(
+    _performance_data: dict[str, MetricRingBuffer] = field(
         default_factory=dict, init=False
     )
+    _metric_units: dict[str, str] = field(default_factory=dict, init=False)
     _kpi_values: dict[str, float] = field(default_factory=dict, init=False)
-    _alert_history: list[dict[str, Any]] = field(default_factory=list, init=False)
+    _kpi_metrics: dict[str, list[str]] = field(default_factory=dict, init=False)
+    _alert_history: deque[dict[str, Any]] = field(default_factory=deque, init=False)
 
     # Analytics
     _trend_analysis: dict[str, dict[str, float]] = field(
@@ -277,8 +289,13 @@ class ProductionPerformanceMonitor:
             logger.info("✅ Performance configuration validation passed")
 
             # Step 3: Initialize data structures
+            self._kpi_metrics = {kpi.kpi_name: [] for kpi in self.config.kpis}
             for threshold in self.config.performance_thresholds:
-                self._performance_data[threshold.metric_name] = []
+                self.register_metric(
+                    threshold.metric_name,
+                    threshold.metric_type.value,
+                    windows=(threshold.time_window_minutes,),
+                )
 
             for kpi in self.config.kpis:
                 self._kpi_values[kpi.kpi_name] = 0.0
@@ -310,6 +327,63 @@ class ProductionPerformanceMonitor:
             logger.error(f"❌ Performance monitor initialization failed: {error_msg}")
             return {"success": False, "error": error_msg}
 
+    def register_metric(
+        self, metric_name: str, unit: str, windows: tuple[int, ...] = ()
+    ) -> MetricRingBuffer:
+        """Create (or extend) the ring buffer for a metric.
+
+        Args:
+            metric_name: Metric name
+            unit: Unit reported for the metric's data points
+            windows: Extra rolling-statistics window sizes, in samples
+
+        Returns:
+            The metric's ring buffer
+        """
+        sizes = {KPI_WINDOW, TREND_WINDOW, *windows}
+        buffer = self._performance_data.get(metric_name)
+        if buffer is None or not sizes.issubset(buffer.windows):
+            if buffer is not None:
+                sizes |= set(buffer.windows)
+            capacity = max(self.config.max_samples_per_metric, *sizes)
+            new_buffer = MetricRingBuffer(capacity, windows=sizes)
+            if buffer is not None:
+                for timestamp, value in zip(
+                    buffer.timestamps(), buffer.values(), strict=True
+                ):
+                    new_buffer.append(timestamp, value)
+            buffer = self._performance_data[metric_name] = new_buffer
+        self._metric_units[metric_name] = unit
+
+        # Average KPIs pool every metric whose name contains the KPI name
+        for kpi_name, metric_names in self._kpi_metrics.items():
+            related = kpi_name.lower() in metric_name.lower()
+            if related and metric_name not in metric_names:
+                metric_names.append(metric_name)
+        return buffer
+
+    def get_data_points(
+        self, metric_name: str, last_n: int | None = None
+    ) -> list[PerformanceDataPoint]:
+        """Materialize stored samples for a metric as data points, oldest first."""
+        buffer = self._performance_data.get(metric_name)
+        if buffer is None:
+            return []
+
+        tags = {"system": self.config.system_name}
+        return [
+            PerformanceDataPoint(
+                timestamp=datetime.fromtimestamp(timestamp),
+                metric_name=metric_name,
+                value=float(value),
+                unit=self._metric_units.get(metric_name, ""),
+                tags=dict(tags),
+            )
+            for timestamp, value in zip(
+                buffer.timestamps(last_n), buffer.values(last_n), strict=True
+            )
+        ]
+
     async def _initialize_analytics(self) -> None:
         """Initialize analytics components."""
         for threshold in self.config.performance_thresholds:
@@ -357,7 +431,7 @@ class ProductionPerformanceMonitor:
 
     async def _collect_performance_data(self) -> None:
         """Collect performance data from various sources."""
-        current_time = datetime.now()
+        current_time = datetime.now().timestamp()
 
         # Simulate data collection (in real implementation, this would
         # interface with actual monitoring systems)
@@ -365,19 +439,11 @@ class ProductionPerformanceMonitor:
             # Generate realistic performance data
             base_value = 50.0
             noise = np.random.normal(0, 5)
-            trend = 0.1 * (current_time.timestamp() % 3600) / 3600  # Hourly trend
+            trend = 0.1 * (current_time % 3600) / 3600  # Hourly trend
 
             value = base_value + noise + trend
 
-            data_point = PerformanceDataPoint(
-                timestamp=current_time,
-                metric_name=threshold.metric_name,
-                value=value,
-                unit=threshold.metric_type.value,
-                tags={"system": self.config.system_name},
-            )
-
-            self._performance_data[threshold.metric_name].append(data_point)
+            self._performance_data[threshold.metric_name].append(current_time, value)
 
     async def _update_kpis(self) -> None:
         """Update KPI calculations."""
@@ -400,14 +466,15 @@ class ProductionPerformanceMonitor:
 
     async def _calculate_average_kpi(self, kpi_name: str) -> float:
         """Calculate average-based KPI."""
-        # Find related performance data
-        related_data = []
-        for metric_name, data_points in self._performance_data.items():
-            if kpi_name.lower() in metric_name.lower():
-                recent_data = [dp.value for dp in data_points[-100:]]  # Last 100 points
-                related_data.extend(recent_data)
+        # Pool the last KPI_WINDOW points of every related metric
+        total = 0.0
+        count = 0
+        for metric_name in self._kpi_metrics.get(kpi_name, []):
+            window = self._performance_data[metric_name].window(KPI_WINDOW)
+            total += window.total
+            count += window.count
 
-        return statistics.mean(related_data) if related_data else 0.0
+        return total / count if count else 0.0
 
     async def _calculate_efficiency_kpi(self, kpi_name: str) -> float:
         """Calculate efficiency-based KPI."""
@@ -425,15 +492,14 @@ class ProductionPerformanceMonitor:
             if threshold.metric_name not in self._performance_data:
                 continue
 
-            recent_data = self._performance_data[threshold.metric_name][
-                -threshold.time_window_minutes :
-            ]
-            if not recent_data:
+            # Aggregated value over the most recent time_window_minutes samples
+            window = self._performance_data[threshold.metric_name].window(
+                threshold.time_window_minutes
+            )
+            if not window.count:
                 continue
 
-            # Calculate aggregated value for time window
-            values = [dp.value for dp in recent_data]
-            avg_value = statistics.mean(values)
+            avg_value = window.mean
 
             # Check thresholds
             alert_level = None
@@ -510,22 +576,18 @@ class ProductionPerformanceMonitor:
 
     async def _update_analytics(self) -> None:
         """Update trend analysis and predictions."""
-        for metric_name, data_points in self._performance_data.items():
-            if len(data_points) < 10:  # Need minimum data for analysis
+        for metric_name, buffer in self._performance_data.items():
+            if len(buffer) < MIN_TREND_SAMPLES:  # Need minimum data for analysis
                 continue
 
             try:
-                # Calculate trend
-                recent_values = [dp.value for dp in data_points[-50:]]  # Last 50 points
-                trend = self._calculate_trend(recent_values)
-
-                # Calculate volatility
-                volatility = (
-                    statistics.stdev(recent_values) if len(recent_values) > 1 else 0.0
-                )
+                # Trend and volatility over the last TREND_WINDOW points
+                window = buffer.window(TREND_WINDOW)
+                trend = window.slope
+                volatility = window.stdev
 
                 # Simple prediction (linear extrapolation)
-                prediction = recent_values[-1] + trend
+                prediction = buffer.latest() + trend
 
                 self._trend_analysis[metric_name] = {
                     "trend": trend,
@@ -536,38 +598,18 @@ class ProductionPerformanceMonitor:
             except Exception as e:
                 logger.error(f"Analytics update error for {metric_name}: {e}")
 
-    def _calculate_trend(self, values: list[float]) -> float:
-        """Calculate trend using simple linear regression."""
-        if len(values) < 2:
-            return 0.0
-
-        n = len(values)
-        x = list(range(n))
-
-        # Calculate slope using least squares
-        x_mean = statistics.mean(x)
-        y_mean = statistics.mean(values)
-
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        return numerator / denominator if denominator != 0 else 0.0
-
     async def _cleanup_old_data(self) -> None:
         """Clean up old performance data based on retention policy."""
         cutoff_time = datetime.now() - timedelta(days=self.config.data_retention_days)
+        cutoff_timestamp = cutoff_time.timestamp()
 
-        for metric_name in self._performance_data:
-            self._performance_data[metric_name] = [
-                dp
-                for dp in self._performance_data[metric_name]
-                if dp.timestamp > cutoff_time
-            ]
+        for buffer in self._performance_data.values():
+            buffer.evict_older_than(cutoff_timestamp)
 
-        # Clean up old alerts
-        self._alert_history = [
-            alert for alert in self._alert_history if alert["timestamp"] > cutoff_time
-        ]
+        # Clean up old alerts (appended in time order)
+        alerts = self._alert_history
+        while alerts and alerts[0]["timestamp"] <= cutoff_time:
+            alerts.popleft()
 
     def get_performance_summary(self) -> dict[str, Any]:
         """Get comprehensive performance summary."""
@@ -575,15 +617,15 @@ class ProductionPerformanceMonitor:
 
         # Calculate data statistics
         data_stats = {}
-        for metric_name, data_points in self._performance_data.items():
-            if data_points:
-                values = [dp.value for dp in data_points[-100:]]  # Last 100 points
+        for metric_name, buffer in self._performance_data.items():
+            if len(buffer):
+                values = buffer.values(KPI_WINDOW)  # Last 100 points
                 data_stats[metric_name] = {
-                    "current": values[-1] if values else 0.0,
-                    "average": statistics.mean(values) if values else 0.0,
-                    "min": min(values) if values else 0.0,
-                    "max": max(values) if values else 0.0,
-                    "data_points": len(data_points),
+                    "current": float(values[-1]),
+                    "average": buffer.window(KPI_WINDOW).mean,
+                    "min": float(values.min()),
+                    "max": float(values.max()),
+                    "data_points": len(buffer),
                 }
 
         return {
@@ -660,7 +702,9 @@ class ProductionPerformanceMonitor:
 
             # Clear data structures
             self._performance_data.clear()
+            self._metric_units.clear()
             self._kpi_values.clear()
+            self._kpi_metrics.clear()
             self._alert_history.clear()
             self._trend_analysis.clear()
 
@@ -18,13 +18,16 @@ Version: 14.0.0
 import asyncio
 import logging
 import os
-from collections.abc import AsyncIterator, Callable
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import numpy as np
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 
@@ -34,6 +37,13 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Parameters not updated for this long raise a stale-data alarm
+STALE_DATA_SECONDS = 60.0
+
+# Latency samples kept for the update and watchdog percentiles
+LATENCY_SAMPLES = 1000
+LATENCY_PERCENTILES = (50, 95, 99)
+
 
 class SafetyLevel(Enum):
     """Safety integrity levels."""
@@ -253,6 +263,25 @@ class ProductionSafetySystem:
     _last_update: dict[str, datetime] = field(default_factory=dict, init=False)
     _watchdog_task: asyncio.Task | None = field(default=None, init=False)
 
+    # Compiled limit index: position i holds the limits of parameter_names[i]
+    _limit_index: dict[str, int] = field(default_factory=dict, init=False)
+    _low_limits: np.ndarray = field(default_factory=lambda: np.empty(0), init=False)
+    _high_limits: np.ndarray = field(default_factory=lambda: np.empty(0), init=False)
+    _update_times: np.ndarray = field(default_factory=lambda: np.empty(0), init=False)
+    _parameter_names: list[str] = field(default_factory=list, init=False)
+    _unindexed_parameters: set[str] = field(default_factory=set, init=False)
+
+    # Latency samples in milliseconds
+    _update_latencies: deque = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES), init=False
+    )
+    _batch_latencies: deque = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES), init=False
+    )
+    _watchdog_latencies: deque = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES), init=False
+    )
+
     # Event handlers
     _alarm_handlers: list[Callable] = field(default_factory=list, init=False)
     _emergency_handlers: list[Callable] = field(default_factory=list, init=False)
@@ -260,6 +289,28 @@ class ProductionSafetySystem:
     def __post_init__(self) -> None:
         """Initialize safety system after creation."""
         logger.info("🛡️ Initializing Production Safety System")
+        self._compile_limit_index()
+
+    def _compile_limit_index(self) -> None:
+        """Build the name lookup and limit arrays aligned to ``parameter_names``.
+
+        Missing limits become -inf/+inf so one comparison covers every parameter.
+        """
+        limits = self.config.safety_limits
+        self._parameter_names = [limit.parameter_name for limit in limits]
+        self._limit_index = {name: i for i, name in enumerate(self._parameter_names)}
+        self._low_limits = np.array([limit.low_limit for limit in limits], dtype=float)
+        self._high_limits = np.array(
+            [limit.high_limit for limit in limits], dtype=float
+        )
+        self._low_limits[np.isnan(self._low_limits)] = -np.inf
+        self._high_limits[np.isnan(self._high_limits)] = np.inf
+        self._update_times = np.full(len(limits), time.time())
+
+    @property
+    def parameter_names(self) -> list[str]:
+        """Limited parameters in index order, as expected by vector batch updates."""
+        return list(self._parameter_names)
 
     async def initialize(self) -> dict[str, Any]:
         """Initialize safety system with comprehensive validation."""
@@ -282,9 +333,11 @@ class ProductionSafetySystem:
             logger.info("✅ Safety configuration validation passed")
 
             # Step 3: Initialize parameter monitoring
+            now = datetime.now()
             for limit in self.config.safety_limits:
                 self._parameter_values[limit.parameter_name] = 0.0
-                self._last_update[limit.parameter_name] = datetime.now()
+                self._last_update[limit.parameter_name] = now
+            self._update_times.fill(now.timestamp())
 
             # Step 4: Start watchdog monitoring
             await self._start_watchdog()
@@ -327,9 +380,13 @@ class ProductionSafetySystem:
         """Safety watchdog monitoring loop."""
         while self._initialized:
             try:
+                start_time = time.perf_counter()
                 await self._check_safety_parameters()
                 await self._check_communication_health()
                 await self._update_safety_state()
+                self._watchdog_latencies.append(
+                    (time.perf_counter() - start_time) * 1000
+                )
 
                 await asyncio.sleep(self.config.watchdog_interval)
 
@@ -358,12 +415,21 @@ class ProductionSafetySystem:
             return {"success": False, "error": "Safety system not initialized"}
 
         try:
+            start_time = time.perf_counter()
+
             # Update parameter value
+            now = datetime.now()
             self._parameter_values[parameter_name] = value
-            self._last_update[parameter_name] = datetime.now()
+            self._last_update[parameter_name] = now
+            index = self._limit_index.get(parameter_name)
+            if index is None:
+                self._unindexed_parameters.add(parameter_name)
+            else:
+                self._update_times[index] = now.timestamp()
 
             # Check safety limits
             safety_check = await self._check_parameter_safety(parameter_name, value)
+            self._update_latencies.append((time.perf_counter() - start_time) * 1000)
 
             return {
                 "success": True,
@@ -386,57 +452,147 @@ class ProductionSafetySystem:
                 "emergency_triggered": True,
             }
 
+    async def update_parameters_batch(
+        self, values: Mapping[str, float] | Sequence[float] | np.ndarray
+    ) -> dict[str, Any]:
+        """Update many parameters and check them against their limits in one pass.
+
+        Args:
+            values: New values keyed by parameter name, or a vector aligned to
+                ``parameter_names`` holding a value for every limited parameter
+
+        Returns:
+            Batch result listing a safety check only for each violated limit
+        """
+        if not self._initialized:
+            return {"success": False, "error": "Safety system not initialized"}
+
+        if isinstance(values, Mapping):
+            names = list(values)
+            vector = np.fromiter(values.values(), dtype=float, count=len(names))
+            positions = np.fromiter(
+                (self._limit_index.get(name, -1) for name in names),
+                dtype=np.intp,
+                count=len(names),
+            )
+            known = positions >= 0
+            if not known.all():
+                self._unindexed_parameters.update(
+                    name for name, ok in zip(names, known, strict=True) if not ok
+                )
+                vector, positions = vector[known], positions[known]
+        else:
+            vector = np.asarray(values, dtype=float)
+            if vector.shape != self._low_limits.shape:
+                return {
+                    "success": False,
+                    "error": (
+                        f"Expected {len(self._low_limits)} values aligned to "
+                        f"parameter_names, got shape {vector.shape}"
+                    ),
+                }
+            names = self._parameter_names
+            positions = np.arange(len(vector))
+
+        try:
+            start_time = time.perf_counter()
+
+            # Update parameter values
+            now = datetime.now()
+            if isinstance(values, Mapping):
+                self._parameter_values.update(values)
+            else:
+                self._parameter_values.update(zip(names, vector.tolist(), strict=True))
+            self._last_update.update(dict.fromkeys(names, now))
+            self._update_times[positions] = now.timestamp()
+
+            # Check every limit at once; only violations create alarms
+            low = vector < self._low_limits[positions]
+            high = ~low & (vector > self._high_limits[positions])
+            violations = []
+            for violation, mask in (("low", low), ("high", high)):
+                for i in np.flatnonzero(mask):
+                    index = int(positions[i])
+                    safety_check = await self._raise_limit_alarm(
+                        index, violation, float(vector[i])
+                    )
+                    violations.append(
+                        {
+                            "parameter": self._parameter_names[index],
+                            "value": float(vector[i]),
+                            **safety_check,
+                        }
+                    )
+            self._batch_latencies.append((time.perf_counter() - start_time) * 1000)
+
+            return {
+                "success": True,
+                "updated": len(names),
+                "checked": len(positions),
+                "safe": not violations,
+                "violations": violations,
+                "current_state": self._current_state.value,
+            }
+
+        except Exception as e:
+            error_msg = format_safety_error(e, "batch parameter update")
+            logger.error(f"❌ Batch parameter update failed: {error_msg}")
+
+            # Trigger emergency response for critical failures
+            await self._trigger_emergency_response("Parameter update failure")
+
+            return {
+                "success": False,
+                "error": error_msg,
+                "emergency_triggered": True,
+            }
+
     async def _check_parameter_safety(
         self, parameter_name: str, value: float
     ) -> dict[str, Any]:
         """Check if parameter value violates safety limits."""
-        # Find safety limit for this parameter
-        safety_limit = None
-        for limit in self.config.safety_limits:
-            if limit.parameter_name == parameter_name:
-                safety_limit = limit
-                break
-
-        if not safety_limit:
+        index = self._limit_index.get(parameter_name)
+        if index is None:
             return {"safe": True, "message": "No safety limit configured"}
 
         # Check limits
         violation = None
-        if safety_limit.low_limit is not None and value < safety_limit.low_limit:
+        if value < self._low_limits[index]:
             violation = "low"
-        elif safety_limit.high_limit is not None and value > safety_limit.high_limit:
+        elif value > self._high_limits[index]:
             violation = "high"
 
         if violation:
-            # Create alarm
-            alarm_id = f"{parameter_name}_{violation}_limit"
-            await self._create_alarm(
-                alarm_id=alarm_id,
-                parameter=parameter_name,
-                value=value,
-                limit=(
-                    safety_limit.low_limit
-                    if violation == "low"
-                    else safety_limit.high_limit
-                ),
-                priority=safety_limit.alarm_priority,
-                safety_level=safety_limit.safety_level,
-            )
-
-            return {
-                "safe": False,
-                "violation": violation,
-                "limit_violated": (
-                    safety_limit.low_limit
-                    if violation == "low"
-                    else safety_limit.high_limit
-                ),
-                "safety_level": safety_limit.safety_level.value,
-                "alarm_created": alarm_id,
-            }
+            return await self._raise_limit_alarm(index, violation, value)
 
         return {"safe": True, "message": "Parameter within safety limits"}
 
+    async def _raise_limit_alarm(
+        self, index: int, violation: str, value: float
+    ) -> dict[str, Any]:
+        """Create the alarm for a violated limit and return its safety check."""
+        safety_limit = self.config.safety_limits[index]
+        limit = (
+            safety_limit.low_limit if violation == "low" else safety_limit.high_limit
+        )
+        alarm_id = f"{safety_limit.parameter_name}_{violation}_limit"
+        await self._create_alarm(
+            alarm_id=alarm_id,
+            parameter=safety_limit.parameter_name,
+            value=value,
+            limit=limit,
+            priority=safety_limit.alarm_priority,
+            safety_level=safety_limit.safety_level,
+        )
+
+        return {
+            "safe": False,
+            "violation": violation,
+            "limit_violated": limit,
+            "safety_level": safety_limit.safety_level.value,
+            "alarm_created": alarm_id,
+        }
+
     async def _create_alarm(
         self,
         alarm_id: str,
@@ -592,18 +748,28 @@ class ProductionSafetySystem:
         """Check all safety parameters for violations."""
         current_time = datetime.now()
 
-        for parameter_name, last_update in self._last_update.items():
-            # Check for stale data
-            if (current_time - last_update).total_seconds() > 60:  # 1 minute timeout
-                logger.warning(f"Stale data for parameter: {parameter_name}")
-                await self._create_alarm(
-                    alarm_id=f"{parameter_name}_stale_data",
-                    parameter=parameter_name,
-                    value=self._parameter_values[parameter_name],
-                    limit=0.0,
-                    priority=AlarmPriority.HIGH,
-                    safety_level=SafetyLevel.SIL_2,
-                )
+        # Check for stale data
+        stale = np.flatnonzero(
+            current_time.timestamp() - self._update_times > STALE_DATA_SECONDS
+        ).tolist()
+        stale_names = [self._parameter_names[i] for i in stale]
+        stale_names.extend(
+            name
+            for name in self._unindexed_parameters
+            if (current_time - self._last_update[name]).total_seconds()
+            > STALE_DATA_SECONDS
+        )
+
+        for parameter_name in stale_names:
+            logger.warning(f"Stale data for parameter: {parameter_name}")
+            await self._create_alarm(
+                alarm_id=f"{parameter_name}_stale_data",
+                parameter=parameter_name,
+                value=self._parameter_values[parameter_name],
+                limit=0.0,
+                priority=AlarmPriority.HIGH,
+                safety_level=SafetyLevel.SIL_2,
+            )
 
     async def _check_communication_health(self) -> None:
         """Check communication health with external systems."""
@@ -679,6 +845,25 @@ class ProductionSafetySystem:
             },
             "alarms": list(self._active_alarms.values()),
             "parameter_values": self._parameter_values.copy(),
+            "latency_ms": {
+                "update": self._latency_percentiles(self._update_latencies),
+                "batch_update": self._latency_percentiles(self._batch_latencies),
+                "watchdog": self._latency_percentiles(self._watchdog_latencies),
+            },
+        }
+
+    @staticmethod
+    def _latency_percentiles(samples: deque) -> dict[str, float]:
+        """Summarise latency samples as p50/p95/p99 in milliseconds."""
+        if not samples:
+            return {"samples": 0}
+        values = np.percentile(np.fromiter(samples, dtype=float), LATENCY_PERCENTILES)
+        return {
+            "samples": len(samples),
+            **{
+                f"p{p}": float(v)
+                for p, v in zip(LATENCY_PERCENTILES, values, strict=True)
+            },
         }
 
     # Step 6: Resource Management (crawl_mcp.py methodology)
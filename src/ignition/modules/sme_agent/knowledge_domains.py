@@ -9,14 +9,20 @@ Following crawl_mcp.py methodology for systematic development:
 - Step 6: Resource management and cleanup
 """
 
+import hashlib
+import heapq
 import json
 import logging
+import math
+import re
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from dotenv import load_dotenv
 
@@ -80,6 +86,177 @@ class DomainQueryResult:
         }
 
 
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_SUBWORD_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+_STOPWORDS = frozenset(
+    {"a", "an", "and", "are", "as", "at", "be", "by", "do", "for", "from", "how", "i", "in", "is", "it", "of"}
+    | {"on", "or", "that", "the", "this", "to", "what", "when", "with", "you"}
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-case search terms.
+
+    camelCase and digit runs are also indexed as parts, so ``listDevices``
+    matches both ``listdevices`` and ``devices``. A plural ``s`` is dropped.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Search terms in order of appearance, without stopwords
+    """
+    terms = []
+    for word in _WORD_PATTERN.findall(text):
+        parts = _SUBWORD_PATTERN.findall(word)
+        for term in [word, *parts] if len(parts) > 1 else [word]:
+            term = term.lower()
+            if term in _STOPWORDS:
+                continue
+            if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+                term = term[:-1]
+            terms.append(term)
+    return terms
+
+
+def _content_text(value: Any) -> Iterator[str]:
+    """Yield the text values nested in item content."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for nested in value.values():
+            yield from _content_text(nested)
+    elif isinstance(value, list | tuple | set):
+        for nested in value:
+            yield from _content_text(nested)
+    elif value is not None:
+        yield str(value)
+
+
+class KnowledgeIndex:
+    """Tokenised inverted index ranking knowledge items with BM25.
+
+    Each item is tokenised once when added. Its fields are folded into one
+    weighted term frequency per term, so a name or tag match outweighs a match
+    in the content. A query only visits the postings of its own terms, so
+    items that match none of them add nothing to its cost.
+    """
+
+    FIELD_WEIGHTS: ClassVar[dict[str, float]] = {
+        "name": 3.0,
+        "tags": 2.0,
+        "category": 2.0,
+        "description": 1.5,
+        "content": 1.0,
+    }
+
+    def __init__(self: Self, k1: float = 1.2, b: float = 0.75):
+        """Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict[str, float]] = {}
+        self.document_terms: dict[str, dict[str, float]] = {}
+        self.document_lengths: dict[str, float] = {}
+        self.total_length = 0.0
+
+    def __len__(self: Self) -> int:
+        return len(self.document_terms)
+
+    def __contains__(self: Self, item_id: str) -> bool:
+        return item_id in self.document_terms
+
+    def add(self: Self, item: DomainKnowledgeItem) -> None:
+        """Index an item, replacing its previous version."""
+        fields = {
+            "name": [item.name],
+            "tags": item.tags,
+            "category": [item.category],
+            "description": [item.description],
+            "content": _content_text(item.content),
+        }
+        terms: dict[str, float] = {}
+        for field_name, texts in fields.items():
+            weight = self.FIELD_WEIGHTS[field_name]
+            for text in texts:
+                for term in tokenize(text):
+                    terms[term] = terms.get(term, 0.0) + weight
+        self._insert(item.id, terms)
+
+    def _insert(self: Self, item_id: str, terms: dict[str, float]) -> None:
+        self.remove(item_id)
+        self.document_terms[item_id] = terms
+        self.document_lengths[item_id] = sum(terms.values())
+        self.total_length += self.document_lengths[item_id]
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[item_id] = frequency
+
+    def remove(self: Self, item_id: str) -> bool:
+        """Remove an item from the index.
+
+        Returns:
+            True if the item was indexed, False otherwise
+        """
+        terms = self.document_terms.pop(item_id, None)
+        if terms is None:
+            return False
+
+        self.total_length -= self.document_lengths.pop(item_id)
+        for term in terms:
+            posting = self.postings[term]
+            del posting[item_id]
+            if not posting:
+                del self.postings[term]
+        return True
+
+    def search(self: Self, query: str, limit: int) -> list[tuple[str, float]]:
+        """Rank indexed items against a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            (item_id, score) pairs of matching items, best first
+        """
+        if not self.document_terms or limit <= 0:
+            return []
+
+        document_count = len(self.document_terms)
+        average_length = self.total_length / document_count or 1.0
+        scores: dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+
+            idf = math.log(1.0 + (document_count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for item_id, frequency in posting.items():
+                length_norm = 1.0 - self.b + self.b * self.document_lengths[item_id] / average_length
+                scores[item_id] = scores.get(item_id, 0.0) + idf * frequency * (self.k1 + 1.0) / (
+                    frequency + self.k1 * length_norm
+                )
+
+        return heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {"k1": self.k1, "b": self.b, "documents": self.document_terms}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "KnowledgeIndex":
+        """Restore an index without re-tokenizing its items."""
+        index = cls(data.get("k1", 1.2), data.get("b", 0.75))
+        for item_id, terms in data.get("documents", {}).items():
+            index._insert(item_id, terms)
+        return index
+
+
 class BaseDomainManager(ABC):
     """Base class for domain knowledge managers.
 
@@ -107,6 +284,7 @@ class BaseDomainManager(ABC):
 
         # Knowledge storage
         self.knowledge_items: dict[str, DomainKnowledgeItem] = {}
+        self.index = KnowledgeIndex()
         self.categories: dict[str, list[str]] = {}
         self.statistics: dict[str, Any] = {
             "total_items": 0,
@@ -189,6 +367,50 @@ class BaseDomainManager(ABC):
         """
         pass
 
+    def add_knowledge_item(self: Self, item: DomainKnowledgeItem) -> None:
+        """Add or replace a knowledge item and update the search index.
+
+        Args:
+            item: Knowledge item to store
+        """
+        self.knowledge_items[item.id] = item
+        self.index.add(item)
+
+    def remove_knowledge_item(self: Self, item_id: str) -> bool:
+        """Remove a knowledge item and its search index entry.
+
+        Args:
+            item_id: ID of the item to remove
+
+        Returns:
+            True if the item existed, False otherwise
+        """
+        self.index.remove(item_id)
+        return self.knowledge_items.pop(item_id, None) is not None
+
+    def rebuild_index(self: Self) -> None:
+        """Rebuild the search index from all knowledge items."""
+        self.index = KnowledgeIndex(self.index.k1, self.index.b)
+        for item in self.knowledge_items.values():
+            self.index.add(item)
+
+    def search_knowledge(self: Self, query: str, limit: int = 5) -> list[tuple[DomainKnowledgeItem, float]]:
+        """Rank knowledge items against a query with the BM25 index.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            (item, score) pairs of matching items, best first
+        """
+        if len(self.index) != len(self.knowledge_items):
+            # Items were assigned directly instead of through add_knowledge_item
+            self.rebuild_index()
+
+        hits = self.index.search(query, limit)
+        return [(self.knowledge_items[item_id], score) for item_id, score in hits]
+
     def get_statistics(self: Self) -> dict[str, Any]:
         """Get domain statistics."""
         return self.statistics.copy()
@@ -216,6 +438,7 @@ class BaseDomainManager(ABC):
         try:
             knowledge_file = self.data_dir / "knowledge_base.json"
             stats_file = self.data_dir / "statistics.json"
+            index_file = self.data_dir / "search_index.json"
 
             # Save knowledge items
             knowledge_data = {
@@ -225,8 +448,17 @@ class BaseDomainManager(ABC):
                 "saved_at": datetime.now().isoformat(),
             }
 
-            with open(knowledge_file, "w", encoding="utf-8") as f:
-                json.dump(knowledge_data, f, indent=2, ensure_ascii=False)
+            knowledge_bytes = json.dumps(knowledge_data, indent=2, ensure_ascii=False).encode("utf-8")
+            knowledge_file.write_bytes(knowledge_bytes)
+
+            # Save the search index, tied to the knowledge base it was built from
+            if len(self.index) != len(self.knowledge_items):
+                self.rebuild_index()
+            index_data = {
+                "knowledge_sha256": hashlib.sha256(knowledge_bytes).hexdigest(),
+                **self.index.to_dict(),
+            }
+            index_file.write_text(json.dumps(index_data, ensure_ascii=False), encoding="utf-8")
 
             # Save statistics
             with open(stats_file, "w", encoding="utf-8") as f:
@@ -248,10 +480,11 @@ class BaseDomainManager(ABC):
         try:
             knowledge_file = self.data_dir / "knowledge_base.json"
             stats_file = self.data_dir / "statistics.json"
+            index_file = self.data_dir / "search_index.json"
 
             if knowledge_file.exists():
-                with open(knowledge_file, encoding="utf-8") as f:
-                    knowledge_data = json.load(f)
+                knowledge_bytes = knowledge_file.read_bytes()
+                knowledge_data = json.loads(knowledge_bytes)
 
                 # Load knowledge items
                 for item_id, item_data in knowledge_data.get("items", {}).items():
@@ -259,6 +492,7 @@ class BaseDomainManager(ABC):
                     self.knowledge_items[item_id] = DomainKnowledgeItem(**item_data)
 
                 self.categories = knowledge_data.get("categories", {})
+                self._load_index(index_file, hashlib.sha256(knowledge_bytes).hexdigest())
 
             if stats_file.exists():
                 with open(stats_file, encoding="utf-8") as f:
@@ -273,6 +507,21 @@ class BaseDomainManager(ABC):
             self.logger.error(f"Failed to load knowledge base: {e}")
             return False
 
+    def _load_index(self: Self, index_file: Path, knowledge_sha256: str) -> None:
+        """Load the saved search index, rebuilding it if it is missing or stale."""
+        try:
+            with open(index_file, encoding="utf-8") as f:
+                index_data = json.load(f)
+            if index_data.get("knowledge_sha256") == knowledge_sha256:
+                self.index = KnowledgeIndex.from_dict(index_data)
+                if self.index.document_terms.keys() == self.knowledge_items.keys():
+                    return
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Search index not loaded: {e}")
+
+        self.logger.info(f"Rebuilding search index for {self.domain_name}")
+        self.rebuild_index()
+
 
 class GatewayScriptingDomainManager(BaseDomainManager):
     """Gateway Scripting Domain Manager.
@@ -418,8 +667,7 @@ except Exception as e:
 
         # Add startup examples
         for example in startup_examples:
-            item = DomainKnowledgeItem(**example)
-            self.knowledge_items[item.id] = item
+            self.add_knowledge_item(DomainKnowledgeItem(**example))
 
         # Tag event script examples
         tag_event_examples = [
@@ -476,8 +724,7 @@ def valueChanged(tag, tagPath, previousValue, currentValue, initialChange, misse
 
         # Add tag event examples
         for example in tag_event_examples:
-            item = DomainKnowledgeItem(**example)
-            self.knowledge_items[item.id] = item
+            self.add_knowledge_item(DomainKnowledgeItem(**example))
 
         # Update categories
         self.categories = {
@@ -517,17 +764,11 @@ def valueChanged(tag, tagPath, previousValue, currentValue, initialChange, misse
         try:
             # Normalize query
             query_lower = query.lower().strip()
-            results = []
-
-            # Search through knowledge items
-            for item in self.knowledge_items.values():
-                score = self._calculate_relevance_score(query_lower, item)
-                if score > 0.3:  # Minimum relevance threshold
-                    item.usage_count += 1
-                    results.append(item)
 
-            # Sort by relevance (using confidence as proxy for now)
-            results.sort(key=lambda x: x.confidence, reverse=True)
+            # Rank by BM25 relevance, limited to top 5 results
+            results = [item for item, _score in self.search_knowledge(query, limit=5)]
+            for item in results:
+                item.usage_count += 1
 
             # Calculate overall confidence
             confidence = sum(item.confidence for item in results) / max(len(results), 1) if results else 0.0
@@ -544,7 +785,7 @@ def valueChanged(tag, tagPath, previousValue, currentValue, initialChange, misse
             return DomainQueryResult(
                 query=query,
                 domain=self.domain_name,
-                results=results[:5],  # Limit to top 5 results
+                results=results,
                 confidence=confidence,
                 processing_time=processing_time,
                 suggestions=suggestions,
@@ -562,36 +803,6 @@ def valueChanged(tag, tagPath, previousValue, currentValue, initialChange, misse
                 suggestions=["An error occurred while processing your query. Please try again."],
             )
 
-    def _calculate_relevance_score(self, query: str, item: DomainKnowledgeItem) -> float:
-        """Calculate relevance score between query and knowledge item."""
-        score = 0.0
-
-        # Check name match
-        if query in item.name.lower():
-            score += 0.4
-
-        # Check description match
-        if query in item.description.lower():
-            score += 0.3
-
-        # Check tags match
-        for tag in item.tags:
-            if query in tag.lower() or tag.lower() in query:
-                score += 0.2
-
-        # Check category match
-        if query in item.category.lower():
-            score += 0.3
-
-        # Check content match (basic keyword matching)
-        content_str = str(item.content).lower()
-        query_words = query.split()
-        for word in query_words:
-            if len(word) > 3 and word in content_str:
-                score += 0.1
-
-        return min(score, 1.0)  # Cap at 1.0
-
     def _generate_suggestions(self: Self, results: list[DomainKnowledgeItem]) -> list[str]:
         """Generate suggestions based on query and results."""
         suggestions = []
@@ -807,7 +1018,7 @@ class SystemFunctionsDomainManager(BaseDomainManager):
                     tags=self._generate_function_tags(record.get("name", ""), record.get("module", "")),
                 )
 
-                self.knowledge_items[function_id] = item
+                self.add_knowledge_item(item)
 
             self.logger.info(f"Loaded {len(self.knowledge_items)} system functions from Neo4j")
 
@@ -876,8 +1087,7 @@ class SystemFunctionsDomainManager(BaseDomainManager):
 
         # Add system functions
         for func_data in system_functions:
-            item = DomainKnowledgeItem(**func_data)
-            self.knowledge_items[item.id] = item
+            self.add_knowledge_item(DomainKnowledgeItem(**func_data))
 
         # Update categories
         self.categories = {}
@@ -958,20 +1168,11 @@ class SystemFunctionsDomainManager(BaseDomainManager):
         try:
             # Normalize query
             query_lower = query.lower().strip()
-            results = []
-
-            # Search through knowledge items
-            for item in self.knowledge_items.values():
-                score = self._calculate_function_relevance(query_lower, item)
-                if score > 0.2:  # Lower threshold for system functions
-                    item.usage_count += 1
-                    results.append(item)
-
-            # Sort by relevance score (calculated dynamically)
-            results.sort(
-                key=lambda x: self._calculate_function_relevance(query_lower, x),
-                reverse=True,
-            )
+
+            # Rank by BM25 relevance, more results for system functions
+            results = [item for item, _score in self.search_knowledge(query, limit=10)]
+            for item in results:
+                item.usage_count += 1
 
             # Calculate overall confidence
             confidence = sum(item.confidence for item in results) / max(len(results), 1) if results else 0.0
@@ -988,7 +1189,7 @@ class SystemFunctionsDomainManager(BaseDomainManager):
             return DomainQueryResult(
                 query=query,
                 domain=self.domain_name,
-                results=results[:10],  # More results for system functions
+                results=results,
                 confidence=confidence,
                 processing_time=processing_time,
                 suggestions=suggestions,
@@ -1006,40 +1207,6 @@ class SystemFunctionsDomainManager(BaseDomainManager):
                 suggestions=["An error occurred while searching system functions. Please try again."],
             )
 
-    def _calculate_function_relevance(self, query: str, item: DomainKnowledgeItem) -> float:
-        """Calculate relevance score for system function."""
-        score = 0.0
-
-        # Exact function name match gets highest score
-        if query == item.name.lower():
-            score += 0.8
-        elif query in item.name.lower():
-            score += 0.6
-
-        # Module match
-        module = item.content.get("module", "")
-        if query in module.lower():
-            score += 0.4
-
-        # Description match
-        if query in item.description.lower():
-            score += 0.3
-
-        # Tags match
-        for tag in item.tags:
-            if query == tag.lower():
-                score += 0.5
-            elif query in tag.lower() or tag.lower() in query:
-                score += 0.2
-
-        # Category match
-        if query == item.category.lower():
-            score += 0.4
-        elif query in item.category.lower():
-            score += 0.2
-
-        return min(score, 1.0)
-
     def _generate_function_suggestions(self, results: list[DomainKnowledgeItem]) -> list[str]:
         """Generate suggestions for system function queries."""
         suggestions = []
@@ -1130,5 +1297,7 @@ __all__ = [
     "DomainKnowledgeItem",
     "DomainQueryResult",
     "GatewayScriptingDomainManager",
+    "KnowledgeIndex",
     "SystemFunctionsDomainManager",
+    "tokenize",
 ]
@@ -9,10 +9,19 @@ This module implements the knowledge graph fine-tuning pipeline following crawl_
 
 Extracts structured knowledge from Neo4j nodes, creates fine-tuning datasets,
 and implements automated knowledge graph expansion pipeline.
+
+Extraction is streamed: each label is read in keyset-paginated pages, pages are
+embedded and written as they arrive, and dataset writes are checkpointed so an
+interrupted run resumes from the last checkpointed page.
 """
 
+import asyncio
+import csv
+import io
 import json
 import os
+import shutil
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -27,11 +36,12 @@ except ImportError:
     NEO4J_AVAILABLE = False
 
 try:
-    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-    PANDAS_AVAILABLE = True
+    PYARROW_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
+    PYARROW_AVAILABLE = False
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -77,7 +87,8 @@ class KnowledgeGraphConfig:
     extraction_types: list[KnowledgeExtractionType] = field(
         default_factory=lambda: [KnowledgeExtractionType.ALL]
     )
-    max_nodes_per_query: int = 1000
+    max_nodes_per_query: int = 1000  # Keyset page size
+    max_concurrent_extractions: int = 4
     include_relationships: bool = True
     include_properties: bool = True
 
@@ -99,6 +110,7 @@ class KnowledgeGraphConfig:
 
     # Pipeline configuration
     batch_size: int = 100
+    checkpoint_interval: int = 20  # Pages written between dataset checkpoints
     enable_caching: bool = True
     cache_directory: str = "cache"
 
@@ -113,6 +125,14 @@ class KnowledgeGraphConfig:
         if not 0.1 <= self.similarity_threshold <= 1.0:
             raise ValueError("similarity_threshold must be between 0.1 and 1.0")
 
+        if self.max_nodes_per_query <= 0 or self.max_concurrent_extractions <= 0:
+            raise ValueError(
+                "max_nodes_per_query and max_concurrent_extractions must be positive"
+            )
+
+        if self.checkpoint_interval <= 0:
+            raise ValueError("checkpoint_interval must be positive")
+
 
 @dataclass
 class KnowledgeRecord:
@@ -151,6 +171,26 @@ class KnowledgeRecord:
         }
 
 
+@dataclass
+class KnowledgePage:
+    """One keyset page of knowledge records from a single extraction query."""
+
+    extraction_type: KnowledgeExtractionType
+    query_name: str
+    records: list[KnowledgeRecord]
+    cursor: dict[str, Any]
+
+
+# Extraction query name and node label per extraction type
+EXTRACTION_LABELS = {
+    KnowledgeExtractionType.FUNCTIONS: ("system_functions", "Function"),
+    KnowledgeExtractionType.COMPONENTS: ("ignition_components", "Component"),
+    KnowledgeExtractionType.PATTERNS: ("code_patterns", "Pattern"),
+    KnowledgeExtractionType.TROUBLESHOOTING: ("troubleshooting", "Troubleshooting"),
+    KnowledgeExtractionType.WORKFLOWS: ("workflows", "Workflow"),
+}
+
+
 def validate_knowledge_graph_environment() -> dict[str, Any]:
     """Validate knowledge graph pipeline environment following crawl_mcp.py methodology.
 
@@ -159,7 +199,7 @@ def validate_knowledge_graph_environment() -> dict[str, Any]:
     Returns:
         dict containing validation results and component availability.
     """
-        validation_result: dict[str, Any] = {
+    validation_result: dict[str, Any] = {
         "validation_score": 0,
         "total_checks": 10,
         "components": {},
@@ -177,12 +217,12 @@ def validate_knowledge_graph_environment() -> dict[str, Any]:
         validation_result["components"]["neo4j"] = {"available": False}
         validation_result["errors"].append("neo4j package not installed")
 
-    if PANDAS_AVAILABLE:
-        validation_result["components"]["pandas"] = {"available": True}
+    if PYARROW_AVAILABLE:
+        validation_result["components"]["pyarrow"] = {"available": True}
         validation_result["validation_score"] += 1
     else:
-        validation_result["components"]["pandas"] = {"available": False}
-        validation_result["errors"].append("pandas package not installed")
+        validation_result["components"]["pyarrow"] = {"available": False}
+        validation_result["errors"].append("pyarrow package not installed")
 
     if SENTENCE_TRANSFORMERS_AVAILABLE:
         validation_result["components"]["sentence_transformers"] = {"available": True}
@@ -259,6 +299,115 @@ def validate_knowledge_graph_environment() -> dict[str, Any]:
     return validation_result
 
 
+TRAINING_FIELDS = ("instruction", "input", "output")
+
+
+class _TextDatasetWriter:
+    """Appends training examples to a JSONL or CSV file, resuming at a byte offset."""
+
+    def __init__(
+        self, output_path: str, format_type: DatasetFormat, state: dict | None
+    ) -> None:
+        self.format_type = format_type
+        if state:
+            self.file = open(output_path, "r+b")  # noqa: SIM115
+            self.file.truncate(state["offset"])
+            self.file.seek(state["offset"])
+        else:
+            self.file = open(output_path, "wb")  # noqa: SIM115
+            if format_type == DatasetFormat.CSV:
+                self.file.write(",".join(TRAINING_FIELDS).encode("utf-8") + b"\n")
+
+    @staticmethod
+    def can_resume(output_path: str, state: dict[str, Any]) -> bool:
+        path = Path(output_path)
+        return path.exists() and path.stat().st_size >= state["offset"]
+
+    def write(self, examples: list[dict[str, str]]) -> None:
+        if self.format_type == DatasetFormat.CSV:
+            buffer = io.StringIO()
+            csv.DictWriter(
+                buffer, fieldnames=TRAINING_FIELDS, lineterminator="\n"
+            ).writerows(examples)
+            text = buffer.getvalue()
+        else:
+            text = "".join(
+                json.dumps(example, ensure_ascii=False) + "\n" for example in examples
+            )
+        self.file.write(text.encode("utf-8"))
+
+    def checkpoint(self) -> dict[str, Any]:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return {"offset": self.file.tell()}
+
+    def finish(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetDatasetWriter:
+    """Writes each page as a row group of a part file, merged into one file at the end.
+
+    A Parquet file cannot be appended to once closed, so every checkpoint closes
+    the current part file; resuming deletes parts written after the checkpoint.
+    """
+
+    def __init__(self, output_path: str, state: dict | None) -> None:
+        self.output_path = output_path
+        self.parts_directory = Path(f"{output_path}.parts")
+        self.parts = state["parts"] if state else 0
+        self.schema = pa.schema([(name, pa.string()) for name in TRAINING_FIELDS])
+        self.writer = None
+
+        if not state:
+            shutil.rmtree(self.parts_directory, ignore_errors=True)
+        self.parts_directory.mkdir(parents=True, exist_ok=True)
+        for part in self.parts_directory.glob("part-*.parquet"):
+            if int(part.stem.split("-")[1]) >= self.parts:
+                part.unlink()
+
+    @staticmethod
+    def can_resume(output_path: str, state: dict[str, Any]) -> bool:
+        parts_directory = Path(f"{output_path}.parts")
+        return all(
+            (parts_directory / f"part-{index:05d}.parquet").exists()
+            for index in range(state["parts"])
+        )
+
+    def _part(self, index: int) -> Path:
+        return self.parts_directory / f"part-{index:05d}.parquet"
+
+    def write(self, examples: list[dict[str, str]]) -> None:
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self._part(self.parts), self.schema)
+        self.writer.write_table(pa.Table.from_pylist(examples, schema=self.schema))
+
+    def checkpoint(self) -> dict[str, Any]:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            self.parts += 1
+        return {"parts": self.parts}
+
+    def finish(self) -> None:
+        self.checkpoint()
+        # Copy row group by row group so memory stays bounded by the page size
+        with pq.ParquetWriter(self.output_path, self.schema) as merged:
+            for index in range(self.parts):
+                with pq.ParquetFile(self._part(index)) as part:
+                    for row_group in range(part.num_row_groups):
+                        merged.write_table(part.read_row_group(row_group))
+        shutil.rmtree(self.parts_directory)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
 class KnowledgeGraphPipeline:
     """Neo4j Knowledge Graph Fine-Tuning Pipeline following crawl_mcp.py methodology.
 
@@ -275,17 +424,20 @@ class KnowledgeGraphPipeline:
         self.config = config or KnowledgeGraphConfig()
         self.driver = None
         self.embedding_model = None
-self.validation_result: dict[str, Any] = None
+        self.validation_result: dict[str, Any] = None
 
         # Extraction state
         self.extracted_records = []
         self.knowledge_cache = {}
+        self.records_by_type: dict[str, int] = {}
 
         # Statistics
         self.extraction_stats = {
             "total_nodes": 0,
             "total_relationships": 0,
             "extracted_records": 0,
+            "pages": 0,
+            "failed_queries": [],
             "processing_time": 0.0,
         }
 
@@ -297,7 +449,7 @@ self.validation_result: dict[str, Any] = None
         Step 3: Resource management setup
         """
         # Step 1: Environment validation first
-self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
+        self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
 
         if self.validation_result["validation_percentage"] < 70:
             raise SMEAgentValidationError(
@@ -335,7 +487,7 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
         except Exception as e:
             raise SMEAgentValidationError(
                 f"Knowledge graph pipeline initialization failed: {e}"
-            )
+            ) from e
 
     def _create_directories(self) -> None:
         """Create necessary directories."""
@@ -350,10 +502,111 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
     ) -> list[KnowledgeRecord]:
         """Extract knowledge from Neo4j following crawl_mcp.py methodology.
 
+        Collects every page of ``stream_knowledge`` in ``self.extracted_records``;
+        use ``stream_knowledge`` or ``create_fine_tuning_dataset`` directly to
+        keep memory bounded by the page size.
+
         Step 2: Comprehensive input validation
         Step 3: Error handling and user-friendly messages
         """
         # Step 2: Comprehensive input validation
+        self._resolve_queries(extraction_types, max_records)
+
+        try:
+            self.extracted_records = []
+            async for page in self.stream_knowledge(extraction_types, max_records):
+                self.extracted_records.extend(page.records)
+
+            return self.extracted_records
+
+        except Exception as e:
+            # Step 3: Error handling and user-friendly messages
+            error_msg = self._format_extraction_error(e)
+            raise SMEAgentValidationError(
+                f"Knowledge extraction failed: {error_msg}"
+            ) from e
+
+    async def stream_knowledge(
+        self,
+        extraction_types: list[KnowledgeExtractionType] | None = None,
+        max_records: int | None = None,
+        cursors: dict[str, dict[str, Any]] | None = None,
+        embed: bool = True,
+    ) -> AsyncIterator[KnowledgePage]:
+        """Stream knowledge pages from Neo4j, running the extraction queries concurrently.
+
+        Each query reads keyset pages of ``max_nodes_per_query`` nodes, with at
+        most ``max_concurrent_extractions`` pages in flight. No more than
+        ``max_concurrent_extractions`` finished pages wait for the consumer, so
+        memory is bounded by the page size rather than by the graph.
+
+        Args:
+            extraction_types: Types to extract, defaults to the configured types
+            max_records: Maximum number of records per extraction query
+            cursors: Cursor of the last consumed page per query name; queries
+                resume after it and are skipped when done
+            embed: Embed each page as a batch when an embedding model is loaded
+
+        Yields:
+            KnowledgePage per page; the last page of a query has ``cursor["done"]`` set
+        """
+        queries = self._resolve_queries(extraction_types, max_records)
+        cursors = cursors or {}
+        start_time = datetime.now()
+        pages: asyncio.Queue[KnowledgePage | None] = asyncio.Queue(
+            self.config.max_concurrent_extractions
+        )
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_extractions)
+        tasks = [
+            asyncio.create_task(
+                self._extract_pages(
+                    extraction_type,
+                    query_name,
+                    query,
+                    cursors.get(query_name, {}),
+                    max_records,
+                    embed,
+                    pages,
+                    semaphore,
+                )
+            )
+            for extraction_type, query_name, query in queries
+            if not cursors.get(query_name, {}).get("done")
+        ]
+
+        try:
+            running = len(tasks)
+            while running:
+                page = await pages.get()
+                if page is None:
+                    running -= 1
+                    continue
+
+                self.extraction_stats["extracted_records"] += len(page.records)
+                self.extraction_stats["pages"] += 1
+                self.records_by_type[page.extraction_type.value] = (
+                    self.records_by_type.get(page.extraction_type.value, 0)
+                    + len(page.records)
+                )
+                yield page
+
+            for task in tasks:
+                task.result()
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.extraction_stats["processing_time"] += (
+                datetime.now() - start_time
+            ).total_seconds()
+
+    def _resolve_queries(
+        self,
+        extraction_types: list[KnowledgeExtractionType] | None,
+        max_records: int | None,
+    ) -> list[tuple[KnowledgeExtractionType, str, str]]:
+        """Validate extraction arguments and list the queries they expand to."""
         if not self.driver:
             raise SMEAgentValidationError("Neo4j driver not initialized")
 
@@ -364,137 +617,129 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
         if max_records is not None and max_records <= 0:
             raise ValueError("max_records must be positive")
 
-        try:
-            start_time = datetime.now()
-            self.extracted_records = []
+        if KnowledgeExtractionType.ALL in extraction_types:
+            extraction_types = list(EXTRACTION_LABELS)
 
-            # Extract knowledge by type
-            for extraction_type in extraction_types:
-                if extraction_type == KnowledgeExtractionType.ALL:
-                    # Extract all types
-                    for single_type in [
-                        KnowledgeExtractionType.FUNCTIONS,
-                        KnowledgeExtractionType.COMPONENTS,
-                        KnowledgeExtractionType.PATTERNS,
-                        KnowledgeExtractionType.TROUBLESHOOTING,
-                        KnowledgeExtractionType.WORKFLOWS,
-                    ]:
-                        records = await self._extract_by_type(single_type, max_records)
-                        self.extracted_records.extend(records)
-                else:
-                    records = await self._extract_by_type(extraction_type, max_records)
-                    self.extracted_records.extend(records)
-
-            # Generate embeddings if model available
-            if self.embedding_model:
-                await self._generate_embeddings()
-
-            # Update statistics
-            processing_time = (datetime.now() - start_time).total_seconds()
-            self.extraction_stats.update(
-                {
-                    "extracted_records": len(self.extracted_records),
-                    "processing_time": processing_time,
-                }
-            )
+        queries = {}
+        for extraction_type in extraction_types:
+            for query_name, query in self._get_extraction_queries(
+                extraction_type
+            ).items():
+                queries.setdefault(query_name, (extraction_type, query_name, query))
 
-            return self.extracted_records
+        return list(queries.values())
 
-        except Exception as e:
-            # Step 3: Error handling and user-friendly messages
-            error_msg = self._format_extraction_error(e)
-            raise SMEAgentValidationError(f"Knowledge extraction failed: {error_msg}")
+    async def _extract_pages(
+        self,
+        extraction_type: KnowledgeExtractionType,
+        query_name: str,
+        query: str,
+        cursor: dict[str, Any],
+        max_records: int | None,
+        embed: bool,
+        pages: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Read one extraction query page by page into the page queue."""
+        after = cursor.get("after")
+        extracted = cursor.get("records", 0)
+        done = False
+        cancelled = False
 
-    async def _extract_by_type(
-        self, extraction_type: KnowledgeExtractionType, max_records: int | None
-    ) -> list[KnowledgeRecord]:
-        """Extract knowledge records by type."""
-        queries = self._get_extraction_queries(extraction_type)
-        records = []
+        try:
+            while not done:
+                limit = self.config.max_nodes_per_query
+                if max_records is not None:
+                    limit = min(limit, max_records - extracted)
 
-        with self.driver.session() as session:
-            for query_name, query in queries.items():
                 try:
-                    # Add limit if specified
-                    if max_records:
-                        query += f" LIMIT {max_records}"
-
-                    result = session.run(query)
-
-                    for record in result:
-                        knowledge_record = self._create_knowledge_record(
-                            record, extraction_type, query_name
+                    async with semaphore:
+                        rows = await asyncio.to_thread(
+                            self._fetch_page, query, after, limit
                         )
-                        records.append(knowledge_record)
-
                 except Exception as e:
                     print(f"Warning: Query {query_name} failed: {e}")
-                    continue
+                    self.extraction_stats["failed_queries"].append(query_name)
+                    return
 
-        return records
-
-    def _get_extraction_queries(
-        self, extraction_type: KnowledgeExtractionType
-    ) -> dict[str, str]:
-        """Get Neo4j queries for different extraction types."""
-        queries = {}
+                records = list(
+                    self._iter_knowledge_records(rows, extraction_type, query_name)
+                )
+                if embed and records:
+                    await self._embed_records(records)
+
+                extracted += len(rows)
+                if rows:
+                    after = rows[-1]["node_key"]
+                done = len(rows) < limit or (
+                    max_records is not None and extracted >= max_records
+                )
 
-        if extraction_type == KnowledgeExtractionType.FUNCTIONS:
-            queries[
-                "system_functions"
-            ] = """
-            MATCH (f:Function)
-            OPTIONAL MATCH (f)-[r]-(related)
-            RETURN f, collect(distinct {type: type(r), node: related}) as relationships
-            """
+                await pages.put(
+                    KnowledgePage(
+                        extraction_type=extraction_type,
+                        query_name=query_name,
+                        records=records,
+                        cursor={"after": after, "records": extracted, "done": done},
+                    )
+                )
 
-        elif extraction_type == KnowledgeExtractionType.COMPONENTS:
-            queries[
-                "ignition_components"
-            ] = """
-            MATCH (c:Component)
-            OPTIONAL MATCH (c)-[r]-(related)
-            RETURN c, collect(distinct {type: type(r), node: related}) as relationships
-            """
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
 
-        elif extraction_type == KnowledgeExtractionType.PATTERNS:
-            queries[
-                "code_patterns"
-            ] = """
-            MATCH (p:Pattern)
-            OPTIONAL MATCH (p)-[r]-(related)
-            RETURN p, collect(distinct {type: type(r), node: related}) as relationships
-            """
+        finally:
+            # A cancelled producer's consumer has stopped reading, so the queue
+            # may stay full and the end-of-stream marker is not needed
+            if not cancelled:
+                await pages.put(None)
 
-        elif extraction_type == KnowledgeExtractionType.TROUBLESHOOTING:
-            queries[
-                "troubleshooting"
-            ] = """
-            MATCH (t:Troubleshooting)
-            OPTIONAL MATCH (t)-[r]-(related)
-            RETURN t, collect(distinct {type: type(r), node: related}) as relationships
-            """
+    def _fetch_page(self, query: str, after: int | None, limit: int) -> list[Any]:
+        """Fetch one keyset page; runs in a worker thread."""
+        with self.driver.session(database=self.config.neo4j_database) as session:
+            return list(session.run(query, after=after, limit=limit))
 
-        elif extraction_type == KnowledgeExtractionType.WORKFLOWS:
-            queries[
-                "workflows"
-            ] = """
-            MATCH (w:Workflow)
-            OPTIONAL MATCH (w)-[r]-(related)
-            RETURN w, collect(distinct {type: type(r), node: related}) as relationships
-            """
+    def _get_extraction_queries(
+        self, extraction_type: KnowledgeExtractionType
+    ) -> dict[str, str]:
+        """Get keyset-paginated Neo4j queries for different extraction types.
 
+        A query returns up to ``$limit`` nodes whose internal ID follows
+        ``$after`` (from the start when null) in ID order, so later pages do
+        not re-read the relationships of earlier ones.
+        """
         # Fallback to general node extraction
-        if not queries:
-            queries[
-                "general_nodes"
-            ] = """
-            MATCH (n)
+        query_name, label = EXTRACTION_LABELS.get(
+            extraction_type, ("general_nodes", None)
+        )
+        match = f"MATCH (n:{label})" if label else "MATCH (n)"
+
+        return {
+            query_name: f"""
+            {match}
+            WHERE $after IS NULL OR id(n) > $after
+            WITH n ORDER BY id(n) LIMIT $limit
             OPTIONAL MATCH (n)-[r]-(related)
-            RETURN n, collect(distinct {type: type(r), node: related}) as relationships
+            RETURN n, id(n) AS node_key,
+                   collect(distinct {{type: type(r), node: related}}) as relationships
+            ORDER BY node_key
             """
+        }
 
-        return queries
+    def _iter_knowledge_records(
+        self,
+        rows: Iterable[Any],
+        extraction_type: KnowledgeExtractionType,
+        query_name: str,
+    ) -> Iterator[KnowledgeRecord]:
+        """Create knowledge records from Neo4j rows one at a time."""
+        for row in rows:
+            relationships = row.get("relationships", [])
+            self.extraction_stats["total_nodes"] += 1
+            self.extraction_stats["total_relationships"] += sum(
+                1 for relationship in relationships if relationship.get("type")
+            )
+            yield self._create_knowledge_record(row, extraction_type, query_name)
 
     def _create_knowledge_record(
         self,
@@ -506,14 +751,14 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
         node = (
             neo4j_record["n"]
             if "n" in neo4j_record
-            else neo4j_record[list(neo4j_record.keys())[0]]
+            else neo4j_record[next(iter(neo4j_record.keys()))]
         )
         relationships = neo4j_record.get("relationships", [])
 
         # Extract node properties
         properties = dict(node)
         node_id = str(node.id)
-        node_type = list(node.labels)[0] if node.labels else "Unknown"
+        node_type = next(iter(node.labels)) if node.labels else "Unknown"
 
         # Generate title and content
         title = properties.get(
@@ -633,25 +878,22 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
             ),
         }
 
-    async def _generate_embeddings(self) -> Any:
-        """Generate embeddings for extracted records."""
+    async def _embed_records(self, records: list[KnowledgeRecord]) -> None:
+        """Embed a page of records in batches without blocking the event loop."""
         if not self.embedding_model:
             return
 
-        texts = [
-            f"{record.title} {record.content}" for record in self.extracted_records
-        ]
+        texts = [f"{record.title} {record.content}" for record in records]
 
-        # Generate embeddings in batches
         batch_size = self.config.batch_size
         for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i : i + batch_size]
-            batch_embeddings = self.embedding_model.encode(batch_texts)
-
-            for j, embedding in enumerate(batch_embeddings):
-                record_idx = i + j
-                if record_idx < len(self.extracted_records):
-                    self.extracted_records[record_idx].embedding = embedding.tolist()
+            batch_embeddings = await asyncio.to_thread(
+                self.embedding_model.encode, texts[i : i + batch_size]
+            )
+            for record, embedding in zip(
+                records[i : i + batch_size], batch_embeddings, strict=True
+            ):
+                record.embedding = embedding.tolist()
 
     def _format_extraction_error(self, error: Exception) -> str:
         """Format extraction errors for user-friendly messages."""
@@ -669,55 +911,180 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
             return str(error)
 
     async def create_fine_tuning_dataset(
-        self, output_path: str | None = None, format_type: DatasetFormat | None = None
+        self,
+        output_path: str | None = None,
+        format_type: DatasetFormat | None = None,
+        extraction_types: list[KnowledgeExtractionType] | None = None,
+        max_records: int | None = None,
+        resume: bool = True,
     ) -> str:
-        """Create fine-tuning dataset from extracted knowledge."""
-        if not self.extracted_records:
-            raise SMEAgentValidationError(
-                "No knowledge records available. Run extract_knowledge first."
-            )
-
+        """Create fine-tuning dataset from extracted knowledge.
+
+        Records already collected by ``extract_knowledge`` are written out.
+        Otherwise pages are streamed from Neo4j straight into the dataset
+        without embeddings, which training examples do not carry, and the
+        dataset is checkpointed every ``checkpoint_interval`` pages.
+
+        Args:
+            output_path: Dataset path, defaults to the configured dataset name
+            format_type: Dataset format, defaults to the configured format
+            extraction_types: Types to stream, defaults to the configured types
+            max_records: Maximum number of records per extraction query
+            resume: Continue an interrupted run from its last checkpoint
+
+        Returns:
+            Path to the dataset file
+        """
+        format_type = format_type or self.config.output_format
         output_path = output_path or os.path.join(
             self.config.output_directory,
-            f"{self.config.dataset_name}.{(format_type or self.config.output_format).value}",
+            f"{self.config.dataset_name}.{format_type.value}",
         )
 
-        format_type = format_type or self.config.output_format
-
-        # Convert records to training examples
-        training_examples = []
-        for record in self.extracted_records:
-            example = record.to_training_example()
-            training_examples.append(example)
-
-        # Save in specified format
-        if format_type == DatasetFormat.JSONL:
-            self._save_as_jsonl(training_examples, output_path)
-        elif format_type == DatasetFormat.CSV and PANDAS_AVAILABLE:
-            self._save_as_csv(training_examples, output_path)
-        elif format_type == DatasetFormat.PARQUET and PANDAS_AVAILABLE:
-            self._save_as_parquet(training_examples, output_path)
-        else:
+        if format_type not in (DatasetFormat.CSV, DatasetFormat.PARQUET) or (
+            format_type == DatasetFormat.PARQUET and not PYARROW_AVAILABLE
+        ):
             # Fallback to JSONL
-            self._save_as_jsonl(training_examples, output_path)
+            format_type = DatasetFormat.JSONL
+
+        if not self.extracted_records:
+            await self._stream_dataset(
+                output_path, format_type, extraction_types, max_records, resume
+            )
+            return output_path
+
+        writer = self._open_writer(output_path, format_type, None)
+        try:
+            page_size = self.config.max_nodes_per_query
+            for i in range(0, len(self.extracted_records), page_size):
+                writer.write(
+                    [
+                        record.to_training_example()
+                        for record in self.extracted_records[i : i + page_size]
+                    ]
+                )
+            writer.finish()
+        finally:
+            writer.close()
 
         return output_path
 
-    def _save_as_jsonl(self, examples: list[dict[str, str]], output_path: str) -> Any:
-        """Save examples as JSONL format."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            for example in examples:
-                f.write(json.dumps(example, ensure_ascii=False) + "\n")
+    async def _stream_dataset(
+        self,
+        output_path: str,
+        format_type: DatasetFormat,
+        extraction_types: list[KnowledgeExtractionType] | None,
+        max_records: int | None,
+        resume: bool,
+    ) -> None:
+        """Stream extraction pages into a dataset with resumable checkpoints.
+
+        A checkpoint records the cursor of every query together with the
+        dataset length after the pages it covers; resuming truncates the
+        dataset to that length and restarts each query after its cursor.
+        """
+        queries = self._resolve_queries(extraction_types, max_records)
+        checkpoint_path = Path(f"{output_path}.checkpoint.json")
+        signature = {
+            "format": format_type.value,
+            "queries": sorted(query_name for _, query_name, _ in queries),
+            "max_records": max_records,
+        }
+        state = (
+            self._load_checkpoint(checkpoint_path, signature, output_path, format_type)
+            if resume
+            else None
+        )
+        cursors = state["cursors"] if state else {}
+        examples = state["examples"] if state else 0
+        writer = self._open_writer(
+            output_path, format_type, state["writer"] if state else None
+        )
+
+        def save_checkpoint() -> None:
+            self._save_checkpoint(
+                checkpoint_path,
+                {
+                    "signature": signature,
+                    "cursors": cursors,
+                    "examples": examples,
+                    "writer": writer.checkpoint(),
+                },
+            )
+
+        try:
+            pages_since_checkpoint = 0
+            async for page in self.stream_knowledge(
+                extraction_types, max_records, cursors=cursors, embed=False
+            ):
+                if page.records:
+                    writer.write(
+                        [record.to_training_example() for record in page.records]
+                    )
+                examples += len(page.records)
+                cursors[page.query_name] = page.cursor
+
+                pages_since_checkpoint += 1
+                if pages_since_checkpoint >= self.config.checkpoint_interval:
+                    save_checkpoint()
+                    pages_since_checkpoint = 0
+
+            incomplete = [
+                query_name
+                for _, query_name, _ in queries
+                if not cursors.get(query_name, {}).get("done")
+            ]
+            if incomplete:
+                # Keep what was written so a rerun resumes the failed queries
+                save_checkpoint()
+                raise SMEAgentValidationError(
+                    f"Dataset {output_path} is incomplete, queries failed: "
+                    f"{', '.join(incomplete)}. Rerun to resume from the checkpoint."
+                )
 
-    def _save_as_csv(self, examples: list[dict[str, str]], output_path: str) -> Any:
-        """Save examples as CSV format."""
-        df = pd.DataFrame(examples)
-        df.to_csv(output_path, index=False, encoding="utf-8")
+            writer.finish()
+            checkpoint_path.unlink(missing_ok=True)
+
+        finally:
+            writer.close()
+
+    def _open_writer(
+        self, output_path: str, format_type: DatasetFormat, state: dict | None
+    ) -> Any:
+        """Open an incremental dataset writer, resuming from a writer checkpoint."""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if format_type == DatasetFormat.PARQUET:
+            return _ParquetDatasetWriter(output_path, state)
+        return _TextDatasetWriter(output_path, format_type, state)
+
+    def _load_checkpoint(
+        self,
+        checkpoint_path: Path,
+        signature: dict[str, Any],
+        output_path: str,
+        format_type: DatasetFormat,
+    ) -> dict[str, Any] | None:
+        """Load a dataset checkpoint if it matches this run and its output is intact."""
+        try:
+            state = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if state.get("signature") != signature:
+            return None
+
+        writer_class = (
+            _ParquetDatasetWriter
+            if format_type == DatasetFormat.PARQUET
+            else _TextDatasetWriter
+        )
+        return state if writer_class.can_resume(output_path, state["writer"]) else None
 
-    def _save_as_parquet(self, examples: list[dict[str, str]], output_path: str) -> Any:
-        """Save examples as Parquet format."""
-        df = pd.DataFrame(examples)
-        df.to_parquet(output_path, index=False)
+    def _save_checkpoint(self, checkpoint_path: Path, state: dict[str, Any]) -> None:
+        """Atomically replace the dataset checkpoint."""
+        temporary_path = checkpoint_path.with_name(f"{checkpoint_path.name}.tmp")
+        temporary_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(temporary_path, checkpoint_path)
 
     def get_pipeline_stats(self) -> dict[str, Any]:
         """Get comprehensive pipeline statistics."""
@@ -733,11 +1100,8 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
         }
 
     def _get_records_by_type(self) -> dict[str, int]:
-        """Get count of records by type."""
-        type_counts = {}
-        for record in self.extracted_records:
-            type_counts[record.type] = type_counts.get(record.type, 0) + 1
-        return type_counts
+        """Get count of records by type, including streamed records."""
+        return dict(self.records_by_type)
 
     async def cleanup(self) -> None:
         """Cleanup resources following crawl_mcp.py methodology."""
@@ -749,6 +1113,7 @@ self.validation_result: dict[str, Any] = validate_knowledge_graph_environment()
             # Clear memory
             self.extracted_records = []
             self.knowledge_cache = {}
+            self.records_by_type = {}
 
         except Exception as e:
             print(f"Warning: Error during knowledge graph pipeline cleanup: {e}")
@@ -813,8 +1178,7 @@ async def create_knowledge_dataset(
     )
 
     async with KnowledgeGraphPipeline(config) as pipeline:
-        await pipeline.extract_knowledge(max_records=max_records)
-        return await pipeline.create_fine_tuning_dataset()
+        return await pipeline.create_fine_tuning_dataset(max_records=max_records)
 
 
 def get_extraction_info() -> dict[str, Any]:
@@ -836,7 +1200,7 @@ def get_extraction_info() -> dict[str, Any]:
         },
         "requirements": {
             "neo4j": "Neo4j database with knowledge graph",
-            "pandas": "For CSV and Parquet output formats",
+            "pyarrow": "For Parquet output format",
             "sentence_transformers": "For embedding generation",
         },
     }
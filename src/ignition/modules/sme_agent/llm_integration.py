@@ -11,8 +11,9 @@ Following crawl_mcp.py methodology:
 """
 
 import logging
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -52,6 +53,14 @@ try:
 except ImportError:
     PLATFORM_AVAILABLE = False
 
+from .llm_scheduler import (
+    BatchScheduler,
+    GenerationHandle,
+    GenerationParams,
+    GenerationResult,
+    TransformersBatchBackend,
+)
+
 
 class LLMValidationError(Exception):
     """Custom exception for LLM validation errors."""
@@ -245,6 +254,12 @@ class LLMConfig:
     use_cache: bool = True
     low_cpu_mem_usage: bool = True
 
+    # Request Batching Configuration
+    max_batch_size: int = 8
+    max_batch_wait_ms: float = 10.0
+    max_batch_tokens: int = 32768  # KV-cache positions per batch, padding included
+    max_queue_size: int = 256
+
     # Environment-Specific Performance Settings
     nvidia_gpu_settings: dict[str, Any] = field(
         default_factory=lambda: {
@@ -309,6 +324,22 @@ class LLMConfig:
             raise LLMValidationError(f"Max context {self.max_context} must be positive")
         if self.max_tokens <= 0:
             raise LLMValidationError(f"Max tokens {self.max_tokens} must be positive")
+        if self.max_batch_size <= 0:
+            raise LLMValidationError(
+                f"Max batch size {self.max_batch_size} must be positive"
+            )
+        if self.max_batch_wait_ms < 0:
+            raise LLMValidationError(
+                f"Max batch wait {self.max_batch_wait_ms} ms must not be negative"
+            )
+        if self.max_batch_tokens <= 0:
+            raise LLMValidationError(
+                f"Max batch tokens {self.max_batch_tokens} must be positive"
+            )
+        if self.max_queue_size <= 0:
+            raise LLMValidationError(
+                f"Max queue size {self.max_queue_size} must be positive"
+            )
 
     def optimize_for_system_environment(
         self, system_env: SystemEnvironment
@@ -343,6 +374,10 @@ class LLMConfig:
             trust_remote_code=self.trust_remote_code,
             use_cache=self.use_cache,
             low_cpu_mem_usage=self.low_cpu_mem_usage,
+            max_batch_size=self.max_batch_size,
+            max_batch_wait_ms=self.max_batch_wait_ms,
+            max_batch_tokens=self.max_batch_tokens,
+            max_queue_size=self.max_queue_size,
             nvidia_gpu_settings=self.nvidia_gpu_settings.copy(),
             macos_unified_settings=self.macos_unified_settings.copy(),
             use_docker=self.use_docker,
@@ -707,6 +742,8 @@ class LLMModelManager:
         self.model_info = None
         self.device = None
         self.is_loaded = False
+        self.scheduler: BatchScheduler | None = None
+        self._scheduler_lock = threading.Lock()
 
         # Setup logging
         log_level = getattr(logging, self.config.log_level.upper(), logging.INFO)
@@ -798,102 +835,202 @@ class LLMModelManager:
 
         return requirements_check
 
+    def load_model(self, model_path: str | None = None) -> bool:
+        """Step 6: Resource Management and Cleanup.
+
+        Load the model and tokenizer onto the configured device. Quantization
+        settings are not applied here.
+
+        Args:
+            model_path: Local path or hub ID, defaults to the configured model
+
+        Returns:
+            True if the model was loaded
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            self.logger.error("Transformers library not available - cannot load model")
+            return False
+
+        self.model_info = self.get_model_info()
+        source = model_path or self.config.model_path
+        if source is None:
+            source = (
+                self.model_info.model_id if self.model_info else self.config.model_name
+            )
+        device = self.config.target_device
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(
+                source,
+                cache_dir=str(self.cache_dir),
+                trust_remote_code=self.config.trust_remote_code,
+            )
+            model = AutoModelForCausalLM.from_pretrained(
+                source,
+                cache_dir=str(self.cache_dir),
+                torch_dtype=self.config.torch_dtype,
+                trust_remote_code=self.config.trust_remote_code,
+                low_cpu_mem_usage=self.config.low_cpu_mem_usage,
+            )
+            model.to(device).eval()
+        except Exception as e:
+            self.logger.error(f"Failed to load model {source}: {e}")
+            return False
+
+        self.model = model
+        self.tokenizer = tokenizer
+        self.device = device
+        self.is_loaded = True
+        self.logger.info(f"Loaded model {source} on {device}")
+        return True
+
     def generate_response(self, prompt: str, **generation_kwargs) -> dict[str, Any]:
         """Step 2: Comprehensive Input Validation
         Step 3: Error Handling and User-Friendly Messages.
 
-        Generate response from the loaded model.
+        Generate response from the loaded model. The request is queued on the
+        batch scheduler, so concurrent callers share batched generate calls.
         """
-        if not TRANSFORMERS_AVAILABLE:
-            return {
-                "success": False,
-                "error": "Transformers library not available - using placeholder response",
-                "response": f"[PLACEHOLDER] This is a simulated response to: {prompt[:100]}...",
-                "processing_time": 0.1,
-                "model_used": self.config.model_name,
-            }
+        placeholder = self._placeholder_response(prompt)
+        if placeholder:
+            return placeholder
+        self._validate_prompt(prompt)
 
-        if not self.is_loaded:
-            return {
-                "success": False,
-                "error": "Model not loaded - using placeholder response",
-                "response": f"[PLACEHOLDER] This is a simulated response to: {prompt[:100]}...",
-                "processing_time": 0.1,
-                "model_used": self.config.model_name,
-            }
+        start_time = time.time()
+        try:
+            params = self._generation_params(generation_kwargs)
+            result = self._get_scheduler().submit(prompt, params).result()
+            return self._format_response(result, params, start_time)
+        except Exception as e:
+            return self._error_response(e, start_time)
 
-        # Input validation
-        if not prompt or not prompt.strip():
-            raise LLMValidationError("Prompt cannot be empty")
+    async def generate_response_async(
+        self, prompt: str, **generation_kwargs
+    ) -> dict[str, Any]:
+        """Generate a response without blocking the event loop.
 
-        if len(prompt) > self.config.max_context * 4:  # Rough token estimate
-            raise LLMValidationError(
-                f"Prompt too long (estimated tokens exceed {self.config.max_context})"
-            )
+        Returns the same dictionary as ``generate_response``.
+        """
+        placeholder = self._placeholder_response(prompt)
+        if placeholder:
+            return placeholder
+        self._validate_prompt(prompt)
 
         start_time = time.time()
-
         try:
-            # Merge generation parameters
-            generation_params = {
-                "max_new_tokens": generation_kwargs.get(
-                    "max_tokens", self.config.max_tokens
-                ),
-                "temperature": generation_kwargs.get(
-                    "temperature", self.config.temperature
-                ),
-                "top_p": generation_kwargs.get("top_p", self.config.top_p),
-                "top_k": generation_kwargs.get("top_k", self.config.top_k),
-                "repetition_penalty": generation_kwargs.get(
-                    "repetition_penalty", self.config.repetition_penalty
-                ),
-                "do_sample": generation_kwargs.get("do_sample", self.config.do_sample),
-                "pad_token_id": self.tokenizer.eos_token_id if self.tokenizer else None,
-                "return_full_text": False,
-            }
+            params = self._generation_params(generation_kwargs)
+            result = await self._get_scheduler().submit(prompt, params).wait()
+            return self._format_response(result, params, start_time)
+        except Exception as e:
+            return self._error_response(e, start_time)
 
-            # Generate response
-            outputs = (
-                self.pipeline(prompt, **generation_params) if self.pipeline else []
-            )
+    def submit_generation(
+        self, prompt: str, stream: bool = True, **generation_kwargs
+    ) -> GenerationHandle:
+        """Queue a prompt on the batch scheduler.
 
-            # Extract generated text
-            generated_text = (
-                outputs[0]["generated_text"] if outputs and len(outputs) > 0 else ""
-            )
+        Args:
+            prompt: Prompt text
+            stream: Publish text to the handle as tokens are generated
+            **generation_kwargs: Same options as ``generate_response``
 
-            processing_time = time.time() - start_time
+        Returns:
+            Handle to iterate, with ``for`` or ``async for``, for streamed text,
+            or to wait on for the ``GenerationResult``
+        """
+        if not TRANSFORMERS_AVAILABLE or not self.is_loaded:
+            raise LLMValidationError("Model not loaded")
+        self._validate_prompt(prompt)
+        return self._get_scheduler().submit(
+            prompt, self._generation_params(generation_kwargs), stream=stream
+        )
 
-            # Calculate approximate token counts
-            if self.tokenizer:
-                input_tokens = len(self.tokenizer.encode(prompt))
-                output_tokens = len(self.tokenizer.encode(generated_text))
-            else:
-                input_tokens = len(prompt.split())  # Rough estimate
-                output_tokens = len(generated_text.split())  # Rough estimate
+    def _placeholder_response(self, prompt: str) -> dict[str, Any] | None:
+        """Placeholder response when no model can serve the prompt."""
+        if not TRANSFORMERS_AVAILABLE:
+            error = "Transformers library not available - using placeholder response"
+        elif not self.is_loaded:
+            error = "Model not loaded - using placeholder response"
+        else:
+            return None
+        return {
+            "success": False,
+            "error": error,
+            "response": f"[PLACEHOLDER] This is a simulated response to: {prompt[:100]}...",
+            "processing_time": 0.1,
+            "model_used": self.config.model_name,
+        }
 
-            return {
-                "success": True,
-                "response": generated_text,
-                "processing_time": processing_time,
-                "token_counts": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": input_tokens + output_tokens,
-                },
-                "generation_params": generation_params,
-                "model_used": self.config.model_name,
-            }
+    def _validate_prompt(self, prompt: str) -> None:
+        if not prompt or not prompt.strip():
+            raise LLMValidationError("Prompt cannot be empty")
 
-        except Exception as e:
-            self.logger.error(f"Generation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "processing_time": time.time() - start_time,
-                "response": f"[ERROR] Generation failed: {str(e)[:100]}...",
-                "model_used": self.config.model_name,
-            }
+        if len(prompt) > self.config.max_context * 4:  # Rough token estimate
+            raise LLMValidationError(
+                f"Prompt too long (estimated tokens exceed {self.config.max_context})"
+            )
+
+    def _generation_params(self, generation_kwargs: dict[str, Any]) -> GenerationParams:
+        """Merge generation parameters with the configured defaults."""
+        return GenerationParams(
+            max_new_tokens=generation_kwargs.get("max_tokens", self.config.max_tokens),
+            temperature=generation_kwargs.get("temperature", self.config.temperature),
+            top_p=generation_kwargs.get("top_p", self.config.top_p),
+            top_k=generation_kwargs.get("top_k", self.config.top_k),
+            repetition_penalty=generation_kwargs.get(
+                "repetition_penalty", self.config.repetition_penalty
+            ),
+            do_sample=generation_kwargs.get("do_sample", self.config.do_sample),
+        )
+
+    def _get_scheduler(self) -> BatchScheduler:
+        """Create the batch scheduler for the loaded model on first use."""
+        with self._scheduler_lock:
+            if self.scheduler is None:
+                model, tokenizer = self.model, self.tokenizer
+                if model is None or tokenizer is None:
+                    model = getattr(self.pipeline, "model", None)
+                    tokenizer = getattr(self.pipeline, "tokenizer", None)
+                if model is None or tokenizer is None:
+                    raise LLMValidationError("No model and tokenizer to generate with")
+                self.scheduler = BatchScheduler(
+                    TransformersBatchBackend(model, tokenizer),
+                    max_batch_size=self.config.max_batch_size,
+                    max_wait_ms=self.config.max_batch_wait_ms,
+                    max_batch_tokens=self.config.max_batch_tokens,
+                    max_queue_size=self.config.max_queue_size,
+                )
+            return self.scheduler
+
+    def _format_response(
+        self, result: GenerationResult, params: GenerationParams, start_time: float
+    ) -> dict[str, Any]:
+        return {
+            "success": True,
+            "response": result.text,
+            "processing_time": time.time() - start_time,
+            "token_counts": {
+                "input_tokens": result.input_tokens,
+                "output_tokens": result.output_tokens,
+                "total_tokens": result.total_tokens,
+            },
+            "batch_size": result.batch_size,
+            "queue_time": result.queue_time,
+            "generation_params": asdict(params),
+            "model_used": self.config.model_name,
+        }
+
+    def _error_response(self, error: Exception, start_time: float) -> dict[str, Any]:
+        self.logger.error(f"Generation failed: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "processing_time": time.time() - start_time,
+            "response": f"[ERROR] Generation failed: {str(error)[:100]}...",
+            "model_used": self.config.model_name,
+        }
 
     def get_model_status(self) -> dict[str, Any]:
         """Get current model status and information."""
@@ -907,9 +1044,14 @@ class LLMModelManager:
                 "gpu_enabled": self.config.gpu_enabled,
                 "max_context": self.config.max_context,
                 "max_tokens": self.config.max_tokens,
+                "max_batch_size": self.config.max_batch_size,
+                "max_batch_wait_ms": self.config.max_batch_wait_ms,
             },
         }
 
+        if self.scheduler:
+            status["scheduler"] = self.scheduler.get_metrics()
+
         if self.model_info:
             status["model_info"] = {
                 "display_name": self.model_info.display_name,
@@ -934,6 +1076,11 @@ class LLMModelManager:
         if self.is_loaded:
             self.logger.info("Unloading model...")
 
+            # Finish queued requests before releasing the model
+            if self.scheduler:
+                self.scheduler.stop()
+                self.scheduler = None
+
             # Clear model and pipeline
             self.model = None
             self.tokenizer = None
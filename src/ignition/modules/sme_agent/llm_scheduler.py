@@ -0,0 +1,526 @@
+"""Batched request scheduler for the SME Agent's LLM model manager.
+
+Callers submit prompts to a queue in front of the model and get a
+``GenerationHandle`` back. A single worker thread owns the model. It takes the
+oldest waiting request and waits at most ``max_wait_ms`` for up to
+``max_batch_size`` compatible requests, meaning requests with identical
+generation parameters, and runs them as one left-padded ``generate`` call.
+Requests that arrive while a batch is generating are queued for the next one.
+
+Batches are also bounded by their KV-cache footprint. A batch holds
+``batch_size * (longest_prompt + max_new_tokens)`` token positions in the
+cache, including padding, and that product must stay within
+``max_batch_tokens``. After the oldest request, candidates are taken in order
+of how close their prompt length is to it, which keeps padding, and with it
+cache memory spent on padding, low.
+
+Each prompt is tokenized once on submission. The same token IDs feed
+generation and the reported input token count, and the output count is the
+number of generated IDs, so nothing is re-encoded. Handles can be iterated,
+synchronously or with ``async for``, to stream text as tokens are generated.
+
+The model is reached through a small backend interface (``encode``,
+``decode``, ``generate`` and ``eos_token_id``). ``TransformersBatchBackend``
+implements it for Hugging Face causal language models and runs on CPU.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+try:
+    import torch
+    from transformers.generation.streamers import BaseStreamer
+
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    BaseStreamer = object
+    TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerQueueFullError(RuntimeError):
+    """Raised when a request is submitted to a full scheduler queue."""
+
+
+@dataclass(frozen=True)
+class GenerationParams:
+    """Generation parameters shared by every request in a batch."""
+
+    max_new_tokens: int = 256
+    temperature: float = 0.7
+    top_p: float = 0.9
+    top_k: int = 50
+    repetition_penalty: float = 1.1
+    do_sample: bool = True
+
+    def generate_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for ``generate``, omitting unused sampling options."""
+        kwargs: dict[str, Any] = {
+            "max_new_tokens": self.max_new_tokens,
+            "repetition_penalty": self.repetition_penalty,
+            "do_sample": self.do_sample,
+        }
+        if self.do_sample:
+            kwargs.update(
+                temperature=self.temperature, top_p=self.top_p, top_k=self.top_k
+            )
+        return kwargs
+
+
+@dataclass
+class GenerationResult:
+    """Completed generation with token counts and timings."""
+
+    text: str
+    input_tokens: int
+    output_tokens: int
+    queue_time: float
+    generation_time: float
+    batch_size: int
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class GenerationBackend(Protocol):
+    """Model interface used by the scheduler."""
+
+    eos_token_id: int | None
+
+    def encode(self, text: str) -> list[int]: ...
+
+    def decode(self, token_ids: list[int]) -> str: ...
+
+    def generate(
+        self,
+        prompts: list[list[int]],
+        params: GenerationParams,
+        on_step: Callable[[list[int]], None] | None = None,
+    ) -> list[list[int]]:
+        """Generate for a batch of tokenized prompts.
+
+        Args:
+            prompts: Token IDs of each prompt
+            params: Generation parameters for the whole batch
+            on_step: Called with one new token ID per row after every step
+
+        Returns:
+            Generated token IDs per prompt, ending before the first EOS token
+        """
+        ...
+
+
+class GenerationHandle:
+    """Result and token stream of one submitted request."""
+
+    def __init__(self) -> None:
+        self._future: Future[GenerationResult] = Future()
+        self._chunks: list[str] = []
+        self._done = False
+        self._condition = threading.Condition()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def result(self, timeout: float | None = None) -> GenerationResult:
+        """Block until the request has been generated."""
+        return self._future.result(timeout)
+
+    async def wait(self) -> GenerationResult:
+        """Wait for the request without blocking the event loop."""
+        return await asyncio.wrap_future(self._future)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield text chunks as they are generated."""
+        position = 0
+        while True:
+            with self._condition:
+                while position == len(self._chunks) and not self._done:
+                    self._condition.wait()
+                chunks, finished = self._chunks[position:], self._done
+            position += len(chunks)
+            yield from chunks
+            if finished:
+                return
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        """Yield text chunks as they are generated, for ``async for``."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._condition:
+            self._waiters.append(waiter)
+        position = 0
+        try:
+            while True:
+                with self._condition:
+                    chunks, finished = self._chunks[position:], self._done
+                    waiter[1].clear()
+                position += len(chunks)
+                for chunk in chunks:
+                    yield chunk
+                if finished:
+                    return
+                await waiter[1].wait()
+        finally:
+            with self._condition:
+                self._waiters.remove(waiter)
+
+    def _publish(self, chunk: str | None = None) -> None:
+        with self._condition:
+            if chunk is None:
+                self._done = True
+            else:
+                self._chunks.append(chunk)
+            self._condition.notify_all()
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            # A consumer whose event loop has closed no longer needs waking
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+    def _set_result(self, result: GenerationResult) -> None:
+        self._publish()
+        self._future.set_result(result)
+
+    def _set_exception(self, error: BaseException) -> None:
+        self._publish()
+        self._future.set_exception(error)
+
+
+@dataclass
+class _Request:
+    input_ids: list[int]
+    params: GenerationParams
+    stream: bool
+    handle: GenerationHandle = field(default_factory=GenerationHandle)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    tokens: list[int] = field(default_factory=list)
+    streamed_text: str = ""
+    finished: bool = False
+
+
+class BatchScheduler:
+    """Dynamic batching queue in front of a generation backend."""
+
+    def __init__(
+        self,
+        backend: GenerationBackend,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        max_batch_tokens: int = 32_768,
+        max_queue_size: int = 256,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            backend: Model backend that tokenizes and generates
+            max_batch_size: Most requests per generate call
+            max_wait_ms: Longest the oldest request waits for a batch to fill
+            max_batch_tokens: KV-cache positions a batch may occupy, padding included
+            max_queue_size: Waiting requests beyond which submissions are rejected
+        """
+        if max_batch_size <= 0 or max_batch_tokens <= 0 or max_queue_size <= 0:
+            raise ValueError("Batch size, batch tokens and queue size must be positive")
+        if max_wait_ms < 0:
+            raise ValueError(f"Max wait {max_wait_ms} ms must not be negative")
+
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_tokens = max_batch_tokens
+        self.max_queue_size = max_queue_size
+
+        self._pending: list[_Request] = []
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._stopping = False
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "last_batch_size": 0,
+            "max_batch_size_seen": 0,
+            "input_tokens": 0,
+            "generated_tokens": 0,
+            "generation_seconds": 0.0,
+            "queue_seconds": 0.0,
+            "failed_requests": 0,
+        }
+
+    def submit(
+        self,
+        prompt: str,
+        params: GenerationParams | None = None,
+        stream: bool = False,
+    ) -> GenerationHandle:
+        """Queue a prompt for generation.
+
+        Args:
+            prompt: Prompt text
+            params: Generation parameters, defaults if omitted
+            stream: Publish text chunks to the handle while generating
+
+        Returns:
+            Handle to wait on or iterate
+
+        Raises:
+            SchedulerQueueFullError: If ``max_queue_size`` requests are waiting
+        """
+        request = _Request(
+            self.backend.encode(prompt), params or GenerationParams(), stream
+        )
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("Scheduler has been stopped")
+            if len(self._pending) >= self.max_queue_size:
+                raise SchedulerQueueFullError(
+                    f"{len(self._pending)} requests already waiting for generation"
+                )
+            self._pending.append(request)
+            self._stats["requests"] += 1
+            self._condition.notify_all()
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="llm-batch-scheduler", daemon=True
+                )
+                self._worker.start()
+        return request.handle
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Finish waiting requests and stop the worker thread."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Queue depth, batch sizes and throughput so far."""
+        with self._condition:
+            stats = dict(self._stats)
+            queue_depth = len(self._pending)
+        batches, batched = stats["batches"], stats["batched_requests"]
+        seconds = stats["generation_seconds"]
+        return {
+            "queue_depth": queue_depth,
+            **stats,
+            "average_batch_size": batched / batches if batches else 0.0,
+            "average_queue_ms": (
+                stats["queue_seconds"] / batched * 1000.0 if batched else 0.0
+            ),
+            "tokens_per_second": (
+                stats["generated_tokens"] / seconds if seconds else 0.0
+            ),
+        }
+
+    def _run(self) -> None:
+        try:
+            self._schedule()
+        except Exception as e:
+            logger.error(f"Batch scheduler stopped: {e}")
+            with self._condition:
+                self._stopping = True
+                pending, self._pending = self._pending, []
+            self._fail(pending, e)
+
+    def _schedule(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                head = self._pending[0]
+                deadline = head.enqueued_at + self.max_wait
+                while not self._stopping:
+                    compatible = sum(
+                        1 for request in self._pending if request.params == head.params
+                    )
+                    remaining = deadline - time.perf_counter()
+                    if compatible >= self.max_batch_size or remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._take_batch(head)
+            self._execute(batch)
+
+    def _take_batch(self, head: _Request) -> list[_Request]:
+        """Remove the head and the compatible requests that fit alongside it."""
+        candidates = sorted(
+            (request for request in self._pending[1:] if request.params == head.params),
+            key=lambda request: abs(len(request.input_ids) - len(head.input_ids)),
+        )
+        batch = [head]
+        longest = len(head.input_ids)
+        for request in candidates:
+            if len(batch) >= self.max_batch_size:
+                break
+            width = max(longest, len(request.input_ids))
+            cache_positions = (len(batch) + 1) * (width + head.params.max_new_tokens)
+            if cache_positions > self.max_batch_tokens:
+                continue
+            batch.append(request)
+            longest = width
+        taken = {id(request) for request in batch}
+        self._pending = [r for r in self._pending if id(r) not in taken]
+        return batch
+
+    def _execute(self, batch: list[_Request]) -> None:
+        try:
+            self._generate_batch(batch)
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} requests failed: {e}")
+            self._fail(batch, e)
+
+    def _generate_batch(self, batch: list[_Request]) -> None:
+        started = time.perf_counter()
+        on_step = (
+            (lambda tokens: self._stream_step(batch, tokens))
+            if any(request.stream for request in batch)
+            else None
+        )
+        outputs = self.backend.generate(
+            [request.input_ids for request in batch], batch[0].params, on_step
+        )
+
+        elapsed = time.perf_counter() - started
+        results = []
+        for request, output_ids in zip(batch, outputs, strict=True):
+            text = self.backend.decode(output_ids)
+            if request.stream and len(text) > len(request.streamed_text):
+                request.handle._publish(text[len(request.streamed_text) :])
+            results.append(
+                GenerationResult(
+                    text=text,
+                    input_tokens=len(request.input_ids),
+                    output_tokens=len(output_ids),
+                    queue_time=started - request.enqueued_at,
+                    generation_time=elapsed,
+                    batch_size=len(batch),
+                )
+            )
+
+        with self._condition:
+            stats = self._stats
+            stats["batches"] += 1
+            stats["batched_requests"] += len(batch)
+            stats["last_batch_size"] = len(batch)
+            stats["max_batch_size_seen"] = max(stats["max_batch_size_seen"], len(batch))
+            stats["input_tokens"] += sum(result.input_tokens for result in results)
+            stats["generated_tokens"] += sum(result.output_tokens for result in results)
+            stats["generation_seconds"] += elapsed
+            stats["queue_seconds"] += sum(result.queue_time for result in results)
+        for request, result in zip(batch, results, strict=True):
+            request.handle._set_result(result)
+
+    def _fail(self, requests: list[_Request], error: Exception) -> None:
+        """Fail every request whose handle has not been settled yet."""
+        unsettled = [request for request in requests if not request.handle.done()]
+        with self._condition:
+            self._stats["failed_requests"] += len(unsettled)
+        for request in unsettled:
+            request.handle._set_exception(error)
+
+    def _stream_step(self, batch: list[_Request], tokens: list[int]) -> None:
+        """Publish the text each streaming row gained in this step."""
+        for request, token in zip(batch, tokens, strict=True):
+            if not request.stream or request.finished:
+                continue
+            if token == self.backend.eos_token_id:
+                request.finished = True
+                continue
+            request.tokens.append(token)
+            text = self.backend.decode(request.tokens)
+            # Hold back a trailing partial multi-byte character
+            if text.endswith("\ufffd") or len(text) <= len(request.streamed_text):
+                continue
+            request.handle._publish(text[len(request.streamed_text) :])
+            request.streamed_text = text
+
+
+class _StepStreamer(BaseStreamer):
+    """Forwards each batched generation step's new tokens to a callback."""
+
+    def __init__(self, on_step: Callable[[list[int]], None]) -> None:
+        self.on_step = on_step
+        self.prompt_seen = False
+
+    def put(self, value: Any) -> None:
+        # The first call carries the prompt IDs, later calls one token per row
+        if not self.prompt_seen:
+            self.prompt_seen = True
+            return
+        self.on_step(value.reshape(-1).tolist())
+
+    def end(self) -> None:
+        return None
+
+
+class TransformersBatchBackend:
+    """Hugging Face causal LM backend generating left-padded batches."""
+
+    def __init__(self, model: Any, tokenizer: Any) -> None:
+        """Initialize the backend.
+
+        Args:
+            model: Causal language model with ``generate``
+            tokenizer: Matching tokenizer
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            raise ImportError(
+                "torch and transformers are required for batched generation"
+            )
+        self.model = model
+        self.tokenizer = tokenizer
+        self.eos_token_id = tokenizer.eos_token_id
+        self.pad_token_id = (
+            tokenizer.pad_token_id
+            if tokenizer.pad_token_id is not None
+            else tokenizer.eos_token_id
+        )
+
+    def encode(self, text: str) -> list[int]:
+        return self.tokenizer.encode(text)
+
+    def decode(self, token_ids: list[int]) -> str:
+        return self.tokenizer.decode(token_ids, skip_special_tokens=True)
+
+    def generate(
+        self,
+        prompts: list[list[int]],
+        params: GenerationParams,
+        on_step: Callable[[list[int]], None] | None = None,
+    ) -> list[list[int]]:
+        width = max(len(ids) for ids in prompts)
+        input_ids = torch.full(
+            (len(prompts), width), self.pad_token_id, dtype=torch.long
+        )
+        attention_mask = torch.zeros_like(input_ids)
+        for row, ids in enumerate(prompts):
+            input_ids[row, width - len(ids) :] = torch.tensor(ids, dtype=torch.long)
+            attention_mask[row, width - len(ids) :] = 1
+
+        with torch.inference_mode():
+            sequences = self.model.generate(
+                input_ids=input_ids.to(self.model.device),
+                attention_mask=attention_mask.to(self.model.device),
+                pad_token_id=self.pad_token_id,
+                use_cache=True,
+                streamer=_StepStreamer(on_step) if on_step else None,
+                **params.generate_kwargs(),
+            )
+
+        outputs = []
+        for row in sequences[:, width:].tolist():
+            if self.eos_token_id in row:
+                row = row[: row.index(self.eos_token_id)]
+            outputs.append(row)
+        return outputs
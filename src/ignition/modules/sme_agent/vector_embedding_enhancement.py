@@ -11,11 +11,18 @@ Enhances existing 384D vector embeddings with domain-specific knowledge,
 implements hybrid search, and builds context-aware RAG system.
 """
 
+import asyncio
+import copy
+import heapq
 import os
 import pickle
-from dataclasses import dataclass, field
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -34,13 +41,6 @@ try:
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
-try:
-    import faiss
-
-    FAISS_AVAILABLE = True
-except ImportError:
-    FAISS_AVAILABLE = False
-
 try:
     from neo4j import GraphDatabase
 
@@ -49,6 +49,15 @@ except ImportError:
     NEO4J_AVAILABLE = False
 
 from . import SMEAgentValidationError
+from .vector_store import FAISS_AVAILABLE, DocumentVectorStore
+
+# Lucene query syntax characters, escaped so free text matches as plain terms
+_LUCENE_SPECIAL_CHARACTERS = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _lucene_query(text: str) -> str:
+    """Escape Lucene syntax in a free-text query for the full-text index."""
+    return _LUCENE_SPECIAL_CHARACTERS.sub(r"\\\1", text.strip())
 
 
 class EmbeddingModel(Enum):
@@ -83,6 +92,10 @@ class VectorConfig:
     use_faiss: bool = True
     faiss_index_type: str = "IndexFlatIP"  # Inner Product for cosine similarity
     enable_gpu: bool = False
+    ivf_train_threshold: int = 20000  # IndexIVFFlat is trained at this corpus size
+    ivf_nprobe: int | None = None  # None tunes nprobe to ivf_target_recall
+    ivf_target_recall: float = 0.95
+    checkpoint_interval: int = 50000  # Changes between index checkpoints
 
     # Neo4j integration
     neo4j_uri: str = "bolt://localhost:7687"
@@ -90,12 +103,32 @@ class VectorConfig:
     neo4j_password: str = "password"
     neo4j_database: str = "neo4j"
 
+    # Neo4j full-text index queried by graph search
+    fulltext_index_name: str = "sme_knowledge_fulltext"
+    fulltext_labels: list[str] = field(
+        default_factory=lambda: [
+            "Function",
+            "Class",
+            "Method",
+            "Pattern",
+            "Task",
+            "Category",
+            "DocumentChunk",
+        ]
+    )
+    fulltext_properties: list[str] = field(
+        default_factory=lambda: ["name", "description", "content", "text"]
+    )
+
     # Search configuration
     default_search_mode: SearchMode = SearchMode.HYBRID
     vector_weight: float = 0.7  # Weight for vector similarity in hybrid search
     graph_weight: float = 0.3  # Weight for graph traversal in hybrid search
     max_results: int = 10
     similarity_threshold: float = 0.5
+    rrf_k: int = 60  # Rank offset in reciprocal-rank fusion
+    query_cache_size: int = 256  # Cached (query, mode, k) results
+    query_cache_ttl: float = 300.0  # Seconds before a cached result is refreshed
 
     # RAG configuration
     context_window: int = 2048
@@ -160,6 +193,14 @@ class SearchResult:
     graph_path: list[str] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def copy(self) -> "SearchResult":
+        """Copy the result, including its metadata, so callers cannot mutate cached entries."""
+        return replace(
+            self,
+            graph_path=list(self.graph_path) if self.graph_path is not None else None,
+            metadata=copy.deepcopy(self.metadata),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert result to dictionary."""
         return {
@@ -294,19 +335,25 @@ class VectorEmbeddingEnhancement:
         """Initialize vector embedding enhancement with configuration."""
         self.config = config or VectorConfig()
         self.embedding_model = None
-        self.faiss_index = None
+        self.vector_store: DocumentVectorStore | None = None
         self.neo4j_driver = None
+        # Cleared while the full-text index cannot be created; graph search is skipped
+        self._fulltext_available = True
         self.validation_result: dict[str, Any] = None
 
         # Storage
-        self.document_store = {}  # id -> document mapping
         self.embedding_cache = {}  # text -> embedding mapping
+        # (query, mode, k) -> (cached_at, results), least recently used first
+        self.query_cache: OrderedDict[tuple[str, str, int], tuple[float, list]] = (
+            OrderedDict()
+        )
 
         # Statistics
         self.stats = {
             "embeddings_generated": 0,
             "searches_performed": 0,
             "cache_hits": 0,
+            "query_cache_hits": 0,
             "total_processing_time": 0.0,
         }
 
@@ -340,11 +387,6 @@ class VectorEmbeddingEnhancement:
                 self.embedding_model = SentenceTransformer(model_name)
                 init_result["components_initialized"].append("embedding_model")
 
-            # Initialize FAISS index
-            if FAISS_AVAILABLE and self.config.use_faiss:
-                self._initialize_faiss_index()
-                init_result["components_initialized"].append("faiss_index")
-
             # Initialize Neo4j connection
             if NEO4J_AVAILABLE:
                 self.neo4j_driver = GraphDatabase.driver(
@@ -353,11 +395,23 @@ class VectorEmbeddingEnhancement:
                 )
                 init_result["components_initialized"].append("neo4j_driver")
 
+                try:
+                    self._ensure_fulltext_index()
+                    init_result["components_initialized"].append("fulltext_index")
+                except Exception as e:
+                    init_result["warnings"].append(
+                        f"Full-text index unavailable, graph search disabled: {e}"
+                    )
+
             # Create directories
             self._create_directories()
             init_result["components_initialized"].append("directories")
 
-            # Load existing index if available
+            # Open the vector store, replaying any persisted documents
+            self._initialize_vector_store()
+            init_result["components_initialized"].append(
+                "faiss_index" if self.vector_store.use_faiss else "vector_store"
+            )
             if self.config.enable_persistence:
                 self._load_persistent_index()
                 init_result["components_initialized"].append("persistent_index")
@@ -378,35 +432,54 @@ class VectorEmbeddingEnhancement:
                 raise SMEAgentValidationError("Custom model path not provided")
         return self.config.embedding_model.value
 
-    def _initialize_faiss_index(self) -> None:
-        """Initialize FAISS index for vector similarity search."""
-        if self.config.faiss_index_type == "IndexFlatIP":
-            # Inner Product (cosine similarity for normalized vectors)
-            self.faiss_index = faiss.IndexFlatIP(self.config.embedding_dimension)
-        elif self.config.faiss_index_type == "IndexFlatL2":
-            # L2 distance
-            self.faiss_index = faiss.IndexFlatL2(self.config.embedding_dimension)
-        elif self.config.faiss_index_type == "IndexIVFFlat":
-            # Inverted File with Flat quantizer (faster for large datasets)
-            quantizer = faiss.IndexFlatIP(self.config.embedding_dimension)
-            self.faiss_index = faiss.IndexIVFFlat(
-                quantizer, self.config.embedding_dimension, 100
-            )
-        else:
-            # Default to flat inner product
-            self.faiss_index = faiss.IndexFlatIP(self.config.embedding_dimension)
+    def _initialize_vector_store(self) -> None:
+        """Open the stable-ID vector store for similarity search."""
+        self.vector_store = DocumentVectorStore(
+            self.config.embedding_dimension,
+            self.config.index_directory if self.config.enable_persistence else None,
+            index_type=self.config.faiss_index_type,
+            ivf_train_threshold=self.config.ivf_train_threshold,
+            ivf_nprobe=self.config.ivf_nprobe,
+            target_recall=self.config.ivf_target_recall,
+            checkpoint_interval=self.config.checkpoint_interval,
+            use_faiss=self.config.use_faiss,
+            enable_gpu=self.config.enable_gpu,
+        )
 
-        # Enable GPU if available and requested
-        if self.config.enable_gpu and FAISS_AVAILABLE:
-            try:
-                import faiss
+    def _ensure_fulltext_index(self) -> None:
+        """Create the graph search full-text index, recreating it on schema change.
 
-                if faiss.get_num_gpus() > 0:
-                    self.faiss_index = faiss.index_cpu_to_gpu(
-                        faiss.StandardGpuResources(), 0, self.faiss_index
-                    )
-            except Exception:
-                pass  # Fall back to CPU
+        Neo4j keeps the index up to date as nodes are written, so graph search
+        is an index lookup instead of a scan over every node property.
+        """
+        self._fulltext_available = False
+        name = self.config.fulltext_index_name
+        labels = sorted(self.config.fulltext_labels)
+        properties = sorted(self.config.fulltext_properties)
+
+        with self.neo4j_driver.session(database=self.config.neo4j_database) as session:
+            existing = session.run(
+                "SHOW FULLTEXT INDEXES YIELD name, labelsOrTypes, properties "
+                "WHERE name = $name RETURN labelsOrTypes, properties",
+                name=name,
+            ).single()
+            if existing and (
+                sorted(existing["labelsOrTypes"]) != labels
+                or sorted(existing["properties"]) != properties
+            ):
+                session.run(f"DROP INDEX `{name}` IF EXISTS").consume()
+                existing = None
+
+            if existing is None:
+                label_pattern = "|".join(f"`{label}`" for label in labels)
+                property_list = ", ".join(f"n.`{prop}`" for prop in properties)
+                session.run(
+                    f"CREATE FULLTEXT INDEX `{name}` IF NOT EXISTS "
+                    f"FOR (n:{label_pattern}) ON EACH [{property_list}]"
+                ).consume()
+
+            session.run("CALL db.awaitIndex($name, 300)", name=name).consume()
+        self._fulltext_available = True
 
     def _create_directories(self) -> None:
         """Create necessary directories."""
@@ -414,22 +487,21 @@ class VectorEmbeddingEnhancement:
         Path(self.config.cache_directory).mkdir(parents=True, exist_ok=True)
 
     def _load_persistent_index(self) -> None:
-        """Load persistent index and document store if available."""
+        """Import a legacy pickled document store into the vector store once."""
         try:
-            index_path = Path(self.config.index_directory) / "faiss_index.bin"
             docs_path = Path(self.config.index_directory) / "document_store.pkl"
 
-            if index_path.exists() and docs_path.exists():
-                # Load FAISS index
-                if FAISS_AVAILABLE and self.faiss_index is not None:
-                    saved_index = faiss.read_index(str(index_path))
-                    # Verify dimensions match
-                    if saved_index.d == self.config.embedding_dimension:
-                        self.faiss_index = saved_index
-
-                # Load document store
+            if docs_path.exists() and self.vector_store is not None:
                 with open(docs_path, "rb") as f:
-                    self.document_store = pickle.load(f)
+                    legacy_store = pickle.load(f)
+
+                self.vector_store.add(
+                    {"id": doc_id, **doc}
+                    for doc_id, doc in legacy_store.items()
+                    if doc_id not in self.vector_store
+                )
+                self.vector_store.checkpoint()
+                docs_path.rename(docs_path.with_suffix(".pkl.migrated"))
 
         except Exception as e:
             print(f"Warning: Could not load persistent index: {e}")
@@ -509,65 +581,57 @@ class VectorEmbeddingEnhancement:
     async def add_documents(
         self, documents: list[dict[str, Any]], batch_size: int = 32
     ) -> dict[str, Any]:
-        """Add documents to the vector index."""
+        """Add documents to the vector index.
+
+        Each batch is appended to the vector store's document log; a document
+        whose ``id`` is already indexed replaces the earlier version.
+        """
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
+        if self.vector_store is None:
+            self._initialize_vector_store()
+
         added_count = 0
-        embeddings_batch = []
-        ids_batch = []
+        batch = []
 
         try:
-            for i, doc in enumerate(documents):
+            for doc in documents:
                 # Validate document format
                 if "id" not in doc or "text" not in doc:
                     continue
 
-                doc_id = doc["id"]
-                text = doc["text"]
-
                 # Generate embedding
-                result = await self.generate_embedding(text)
-
-                # Store document
-                self.document_store[doc_id] = {
-                    "text": text,
-                    "embedding": result.embedding,
-                    "metadata": doc.get("metadata", {}),
-                    "added_at": datetime.now().isoformat(),
-                }
-
-                embeddings_batch.append(result.embedding)
-                ids_batch.append(doc_id)
+                result = await self.generate_embedding(doc["text"])
+
+                batch.append(
+                    {
+                        "id": doc["id"],
+                        "text": doc["text"],
+                        "embedding": result.embedding,
+                        "metadata": doc.get("metadata", {}),
+                    }
+                )
                 added_count += 1
 
-                # Add to FAISS index in batches
-                if len(embeddings_batch) >= batch_size or i == len(documents) - 1:
-                    if (
-                        FAISS_AVAILABLE
-                        and self.faiss_index is not None
-                        and embeddings_batch
-                    ):
-                        if NUMPY_AVAILABLE:
-                            embeddings_array = np.array(
-                                embeddings_batch, dtype=np.float32
-                            )
-                            self.faiss_index.add(embeddings_array)
-
-                        embeddings_batch = []
-                        ids_batch = []
-
-            # Save persistent index
-            if self.config.enable_persistence:
-                self._save_persistent_index()
+                # Add to the index in batches
+                if len(batch) >= batch_size:
+                    self.vector_store.add(batch)
+                    batch = []
+
+            if batch:
+                self.vector_store.add(batch)
+            self.query_cache.clear()
 
             return {
                 "status": "success",
                 "documents_added": added_count,
-                "total_documents": len(self.document_store),
+                "total_documents": len(self.vector_store),
             }
 
         except Exception as e:
+            # Earlier batches may already be searchable
+            self.query_cache.clear()
             raise SMEAgentValidationError(f"Failed to add documents: {e}")
 
     async def hybrid_search(
@@ -594,6 +658,14 @@ class VectorEmbeddingEnhancement:
         if max_results <= 0:
             raise ValueError("max_results must be positive")
 
+        cache_key = (query, search_mode.value, max_results)
+        cached = self.query_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] <= self.config.query_cache_ttl:
+            self.query_cache.move_to_end(cache_key)
+            self.stats["query_cache_hits"] += 1
+            self.stats["searches_performed"] += 1
+            return [result.copy() for result in cached[1]]
+
         try:
             start_time = datetime.now()
 
@@ -613,6 +685,15 @@ class VectorEmbeddingEnhancement:
             self.stats["searches_performed"] += 1
             self.stats["total_processing_time"] += processing_time
 
+            if self.config.query_cache_size > 0:
+                self.query_cache[cache_key] = (
+                    time.monotonic(),
+                    [result.copy() for result in results],
+                )
+                self.query_cache.move_to_end(cache_key)
+                while len(self.query_cache) > self.config.query_cache_size:
+                    self.query_cache.popitem(last=False)
+
             return results
 
         except Exception as e:
@@ -622,126 +703,136 @@ class VectorEmbeddingEnhancement:
 
     async def _vector_search(self, query: str, max_results: int) -> list[SearchResult]:
         """Perform pure vector similarity search."""
-        if not self.faiss_index or not self.document_store:
+        if self.vector_store is None or not len(self.vector_store):
             return []
 
         # Generate query embedding
         query_result = await self.generate_embedding(query)
-        query_embedding = np.array([query_result.embedding], dtype=np.float32)
 
-        # Search FAISS index
-        scores, indices = self.faiss_index.search(query_embedding, max_results)
-
-        results = []
-        doc_ids = list(self.document_store.keys())
-
-        for i, (score, idx) in enumerate(zip(scores[0], indices[0], strict=False)):
-            if (
-                idx >= 0
-                and idx < len(doc_ids)
-                and score >= self.config.similarity_threshold
-            ):
-                doc_id = doc_ids[idx]
-                doc = self.document_store[doc_id]
-
-                result = SearchResult(
-                    id=doc_id,
-                    text=doc["text"],
-                    score=float(score),
-                    source="vector",
-                    embedding=doc["embedding"],
-                    metadata=doc.get("metadata", {}),
-                )
-                results.append(result)
-
-        return results
+        # Search the index; hits resolve to documents through their stable IDs
+        hits = self.vector_store.search(query_result.embedding, max_results)
+
+        return [
+            SearchResult(
+                id=doc_id,
+                text=doc["text"],
+                score=score,
+                source="vector",
+                embedding=doc["embedding"],
+                metadata=doc.get("metadata", {}),
+            )
+            for doc_id, score, doc in hits
+            if score >= self.config.similarity_threshold
+        ]
 
     async def _graph_search(self, query: str, max_results: int) -> list[SearchResult]:
-        """Perform pure graph traversal search."""
-        if not self.neo4j_driver:
+        """Perform full-text graph search without blocking the event loop."""
+        if not self.neo4j_driver or not self._fulltext_available:
             return []
 
         results = []
 
         try:
-            with self.neo4j_driver.session() as session:
-                # Simple text search in Neo4j
-                cypher_query = """
-                MATCH (n)
-                WHERE any(prop in keys(n) WHERE toString(n[prop]) CONTAINS $query)
-                RETURN n, id(n) as node_id
-                LIMIT $max_results
-                """
-
-                result = session.run(cypher_query, query=query, max_results=max_results)
-
-                for record in result:
-                    node = record["n"]
-                    node_id = str(record["node_id"])
-
-                    # Extract text content
-                    properties = dict(node)
-                    text_parts = []
-                    for key, value in properties.items():
-                        if isinstance(value, str) and value.strip():
-                            text_parts.append(f"{key}: {value}")
-
-                    text = " | ".join(text_parts) if text_parts else str(properties)
-
-                    search_result = SearchResult(
-                        id=node_id,
-                        text=text,
-                        score=0.8,  # Default score for graph results
-                        source="graph",
-                        metadata={
-                            "node_labels": list(node.labels),
-                            "properties": properties,
-                        },
-                    )
-                    results.append(search_result)
+            records = await asyncio.to_thread(
+                self._query_fulltext_index, query, max_results
+            )
+
+            for record in records:
+                node = record["node"]
+                node_id = str(record["node_id"])
+
+                # Extract text content
+                properties = dict(node)
+                text_parts = []
+                for key, value in properties.items():
+                    if isinstance(value, str) and value.strip():
+                        text_parts.append(f"{key}: {value}")
+
+                text = " | ".join(text_parts) if text_parts else str(properties)
+
+                search_result = SearchResult(
+                    id=node_id,
+                    text=text,
+                    score=float(record["score"]),
+                    source="graph",
+                    metadata={
+                        "node_labels": list(node.labels),
+                        "properties": properties,
+                    },
+                )
+                results.append(search_result)
 
         except Exception as e:
             print(f"Warning: Graph search failed: {e}")
 
         return results
 
+    def _query_fulltext_index(self, query: str, max_results: int) -> list[Any]:
+        """Query the full-text index; runs in a worker thread."""
+        cypher_query = """
+        CALL db.index.fulltext.queryNodes($index, $query, {limit: $max_results})
+        YIELD node, score
+        RETURN node, elementId(node) AS node_id, score
+        """
+        with self.neo4j_driver.session(database=self.config.neo4j_database) as session:
+            return list(
+                session.run(
+                    cypher_query,
+                    index=self.config.fulltext_index_name,
+                    query=_lucene_query(query),
+                    max_results=max_results,
+                )
+            )
+
     async def _hybrid_search_combined(
         self, query: str, max_results: int
     ) -> list[SearchResult]:
-        """Perform combined vector and graph search."""
-        # Get results from both methods
-        vector_results = await self._vector_search(query, max_results)
-        graph_results = await self._graph_search(query, max_results)
-
-        # Combine and rerank results
-        all_results = []
-
-        # Add vector results with weighted scores
-        for result in vector_results:
-            result.score = result.score * self.config.vector_weight
-            result.source = "hybrid"
-            all_results.append(result)
-
-        # Add graph results with weighted scores
-        for result in graph_results:
-            result.score = result.score * self.config.graph_weight
-            result.source = "hybrid"
-            all_results.append(result)
-
-        # Remove duplicates and sort by score
-        unique_results = {}
-        for result in all_results:
-            if (
-                result.id not in unique_results
-                or result.score > unique_results[result.id].score
-            ):
-                unique_results[result.id] = result
-
-        # Sort by score and return top results
-        sorted_results = sorted(
-            unique_results.values(), key=lambda x: x.score, reverse=True
+        """Perform vector and graph search concurrently and fuse their rankings."""
+        # The graph leg waits on Neo4j in a worker thread while the vector
+        # leg embeds the query and searches the index
+        graph_results, vector_results = await asyncio.gather(
+            self._graph_search(query, max_results),
+            self._vector_search(query, max_results),
+        )
+        return self._fuse_results(
+            {"vector": vector_results, "graph": graph_results}, max_results
         )
-        return sorted_results[:max_results]
+
+    def _fuse_results(
+        self, rankings: dict[str, list[SearchResult]], max_results: int
+    ) -> list[SearchResult]:
+        """Weighted reciprocal-rank fusion, keeping the top results with a heap.
+
+        Each ranking contributes ``weight / (rrf_k + rank)`` per result, so
+        vector similarities and full-text scores need no common scale.
+        """
+        weights = {
+            "vector": self.config.vector_weight,
+            "graph": self.config.graph_weight,
+        }
+        fused: dict[str, float] = {}
+        ranks: dict[str, dict[str, int]] = {}
+        first_seen: dict[str, SearchResult] = {}
+
+        for source, results in rankings.items():
+            for rank, result in enumerate(results, start=1):
+                fused[result.id] = fused.get(result.id, 0.0) + weights[source] / (
+                    self.config.rrf_k + rank
+                )
+                ranks.setdefault(result.id, {})[source] = rank
+                first_seen.setdefault(result.id, result)
+
+        return [
+            replace(
+                first_seen[result_id],
+                score=score,
+                source="hybrid",
+                metadata={**first_seen[result_id].metadata, "ranks": ranks[result_id]},
+            )
+            for result_id, score in heapq.nlargest(
+                max_results, fused.items(), key=itemgetter(1)
+            )
+        ]
 
     async def _adaptive_search(
         self, query: str, max_results: int
@@ -791,18 +882,10 @@ class VectorEmbeddingEnhancement:
             return str(error)
 
     def _save_persistent_index(self) -> Any:
-        """Save persistent index and document store."""
+        """Checkpoint the vector index; documents are already in the log."""
         try:
-            index_path = Path(self.config.index_directory) / "faiss_index.bin"
-            docs_path = Path(self.config.index_directory) / "document_store.pkl"
-
-            # Save FAISS index
-            if FAISS_AVAILABLE and self.faiss_index is not None:
-                faiss.write_index(self.faiss_index, str(index_path))
-
-            # Save document store
-            with open(docs_path, "wb") as f:
-                pickle.dump(self.document_store, f)
+            if self.vector_store is not None:
+                self.vector_store.checkpoint()
 
         except Exception as e:
             print(f"Warning: Could not save persistent index: {e}")
@@ -812,13 +895,14 @@ class VectorEmbeddingEnhancement:
         return {
             "stats": self.stats,
             "index_info": {
-                "total_documents": len(self.document_store),
+                "total_documents": len(self.vector_store) if self.vector_store else 0,
                 "index_size": (
-                    self.faiss_index.ntotal
-                    if FAISS_AVAILABLE and self.faiss_index
-                    else 0
+                    self.vector_store.index.ntotal if self.vector_store else 0
                 ),
                 "embedding_dimension": self.config.embedding_dimension,
+                "vector_store": (
+                    self.vector_store.info() if self.vector_store else None
+                ),
             },
             "config": {
                 "embedding_model": self.config.embedding_model.value,
@@ -831,9 +915,10 @@ class VectorEmbeddingEnhancement:
     async def cleanup(self) -> None:
         """Cleanup resources following crawl_mcp.py methodology."""
         try:
-            # Save persistent state
-            if self.config.enable_persistence:
-                self._save_persistent_index()
+            # Checkpoint the index and close the document log
+            if self.vector_store is not None:
+                self.vector_store.close()
+                self.vector_store = None
 
             # Close Neo4j connection
             if self.neo4j_driver:
@@ -841,8 +926,8 @@ class VectorEmbeddingEnhancement:
                 self.neo4j_driver = None
 
             # Clear memory
-            self.document_store = {}
             self.embedding_cache = {}
+            self.query_cache.clear()
 
             # Clear GPU cache if using PyTorch
             if SENTENCE_TRANSFORMERS_AVAILABLE:
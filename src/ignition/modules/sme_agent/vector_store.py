@@ -0,0 +1,556 @@
+"""Document vector store for the SME Agent's vector embedding enhancement.
+
+Documents get stable int64 vector IDs. The FAISS index is wrapped in an ID map,
+so a search hit always resolves to the document it was added for, even after
+other documents are updated or removed.
+
+Documents, metadata and embeddings are kept in an append-only SQLite log:
+adding a document inserts a row, and updating or deleting one appends a
+tombstone for its previous vector ID. Each add therefore writes O(batch) rows
+instead of rewriting the whole store. The index itself is checkpointed to
+``index-<vector_id>-<tombstone_seq>`` files, either explicitly or after
+``checkpoint_interval`` changes. On load, rows and tombstones past the newest
+checkpoint are replayed.
+
+With ``index_type="IndexIVFFlat"`` the store uses an exact index until the
+corpus reaches ``ivf_train_threshold`` vectors. It then trains an IVF index
+with about ``4 * sqrt(n)`` lists and tunes ``nprobe`` to the smallest value
+whose recall@10, measured against exact search on a sample of stored vectors,
+reaches ``target_recall``. It retrains after the corpus has grown fourfold.
+Without FAISS, an exact NumPy index with the same ID semantics is used.
+"""
+
+import json
+import logging
+import math
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import faiss
+
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Stored vectors read per query when replaying the log or training
+REPLAY_CHUNK_SIZE = 10_000
+# Queries and neighbours used to tune nprobe after training
+TUNING_QUERIES = 256
+TUNING_K = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    vector_id INTEGER PRIMARY KEY,
+    doc_id TEXT NOT NULL,
+    text TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    added_at TEXT NOT NULL,
+    embedding BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_doc_id ON documents (doc_id);
+CREATE TABLE IF NOT EXISTS tombstones (
+    seq INTEGER PRIMARY KEY,
+    vector_id INTEGER NOT NULL
+);
+"""
+
+
+class _ExactIndex:
+    """NumPy stand-in for a FAISS ``IndexIDMap2`` over a flat index."""
+
+    def __init__(self, dimension: int, metric: str = "ip") -> None:
+        self.d = dimension
+        self.metric = metric
+        self._ids = np.empty(0, dtype=np.int64)
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._rows: dict[int, int] = {}
+        self._size = 0
+
+    @property
+    def ntotal(self) -> int:
+        return self._size
+
+    def add_with_ids(self, vectors: np.ndarray, ids: np.ndarray) -> None:
+        count = len(ids)
+        if self._size + count > len(self._ids):
+            capacity = max(1024, 2 * (self._size + count))
+            self._ids = np.resize(self._ids, capacity)
+            vectors_grown = np.empty((capacity, self.d), dtype=np.float32)
+            vectors_grown[: self._size] = self._vectors[: self._size]
+            self._vectors = vectors_grown
+        self._ids[self._size : self._size + count] = ids
+        self._vectors[self._size : self._size + count] = vectors
+        for offset, vector_id in enumerate(ids.tolist()):
+            self._rows[vector_id] = self._size + offset
+        self._size += count
+
+    def remove_ids(self, ids: np.ndarray) -> int:
+        removed = 0
+        for vector_id in ids.tolist():
+            row = self._rows.pop(vector_id, None)
+            if row is None:
+                continue
+            last = self._size - 1
+            if row != last:
+                moved = int(self._ids[last])
+                self._ids[row] = moved
+                self._vectors[row] = self._vectors[last]
+                self._rows[moved] = row
+            self._size = last
+            removed += 1
+        return removed
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        vectors = self._vectors[: self._size]
+        scores = queries @ vectors.T
+        if self.metric == "l2":
+            # Negated squared distance, so larger is closer for both metrics
+            scores = 2 * scores - (vectors**2).sum(axis=1) - (queries**2).sum(axis=1, keepdims=True)
+        k_found = min(k, self._size)
+        distances = np.full((len(queries), k), -np.inf if self.metric == "ip" else np.inf, dtype=np.float32)
+        labels = np.full((len(queries), k), -1, dtype=np.int64)
+        if k_found:
+            top = np.argpartition(-scores, k_found - 1, axis=1)[:, :k_found]
+            order = np.take_along_axis(-scores, top, axis=1).argsort(axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            best = np.take_along_axis(scores, top, axis=1)
+            distances[:, :k_found] = -best if self.metric == "l2" else best
+            labels[:, :k_found] = self._ids[top]
+        return distances, labels
+
+    def save(self, path: Path) -> None:
+        with open(path, "wb") as file:
+            np.savez(file, ids=self._ids[: self._size], vectors=self._vectors[: self._size])
+
+    @classmethod
+    def load(cls, path: Path, dimension: int, metric: str) -> "_ExactIndex":
+        index = cls(dimension, metric)
+        with np.load(path) as data:
+            index.add_with_ids(data["vectors"], data["ids"])
+        return index
+
+
+class DocumentVectorStore:
+    """Stable-ID vector index backed by an append-only SQLite document log."""
+
+    def __init__(
+        self,
+        dimension: int,
+        directory: str | Path | None = None,
+        index_type: str = "IndexFlatIP",
+        ivf_train_threshold: int = 20_000,
+        ivf_nlist: int | None = None,
+        ivf_nprobe: int | None = None,
+        target_recall: float = 0.95,
+        checkpoint_interval: int = 50_000,
+        use_faiss: bool = True,
+        enable_gpu: bool = False,
+    ) -> None:
+        """Open (or create) a store.
+
+        Args:
+            dimension: Embedding width
+            directory: Directory for the SQLite log and index checkpoints; None
+                keeps everything in memory
+            index_type: ``IndexFlatIP``, ``IndexFlatL2`` or ``IndexIVFFlat``
+            ivf_train_threshold: Corpus size at which an IVF index is trained
+            ivf_nlist: Number of IVF lists; defaults to about ``4 * sqrt(n)``
+            ivf_nprobe: Fixed nprobe; None tunes it against ``target_recall``
+            target_recall: Recall@10 the tuned nprobe must reach
+            checkpoint_interval: Changes after which the index is checkpointed
+            use_faiss: Use FAISS when it is installed
+            enable_gpu: Search a GPU copy of the index when FAISS has GPUs
+        """
+        self.dimension = dimension
+        self.directory = Path(directory) if directory is not None else None
+        self.index_type = index_type
+        self.metric = "l2" if index_type == "IndexFlatL2" else "ip"
+        self.ivf_train_threshold = ivf_train_threshold
+        self.ivf_nlist = ivf_nlist
+        self.ivf_nprobe = ivf_nprobe
+        self.target_recall = target_recall
+        self.checkpoint_interval = checkpoint_interval
+        self.use_faiss = use_faiss and FAISS_AVAILABLE
+        self.enable_gpu = enable_gpu
+
+        self._vector_ids: dict[str, int] = {}  # doc_id -> live vector id
+        self._doc_ids: dict[int, str] = {}  # live vector id -> doc_id
+        self._next_vector_id = 1
+        self._next_tombstone_seq = 1
+        self._checkpointed = (0, 0)
+        self._pending = 0
+        self._trained_size = 0
+        self._quantizer = None
+        self._gpu_index = None
+        self.stats = {"documents_added": 0, "documents_removed": 0, "checkpoints": 0, "trainings": 0, "nprobe": None}
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.directory / "documents.sqlite")
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        else:
+            self._db = sqlite3.connect(":memory:")
+        self._db.executescript(_SCHEMA)
+        self.index = self._new_exact_index()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._vector_ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._vector_ids
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the index is a trained IVF index."""
+        return self._trained_size > 0
+
+    def vector_id(self, doc_id: str) -> int | None:
+        """Return the live vector ID of a document."""
+        return self._vector_ids.get(doc_id)
+
+    def add(self, documents: Iterable[dict[str, Any]]) -> list[int]:
+        """Add or replace documents.
+
+        Args:
+            documents: Dicts with ``id``, ``text``, ``embedding`` and optional
+                ``metadata``; a known ``id`` replaces the earlier version
+
+        Returns:
+            Vector IDs assigned to the documents, in order
+        """
+        rows = []
+        embeddings = []
+        replaced = []
+        added_at = datetime.now().isoformat()
+        for document in documents:
+            doc_id = str(document["id"])
+            embedding = np.asarray(document["embedding"], dtype=np.float32).reshape(self.dimension)
+            vector_id = self._next_vector_id
+            self._next_vector_id += 1
+            previous = self._vector_ids.get(doc_id)
+            if previous is not None:
+                replaced.append(previous)
+                del self._doc_ids[previous]
+            self._vector_ids[doc_id] = vector_id
+            self._doc_ids[vector_id] = doc_id
+            rows.append(
+                (
+                    vector_id,
+                    doc_id,
+                    document["text"],
+                    json.dumps(document.get("metadata", {}), default=str),
+                    added_at,
+                    embedding.tobytes(),
+                )
+            )
+            embeddings.append(embedding)
+        if not rows:
+            return []
+
+        with self._db:
+            self._db.executemany("INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._write_tombstones(replaced)
+
+        # A document replaced twice within the batch has no index entry yet
+        live_replaced = [vector_id for vector_id in replaced if vector_id < rows[0][0]]
+        if live_replaced:
+            self.index.remove_ids(np.asarray(live_replaced, dtype=np.int64))
+        ids = np.asarray([row[0] for row in rows], dtype=np.int64)
+        live = np.asarray([vector_id in self._doc_ids for vector_id in ids.tolist()])
+        self.index.add_with_ids(np.stack(embeddings)[live], ids[live])
+        self._gpu_index = None
+
+        self.stats["documents_added"] += len(rows)
+        self._after_change(len(rows) + len(replaced))
+        return ids.tolist()
+
+    def delete(self, doc_ids: Iterable[str]) -> int:
+        """Remove documents by ID and return how many were present."""
+        removed = []
+        for doc_id in doc_ids:
+            vector_id = self._vector_ids.pop(doc_id, None)
+            if vector_id is not None:
+                del self._doc_ids[vector_id]
+                removed.append(vector_id)
+        if not removed:
+            return 0
+
+        with self._db:
+            self._write_tombstones(removed)
+        self.index.remove_ids(np.asarray(removed, dtype=np.int64))
+        self._gpu_index = None
+
+        self.stats["documents_removed"] += len(removed)
+        self._after_change(len(removed))
+        return len(removed)
+
+    def get(self, doc_id: str) -> dict[str, Any] | None:
+        """Return a stored document by ID."""
+        vector_id = self._vector_ids.get(doc_id)
+        if vector_id is None:
+            return None
+        return self._fetch([vector_id])[vector_id]
+
+    def search(self, query: Any, k: int) -> list[tuple[str, float, dict[str, Any]]]:
+        """Return the ``k`` nearest documents as (doc_id, score, document) tuples."""
+        if not self._vector_ids:
+            return []
+        queries = np.asarray(query, dtype=np.float32).reshape(1, self.dimension)
+        scores, labels = self._search_index().search(queries, k)
+        hits = [
+            (int(vector_id), float(score))
+            for score, vector_id in zip(scores[0], labels[0], strict=True)
+            if vector_id >= 0 and int(vector_id) in self._doc_ids
+        ]
+        documents = self._fetch([vector_id for vector_id, _ in hits])
+        return [(self._doc_ids[vector_id], score, documents[vector_id]) for vector_id, score in hits]
+
+    def checkpoint(self) -> bool:
+        """Write the index to disk if it changed since the last checkpoint.
+
+        Returns:
+            True if a checkpoint was written
+        """
+        position = (self._next_vector_id - 1, self._next_tombstone_seq - 1)
+        if self.directory is None or position == self._checkpointed:
+            return False
+
+        suffix = ".faiss" if self.use_faiss else ".npz"
+        path = self.directory / f"index-{position[0]}-{position[1]}{suffix}"
+        temporary = path.with_name(path.name + ".tmp")
+        if self.use_faiss:
+            faiss.write_index(self.index, str(temporary))
+        else:
+            self.index.save(temporary)
+        os.replace(temporary, path)
+        for stale, _ in self._checkpoint_files():
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+        self._checkpointed = position
+        self._pending = 0
+        self.stats["checkpoints"] += 1
+        return True
+
+    def close(self) -> None:
+        """Checkpoint the index and close the document log."""
+        try:
+            self.checkpoint()
+        finally:
+            self._db.close()
+
+    def info(self) -> dict[str, Any]:
+        """Return index and persistence information."""
+        return {
+            **self.stats,
+            "documents": len(self),
+            "index_size": self.index.ntotal,
+            "backend": "faiss" if self.use_faiss else "numpy",
+            "index": "ivf" if self.is_trained else "flat",
+            "trained_size": self._trained_size,
+            "pending_changes": self._pending,
+            "checkpoint": self._checkpointed,
+        }
+
+    def _new_exact_index(self) -> Any:
+        """Create an empty exact index mapped by vector ID."""
+        if not self.use_faiss:
+            return _ExactIndex(self.dimension, self.metric)
+        flat = faiss.IndexFlatL2(self.dimension) if self.metric == "l2" else faiss.IndexFlatIP(self.dimension)
+        return faiss.IndexIDMap2(flat)
+
+    def _write_tombstones(self, vector_ids: list[int]) -> None:
+        """Append tombstones for superseded vector IDs (inside a transaction)."""
+        first = self._next_tombstone_seq
+        self._db.executemany(
+            "INSERT INTO tombstones VALUES (?, ?)",
+            [(first + offset, vector_id) for offset, vector_id in enumerate(vector_ids)],
+        )
+        self._next_tombstone_seq += len(vector_ids)
+
+    def _after_change(self, changes: int) -> None:
+        """Train or retrain IVF and checkpoint once enough has changed."""
+        self._pending += changes
+        if self._should_train():
+            self._train()
+        if self._pending >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def _should_train(self) -> bool:
+        if not self.use_faiss or self.index_type != "IndexIVFFlat":
+            return False
+        if self.is_trained:
+            return len(self) >= 4 * self._trained_size
+        return len(self) >= self.ivf_train_threshold
+
+    def _train(self) -> None:
+        """Build a trained IVF index over all live vectors and tune nprobe."""
+        ids = np.fromiter(self._doc_ids, dtype=np.int64, count=len(self._doc_ids))
+        vectors = np.empty((len(ids), self.dimension), dtype=np.float32)
+        for start, (vector_ids, chunk) in self._read_vectors(ids):
+            vectors[start : start + len(vector_ids)] = chunk
+
+        nlist = self.ivf_nlist or max(1, min(len(ids) // 39, int(4 * math.sqrt(len(ids)))))
+        quantizer = faiss.IndexFlatIP(self.dimension)
+        index = faiss.IndexIVFFlat(quantizer, self.dimension, nlist, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        index.add_with_ids(vectors, ids)
+        index.nprobe = self.ivf_nprobe or self._tune_nprobe(index, vectors, ids, nlist)
+
+        self._quantizer = quantizer
+        self.index = index
+        self._gpu_index = None
+        self._trained_size = len(ids)
+        self.stats["trainings"] += 1
+        self.stats["nprobe"] = index.nprobe
+        logger.info("Trained IVF index: %d vectors, %d lists, nprobe %d", len(ids), nlist, index.nprobe)
+        # Persist the trained index right away so a restart does not retrain
+        self.checkpoint()
+
+    def _tune_nprobe(self, index: Any, vectors: np.ndarray, ids: np.ndarray, nlist: int) -> int:
+        """Smallest nprobe whose recall@k against exact search reaches the target."""
+        rng = np.random.default_rng(0)
+        sample = vectors[rng.choice(len(vectors), min(TUNING_QUERIES, len(vectors)), replace=False)]
+        k = min(TUNING_K, len(vectors))
+
+        # Exact top-k by inner product, merged chunk by chunk to bound memory
+        best_scores = np.full((len(sample), k), -np.inf, dtype=np.float32)
+        exact = np.zeros((len(sample), k), dtype=np.int64)
+        for start in range(0, len(vectors), REPLAY_CHUNK_SIZE):
+            chunk_ids = ids[start : start + REPLAY_CHUNK_SIZE]
+            scores = np.hstack([best_scores, sample @ vectors[start : start + REPLAY_CHUNK_SIZE].T])
+            labels = np.hstack([exact, np.broadcast_to(chunk_ids, (len(sample), len(chunk_ids)))])
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(scores, top, axis=1)
+            exact = np.take_along_axis(labels, top, axis=1)
+
+        nprobe = 1
+        while True:
+            index.nprobe = nprobe
+            _, found = index.search(sample, k)
+            recall = np.mean([len(set(row) & set(truth)) / k for row, truth in zip(found, exact, strict=True)])
+            if recall >= self.target_recall or nprobe >= nlist:
+                return nprobe
+            nprobe = min(2 * nprobe, nlist)
+
+    def _search_index(self) -> Any:
+        """Return the index to search, mirrored to GPU when requested."""
+        if not (self.enable_gpu and self.use_faiss):
+            return self.index
+        if self._gpu_index is None:
+            try:
+                if faiss.get_num_gpus() == 0:
+                    self.enable_gpu = False
+                    return self.index
+                self._gpu_index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, self.index)
+            except Exception as e:
+                logger.warning("Falling back to CPU vector search: %s", e)
+                self.enable_gpu = False
+                return self.index
+        return self._gpu_index
+
+    def _fetch(self, vector_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """Load the stored documents for the given vector IDs."""
+        if not vector_ids:
+            return {}
+        placeholders = ", ".join("?" * len(vector_ids))
+        rows = self._db.execute(
+            f"SELECT vector_id, text, metadata, added_at, embedding FROM documents WHERE vector_id IN ({placeholders})",
+            vector_ids,
+        )
+        return {
+            vector_id: {
+                "text": text,
+                "metadata": json.loads(metadata),
+                "added_at": added_at,
+                "embedding": np.frombuffer(embedding, dtype=np.float32).tolist(),
+            }
+            for vector_id, text, metadata, added_at, embedding in rows
+        }
+
+    def _read_vectors(self, vector_ids: np.ndarray) -> Iterator[tuple[int, tuple[np.ndarray, np.ndarray]]]:
+        """Yield (offset, (ids, vectors)) chunks for the given vector IDs, in order."""
+        for start in range(0, len(vector_ids), REPLAY_CHUNK_SIZE):
+            chunk = vector_ids[start : start + REPLAY_CHUNK_SIZE].tolist()
+            placeholders = ", ".join("?" * len(chunk))
+            rows = dict(
+                self._db.execute(
+                    f"SELECT vector_id, embedding FROM documents WHERE vector_id IN ({placeholders})",
+                    chunk,
+                )
+            )
+            vectors = np.frombuffer(b"".join(rows[vector_id] for vector_id in chunk), dtype=np.float32)
+            yield start, (np.asarray(chunk, dtype=np.int64), vectors.reshape(len(chunk), self.dimension))
+
+    def _checkpoint_files(self) -> list[tuple[Path, tuple[int, int]]]:
+        """Return index checkpoint files with their (vector_id, tombstone_seq) positions."""
+        if self.directory is None:
+            return []
+        files = []
+        for path in self.directory.glob("index-*-*.*"):
+            if path.suffix not in (".faiss", ".npz"):
+                continue
+            _, vector_id, seq = path.stem.split("-")
+            files.append((path, (int(vector_id), int(seq))))
+        return sorted(files, key=lambda item: item[1])
+
+    def _load(self) -> None:
+        """Rebuild the ID maps from the log and the index from checkpoint plus replay."""
+        tombstoned = {vector_id for (vector_id,) in self._db.execute("SELECT vector_id FROM tombstones")}
+        for vector_id, doc_id in self._db.execute("SELECT vector_id, doc_id FROM documents ORDER BY vector_id"):
+            if vector_id not in tombstoned:
+                self._vector_ids[doc_id] = vector_id
+        self._doc_ids = {vector_id: doc_id for doc_id, vector_id in self._vector_ids.items()}
+        self._next_vector_id = (self._db.execute("SELECT MAX(vector_id) FROM documents").fetchone()[0] or 0) + 1
+        self._next_tombstone_seq = (self._db.execute("SELECT MAX(seq) FROM tombstones").fetchone()[0] or 0) + 1
+
+        position = (0, 0)
+        suffix = ".faiss" if self.use_faiss else ".npz"
+        checkpoints = [item for item in self._checkpoint_files() if item[0].suffix == suffix]
+        if checkpoints:
+            path, position = checkpoints[-1]
+            try:
+                if self.use_faiss:
+                    index = faiss.read_index(str(path))
+                else:
+                    index = _ExactIndex.load(path, self.dimension, self.metric)
+                if index.d != self.dimension:
+                    raise ValueError(f"checkpoint has dimension {index.d}, expected {self.dimension}")
+                self.index = index
+                if hasattr(index, "nprobe"):
+                    self._trained_size = index.ntotal
+                    self.stats["nprobe"] = index.nprobe
+            except Exception as e:
+                logger.warning("Ignoring index checkpoint %s: %s", path, e)
+                position = (0, 0)
+
+        replay = np.asarray(sorted(vector_id for vector_id in self._doc_ids if vector_id > position[0]), dtype=np.int64)
+        for _, (vector_ids, vectors) in self._read_vectors(replay):
+            self.index.add_with_ids(vectors, vector_ids)
+        removed = [
+            vector_id
+            for (vector_id,) in self._db.execute("SELECT vector_id FROM tombstones WHERE seq > ?", (position[1],))
+            if vector_id <= position[0]
+        ]
+        if removed:
+            self.index.remove_ids(np.asarray(removed, dtype=np.int64))
+
+        self._checkpointed = position
+        self._pending = len(replay) + len(removed)
+        if self._should_train():
+            self._train()
+        if self._vector_ids:
+            logger.info(
+                "Loaded %d documents (%d replayed, %d removed since checkpoint)", len(self), len(replay), len(removed)
+            )
@@ -8,7 +8,7 @@ from .browser import AddressSpaceBrowser
 from .client import IgnitionOPCUAClient
 from .connection import ConnectionManager
 from .security import SecurityManager
-from .subscription import SubscriptionManager
+from .subscription import DeadbandType, MonitoringProfile, SubscriptionManager
 
 __version__ = "0.1.0"
 __author__ = "Ignition Tools Project"
@@ -16,7 +16,9 @@ __author__ = "Ignition Tools Project"
 __all__ = [
     "AddressSpaceBrowser",
     "ConnectionManager",
+    "DeadbandType",
     "IgnitionOPCUAClient",
+    "MonitoringProfile",
     "SecurityManager",
     "SubscriptionManager",
 ]
@@ -2,27 +2,63 @@
 
 Provides functionality for browsing and navigating OPC-UA server
 address spaces with filtering and search capabilities.
+
+Large address spaces are crawled breadth-first: each level is browsed with
+multi-node Browse requests, node attributes are read with multi-node Read
+requests, and discovered nodes are kept in a snapshot that later searches and
+path lookups are answered from.
 """
 
+import asyncio
 import logging
+import math
+from collections.abc import AsyncIterator
 from typing import Any
 
-from asyncua import Client, Node
+from asyncua import Client, Node, ua
 from asyncua.ua import NodeClass
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CRAWL_CONCURRENCY = 8
+DEFAULT_CRAWL_BATCH_SIZE = 500  # nodes per Browse/Read request
+SEARCH_DEPTH = 4  # levels below the start node covered by find_nodes_by_browse_name
+
+# Attributes read in bulk for every Variable node
+VARIABLE_ATTRIBUTES = (
+    ("data_type", ua.AttributeIds.DataType),
+    ("value", ua.AttributeIds.Value),
+    ("access_level", ua.AttributeIds.AccessLevel),
+)
+
 
 class AddressSpaceBrowser:
     """Browses OPC-UA server address space and provides navigation utilities."""
 
-    def __init__(self, client: Client):
+    def __init__(
+        self,
+        client: Client,
+        concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+        batch_size: int = DEFAULT_CRAWL_BATCH_SIZE,
+    ):
         """Initialize address space browser.
 
         Args:
             client: AsyncUA client instance
+            concurrency: Maximum Browse/Read requests in flight during a crawl
+            batch_size: Maximum nodes per Browse/Read request
         """
         self.client = client
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+
+        # Crawl snapshot: node ID -> node info, plus the parent -> children edges
+        # (ordered, deduplicated) and child -> parents edges seen when browsing
+        self.snapshot: dict[str, dict[str, Any]] = {}
+        self._children: dict[str, dict[str, None]] = {}
+        self._parents: dict[str, set[str]] = {}
+        # Crawl root node ID -> depth fully crawled below it (inf when exhausted)
+        self._crawled_depths: dict[str, float] = {}
 
     async def browse_tree(self, node_id: str = "i=85", max_depth: int = 3) -> dict[str, Any]:
         """Browse OPC-UA address space starting from specified node.
@@ -35,51 +71,320 @@ class AddressSpaceBrowser:
             Dictionary containing browsed tree structure
         """
         try:
-            root_node = self.client.get_node(node_id)
-            tree = await self._browse_node_recursive(root_node, max_depth, 0)
-            return tree
+            root_id = None
+            async for node_info in self.crawl(node_id, max_depth):
+                root_id = root_id or node_info["node_id"]
+            return self.build_tree(root_id, max_depth)
 
         except Exception as e:
             logger.error("Error browsing tree from %s: %s", node_id, e)
             raise
 
-    async def _browse_node_recursive(self, node: Node, max_depth: int, current_depth: int) -> dict[str, Any]:
-        """Recursively browse a node and its children.
+    async def crawl(self, node_id: str = "i=85", max_depth: int = 3) -> AsyncIterator[dict[str, Any]]:
+        """Crawl the address space breadth-first, yielding node info as nodes are discovered.
+
+        Each level is browsed with batched Browse requests (at most
+        ``concurrency`` in flight), attributes of newly discovered nodes are
+        read in bulk, and NodeIds already visited are skipped. Every yielded
+        node is also stored in ``snapshot``. Nodes on the last level carry
+        ``has_children`` instead of being expanded. Each browsed node's
+        children in the snapshot are replaced by what the server returned, so
+        nodes deleted on the server drop out once no known parent links them. A
+        crawl that runs to completion records how deep the snapshot covers the
+        subtree below ``node_id``.
+
+        Args:
+            node_id: Starting node ID (default: Objects folder)
+            max_depth: Maximum browsing depth
+
+        Yields:
+            Node info dictionaries, root first, with ``depth``, ``parent_id`` and ``path``
+        """
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        root = self.client.get_node(node_id)
+        root_info = await self._read_root_info(root, semaphore)
+        if max_depth <= 0:
+            root_info["has_children"] = bool((await self._browse([root.nodeid], semaphore, max_references=1))[0])
+        self._store(root_info)
+        yield root_info
+
+        visited = {root_info["node_id"]}
+        level = [root_info]
+        for depth in range(1, max_depth + 1):
+            chunks = [level[start : start + self.batch_size] for start in range(0, len(level), self.batch_size)]
+            tasks = [asyncio.ensure_future(self._browse_chunk(chunk, semaphore)) for chunk in chunks]
+            next_level = []
+            try:
+                for task in asyncio.as_completed(tasks):
+                    parents, references = await task
+
+                    # Link every child to each parent it appears under, but yield it once
+                    discovered = []
+                    for parent, refs in zip(parents, references, strict=True):
+                        child_ids = [ref.NodeId.to_string() for ref in refs]
+                        self._replace_children(parent["node_id"], child_ids, keep=visited)
+                        for ref, child_id in zip(refs, child_ids, strict=True):
+                            if child_id in visited:
+                                continue
+                            visited.add(child_id)
+                            discovered.append(self._info_from_reference(ref, parent, depth))
+
+                    await self._read_attributes(discovered, semaphore)
+                    if depth == max_depth:
+                        probes = await self._browse(
+                            [ua.NodeId.from_string(info["node_id"]) for info in discovered],
+                            semaphore,
+                            max_references=1,
+                        )
+                        for info, refs in zip(discovered, probes, strict=True):
+                            info["has_children"] = bool(refs)
+
+                    for info in discovered:
+                        self._store(info)
+                        yield info
+                    next_level.extend(discovered)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            if not next_level:
+                crawled_depth = math.inf
+                break
+            level = next_level
+        else:
+            # The subtree is exhausted when nothing on the last level has children
+            crawled_depth = max_depth if any(info.get("has_children") for info in level) else math.inf
+
+        root_id = root_info["node_id"]
+        self._crawled_depths[root_id] = max(self._crawled_depths.get(root_id, -1), crawled_depth)
+
+    def build_tree(self, node_id: str, max_depth: int = 3) -> dict[str, Any]:
+        """Assemble a nested tree from the crawl snapshot.
 
         Args:
-            node: Node to browse
-            max_depth: Maximum recursion depth
-            current_depth: Current recursion depth
+            node_id: Root node ID (must be in the snapshot)
+            max_depth: Maximum tree depth
 
         Returns:
-            Dictionary containing node information and children
+            Node info with ``children`` lists, and ``has_children`` on the last level
         """
-        try:
-            # Get node information
-            node_info = await self.get_node_info(node)
-
-            # Add children if within depth limit
-            if current_depth < max_depth:
-                children = await node.get_children()
-                node_info["children"] = []
-
-                for child in children:
-                    try:
-                        child_info = await self._browse_node_recursive(child, max_depth, current_depth + 1)
-                        node_info["children"].append(child_info)
-                    except Exception as e:
-                        logger.warning("Error browsing child node: %s", e)
-                        continue
-            else:
-                # Check if node has children (without browsing them)
-                children = await node.get_children()
-                node_info["has_children"] = len(children) > 0
+        node_info = dict(self.snapshot[node_id])
+        if max_depth > 0:
+            node_info.pop("has_children", None)
+            node_info["children"] = [
+                self.build_tree(child_id, max_depth - 1)
+                for child_id in self._children.get(node_id, {})
+                if child_id in self.snapshot
+            ]
+        else:
+            # Nodes crawled beyond this depth know their children from the snapshot
+            node_info.setdefault("has_children", bool(self._children.get(node_id)))
+        return node_info
+
+    def clear_snapshot(self) -> None:
+        """Discard the cached crawl snapshot."""
+        self.snapshot.clear()
+        self._children.clear()
+        self._parents.clear()
+        self._crawled_depths.clear()
+
+    def _store(self, node_info: dict[str, Any]) -> None:
+        self.snapshot[node_info["node_id"]] = node_info
+
+    def _replace_children(self, parent_id: str, child_ids: list[str], keep: set[str]) -> None:
+        """Set a browsed node's children, dropping snapshot nodes left without any parent.
+
+        Nodes in ``keep`` (those already seen by the running crawl) are never dropped.
+        """
+        children = dict.fromkeys(child_ids)
+        previous = self._children.get(parent_id, {})
+        self._children[parent_id] = children
+        for child_id in children:
+            self._parents.setdefault(child_id, set()).add(parent_id)
+
+        orphans = []
+        for child_id in previous.keys() - children.keys():
+            parents = self._parents.get(child_id)
+            if parents is not None:
+                parents.discard(parent_id)
+                if not parents:
+                    orphans.append(child_id)
+
+        while orphans:
+            node_id = orphans.pop()
+            if node_id in keep:
+                continue
+            self.snapshot.pop(node_id, None)
+            self._parents.pop(node_id, None)
+            self._crawled_depths.pop(node_id, None)
+            for child_id in self._children.pop(node_id, {}):
+                parents = self._parents.get(child_id)
+                if parents is not None:
+                    parents.discard(node_id)
+                    if not parents:
+                        orphans.append(child_id)
+
+    async def _browse_chunk(
+        self, parents: list[dict[str, Any]], semaphore: asyncio.Semaphore
+    ) -> tuple[list[dict[str, Any]], list[list[ua.ReferenceDescription]]]:
+        references = await self._browse([ua.NodeId.from_string(p["node_id"]) for p in parents], semaphore)
+        return parents, references
+
+    async def _browse(
+        self, node_ids: list[ua.NodeId], semaphore: asyncio.Semaphore, max_references: int = 0
+    ) -> list[list[ua.ReferenceDescription]]:
+        """Browse forward hierarchical references of many nodes with batched Browse requests.
 
-            return node_info
+        Args:
+            node_ids: Nodes to browse
+            semaphore: Bounds the number of requests in flight
+            max_references: References to return per node (0 follows continuation points for all)
 
-        except Exception as e:
-            logger.error("Error browsing node %s: %s", node, e)
-            raise
+        Returns:
+            list of references per node, in input order (empty on error)
+        """
+
+        async def browse_chunk(chunk: list[ua.NodeId]) -> list[list[ua.ReferenceDescription]]:
+            params = ua.BrowseParameters()
+            params.View.Timestamp = ua.get_win_epoch()
+            params.RequestedMaxReferencesPerNode = max_references
+            for node_id in chunk:
+                description = ua.BrowseDescription()
+                description.NodeId = node_id
+                description.BrowseDirection = ua.BrowseDirection.Forward
+                description.ReferenceTypeId = ua.NodeId(ua.ObjectIds.HierarchicalReferences)
+                description.IncludeSubtypes = True
+                description.NodeClassMask = ua.NodeClass.Unspecified
+                description.ResultMask = ua.BrowseResultMask.All
+                params.NodesToBrowse.append(description)
+
+            async with semaphore:
+                try:
+                    results = await self.client.uaclient.browse(params)
+                except Exception as e:
+                    logger.warning("Browse request for %d nodes failed: %s", len(chunk), e)
+                    return [[] for _ in chunk]
+
+                references = []
+                for node_id, result in zip(chunk, results, strict=True):
+                    if not result.StatusCode.is_good():
+                        logger.debug("Error browsing %s: %s", node_id.to_string(), result.StatusCode)
+                        references.append([])
+                        continue
+                    refs = list(result.References)
+                    continuation_point = result.ContinuationPoint
+                    while continuation_point:
+                        next_params = ua.BrowseNextParameters()
+                        next_params.ContinuationPoints = [continuation_point]
+                        # A probe only needs the first reference; release the rest
+                        next_params.ReleaseContinuationPoints = max_references > 0
+                        next_results = await self.client.uaclient.browse_next(next_params)
+                        if max_references > 0 or not next_results:
+                            break
+                        refs.extend(next_results[0].References)
+                        continuation_point = next_results[0].ContinuationPoint
+                    references.append(refs)
+                return references
+
+        chunks = [node_ids[start : start + self.batch_size] for start in range(0, len(node_ids), self.batch_size)]
+        results = await asyncio.gather(*(browse_chunk(chunk) for chunk in chunks))
+        return [refs for chunk_refs in results for refs in chunk_refs]
+
+    async def _read(
+        self, requests: list[tuple[ua.NodeId, ua.AttributeIds]], semaphore: asyncio.Semaphore
+    ) -> list[ua.DataValue | None]:
+        """Read many (node, attribute) pairs with batched Read requests (None on error)."""
+
+        async def read_chunk(chunk: list[tuple[ua.NodeId, ua.AttributeIds]]) -> list[ua.DataValue | None]:
+            params = ua.ReadParameters()
+            for node_id, attribute in chunk:
+                params.NodesToRead.append(ua.ReadValueId(NodeId=node_id, AttributeId=attribute))
+            async with semaphore:
+                try:
+                    return list(await self.client.uaclient.read(params))
+                except Exception as e:
+                    logger.warning("Read request for %d attributes failed: %s", len(chunk), e)
+                    return [None] * len(chunk)
+
+        chunks = [requests[start : start + self.batch_size] for start in range(0, len(requests), self.batch_size)]
+        results = await asyncio.gather(*(read_chunk(chunk) for chunk in chunks))
+        return [data_value for chunk_values in results for data_value in chunk_values]
+
+    async def _read_attributes(self, infos: list[dict[str, Any]], semaphore: asyncio.Semaphore) -> None:
+        """Fill in description and Variable attributes for discovered nodes in bulk."""
+        requests: list[tuple[ua.NodeId, ua.AttributeIds]] = []
+        targets: list[tuple[dict[str, Any], str]] = []
+        for info in infos:
+            node_id = ua.NodeId.from_string(info["node_id"])
+            requests.append((node_id, ua.AttributeIds.Description))
+            targets.append((info, "description"))
+            if info.get("node_class") == NodeClass.Variable.name:
+                for key, attribute in VARIABLE_ATTRIBUTES:
+                    requests.append((node_id, attribute))
+                    targets.append((info, key))
+
+        for (info, key), data_value in zip(targets, await self._read(requests, semaphore), strict=True):
+            if data_value is None or not data_value.StatusCode.is_good() or data_value.Value is None:
+                continue
+            value = data_value.Value.Value
+            if key == "value":
+                info[key] = value
+            elif key == "access_level":
+                info[key] = ua.AccessLevel.parse_bitfield(value)
+            else:
+                info[key] = str(value)
+
+    async def _read_root_info(self, root: Node, semaphore: asyncio.Semaphore) -> dict[str, Any]:
+        """Read the crawl root's attributes and its browse path from the server."""
+        node_id = root.nodeid
+        info = {
+            "node_id": node_id.to_string(),
+            "namespace_index": node_id.NamespaceIndex,
+            "identifier": str(node_id.Identifier),
+            "depth": 0,
+            "parent_id": None,
+        }
+
+        attributes = (
+            ("browse_name", ua.AttributeIds.BrowseName),
+            ("display_name", ua.AttributeIds.DisplayName),
+            ("node_class", ua.AttributeIds.NodeClass),
+        )
+        data_values = await self._read([(node_id, attribute) for _, attribute in attributes], semaphore)
+        for (key, _), data_value in zip(attributes, data_values, strict=True):
+            if data_value is not None and data_value.StatusCode.is_good() and data_value.Value is not None:
+                value = data_value.Value.Value
+                info[key] = NodeClass(value).name if key == "node_class" else str(value)
+
+        await self._read_attributes([info], semaphore)
+        if info.get("node_class") == NodeClass.Object.name:
+            try:
+                info["type_definition"] = str(await root.read_type_definition())
+            except Exception as e:
+                logger.debug("Error reading object attributes: %s", e)
+
+        info["path"] = await self._read_node_path(root)
+        return info
+
+    @staticmethod
+    def _info_from_reference(ref: ua.ReferenceDescription, parent: dict[str, Any], depth: int) -> dict[str, Any]:
+        """Build node info from a Browse reference, which already carries names and node class."""
+        node_id = ref.NodeId
+        browse_name = str(ref.BrowseName)
+        info = {
+            "node_id": node_id.to_string(),
+            "namespace_index": node_id.NamespaceIndex,
+            "identifier": str(node_id.Identifier),
+            "browse_name": browse_name,
+            "display_name": str(ref.DisplayName),
+            "node_class": ref.NodeClass.name,
+            "depth": depth,
+            "parent_id": parent["node_id"],
+            "path": [*parent.get("path", []), browse_name],
+        }
+        if ref.NodeClass == NodeClass.Object:
+            info["type_definition"] = str(ref.TypeDefinition)
+        return info
 
     async def get_node_info(self, node: Node) -> dict[str, Any]:
         """Get detailed information about a specific node.
@@ -103,7 +408,7 @@ class AddressSpaceBrowser:
             try:
                 info["browse_name"] = str(await node.read_browse_name())
                 info["display_name"] = str(await node.read_display_name())
-                info["node_class"] = str(await node.read_node_class())
+                info["node_class"] = (await node.read_node_class()).name
                 info["description"] = str(await node.read_description())
             except Exception as e:
                 logger.debug("Error reading basic attributes: %s", e)
@@ -113,7 +418,7 @@ class AddressSpaceBrowser:
                 try:
                     info["data_type"] = str(await node.read_data_type())
                     info["value"] = await node.read_value()
-                    info["access_level"] = await node.read_access_level()
+                    info["access_level"] = await node.get_access_level()
                 except Exception as e:
                     logger.debug("Error reading variable attributes: %s", e)
 
@@ -146,12 +451,19 @@ class AddressSpaceBrowser:
         except Exception:
             return False
 
-    async def find_nodes_by_browse_name(self, browse_name: str, start_node: str = "i=85") -> list[dict[str, Any]]:
+    async def find_nodes_by_browse_name(
+        self, browse_name: str, start_node: str = "i=85", use_snapshot: bool = True
+    ) -> list[dict[str, Any]]:
         """Find nodes by browse name starting from specified node.
 
+        When a previous crawl from ``start_node`` covered the search depth the
+        search is answered from the snapshot; otherwise the subtree is crawled
+        first.
+
         Args:
             browse_name: Browse name to search for
             start_node: Starting node ID for search
+            use_snapshot: Answer from a previous crawl when possible
 
         Returns:
             List of matching nodes
@@ -159,56 +471,38 @@ class AddressSpaceBrowser:
         matches = []
 
         try:
-            root = self.client.get_node(start_node)
-            await self._search_by_browse_name(root, browse_name, matches, max_depth=5)
+            start_id = self.client.get_node(start_node).nodeid.to_string()
+            if not (use_snapshot and self._crawled_depths.get(start_id, -1) >= SEARCH_DEPTH):
+                async for _ in self.crawl(start_node, max_depth=SEARCH_DEPTH):
+                    pass
+
+            target = browse_name.lower()
+            level, depth = [start_id], 0
+            seen = {start_id}
+            while level and depth <= SEARCH_DEPTH:
+                for node_id in level:
+                    node_info = self.snapshot.get(node_id)
+                    if node_info and target in node_info.get("browse_name", "").lower():
+                        matches.append(node_info)
+                # Nodes linked under several parents are matched once
+                level = list(
+                    dict.fromkeys(
+                        child for node_id in level for child in self._children.get(node_id, {}) if child not in seen
+                    )
+                )
+                seen.update(level)
+                depth += 1
 
         except Exception as e:
             logger.error("Error searching for browse name %s: %s", browse_name, e)
 
         return matches
 
-    async def _search_by_browse_name(
-        self,
-        node: Node,
-        target_name: str,
-        matches: list[dict[str, Any]],
-        current_depth: int = 0,
-        max_depth: int = 5,
-    ):
-        """Recursively search for nodes by browse name.
-
-        Args:
-            node: Current node to search from
-            target_name: Target browse name
-            matches: List to collect matches
-            current_depth: Current search depth
-            max_depth: Maximum search depth
-        """
-        if current_depth >= max_depth:
-            return
-
-        try:
-            # Check current node
-            browse_name = str(await node.read_browse_name())
-            if target_name.lower() in browse_name.lower():
-                node_info = await self.get_node_info(node)
-                matches.append(node_info)
-
-            # Search children
-            children = await node.get_children()
-            for child in children:
-                try:
-                    await self._search_by_browse_name(child, target_name, matches, current_depth + 1, max_depth)
-                except Exception as e:
-                    logger.debug("Error searching child node: %s", e)
-                    continue
-
-        except Exception as e:
-            logger.debug("Error in browse name search: %s", e)
-
     async def get_node_path(self, node_id: str) -> list[str]:
         """Get the browse path from root to specified node.
 
+        Nodes in the crawl snapshot are answered without a server round trip.
+
         Args:
             node_id: Target node ID
 
@@ -217,31 +511,38 @@ class AddressSpaceBrowser:
         """
         try:
             node = self.client.get_node(node_id)
-            path = []
+            cached = self.snapshot.get(node.nodeid.to_string())
+            if cached and "path" in cached:
+                return list(cached["path"])
+            return await self._read_node_path(node)
 
-            # Get path by walking up the hierarchy
-            current = node
-            while current:
-                try:
-                    browse_name = str(await current.read_browse_name())
-                    path.insert(0, browse_name)
+        except Exception as e:
+            logger.error("Error getting node path for %s: %s", node_id, e)
+            return []
 
-                    # Get parent
-                    parents = await current.get_parent()
-                    if parents and str(parents.nodeid) != "i=84":  # Stop at Root
-                        current = parents
-                    else:
-                        break
+    async def _read_node_path(self, node: Node) -> list[str]:
+        """Walk parent references on the server to build a node's browse path."""
+        path = []
 
-                except Exception as e:
-                    logger.debug("Error getting parent: %s", e)
+        # Get path by walking up the hierarchy
+        current = node
+        while current:
+            try:
+                browse_name = str(await current.read_browse_name())
+                path.insert(0, browse_name)
+
+                # Get parent
+                parents = await current.get_parent()
+                if parents and parents.nodeid != ua.NodeId(ua.ObjectIds.RootFolder):  # Stop at Root
+                    current = parents
+                else:
                     break
 
-            return path
+            except Exception as e:
+                logger.debug("Error getting parent: %s", e)
+                break
 
-        except Exception as e:
-            logger.error("Error getting node path for %s: %s", node_id, e)
-            return []
+        return path
 
     async def get_variable_nodes(self, start_node: str = "i=85") -> list[dict[str, Any]]:
         """Get all variable nodes from specified starting point.
@@ -255,46 +556,11 @@ class AddressSpaceBrowser:
         variables = []
 
         try:
-            root = self.client.get_node(start_node)
-            await self._collect_variable_nodes(root, variables, max_depth=10)
+            async for node_info in self.crawl(start_node, max_depth=9):
+                if node_info.get("node_class") == NodeClass.Variable.name:
+                    variables.append(node_info)
 
         except Exception as e:
             logger.error("Error collecting variable nodes: %s", e)
 
         return variables
-
-    async def _collect_variable_nodes(
-        self,
-        node: Node,
-        variables: list[dict[str, Any]],
-        current_depth: int = 0,
-        max_depth: int = 10,
-    ):
-        """Recursively collect all variable nodes.
-
-        Args:
-            node: Current node
-            variables: List to collect variables
-            current_depth: Current depth
-            max_depth: Maximum depth
-        """
-        if current_depth >= max_depth:
-            return
-
-        try:
-            # Check if current node is a variable
-            if await self._is_variable_node(node):
-                node_info = await self.get_node_info(node)
-                variables.append(node_info)
-
-            # Process children
-            children = await node.get_children()
-            for child in children:
-                try:
-                    await self._collect_variable_nodes(child, variables, current_depth + 1, max_depth)
-                except Exception as e:
-                    logger.debug("Error processing child variable: %s", e)
-                    continue
-
-        except Exception as e:
-            logger.debug("Error collecting variables: %s", e)
@@ -333,8 +333,15 @@ async def _browse_impl(node: str, depth: int, filter: str | None, variables_only
         ) as progress:
             task = progress.add_task("Browsing...", total=None)
 
-            # Browse the tree
-            tree_data = await _current_client.browse_tree(node, depth)
+            # Crawl breadth-first, updating progress as nodes stream in
+            browser = _current_client.browser
+            root_id = None
+            discovered = 0
+            async for node_info in browser.crawl(node, depth):
+                root_id = root_id or node_info["node_id"]
+                discovered += 1
+                progress.update(task, description=f"Browsing... {discovered} nodes (depth {node_info['depth']})")
+            tree_data = browser.build_tree(root_id, depth)
 
             progress.update(task, description="✅ Browsing complete!")
 
@@ -7,19 +7,24 @@ and real-time monitoring.
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from typing import Any
 
-from asyncua import Client
+from asyncua import Client, ua
+from asyncua.common.ua_utils import value_to_datavalue
 
 from .browser import AddressSpaceBrowser
 from .connection import ConnectionManager
 from .security import SecurityManager
-from .subscription import SubscriptionManager
+from .subscription import MonitoringProfile, SubscriptionManager
 
 logger = logging.getLogger(__name__)
 
+# Used when the server does not advertise MaxNodesPerRead/MaxNodesPerWrite (0 means unlimited)
+DEFAULT_MAX_NODES_PER_CALL = 1000
+DEFAULT_BATCH_CONCURRENCY = 4
+
 
 class IgnitionOPCUAClient:
     """Enhanced OPC-UA client wrapper for Ignition tools.
@@ -51,12 +56,25 @@ class IgnitionOPCUAClient:
             "description": kwargs.get("description", "Ignition OPC-UA Client"),
             "auto_reconnect": kwargs.get("auto_reconnect", True),
             "keep_alive": kwargs.get("keep_alive", True),
+            # Override the server's operation limits for batch reads/writes
+            "max_nodes_per_read": kwargs.get("max_nodes_per_read"),
+            "max_nodes_per_write": kwargs.get("max_nodes_per_write"),
+            # Maximum Read/Write service calls in flight for one batch operation
+            "batch_concurrency": kwargs.get("batch_concurrency", DEFAULT_BATCH_CONCURRENCY),
+            # Monitored items per CreateMonitoredItems request and extra named monitoring profiles
+            "max_monitored_items_per_call": kwargs.get("max_monitored_items_per_call", DEFAULT_MAX_NODES_PER_CALL),
+            "monitoring_profiles": kwargs.get("monitoring_profiles"),
         }
+        self._operation_limits: dict[str, int] | None = None
 
         # Initialize managers
         self.connection_manager = ConnectionManager(self.client, self.config)
         self.browser = AddressSpaceBrowser(self.client)
-        self.subscription_manager = SubscriptionManager(self.client)
+        self.subscription_manager = SubscriptionManager(
+            self.client,
+            profiles=self.config["monitoring_profiles"],
+            max_monitored_items_per_call=self.config["max_monitored_items_per_call"],
+        )
         self.security_manager = SecurityManager(self.client)
 
         # State tracking
@@ -131,6 +149,7 @@ class IgnitionOPCUAClient:
                 # Disconnect client
                 await self.connection_manager.disconnect()
                 self.connected = False
+                self._operation_limits = None
 
                 logger.info("Disconnected from %s", self.url)
 
@@ -155,11 +174,14 @@ class IgnitionOPCUAClient:
     async def read_values(self, node_ids: str | list[str]) -> Any | list[Any]:
         """Read values from one or more OPC-UA nodes.
 
+        Lists are read with multi-node Read service calls, chunked by the
+        server's MaxNodesPerRead limit and run concurrently.
+
         Args:
             node_ids: Single node ID or list of node IDs
 
         Returns:
-            Single value or list of values
+            Single value or list of values (None for nodes that could not be read)
         """
         if not self.connected:
             raise RuntimeError("Not connected to OPC-UA server")
@@ -173,16 +195,20 @@ class IgnitionOPCUAClient:
             logger.debug("Read %s = %s", node_ids, value)
             return value
         else:
-            # Batch read
-            nodes = [self.client.get_node(nid) for nid in node_ids]
-            values = []
-            for node in nodes:
-                try:
-                    value = await node.read_value()
-                    values.append(value)
-                except Exception as e:
-                    logger.error("Error reading %s: %s", node, e)
-                    values.append(None)
+            # Batch read using multi-node Read service calls
+            node_ids = list(node_ids)
+            values: list[Any] = [None] * len(node_ids)
+            indices, nodes = self._resolve_nodes(node_ids)
+            limits = await self._get_operation_limits()
+
+            data_values = await self._run_batched(self.client.read_attributes, nodes, limits["read"])
+            for index, data_value in zip(indices, data_values, strict=True):
+                if data_value is None:
+                    continue
+                if not data_value.StatusCode.is_good():
+                    logger.error("Error reading %s: %s", node_ids[index], data_value.StatusCode)
+                    continue
+                values[index] = data_value.Value.Value if data_value.Value is not None else None
 
             logger.debug("Batch read %d nodes", len(values))
             return values
@@ -190,6 +216,9 @@ class IgnitionOPCUAClient:
     async def write_values(self, node_values: dict[str, Any]) -> dict[str, bool]:
         """Write values to OPC-UA nodes.
 
+        Nodes are written with multi-node Write service calls, chunked by the
+        server's MaxNodesPerWrite limit and run concurrently.
+
         Args:
             node_values: Dictionary of {node_id: value}
 
@@ -200,25 +229,104 @@ class IgnitionOPCUAClient:
             raise RuntimeError("Not connected to OPC-UA server")
 
         self._update_activity()
-        results = {}
+        results = dict.fromkeys(node_values, False)
+
+        node_ids = list(node_values)
+        indices, nodes = self._resolve_nodes(node_ids)
+        items = [
+            (node.nodeid, value_to_datavalue(node_values[node_ids[i]])) for i, node in zip(indices, nodes, strict=True)
+        ]
+        limits = await self._get_operation_limits()
+
+        async def write_chunk(chunk: list[tuple[ua.NodeId, ua.DataValue]]) -> list[ua.StatusCode]:
+            return await self.client.uaclient.write_attributes(
+                [nodeid for nodeid, _ in chunk], [data_value for _, data_value in chunk], ua.AttributeIds.Value
+            )
+
+        status_codes = await self._run_batched(write_chunk, items, limits["write"])
+        for index, status in zip(indices, status_codes, strict=True):
+            node_id = node_ids[index]
+            if status is not None and status.is_good():
+                results[node_id] = True
+                logger.debug("Wrote %s = %s", node_id, node_values[node_id])
+            elif status is not None:
+                logger.error("Error writing %s: %s", node_id, status)
 
-        for node_id, value in node_values.items():
+        return results
+
+    def _resolve_nodes(self, node_ids: list[str]) -> tuple[list[int], list[Any]]:
+        """Resolve node ID strings, logging and skipping any that cannot be parsed.
+
+        Returns:
+            tuple of (positions in ``node_ids``, nodes) for the valid IDs
+        """
+        indices, nodes = [], []
+        for index, node_id in enumerate(node_ids):
             try:
-                node = self.client.get_node(node_id)
-                await node.write_value(value)
-                results[node_id] = True
-                logger.debug("Wrote %s = %s", node_id, value)
+                nodes.append(self.client.get_node(node_id))
+                indices.append(index)
             except Exception as e:
-                logger.error("Error writing %s: %s", node_id, e)
-                results[node_id] = False
+                logger.error("Invalid node ID %s: %s", node_id, e)
+        return indices, nodes
 
-        return results
+    async def _get_operation_limits(self) -> dict[str, int]:
+        """Return the per-call node limits for Read and Write, read once from the server."""
+        if self._operation_limits is None:
+            limits = {"read": DEFAULT_MAX_NODES_PER_CALL, "write": DEFAULT_MAX_NODES_PER_CALL}
+            try:
+                limit_nodes = [
+                    self.client.get_node(
+                        ua.NodeId(ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerRead)
+                    ),
+                    self.client.get_node(
+                        ua.NodeId(ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerWrite)
+                    ),
+                ]
+                data_values = await self.client.read_attributes(limit_nodes)
+                for key, data_value in zip(("read", "write"), data_values, strict=True):
+                    if data_value.StatusCode.is_good() and data_value.Value is not None and data_value.Value.Value:
+                        limits[key] = int(data_value.Value.Value)
+            except Exception as e:
+                logger.debug("Could not read server operation limits, using defaults: %s", e)
+
+            for key in ("read", "write"):
+                override = self.config[f"max_nodes_per_{key}"]
+                if override:
+                    limits[key] = int(override)
+
+            self._operation_limits = limits
+            logger.debug("OPC-UA operation limits: %s", limits)
+
+        return self._operation_limits
+
+    async def _run_batched(self, call: Callable, items: list[Any], chunk_size: int) -> list[Any]:
+        """Run ``call`` over ``chunk_size`` slices of ``items`` with bounded concurrency.
+
+        A chunk that fails as a whole yields ``None`` for each of its items, so
+        results always line up with ``items``.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.config["batch_concurrency"]))
+
+        async def run_chunk(chunk: list[Any]) -> list[Any]:
+            async with semaphore:
+                try:
+                    return list(await call(chunk))
+                except Exception as e:
+                    self._connection_stats["error_count"] += 1
+                    logger.error("Batch operation on %d nodes failed: %s", len(chunk), e)
+                    return [None] * len(chunk)
+
+        chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+        chunk_results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        return [result for chunk_result in chunk_results for result in chunk_result]
 
     async def subscribe_nodes(
         self,
         node_ids: list[str],
         callback: Callable[[str, Any], None],
         interval: float = 1000.0,
+        profile: MonitoringProfile | str | None = None,
+        item_profiles: Mapping[str, MonitoringProfile | str] | None = None,
     ) -> str:
         """Subscribe to data changes on multiple nodes.
 
@@ -226,6 +334,9 @@ class IgnitionOPCUAClient:
             node_ids: List of node IDs to monitor
             callback: Function called on data change (node_id, new_value)
             interval: Publishing interval in milliseconds
+            profile: Monitoring profile (or profile name) with sampling
+                interval, deadband and queue settings for every node
+            item_profiles: Per-node profiles overriding ``profile``
 
         Returns:
             Subscription ID for management
@@ -233,7 +344,9 @@ class IgnitionOPCUAClient:
         if not self.connected:
             raise RuntimeError("Not connected to OPC-UA server")
 
-        return await self.subscription_manager.create_subscription(node_ids, callback, interval)
+        return await self.subscription_manager.create_subscription(
+            node_ids, callback, interval, profile=profile, item_profiles=item_profiles
+        )
 
     async def unsubscribe(self, subscription_id: str) -> bool:
         """Remove a subscription.
@@ -53,7 +53,7 @@ class ConnectionManager:
 
             # Set timeout
             timeout = kwargs.get("timeout", self.config.get("timeout", 10.0))
-            self.client.secure_channel_timeout = timeout * 1000  # Convert to milliseconds
+            self.client.secure_channel_timeout = int(timeout * 1000)  # Convert to milliseconds
 
             # Attempt connection
             await self.client.connect()
@@ -4,17 +4,99 @@ Handles real-time data subscriptions, monitoring, and event handling
 for OPC-UA clients.
 """
 
+import inspect
+import itertools
 import logging
+import time
 import uuid
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
-from asyncua import Client, Node
+from asyncua import Client, Node, ua
 from asyncua.common.subscription import DataChangeNotif
 
 logger = logging.getLogger(__name__)
 
+# Monitored items sent per CreateMonitoredItems call when adding nodes
+DEFAULT_MONITORED_ITEMS_PER_CALL = 1000
+
+# StatusCode InfoType "DataValue" (0x400) with the Overflow bit (0x80): the
+# server discarded values from the monitored item's queue
+_OVERFLOW_INFO_BITS = 0x480
+
+
+class DeadbandType(Enum):
+    """Deadband applied by the server before reporting a value change."""
+
+    NONE = "none"
+    ABSOLUTE = "absolute"
+    PERCENT = "percent"
+
+
+_UA_DEADBAND_TYPES = {
+    DeadbandType.NONE: ua.DeadbandType.None_,
+    DeadbandType.ABSOLUTE: ua.DeadbandType.Absolute,
+    DeadbandType.PERCENT: ua.DeadbandType.Percent,
+}
+
+
+@dataclass(frozen=True)
+class MonitoringProfile:
+    """Monitored item parameters shared by a class of tags.
+
+    Items are grouped into one server subscription per sampling class, i.e.
+    per publishing interval, so fast and slow tags do not share a publish cycle.
+
+    Attributes:
+        sampling_interval: Server-side sampling interval in milliseconds
+        publishing_interval: Publishing interval of the hosting subscription in
+            milliseconds; defaults to the sampling interval
+        deadband_type: No deadband, absolute (engineering units) or percent of
+            the item's EURange
+        deadband_value: Width of the deadband
+        queue_size: Server-side queue length per monitored item
+        discard_oldest: Drop the oldest queued value when the queue is full
+            instead of the newest
+    """
+
+    sampling_interval: float = 1000.0
+    publishing_interval: float | None = None
+    deadband_type: DeadbandType = DeadbandType.NONE
+    deadband_value: float = 0.0
+    queue_size: int = 1
+    discard_oldest: bool = True
+
+    @property
+    def sampling_class(self) -> float:
+        """Publishing interval of the subscription this profile's items join."""
+        return self.publishing_interval if self.publishing_interval is not None else self.sampling_interval
+
+    def data_change_filter(self) -> ua.DataChangeFilter | None:
+        """Build the server-side deadband filter, or None without a deadband."""
+        if self.deadband_type is DeadbandType.NONE:
+            return None
+        data_filter = ua.DataChangeFilter()
+        data_filter.Trigger = ua.DataChangeTrigger.StatusValue
+        data_filter.DeadbandType = _UA_DEADBAND_TYPES[self.deadband_type]
+        data_filter.DeadbandValue = self.deadband_value
+        return data_filter
+
+
+DEFAULT_PROFILES: dict[str, MonitoringProfile] = {
+    # Discrete states and interlocks: every transition matters, so queue them
+    "discrete": MonitoringProfile(sampling_interval=250.0, queue_size=10),
+    # Control loop signals that feed fast displays
+    "fast": MonitoringProfile(sampling_interval=100.0, deadband_type=DeadbandType.PERCENT, deadband_value=0.1),
+    # Process measurements: suppress noise below 0.5% of span
+    "analog": MonitoringProfile(sampling_interval=1000.0, deadband_type=DeadbandType.PERCENT, deadband_value=0.5),
+    # Slow-moving values such as tank levels and ambient conditions
+    "slow": MonitoringProfile(sampling_interval=10000.0, deadband_type=DeadbandType.PERCENT, deadband_value=1.0),
+}
+
 
 class DataChangeHandler:
     """Handles data change notifications for subscriptions."""
@@ -27,6 +109,26 @@ class DataChangeHandler:
         """
         self.callback = callback
         self.node_map = {}  # Maps handle to node_id
+        self.notifications = 0
+        self.overflows = 0
+        self.started = time.monotonic()
+
+    def _record(self, data: DataChangeNotif) -> None:
+        """Count a notification and whether the server overflowed the item's queue."""
+        self.notifications += 1
+        status = getattr(getattr(data.monitored_item, "Value", None), "StatusCode", None)
+        if status is not None and status.value & _OVERFLOW_INFO_BITS == _OVERFLOW_INFO_BITS:
+            self.overflows += 1
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Notification count, average rate per second and queue overflows."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "notifications": self.notifications,
+            "notification_rate": self.notifications / elapsed,
+            "overflows": self.overflows,
+        }
 
     def datachange_notification(self, node: Node, val: Any, data: DataChangeNotif) -> None:
         """Handle data change notification.
@@ -37,6 +139,7 @@ class DataChangeHandler:
             data: Change notification data
         """
         try:
+            self._record(data)
             node_id = str(node.nodeid)
             logger.debug("Data change: %s = %s", node_id, val)
 
@@ -48,66 +151,208 @@ class DataChangeHandler:
             logger.error("Error in data change handler: %s", e)
 
 
+class AsyncDataChangeHandler(DataChangeHandler):
+    """Data change handler that awaits a coroutine callback.
+
+    asyncua awaits coroutine handler methods, so a callback that waits (for
+    example on a full queue) holds back further notifications instead of
+    piling up tasks.
+    """
+
+    async def datachange_notification(self, node: Node, val: Any, data: DataChangeNotif) -> None:
+        """Handle data change notification.
+
+        Args:
+            node: The node that changed
+            val: New value
+            data: Change notification data
+        """
+        try:
+            self._record(data)
+            node_id = str(node.nodeid)
+            logger.debug("Data change: %s = %s", node_id, val)
+
+            if self.callback:
+                await self.callback(node_id, val)
+
+        except Exception as e:
+            logger.error("Error in data change handler: %s", e)
+
+
 class SubscriptionManager:
-    """Manages OPC-UA subscriptions for real-time data monitoring."""
+    """Manages OPC-UA subscriptions for real-time data monitoring.
 
-    def __init__(self, client: Client):
+    A subscription returned by :meth:`create_subscription` may span several
+    server subscriptions, one per sampling class of its monitored items.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        profiles: Mapping[str, MonitoringProfile] | None = None,
+        max_monitored_items_per_call: int = DEFAULT_MONITORED_ITEMS_PER_CALL,
+    ):
         """Initialize subscription manager.
 
         Args:
             client: AsyncUA client instance
+            profiles: Named monitoring profiles added to (or overriding) the defaults
+            max_monitored_items_per_call: Monitored items created per
+                CreateMonitoredItems request
         """
         self.client = client
+        self.profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.max_monitored_items_per_call = max(1, max_monitored_items_per_call)
         self.subscriptions = {}  # subscription_id -> subscription info
-        self.active_subscriptions = {}  # subscription_id -> Subscription object
+        self.active_subscriptions = {}  # subscription_id -> {sampling class: Subscription}
+        # Client handles for monitored items; unique across every subscription this manager creates
+        self._client_handles = itertools.count(1)
+
+    def register_profile(self, name: str, profile: MonitoringProfile) -> None:
+        """Register a named monitoring profile.
+
+        Args:
+            name: Profile name usable wherever a profile is accepted
+            profile: Monitored item parameters
+        """
+        self.profiles[name] = profile
+
+    def _resolve_profile(self, profile: MonitoringProfile | str | None, interval: float) -> MonitoringProfile:
+        """Look up a named profile; without one, sample at the publishing interval."""
+        if profile is None:
+            return MonitoringProfile(sampling_interval=interval)
+        if isinstance(profile, str):
+            if profile not in self.profiles:
+                raise ValueError(f"Unknown monitoring profile: {profile}")
+            return self.profiles[profile]
+        return profile
 
     async def create_subscription(
         self,
         node_ids: list[str],
         callback: Callable[[str, Any], None],
         interval: float = 1000.0,
+        profile: MonitoringProfile | str | None = None,
+        item_profiles: Mapping[str, MonitoringProfile | str] | None = None,
     ) -> str:
         """Create a new subscription for monitoring nodes.
 
         Args:
             node_ids: List of node IDs to monitor
-            callback: Function called on data change (node_id, new_value)
-            interval: Publishing interval in milliseconds
+            callback: Function called on data change (node_id, new_value); a
+                coroutine function is awaited for each notification
+            interval: Publishing interval in milliseconds, used when no profile
+                applies to a node
+            profile: Profile (or profile name) for every node
+            item_profiles: Per-node profiles overriding ``profile``
 
         Returns:
             Subscription ID for management
         """
         subscription_id = str(uuid.uuid4())
+        self.subscriptions[subscription_id] = {
+            "id": subscription_id,
+            "node_ids": [],
+            "interval": interval,
+            "created_at": datetime.now(),
+            "callback": callback,
+            "monitored_items": 0,
+            "failed_items": 0,
+            "groups": {},
+            "handlers": {},
+        }
+        self.active_subscriptions[subscription_id] = {}
 
         try:
-            # Create OPC-UA subscription
-            handler = DataChangeHandler(callback)
-            subscription = await self.client.create_subscription(interval, handler)
-
-            # Subscribe to nodes
-            nodes = [self.client.get_node(node_id) for node_id in node_ids]
-            monitored_items = await subscription.subscribe_data_change(nodes)
-
-            # Store subscription info
-            self.subscriptions[subscription_id] = {
-                "id": subscription_id,
-                "node_ids": node_ids,
-                "interval": interval,
-                "created_at": datetime.now(),
-                "callback": callback,
-                "monitored_items": len(monitored_items),
-                "handler": handler,
-            }
-
-            self.active_subscriptions[subscription_id] = subscription
-
-            logger.info("Created subscription %s for %d nodes", subscription_id, len(node_ids))
-            return subscription_id
-
+            await self._add_monitored_items(subscription_id, node_ids, profile, item_profiles)
         except Exception as e:
             logger.error("Error creating subscription: %s", e)
+            await self.remove_subscription(subscription_id)
             raise
 
+        logger.info(
+            "Created subscription %s for %d nodes in %d sampling classes",
+            subscription_id,
+            len(node_ids),
+            len(self.active_subscriptions[subscription_id]),
+        )
+        return subscription_id
+
+    async def _add_monitored_items(
+        self,
+        subscription_id: str,
+        node_ids: list[str],
+        profile: MonitoringProfile | str | None,
+        item_profiles: Mapping[str, MonitoringProfile | str] | None,
+    ) -> None:
+        """Group nodes by sampling class and create their monitored items in batches."""
+        info = self.subscriptions[subscription_id]
+        servers = self.active_subscriptions[subscription_id]
+
+        groups: dict[float, list[tuple[str, MonitoringProfile]]] = defaultdict(list)
+        for node_id in node_ids:
+            item_profile = (item_profiles or {}).get(node_id, profile)
+            resolved = self._resolve_profile(item_profile, info["interval"])
+            groups[resolved.sampling_class].append((node_id, resolved))
+
+        for sampling_class, items in groups.items():
+            subscription = servers.get(sampling_class)
+            if subscription is None:
+                callback = info["callback"]
+                if inspect.iscoroutinefunction(callback):
+                    handler = AsyncDataChangeHandler(callback)
+                else:
+                    handler = DataChangeHandler(callback)
+                subscription = await self.client.create_subscription(sampling_class, handler)
+                servers[sampling_class] = subscription
+                info["handlers"][sampling_class] = handler
+                info["groups"][sampling_class] = {
+                    "publishing_interval": sampling_class,
+                    "monitored_items": 0,
+                    "failed_items": 0,
+                }
+
+            requests = [
+                self._monitored_item_request(self.client.get_node(node_id), item_profile)
+                for node_id, item_profile in items
+            ]
+            batch_size = self.max_monitored_items_per_call
+            for start in range(0, len(requests), batch_size):
+                results = await subscription.create_monitored_items(requests[start : start + batch_size])
+                created = 0
+                for (node_id, _), result in zip(items[start : start + batch_size], results, strict=True):
+                    if isinstance(result, ua.StatusCode):
+                        logger.warning("Could not monitor %s: %s", node_id, result)
+                        continue
+                    info["node_ids"].append(node_id)
+                    created += 1
+                failed = len(results) - created
+                info["groups"][sampling_class]["monitored_items"] += created
+                info["groups"][sampling_class]["failed_items"] += failed
+                info["monitored_items"] += created
+                info["failed_items"] += failed
+
+    def _monitored_item_request(self, node: Node, profile: MonitoringProfile) -> ua.MonitoredItemCreateRequest:
+        """Build a Value monitored item request carrying the profile's parameters."""
+        item = ua.ReadValueId()
+        item.NodeId = node.nodeid
+        item.AttributeId = ua.AttributeIds.Value
+
+        parameters = ua.MonitoringParameters()
+        parameters.ClientHandle = next(self._client_handles)
+        parameters.SamplingInterval = profile.sampling_interval
+        parameters.QueueSize = profile.queue_size
+        parameters.DiscardOldest = profile.discard_oldest
+        data_change_filter = profile.data_change_filter()
+        if data_change_filter is not None:
+            parameters.Filter = data_change_filter
+
+        request = ua.MonitoredItemCreateRequest()
+        request.ItemToMonitor = item
+        request.MonitoringMode = ua.MonitoringMode.Reporting
+        request.RequestedParameters = parameters
+        return request
+
     async def remove_subscription(self, subscription_id: str) -> bool:
         """Remove a subscription.
 
@@ -119,8 +364,8 @@ class SubscriptionManager:
         """
         try:
             if subscription_id in self.active_subscriptions:
-                subscription = self.active_subscriptions[subscription_id]
-                await subscription.delete()
+                for subscription in self.active_subscriptions[subscription_id].values():
+                    await subscription.delete()
 
                 del self.active_subscriptions[subscription_id]
                 del self.subscriptions[subscription_id]
@@ -135,6 +380,19 @@ class SubscriptionManager:
             logger.error("Error removing subscription %s: %s", subscription_id, e)
             return False
 
+    def _subscription_stats(self, subscription_id: str) -> dict[str, Any]:
+        """Notification rates and queue overflows, in total and per sampling class."""
+        info = self.subscriptions[subscription_id]
+        groups = []
+        for sampling_class, handler in info.get("handlers", {}).items():
+            groups.append({**info["groups"].get(sampling_class, {}), **handler.stats})
+        return {
+            "notifications": sum(group["notifications"] for group in groups),
+            "notification_rate": sum(group["notification_rate"] for group in groups),
+            "overflows": sum(group["overflows"] for group in groups),
+            "groups": groups,
+        }
+
     async def get_subscription_info(self, subscription_id: str) -> dict[str, Any] | None:
         """Get information about a specific subscription.
 
@@ -149,15 +407,18 @@ class SubscriptionManager:
 
             # Add runtime information
             if subscription_id in self.active_subscriptions:
-                subscription = self.active_subscriptions[subscription_id]
+                servers = self.active_subscriptions[subscription_id]
                 info["active"] = True
-                info["subscription_id_internal"] = subscription.subscription_id
+                info["subscription_id_internal"] = [subscription.subscription_id for subscription in servers.values()]
             else:
                 info["active"] = False
 
             # Remove callback from serializable info
             info.pop("callback", None)
             info.pop("handler", None)
+            info.pop("handlers", None)
+            if "groups" in info:
+                info.update(self._subscription_stats(subscription_id))
 
             return info
 
@@ -181,6 +442,9 @@ class SubscriptionManager:
     async def modify_subscription_interval(self, subscription_id: str, new_interval: float) -> bool:
         """Modify the publishing interval of a subscription.
 
+        Every server subscription backing the subscription is moved to the new
+        interval; items keep their sampling intervals and deadbands.
+
         Args:
             subscription_id: Subscription ID
             new_interval: New interval in milliseconds
@@ -190,11 +454,13 @@ class SubscriptionManager:
         """
         try:
             if subscription_id in self.active_subscriptions:
-                subscription = self.active_subscriptions[subscription_id]
-                await subscription.modify_subscription(new_interval)
+                for subscription in self.active_subscriptions[subscription_id].values():
+                    await subscription.modify_subscription(new_interval)
 
                 # Update stored info
                 self.subscriptions[subscription_id]["interval"] = new_interval
+                for group in self.subscriptions[subscription_id].get("groups", {}).values():
+                    group["publishing_interval"] = new_interval
 
                 logger.info(
                     "Modified subscription %s interval to %f ms",
@@ -210,28 +476,31 @@ class SubscriptionManager:
             logger.error("Error modifying subscription %s: %s", subscription_id, e)
             return False
 
-    async def add_nodes_to_subscription(self, subscription_id: str, node_ids: list[str]) -> bool:
+    async def add_nodes_to_subscription(
+        self,
+        subscription_id: str,
+        node_ids: list[str],
+        profile: MonitoringProfile | str | None = None,
+        item_profiles: Mapping[str, MonitoringProfile | str] | None = None,
+    ) -> bool:
         """Add additional nodes to an existing subscription.
 
+        Nodes join the server subscription of their sampling class, which is
+        created if the subscription has none yet. Monitored items are created
+        in batches of ``max_monitored_items_per_call``.
+
         Args:
             subscription_id: Subscription ID
             node_ids: Additional node IDs to monitor
+            profile: Profile (or profile name) for every added node
+            item_profiles: Per-node profiles overriding ``profile``
 
         Returns:
             True if successfully added
         """
         try:
-            if subscription_id in self.active_subscriptions:
-                subscription = self.active_subscriptions[subscription_id]
-
-                # Subscribe to additional nodes
-                nodes = [self.client.get_node(node_id) for node_id in node_ids]
-                monitored_items = await subscription.subscribe_data_change(nodes)
-
-                # Update stored info
-                sub_info = self.subscriptions[subscription_id]
-                sub_info["node_ids"].extend(node_ids)
-                sub_info["monitored_items"] += len(monitored_items)
+            if subscription_id in self.active_subscriptions and "groups" in self.subscriptions[subscription_id]:
+                await self._add_monitored_items(subscription_id, node_ids, profile, item_profiles)
 
                 logger.info("Added %d nodes to subscription %s", len(node_ids), subscription_id)
                 return True
@@ -293,7 +562,7 @@ class SubscriptionManager:
                 "handler": handler,
             }
 
-            self.active_subscriptions[subscription_id] = subscription
+            self.active_subscriptions[subscription_id] = {interval: subscription}
 
             logger.info("Created event subscription %s", subscription_id)
             return subscription_id
@@ -310,12 +579,21 @@ class SubscriptionManager:
         """
         active_count = len(self.active_subscriptions)
         total_nodes = sum(sub_info.get("monitored_items", 0) for sub_info in self.subscriptions.values())
+        stats = {
+            subscription_id: self._subscription_stats(subscription_id)
+            for subscription_id, sub_info in self.subscriptions.items()
+            if "groups" in sub_info
+        }
 
         return {
             "active_subscriptions": active_count,
             "total_subscriptions": len(self.subscriptions),
             "total_monitored_nodes": total_nodes,
+            "server_subscriptions": sum(len(servers) for servers in self.active_subscriptions.values()),
             "subscription_ids": list(self.subscriptions.keys()),
+            "notification_rate": sum(sub_stats["notification_rate"] for sub_stats in stats.values()),
+            "overflows": sum(sub_stats["overflows"] for sub_stats in stats.values()),
+            "subscriptions": stats,
         }
 
     async def cleanup(self) -> None:
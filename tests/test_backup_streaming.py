@@ -0,0 +1,173 @@
+"""Tests for the streamed JSON Lines backup format of Neo4jBackupManager."""
+
+import gzip
+import json
+from typing import Any, Self
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ignition.graph.backup_manager import IMPORT_LABEL, Neo4jBackupManager
+
+
+class FakeGraphClient:
+    """Minimal in-memory stand-in recording the queries a backup/restore issues."""
+
+    def __init__(self, nodes: list[dict[str, Any]], rels: list[dict[str, Any]]):
+        self.nodes = nodes
+        self.rels = rels
+        self.batches: list[tuple[str, list[dict[str, Any]]]] = []
+        self.written_ids: set[str] = set()
+        self.fail_on: str | None = None
+        self.is_connected = MagicMock(return_value=True)
+
+    def connect(self) -> bool:
+        return True
+
+    def execute_query(self, query: str, parameters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        params = parameters or {}
+        if "RETURN elementId(n) AS node_id" in query:
+            return self._page(self.nodes, "node_id", params)
+        if "RETURN elementId(r) AS rel_id" in query:
+            return self._page(self.rels, "rel_id", params)
+        if "count(n) as count" in query:
+            return [{"count": len(self.nodes)}]
+        if "count(r) as count" in query:
+            return [{"count": len(self.rels)}]
+        if "AS removed" in query or "AS deleted" in query:
+            return [{"removed": 0, "deleted": 0}]
+        return []
+
+    def execute_write_query(self, query: str, parameters: dict[str, Any] | None = None) -> None:
+        return None
+
+    def execute_write_batches(
+        self,
+        query: str,
+        rows: list[dict[str, Any]],
+        batch_size: int | None = None,
+        raise_on_error: bool = False,
+        count_key: str | None = None,
+    ) -> int:
+        self.batches.append((query, rows))
+        if self.fail_on and self.fail_on in query:
+            if raise_on_error:
+                raise RuntimeError("transaction failed")
+            return 0
+        if count_key is None:
+            self.written_ids.update(row["id"] for row in rows)
+            return len(rows)
+        return sum(row["start_id"] in self.written_ids and row["end_id"] in self.written_ids for row in rows)
+
+    @staticmethod
+    def _page(items: list[dict[str, Any]], key: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        cursor = params["cursor"]
+        remaining = [item for item in sorted(items, key=lambda i: i[key]) if cursor is None or item[key] > cursor]
+        return remaining[: params["limit"]]
+
+
+@pytest.fixture
+def graph():
+    nodes = [{"node_id": f"n{i:03d}", "labels": ["Function"], "props": {"name": f"system.fn{i}"}} for i in range(7)]
+    nodes.append({"node_id": "n999", "labels": ["UsageEvent"], "props": {"id": "evt"}})
+    rels = [
+        {"rel_id": f"r{i:03d}", "rel_type": "USES", "props": {}, "start_id": f"n{i:03d}", "end_id": "n999"}
+        for i in range(7)
+    ]
+    return FakeGraphClient(nodes, rels)
+
+
+@pytest.fixture
+def manager(graph, temp_dir):
+    mgr = Neo4jBackupManager(graph)
+    mgr.backup_dir = temp_dir
+    mgr.page_size = 3
+    mgr.batch_size = 4
+    return mgr
+
+
+class TestStreamingBackup:
+    """Test cases for paged extraction and batched restore."""
+
+    @pytest.mark.unit
+    def test_backup_is_paged_jsonl(self: Self, manager, graph):
+        success, path = manager.create_full_backup("test")
+        assert success
+        assert path.endswith(".jsonl.gz")
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+
+        assert lines[0]["kind"] == "metadata"
+        kinds = [line["kind"] for line in lines[1:]]
+        assert kinds == ["node"] * 8 + ["relationship"] * 7
+        assert manager.list_backups()[0]["node_count"] == 8
+
+    @pytest.mark.unit
+    def test_restore_batches_by_label_and_type(self: Self, manager, graph):
+        _, path = manager.create_full_backup("test")
+        graph.batches.clear()
+
+        success, _ = manager.restore_from_backup(path.rsplit("/", 1)[-1])
+        assert success
+
+        node_batches = [rows for query, rows in graph.batches if "CREATE (n:" in query]
+        rel_batches = [rows for query, rows in graph.batches if "[r:`USES`]" in query]
+        assert sorted(len(rows) for rows in node_batches) == [1, 3, 4]
+        assert [len(rows) for rows in rel_batches] == [4, 3]
+        assert all(IMPORT_LABEL in query for query, _ in graph.batches)
+
+    @pytest.mark.unit
+    def test_selective_restore_skips_preserved_labels(self: Self, manager, graph):
+        _, path = manager.create_full_backup("test")
+        graph.batches.clear()
+
+        success, _ = manager.selective_restore_from_backup(path.rsplit("/", 1)[-1], preserve_labels=["UsageEvent"])
+        assert success
+        restored = [row for query, rows in graph.batches if "MERGE (n:" in query for row in rows]
+        assert len(restored) == 7
+        assert all(row["props"]["name"].startswith("system.fn") for row in restored)
+
+    @pytest.mark.unit
+    def test_legacy_json_backup_is_readable(self: Self, manager, temp_dir):
+        legacy = {
+            "metadata": {"timestamp": "20240101_000000", "reason": "legacy"},
+            "data": {
+                "nodes": [{"_id": "a", "_labels": ["Function"], "name": "x"}],
+                "relationships": [{"_id": "r", "_type": "USES", "_start_id": "a", "_end_id": "a"}],
+                "statistics": {"node_count": 1},
+            },
+        }
+        path = temp_dir / "ign_scripts_db_backup_20240101_000000.json"
+        path.write_text(json.dumps(legacy))
+
+        records = list(manager._iter_backup_records(path))
+        assert records[0] == {"kind": "node", "id": "a", "labels": ["Function"], "properties": {"name": "x"}}
+        assert records[1]["type"] == "USES"
+        assert manager._get_last_backup_statistics() == {"node_count": 1}
+
+    @pytest.mark.unit
+    def test_failed_batches_fail_the_restore(self: Self, manager, graph):
+        _, path = manager.create_full_backup("test")
+        backup_file = path.rsplit("/", 1)[-1]
+
+        graph.fail_on = "[r:`USES`]"
+        assert manager.restore_from_backup(backup_file) == (False, "Failed to restore database data")
+        graph.fail_on = "MERGE (n:`Function`"
+        success, _ = manager.selective_restore_from_backup(backup_file)
+        assert not success
+
+    @pytest.mark.unit
+    def test_restore_counts_matched_relationships_and_keeps_unlabelled_nodes(self: Self, manager, graph):
+        records = [
+            {"kind": "node", "id": "a", "labels": ["Function"], "properties": {"name": "system.a"}},
+            {"kind": "node", "id": "b", "labels": [], "properties": {"name": "orphan"}},
+            {"kind": "relationship", "type": "USES", "start_id": "a", "end_id": "b"},
+            {"kind": "relationship", "type": "USES", "start_id": "a", "end_id": "missing"},
+        ]
+
+        assert manager._restore_records(records, preserve_labels=[], merge=True) == (2, 1, 0)
+        node_queries = [query for query, _ in graph.batches if "row.props" in query and "[r:" not in query]
+        assert any("MERGE (n:`Function` {name: row.props.name})" in query for query in node_queries)
+        assert any("CREATE (n)" in query for query in node_queries)
+        assert not any("Node" in query for query in node_queries)
@@ -0,0 +1,69 @@
+"""Tests for batched embedding generation in CodeEmbeddingGenerator."""
+
+from typing import ClassVar, Self
+
+import numpy as np
+import pytest
+
+from src.ignition.code_intelligence import embeddings
+from src.ignition.code_intelligence.analyzer import CodeAnalyzer
+
+
+class FakeSentenceTransformer:
+    """Deterministic stand-in for SentenceTransformer that records encode calls."""
+
+    calls: ClassVar[list[list[str]]] = []
+
+    def __init__(self: Self, model_name: str) -> None:
+        self.model_name = model_name
+
+    def get_sentence_embedding_dimension(self: Self) -> int:
+        return 8
+
+    def encode(self: Self, texts, batch_size: int = 32, convert_to_numpy: bool = True, show_progress_bar=None):
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        FakeSentenceTransformer.calls.append(texts)
+        return np.stack([np.full(8, len(text), dtype=np.float32) for text in texts])
+
+
+@pytest.fixture
+def generator(monkeypatch, temp_dir):
+    FakeSentenceTransformer.calls = []
+    monkeypatch.setattr(embeddings, "EMBEDDINGS_AVAILABLE", True)
+    monkeypatch.setattr(embeddings, "SentenceTransformer", FakeSentenceTransformer, raising=False)
+    return embeddings.CodeEmbeddingGenerator("fake-model", cache_dir=str(temp_dir / "cache"))
+
+
+class TestBatchEmbeddings:
+    """Test cases for generate_embeddings_batch and embed_analyses."""
+
+    @pytest.mark.unit
+    def test_batch_dedupes_and_preserves_order(self: Self, generator):
+        results = generator.generate_embeddings_batch(["a", "bbb", "a", "cc"])
+
+        assert FakeSentenceTransformer.calls == [["a", "bbb", "cc"]]
+        assert [r.text for r in results] == ["a", "bbb", "a", "cc"]
+        assert [r.embedding[0] for r in results] == [1.0, 3.0, 1.0, 2.0]
+
+    @pytest.mark.unit
+    def test_batch_encodes_only_cache_misses(self: Self, generator):
+        generator.generate_embeddings_batch(["a", "bb"])
+        results = generator.generate_embeddings_batch(["bb", "dddd", "a"])
+
+        assert FakeSentenceTransformer.calls[-1] == ["dddd"]
+        assert [r.embedding[0] for r in results] == [2.0, 4.0, 1.0]
+        assert generator.get_cache_stats()["hits"] == 2
+
+    @pytest.mark.unit
+    def test_embed_analyses_sets_node_embeddings(self: Self, generator, temp_dir):
+        source = 'class A:\n    """Doc."""\n\n    def run(self):\n        return 1\n\n\ndef helper():\n    pass\n'
+        path = temp_dir / "mod.py"
+        path.write_text(source)
+        analysis = CodeAnalyzer().analyze_file(path)
+
+        embedded = generator.embed_analyses([analysis], [source])
+
+        nodes = [analysis["file"], *analysis["classes"], *analysis["methods"]]
+        assert embedded == len(nodes) == 4
+        assert all(node.embedding is not None for node in nodes)
+        assert len(FakeSentenceTransformer.calls) == 1
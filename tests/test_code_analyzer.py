@@ -0,0 +1,42 @@
+"""Tests for serial and process-pool analysis in CodeAnalyzer."""
+
+from typing import Self
+
+import pytest
+
+from src.ignition.code_intelligence.analyzer import CodeAnalyzer
+
+
+class TestParallelAnalysis:
+    """Test cases for the ``workers`` option of CodeAnalyzer."""
+
+    @pytest.mark.unit
+    def test_parallel_results_match_serial_order(self: Self, temp_dir):
+        for i in range(12):
+            body = "".join(f"        if x == {j}:\n            return {j}\n" for j in range(i))
+            (temp_dir / f"mod_{i:02d}.py").write_text(
+                f"import os\n\n\nclass C{i}:\n    def run(self, x):\n{body}        return x\n"
+            )
+        (temp_dir / "broken.py").write_text("def broken(:\n")
+
+        analyzer = CodeAnalyzer()
+        serial = analyzer.analyze_directory(temp_dir)
+        parallel = analyzer.analyze_directory(temp_dir, workers=3)
+
+        assert len(serial) == 12
+        assert [r["file"].path for r in parallel] == [r["file"].path for r in serial]
+        assert [r["file"].complexity for r in parallel] == [r["file"].complexity for r in serial]
+        assert [r["classes"][0].name for r in parallel] == [f"C{i}" for i in range(12)]
+
+    @pytest.mark.unit
+    def test_iter_analyze_files_streams(self: Self, temp_dir):
+        paths = []
+        for i in range(4):
+            path = temp_dir / f"m{i}.py"
+            path.write_text(f"def f{i}():\n    pass\n")
+            paths.append(path)
+
+        stream = CodeAnalyzer().iter_analyze_files(paths, workers=2)
+        first = next(stream)
+        assert first["methods"][0].name == "f0"
+        assert [r["methods"][0].name for r in stream] == ["f1", "f2", "f3"]
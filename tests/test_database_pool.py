@@ -0,0 +1,231 @@
+"""Tests for pooled connections in the DatabaseConnectionManager."""
+
+from typing import Self
+
+import pytest
+
+from src.ignition.data_integration.connection_pool import ConnectionPool, PooledConnection, StatementCache
+from src.ignition.data_integration.database_connections import (
+    DatabaseConfig,
+    DatabaseConnectionManager,
+    DatabaseType,
+    _to_positional,
+)
+
+
+class FakeConnection:
+    """Minimal connection recording whether it was closed."""
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class RecordingCursor:
+    """psycopg-style cursor recording the statements it executes."""
+
+    description = None
+    rowcount = 0
+
+    def __init__(self, executed: list[tuple[str, object]], reject: str | None = None) -> None:
+        self.executed = executed
+        self.reject = reject
+
+    def __enter__(self) -> "RecordingCursor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def execute(self, sql: str, params: object = None) -> None:
+        self.executed.append((sql, params))
+        if self.reject is not None and self.reject in sql:
+            raise RuntimeError(f"syntax error at or near {self.reject!r}")
+
+
+class RecordingConnection:
+    """PostgreSQL connection double whose cursors share one statement log."""
+
+    autocommit = False
+
+    def __init__(self, reject: str | None = None) -> None:
+        self.executed: list[tuple[str, object]] = []
+        self.reject = reject
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self.executed, self.reject)
+
+
+def _manager(tmp_path, **overrides) -> DatabaseConnectionManager:
+    manager = DatabaseConnectionManager()
+    config = DatabaseConfig(
+        db_type=DatabaseType.SQLITE,
+        host=str(tmp_path / "plant.db"),
+        port=0,
+        database="plant",
+        username="",
+        password="",
+        **{"pool_size": 2, **overrides},
+    )
+    manager.add_config("plant", config)
+    return manager
+
+
+class TestConnectionPool:
+    """Test cases for pool sizing, idle retirement and health checks."""
+
+    @pytest.mark.unit
+    def test_idle_connections_retire_down_to_min_size(self: Self):
+        opened: list[FakeConnection] = []
+
+        def factory() -> FakeConnection:
+            opened.append(FakeConnection(len(opened)))
+            return opened[-1]
+
+        pool = ConnectionPool("fake", factory, min_size=1, max_size=3, idle_timeout=0.0)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        assert pool.stats["size"] == 1
+        assert sum(connection.closed for connection in opened) == 1
+        assert pool.stats["retired"] == 1
+
+    @pytest.mark.unit
+    def test_unhealthy_connection_is_replaced_on_checkout(self: Self):
+        opened: list[FakeConnection] = []
+
+        def factory() -> FakeConnection:
+            opened.append(FakeConnection(len(opened)))
+            return opened[-1]
+
+        pool = ConnectionPool(
+            "fake",
+            factory,
+            max_size=1,
+            health_check=lambda connection: connection.number > 0,
+            health_check_interval=0.0,
+        )
+        pool.fill()
+
+        pooled = pool.acquire()
+
+        assert pooled.connection.number == 1
+        assert opened[0].closed
+        assert pool.stats["health_check_failures"] == 1
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+    @pytest.mark.unit
+    def test_statement_cache_evicts_least_recently_used(self: Self):
+        released: list[str] = []
+        cache = StatementCache(2, lambda query: query.upper(), released.append)
+
+        cache.get("select a")
+        cache.get("select b")
+        cache.get("select a")
+        cache.get("select c")
+
+        assert released == ["SELECT B"]
+        assert cache.stats == {"size": 2, "max_size": 2, "hits": 1, "misses": 3, "evictions": 1}
+
+
+class TestDatabaseConnectionManagerPooling:
+    """Test cases for checkouts, streaming and metrics on SQLite."""
+
+    @pytest.mark.unit
+    def test_checkouts_reuse_connections_with_unique_ids(self: Self, tmp_path):
+        manager = _manager(tmp_path)
+
+        with manager.get_connection("plant") as first_id:
+            manager.execute_query(first_id, "CREATE TABLE tags (name TEXT, value REAL)")
+            manager.execute_query(first_id, "INSERT INTO tags VALUES (:name, :value)", {"name": "T1", "value": 1.5})
+            second = manager.connect("plant")
+            exhausted = manager.connect("plant", timeout=0.01)
+            manager.disconnect(second.connection_id)
+
+        with manager.get_connection("plant") as third_id:
+            rows = manager.execute_query(third_id, "SELECT name, value FROM tags")
+            info = manager.get_connection_info(third_id)
+
+        assert len({first_id, second.connection_id, third_id}) == 3
+        assert not exhausted.success
+        assert "Timed out" in exhausted.error_message
+        assert rows == [{"name": "T1", "value": 1.5}]
+        assert info["pool"]["created"] == 2
+        assert info["pool"]["timeouts"] == 1
+        assert {connection["state"] for connection in manager.list_connections()} == {"idle"}
+
+        manager.disconnect_all()
+        assert manager.pools == {}
+
+    @pytest.mark.unit
+    def test_iter_query_streams_batches_and_records_metrics(self: Self, tmp_path):
+        manager = _manager(tmp_path, statement_cache_size=8)
+
+        with manager.get_connection("plant") as connection_id:
+            manager.execute_query(connection_id, "CREATE TABLE samples (id INTEGER)")
+            for i in range(25):
+                manager.execute_query(connection_id, "INSERT INTO samples VALUES (:id)", {"id": i})
+            batches = list(manager.iter_query(connection_id, "SELECT id FROM samples ORDER BY id", batch_size=10))
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert batches[2][-1] == {"id": 24}
+
+        (connection,) = manager.list_connections()
+        assert connection["queries"] == 27
+        assert connection["statement_cache"]["hits"] == 24
+        assert connection["pool"]["query_ms"]["samples"] == 27
+        assert connection["pool"]["wait_ms"]["samples"] == 1
+
+    @pytest.mark.unit
+    def test_pyformat_placeholders_become_numbered_parameters(self: Self):
+        sql, keys = _to_positional(
+            "SELECT * FROM t WHERE a = %(a)s AND b LIKE 'x%%' AND c = %(c)s", lambda position: f"${position}"
+        )
+
+        assert sql == "SELECT * FROM t WHERE a = $1 AND b LIKE 'x%' AND c = $2"
+        assert keys == ["a", "c"]
+
+    @pytest.mark.unit
+    def test_percent_signs_in_literals_are_not_placeholders(self: Self):
+        manager = DatabaseConnectionManager()
+        connection = RecordingConnection()
+        cache = StatementCache(8, lambda query: manager._prepare_postgresql_statement(connection, query))
+        pooled = PooledConnection(connection, 0.0, 0.0, 0.0, statements=cache)
+
+        literal = "SELECT * FROM tags WHERE name LIKE '%sensor%'"
+        manager._execute_postgresql_query(pooled, literal)
+        manager._execute_postgresql_query(pooled, "SELECT * FROM tags WHERE path LIKE 'a%%' AND id = %(id)s", {"id": 7})
+
+        assert connection.executed == [
+            (literal, None),
+            ("SAVEPOINT ign_prepare", None),
+            ("PREPARE ign_stmt_1 AS SELECT * FROM tags WHERE path LIKE 'a%' AND id = $1", None),
+            ("RELEASE SAVEPOINT ign_prepare", None),
+            ("EXECUTE ign_stmt_1 (%s)", [7]),
+        ]
+        assert _to_positional("SELECT '%s', \"100%\", %s", lambda _position: "?") == ("SELECT '%s', \"100%\", ?", [0])
+
+    @pytest.mark.unit
+    def test_unpreparable_in_list_falls_back_to_client_side_binding(self: Self):
+        manager = DatabaseConnectionManager()
+        connection = RecordingConnection(reject="IN $1")
+        cache = StatementCache(8, lambda query: manager._prepare_postgresql_statement(connection, query))
+        pooled = PooledConnection(connection, 0.0, 0.0, 0.0, statements=cache)
+        query = "SELECT * FROM tags WHERE id IN %(ids)s"
+
+        manager._execute_postgresql_query(pooled, query, {"ids": (1, 2, 3)})
+        manager._execute_postgresql_query(pooled, query, {"ids": (4,)})
+
+        assert connection.executed == [
+            ("SAVEPOINT ign_prepare", None),
+            ("PREPARE ign_stmt_1 AS SELECT * FROM tags WHERE id IN $1", None),
+            ("ROLLBACK TO SAVEPOINT ign_prepare", None),
+            (query, {"ids": (1, 2, 3)}),
+            (query, {"ids": (4,)}),
+        ]
+        assert cache.stats["hits"] == 1
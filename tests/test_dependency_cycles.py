@@ -0,0 +1,73 @@
+"""Tests for client-side cycle detection and layering in DependencyAnalyzer."""
+
+from typing import Self
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ignition.code_intelligence.dependency_analyzer import (
+    DependencyAnalyzer,
+    analyze_dependency_graph,
+    find_strongly_connected_components,
+)
+
+
+class TestDependencyGraphAnalysis:
+    """Test cases for SCC-based dependency analysis."""
+
+    @pytest.mark.unit
+    def test_components_in_reverse_topological_order(self: Self):
+        graph = {"a": ["b"], "b": ["c"], "c": ["a", "d"], "d": []}
+
+        components = find_strongly_connected_components(graph)
+
+        assert components[0] == ["d"]
+        assert sorted(components[1]) == ["a", "b", "c"]
+
+    @pytest.mark.unit
+    def test_cycles_fan_and_layers(self: Self):
+        edges = [
+            ("app.py", "service.py"),
+            ("service.py", "models.py"),
+            ("models.py", "service.py"),
+            ("service.py", "utils.py"),
+            ("models.py", "utils.py"),
+            ("x.py", "y.py"),
+            ("y.py", "x.py"),
+            ("app.py", "utils.py"),
+        ]
+
+        structure = analyze_dependency_graph(edges)
+
+        assert structure.total_files == 6
+        assert structure.total_dependencies == 8
+        assert structure.cycles == [["models.py", "service.py"], ["x.py", "y.py"]]
+        assert structure.fan_in["utils.py"] == 3
+        assert structure.fan_out["app.py"] == 2
+        assert structure.layers == [["utils.py", "x.py", "y.py"], ["models.py", "service.py"], ["app.py"]]
+
+    @pytest.mark.unit
+    def test_deep_chain_does_not_recurse(self: Self):
+        edges = [(f"m{i}", f"m{i + 1}") for i in range(5000)] + [("m5000", "m0")]
+
+        structure = analyze_dependency_graph(edges)
+
+        assert len(structure.cycles) == 1
+        assert len(structure.cycles[0]) == 5001
+
+    @pytest.mark.unit
+    def test_metrics_use_single_edge_query(self: Self):
+        client = MagicMock()
+        client.execute_query.return_value = [
+            {"source": "a.py", "target": "b.py"},
+            {"source": "b.py", "target": "a.py"},
+            {"source": "c.py", "target": "a.py"},
+        ]
+
+        metrics = DependencyAnalyzer(client).get_dependency_metrics()
+
+        assert client.execute_query.call_count == 1
+        assert metrics["total_dependencies"] == 3
+        assert metrics["circular_dependencies"] == [["a.py", "b.py"]]
+        assert metrics["most_depended_upon"][0] == {"file_path": "a.py", "in_degree": 2}
+        assert metrics["dependency_depth"] == 2
@@ -0,0 +1,75 @@
+"""Tests for the memory-mapped embedding cache."""
+
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.code_intelligence.embedding_cache import EmbeddingCache
+
+
+def _vec(seed: int, dims: int = 8) -> np.ndarray:
+    return np.random.default_rng(seed).random(dims, dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    @pytest.mark.unit
+    def test_put_get_returns_read_only_view(self: Self, temp_dir):
+        cache = EmbeddingCache(temp_dir, dimensions=8, model_name="m", initial_capacity=2)
+        for i in range(5):
+            cache.put(f"h{i}", _vec(i))
+
+        view = cache.get("h3")
+        np.testing.assert_array_equal(view, _vec(3))
+        assert not view.flags.writeable
+        assert cache.get("missing") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["capacity_rows"] >= 5
+
+    @pytest.mark.unit
+    def test_get_many_gathers_hits_in_order(self: Self, temp_dir):
+        cache = EmbeddingCache(temp_dir, dimensions=8, model_name="m")
+        cache.put_many(["a", "b", "a"], np.stack([_vec(1), _vec(2), _vec(3)]))
+
+        hit_mask, vectors = cache.get_many(["b", "x", "a"])
+
+        assert hit_mask.tolist() == [True, False, True]
+        np.testing.assert_array_equal(vectors, np.stack([_vec(2), _vec(1)]))
+
+    @pytest.mark.unit
+    def test_lru_eviction_and_compaction(self: Self, temp_dir):
+        cache = EmbeddingCache(temp_dir, dimensions=8, model_name="m", max_entries=3)
+        for i in range(3):
+            cache.put(f"h{i}", _vec(i))
+        cache.get("h0")  # h1 is now least recently used
+        for i in range(3, 8):
+            cache.put(f"h{i}", _vec(i))
+
+        assert len(cache) == 3
+        assert "h0" not in cache
+        assert set(cache._index) == {"h5", "h6", "h7"}
+        assert cache.stats()["dead_rows"] <= len(cache)
+        np.testing.assert_array_equal(cache.get("h6"), _vec(6))
+
+    @pytest.mark.unit
+    def test_persists_across_reopen(self: Self, temp_dir):
+        cache = EmbeddingCache(temp_dir, dimensions=8, model_name="m", max_entries=2)
+        for i in range(3):
+            cache.put(f"h{i}", _vec(i))
+        del cache
+
+        reopened = EmbeddingCache(temp_dir, dimensions=8, model_name="m", max_entries=2)
+        assert set(reopened._index) == {"h1", "h2"}
+        np.testing.assert_array_equal(reopened.get("h2"), _vec(2))
+        assert reopened.get_created_at("h2") is not None
+
+    @pytest.mark.unit
+    def test_model_change_resets_cache(self: Self, temp_dir):
+        EmbeddingCache(temp_dir, dimensions=8, model_name="m").put("h", _vec(0))
+
+        other = EmbeddingCache(temp_dir, dimensions=4, model_name="other")
+        assert len(other) == 0
+        assert other.get("h") is None
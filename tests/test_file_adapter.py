@@ -0,0 +1,109 @@
+"""Tests for columnar streaming reads and append writes in the FileAdapter."""
+
+from datetime import datetime
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.core.abstract_module import ModuleContext
+from src.ignition.modules.data_integration.adapters.file_adapter import FileAdapter
+from src.ignition.modules.data_integration.integration_module import (
+    DataSourceConfig,
+    DataSourceType,
+    VariableMetadata,
+    VariableType,
+    create_data_integration_module,
+)
+
+START = np.datetime64("2024-01-15T10:00:00", "us")
+
+
+def _adapter(path, source_type: DataSourceType, batch_size: int = 4) -> FileAdapter:
+    config = DataSourceConfig(
+        source_id="export",
+        source_type=source_type,
+        connection_params={"path": str(path)},
+        batch_size=batch_size,
+    )
+    return FileAdapter(config)
+
+
+def _points(first: int, count: int) -> dict[str, np.ndarray]:
+    seconds = np.arange(first, first + count)
+    return {
+        "timestamp": START + seconds * 1_000_000,
+        "tag_name": np.array(["Flow" if i % 2 else "Temp" for i in seconds], dtype=object),
+        "value": seconds * 0.5,
+    }
+
+
+class TestFileAdapter:
+    """Test cases for projected, filtered, fixed-size batch reads."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_csv_appends_and_streams_filtered_fixed_size_blocks(self: Self, tmp_path):
+        adapter = _adapter(tmp_path / "history.csv", DataSourceType.CSV)
+        await adapter.connect()
+
+        assert await adapter.write_data(_points(0, 10))
+        # Later appends follow the header's column order
+        second = _points(10, 10)
+        assert await adapter.write_data({"value": second["value"], **second})
+
+        query = {
+            "columns": ["timestamp", "value"],
+            "start_time": "2024-01-15T10:00:02",
+            "end_time": datetime(2024, 1, 15, 10, 0, 18),
+            "tags": ["Temp"],
+        }
+        blocks = [block async for block in adapter.read_blocks(query)]
+
+        assert (tmp_path / "history.csv").read_text().count("timestamp") == 1
+        assert [len(block["value"]) for block in blocks] == [4, 4]
+        assert list(blocks[0]) == ["timestamp", "value"]
+        assert blocks[0]["timestamp"].dtype == np.dtype("datetime64[us]")
+        np.testing.assert_array_equal(np.concatenate([block["value"] for block in blocks]), np.arange(2, 18, 2) * 0.5)
+        assert adapter.get_connection_info()["read_stats"] == {"rows_read": 8, "batches_read": 2}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_parquet_writes_parts_and_reads_dataset(self: Self, tmp_path):
+        adapter = _adapter(tmp_path / "history.parquet", DataSourceType.PARQUET, batch_size=1000)
+        await adapter.connect()
+
+        assert await adapter.write_data(_points(0, 6))
+        assert await adapter.write_data([{"timestamp": datetime(2024, 1, 15, 11), "tag_name": "Flow", "value": 99.0}])
+        records = await adapter.read_data({"tags": ["Flow"], "start_time": "2024-01-15T10:00:02"})
+
+        assert len(list((tmp_path / "history.parquet").glob("part-*.parquet"))) == 2
+        assert sorted(record["value"] for record in records) == [1.5, 2.5, 99.0]
+        assert records[0]["source_type"] == "file"
+        assert adapter.get_connection_info()["write_stats"] == {"rows_written": 7, "writes": 2}
+
+
+class TestColumnarMetadataInjection:
+    """Test cases for annotating columnar blocks."""
+
+    @pytest.mark.unit
+    def test_block_metadata_is_added_per_column(self: Self, tmp_path):
+        context = ModuleContext(
+            module_path=tmp_path,
+            config_path=tmp_path / "config",
+            data_path=tmp_path / "data",
+            log_path=tmp_path / "logs",
+            temp_path=tmp_path / "tmp",
+        )
+        module = create_data_integration_module(context)
+        mappings = {
+            "value": VariableMetadata(VariableType.PV, "value", "degC", max_value=50.0, is_primary_pv=True),
+            "tag_name": VariableMetadata(VariableType.DV, "tag_name", max_value=10.0),
+        }
+
+        block = module._inject_metadata(_points(0, 4), mappings)
+
+        np.testing.assert_array_equal(block["value_normalized"], [0.0, 0.01, 0.02, 0.03])
+        assert "tag_name_normalized" not in block
+        assert block["metadata"]["value"]["is_primary_pv"] is True
+        assert block["metadata"]["tag_name"]["type"] == VariableType.DV.value
@@ -0,0 +1,85 @@
+"""Tests for the batched UNWIND write API of IgnitionGraphClient."""
+
+from typing import Any, Self
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ignition.graph.client import IgnitionGraphClient
+from src.ignition.graph.schema import GraphNode, GraphRelationship, NodeType, RelationshipType
+
+
+@pytest.fixture
+def recording_client():
+    """Client whose session records every (query, parameters) pair written."""
+    client = IgnitionGraphClient(batch_size=2)
+    calls: list[tuple[str, dict[str, Any]]] = []
+
+    session = MagicMock()
+
+    def execute_write(work):
+        tx = MagicMock()
+        tx.run.side_effect = lambda query, params: calls.append((query, params)) or MagicMock()
+        return work(tx)
+
+    session.execute_write.side_effect = execute_write
+    client.driver = MagicMock()
+    client.driver.session.return_value = session
+    client._connected = True
+    return client, calls
+
+
+class TestGraphBulkWrites:
+    """Test cases for create_nodes_bulk and create_relationships_bulk."""
+
+    @pytest.mark.unit
+    def test_nodes_grouped_by_label_and_batched(self: Self, recording_client):
+        client, calls = recording_client
+        nodes = [GraphNode(NodeType.FUNCTION, {"name": f"f{i}"}) for i in range(5)]
+        nodes.append(GraphNode(NodeType.CONTEXT, {"name": "Gateway"}))
+
+        assert client.create_nodes_bulk(nodes) == 6
+
+        function_calls = [c for c in calls if ":Function" in c[0]]
+        context_calls = [c for c in calls if ":Context" in c[0]]
+        assert [len(p["rows"]) for _, p in function_calls] == [2, 2, 1]
+        assert len(context_calls) == 1
+        assert all("UNWIND $rows" in q for q, _ in calls)
+
+    @pytest.mark.unit
+    def test_relationships_grouped_by_type(self: Self, recording_client):
+        client, calls = recording_client
+        rels = [
+            GraphRelationship(NodeType.FUNCTION, NodeType.CONTEXT, RelationshipType.AVAILABLE_IN, "f1", "Gateway"),
+            GraphRelationship(NodeType.FUNCTION, NodeType.CATEGORY, RelationshipType.BELONGS_TO, "f1", "tag"),
+            GraphRelationship(NodeType.FUNCTION, NodeType.CONTEXT, RelationshipType.AVAILABLE_IN, "f2", "Vision"),
+        ]
+
+        assert client.create_relationships_bulk(rels) == 3
+        assert len(calls) == 2
+        available_in = next(p for q, p in calls if ":AVAILABLE_IN" in q)
+        assert [row["from_name"] for row in available_in["rows"]] == ["f1", "f2"]
+        assert available_in["rows"][0]["properties"] == {}
+
+    @pytest.mark.unit
+    def test_failed_batch_is_not_counted(self: Self, recording_client):
+        client, _ = recording_client
+        session = client.driver.session.return_value
+        session.execute_write.side_effect = [None, RuntimeError("boom"), None]
+
+        nodes = [GraphNode(NodeType.FUNCTION, {"name": f"f{i}"}) for i in range(5)]
+        assert client.create_nodes_bulk(nodes) == 3
+
+    @pytest.mark.unit
+    def test_counted_writes_and_raised_failures(self: Self, recording_client):
+        client, _ = recording_client
+        session = client.driver.session.return_value
+        session.execute_write.side_effect = [{"written": 2}, None, {"written": 1}]
+
+        rows = [{"id": i} for i in range(5)]
+        assert client.execute_write_batches("UNWIND $rows AS row RETURN 0", rows, count_key="written") == 3
+
+        session.execute_write.side_effect = [None, RuntimeError("boom"), None]
+        with pytest.raises(RuntimeError, match="boom"):
+            client.execute_write_batches("UNWIND $rows AS row CREATE (n)", rows, raise_on_error=True)
+        assert session.execute_write.call_count == 5
@@ -0,0 +1,106 @@
+"""Tests for incremental directory analysis in CodeIntelligenceManager."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Self
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ignition.code_intelligence.manager import CodeIntelligenceManager
+
+
+def _make_manager(stored: list[dict[str, Any]]) -> tuple[CodeIntelligenceManager, list[tuple[str, dict]]]:
+    calls: list[tuple[str, dict]] = []
+
+    def execute_query(query: str, params: dict | None = None) -> list[dict[str, Any]]:
+        calls.append((query, params or {}))
+        if "f.content_hash as content_hash" in query:
+            return [row for row in stored if row["path"].startswith(params["prefix"])]
+        return []
+
+    client = MagicMock()
+    client.execute_query.side_effect = execute_query
+    return CodeIntelligenceManager(client), calls
+
+
+def _record(manager: CodeIntelligenceManager, path, content: str, stale_mtime: bool = False) -> dict[str, Any]:
+    stat = path.stat()
+    mtime = stat.st_mtime - 60 if stale_mtime else stat.st_mtime
+    return {
+        "path": manager.analyzer._get_relative_path(path),
+        "content_hash": manager.analyzer.compute_content_hash(content),
+        "last_modified": datetime.fromtimestamp(mtime).isoformat(),
+        "size_bytes": stat.st_size,
+    }
+
+
+class TestIncrementalAnalysis:
+    """Test cases for the incremental analysis mode."""
+
+    @pytest.mark.unit
+    def test_classifies_unchanged_changed_added_removed(self: Self, temp_dir):
+        same = temp_dir / "same.py"
+        same.write_text("x = 1\n")
+        touched = temp_dir / "touched.py"
+        touched.write_text("y = 2\n")
+        edited = temp_dir / "edited.py"
+        edited.write_text("def f():\n    return 1\n")
+        added = temp_dir / "added.py"
+        added.write_text("class A:\n    pass\n")
+
+        manager, _ = _make_manager([])
+        stored = [
+            _record(manager, same, "x = 1\n"),
+            _record(manager, touched, "y = 2\n", stale_mtime=True),
+            _record(manager, edited, "old content", stale_mtime=True),
+            {"path": str(temp_dir / "gone.py"), "content_hash": "x", "last_modified": "", "size_bytes": 0},
+        ]
+        manager, calls = _make_manager(stored)
+
+        results = manager.analyze_and_store_directory(temp_dir, incremental=True)
+
+        assert results["files_unchanged"] == 2
+        assert results["files_changed"] == 1
+        assert results["files_added"] == 1
+        assert results["files_removed"] == 1
+        assert results["files_processed"] == 2
+
+        deletes = [params["paths"] for query, params in calls if "DETACH DELETE f" in query]
+        assert deletes == [[str(temp_dir / "gone.py")]]
+        touches = [params["rows"] for query, params in calls if "SET f.last_modified" in query]
+        assert [row["path"] for row in touches[0]] == [str(touched)]
+        stored_files = [params["path"] for query, params in calls if "MERGE (f:CodeFile" in query]
+        assert sorted(stored_files) == sorted([str(added), str(edited)])
+
+    @pytest.mark.unit
+    def test_non_recursive_ignores_nested_removed_files(self: Self, temp_dir):
+        manager, _ = _make_manager(
+            [{"path": str(temp_dir / "pkg" / "mod.py"), "content_hash": "x", "last_modified": "", "size_bytes": 0}]
+        )
+        results = manager.analyze_and_store_directory(temp_dir, recursive=False, incremental=True)
+        assert results["files_removed"] == 0
+
+    @pytest.mark.unit
+    def test_working_directory_run_keeps_files_indexed_from_other_trees(self: Self, temp_dir, monkeypatch):
+        project = temp_dir / "project"
+        project.mkdir()
+        (project / "kept.py").write_text("x = 1\n")
+        outside = temp_dir / "other" / "outside.py"
+        outside.parent.mkdir()
+        outside.write_text("y = 2\n")
+        monkeypatch.chdir(project)
+
+        manager, _ = _make_manager([])
+        stored = [
+            _record(manager, outside, "y = 2\n"),
+            {"path": "gone.py", "content_hash": "x", "last_modified": "", "size_bytes": 0},
+        ]
+        assert stored[0]["path"] == str(outside)
+        manager, calls = _make_manager(stored)
+
+        results = manager.analyze_and_store_directory(Path("."), incremental=True)
+
+        assert results["files_removed"] == 1
+        deletes = [params["paths"] for query, params in calls if "DETACH DELETE f" in query]
+        assert deletes == [["gone.py"]]
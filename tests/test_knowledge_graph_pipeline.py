@@ -0,0 +1,160 @@
+"""Tests for paged, streaming knowledge extraction in the KnowledgeGraphPipeline."""
+
+import asyncio
+import json
+import re
+from contextlib import aclosing
+from typing import Self
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+
+from src.ignition.modules.sme_agent import SMEAgentValidationError
+from src.ignition.modules.sme_agent.knowledge_graph_pipeline import (
+    DatasetFormat,
+    KnowledgeExtractionType,
+    KnowledgeGraphConfig,
+    KnowledgeGraphPipeline,
+)
+
+LABELS = {"Function": 5, "Component": 3, "Pattern": 0, "Troubleshooting": 2, "Workflow": 4}
+
+
+class FakeNode(dict):
+    """Neo4j node double: a property mapping with an ID and labels."""
+
+    def __init__(self, node_id: int, label: str) -> None:
+        super().__init__(name=f"{label} {node_id}", description=f"About {label.lower()} {node_id}")
+        self.id = node_id
+        self.labels = {label}
+
+
+class FakeDriver:
+    """Neo4j driver double answering keyset page queries from in-memory nodes."""
+
+    def __init__(self, fail_after: dict[str, int] | None = None) -> None:
+        self.nodes = {
+            label: [FakeNode(1000 * index + offset, label) for offset in range(count)]
+            for index, (label, count) in enumerate(LABELS.items())
+        }
+        self.fail_after = fail_after or {}
+        self.calls: list[tuple[str, int | None, int]] = []
+
+    def session(self, database: str | None = None) -> "FakeDriver":
+        return self
+
+    def __enter__(self) -> "FakeDriver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def run(self, query: str, after: int | None, limit: int) -> list[dict]:
+        label = re.search(r"MATCH \(n:(\w+)\)", query).group(1)
+        self.calls.append((label, after, limit))
+        if after is not None and after >= self.fail_after.get(label, float("inf")):
+            raise RuntimeError(f"connection to {label} lost")
+        nodes = [node for node in self.nodes[label] if after is None or node.id > after][:limit]
+        return [{"n": node, "node_key": node.id, "relationships": [{"type": "USES", "node": None}]} for node in nodes]
+
+
+class CountingEncoder:
+    """Embedding model double recording its batch sizes."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.batches.append(len(texts))
+        return np.ones((len(texts), 3), dtype=np.float32)
+
+
+def _pipeline(tmp_path, driver: FakeDriver, **overrides) -> KnowledgeGraphPipeline:
+    settings = {
+        "max_nodes_per_query": 2,
+        "max_concurrent_extractions": 2,
+        "checkpoint_interval": 1,
+        "batch_size": 8,
+        "output_directory": str(tmp_path),
+    }
+    pipeline = KnowledgeGraphPipeline(KnowledgeGraphConfig(**(settings | overrides)))
+    pipeline.driver = driver
+    return pipeline
+
+
+class TestKnowledgeGraphPipelineStreaming:
+    """Test cases for keyset pages, concurrent extraction and resumable datasets."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stream_pages_every_label_with_embedded_pages(self: Self, tmp_path):
+        driver = FakeDriver()
+        pipeline = _pipeline(tmp_path, driver)
+        pipeline.embedding_model = CountingEncoder()
+
+        pages = [page async for page in pipeline.stream_knowledge([KnowledgeExtractionType.ALL], max_records=4)]
+
+        functions = [page for page in pages if page.query_name == "system_functions"]
+        assert [len(page.records) for page in functions] == [2, 2]
+        assert functions[-1].cursor == {"after": 3, "records": 4, "done": True}
+        assert [call[1] for call in driver.calls if call[0] == "Function"] == [None, 1]
+        assert sum(len(page.records) for page in pages) == 4 + 3 + 0 + 2 + 4
+        assert max(pipeline.embedding_model.batches) <= 2
+        assert all(record.embedding == [1.0, 1.0, 1.0] for page in pages for record in page.records)
+        assert pipeline.get_pipeline_stats()["records_by_type"]["functions"] == 4
+        assert pipeline.extraction_stats["total_relationships"] == 13
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_interrupted_dataset_resumes_from_checkpoint(self: Self, tmp_path):
+        output_path = str(tmp_path / "knowledge.jsonl")
+        pipeline = _pipeline(tmp_path, FakeDriver(fail_after={"Function": 1}))
+
+        with pytest.raises(SMEAgentValidationError, match="system_functions"):
+            await pipeline.create_fine_tuning_dataset(output_path)
+
+        checkpoint = json.loads((tmp_path / "knowledge.jsonl.checkpoint.json").read_text())
+        assert checkpoint["cursors"]["system_functions"] == {"after": 1, "records": 2, "done": False}
+
+        driver = FakeDriver()
+        resumed = _pipeline(tmp_path, driver)
+        await resumed.create_fine_tuning_dataset(output_path)
+
+        with open(output_path, encoding="utf-8") as f:
+            titles = [json.loads(line)["instruction"] for line in f]
+        assert len(titles) == len(set(titles)) == sum(LABELS.values())
+        assert [call[1] for call in driver.calls] == [1, 3]
+        assert not (tmp_path / "knowledge.jsonl.checkpoint.json").exists()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_parquet_parts_merge_into_one_file(self: Self, tmp_path):
+        pipeline = _pipeline(tmp_path, FakeDriver(), dataset_name="knowledge")
+
+        output_path = await pipeline.create_fine_tuning_dataset(format_type=DatasetFormat.PARQUET)
+
+        dataset = pq.ParquetFile(output_path)
+        assert dataset.metadata.num_rows == sum(LABELS.values())
+        assert dataset.num_row_groups == 8
+        assert dataset.schema_arrow.names == ["instruction", "input", "output"]
+        assert not (tmp_path / "knowledge.parquet.parts").exists()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_closing_stream_early_cancels_blocked_extractions(self: Self, tmp_path):
+        driver = FakeDriver()
+        pipeline = _pipeline(tmp_path, driver, max_nodes_per_query=1, max_concurrent_extractions=1)
+
+        async def first_page():
+            async with aclosing(pipeline.stream_knowledge([KnowledgeExtractionType.ALL], embed=False)) as stream:
+                async for page in stream:
+                    return page
+
+        page = await asyncio.wait_for(first_page(), 3)
+
+        assert len(page.records) == 1
+        assert len(driver.calls) < sum(LABELS.values())
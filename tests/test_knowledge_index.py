@@ -0,0 +1,83 @@
+"""Tests for BM25 inverted-index retrieval in the knowledge domain managers."""
+
+import json
+from typing import Self
+
+import pytest
+
+from src.ignition.modules.sme_agent.knowledge_domains import (
+    DomainKnowledgeItem,
+    GatewayScriptingDomainManager,
+    KnowledgeIndex,
+    SystemFunctionsDomainManager,
+    tokenize,
+)
+
+
+def _item(item_id: str, name: str, description: str, confidence: float = 0.5, **content) -> DomainKnowledgeItem:
+    return DomainKnowledgeItem(
+        id=item_id,
+        name=name,
+        description=description,
+        category="utility",
+        content=content,
+        confidence=confidence,
+    )
+
+
+class TestKnowledgeIndex:
+    """Test cases for tokenization, ranking, incremental updates and persistence."""
+
+    @pytest.mark.unit
+    def test_tokenize_splits_identifiers_and_drops_stopwords(self: Self):
+        assert tokenize("How do I call system.device.listDevices?") == [
+            "call",
+            "system",
+            "device",
+            "listdevice",
+            "list",
+            "device",
+        ]
+
+    @pytest.mark.unit
+    def test_query_ranks_by_relevance_and_tracks_item_changes(self: Self, tmp_path):
+        manager = SystemFunctionsDomainManager(data_dir=str(tmp_path))
+        manager.add_knowledge_item(_item("f1", "listDevices", "List configured devices", confidence=0.4))
+        manager.add_knowledge_item(_item("f2", "readFile", "Read a file from disk", confidence=0.9))
+        manager.add_knowledge_item(_item("f3", "browseServer", "Browse an OPC-UA server", confidence=0.9))
+
+        result = manager.query_knowledge("list devices")
+        assert [item.id for item in result.results] == ["f1"]
+        assert result.results[0].usage_count == 1
+
+        manager.add_knowledge_item(_item("f2", "readFile", "Read the device list from disk", confidence=0.9))
+        assert [item.id for item, _score in manager.search_knowledge("list devices")] == ["f1", "f2"]
+
+        assert manager.remove_knowledge_item("f1")
+        assert not manager.remove_knowledge_item("f1")
+        assert [item.id for item, _score in manager.search_knowledge("list devices")] == ["f2"]
+        assert "listdevice" not in manager.index.postings
+        assert manager.search_knowledge("opc ua server", limit=1)[0][0].id == "f3"
+
+    @pytest.mark.unit
+    def test_saved_index_is_reused_until_knowledge_base_changes(self: Self, tmp_path, monkeypatch):
+        manager = GatewayScriptingDomainManager(str(tmp_path))
+        manager.add_knowledge_item(_item("s1", "Startup Script", "Initialize databases", code="system.db.runQuery"))
+        manager.add_knowledge_item(_item("s2", "Timer Script", "Periodic report generation"))
+        assert manager.save_knowledge_base()
+
+        def fail_add(index: KnowledgeIndex, item: DomainKnowledgeItem) -> None:
+            raise AssertionError(f"{item.id} was re-tokenized")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(KnowledgeIndex, "add", fail_add)
+            reloaded = GatewayScriptingDomainManager(str(tmp_path))
+        assert reloaded.search_knowledge("runquery")[0][0].id == "s1"
+
+        knowledge_file = tmp_path / "knowledge_base.json"
+        knowledge = json.loads(knowledge_file.read_text(encoding="utf-8"))
+        knowledge["items"]["s2"]["description"] = "Periodic database purge"
+        knowledge_file.write_text(json.dumps(knowledge), encoding="utf-8")
+
+        edited = GatewayScriptingDomainManager(str(tmp_path))
+        assert [item.id for item, _score in edited.search_knowledge("database purge")] == ["s2", "s1"]
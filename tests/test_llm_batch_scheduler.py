@@ -0,0 +1,164 @@
+"""Tests for the batched LLM request scheduler."""
+
+import threading
+import time
+from typing import Self
+
+import pytest
+
+from src.ignition.modules.sme_agent.llm_scheduler import (
+    BatchScheduler,
+    GenerationParams,
+    SchedulerQueueFullError,
+)
+
+EOS = 0
+
+
+class EchoBackend:
+    """Backend double that answers with the prompt reversed, one character per step."""
+
+    eos_token_id = EOS
+
+    def __init__(self, fail: bool = False, release: threading.Event | None = None) -> None:
+        self.fail = fail
+        self.release = release
+        self.batches: list[tuple[list[int], GenerationParams]] = []
+        self.encoded = 0
+        self.decoded = 0
+
+    def encode(self, text: str) -> list[int]:
+        self.encoded += 1
+        return [ord(char) for char in text]
+
+    def decode(self, token_ids: list[int]) -> str:
+        self.decoded += 1
+        return "".join(chr(token) for token in token_ids)
+
+    def generate(self, prompts, params, on_step=None):
+        if self.release:
+            self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("out of memory")
+        self.batches.append(([len(ids) for ids in prompts], params))
+        outputs = [[*ids[::-1][: params.max_new_tokens - 1], EOS] for ids in prompts]
+        for step in range(params.max_new_tokens):
+            if on_step:
+                on_step([output[step] if step < len(output) else EOS for output in outputs])
+        return [output[:-1] for output in outputs]
+
+
+class TestBatchScheduler:
+    """Test cases for dynamic batching, KV-cache budgets, streaming and metrics."""
+
+    @pytest.mark.unit
+    def test_compatible_requests_share_batches_and_reuse_tokenization(self: Self):
+        backend = EchoBackend()
+        scheduler = BatchScheduler(backend, max_batch_size=4, max_wait_ms=200)
+        greedy = GenerationParams(max_new_tokens=8, do_sample=False)
+
+        handles = [scheduler.submit(f"prompt {i}", greedy) for i in range(6)]
+        sampled = scheduler.submit("sampled", GenerationParams(max_new_tokens=8))
+        results = [handle.result(5) for handle in handles]
+        scheduler.stop()
+
+        assert [(sizes, params.do_sample) for sizes, params in backend.batches] == [
+            ([8, 8, 8, 8], False),
+            ([8, 8], False),
+            ([7], True),
+        ]
+        assert results[3].text == "3 tpmor"
+        assert (results[3].input_tokens, results[3].output_tokens, results[3].batch_size) == (8, 7, 4)
+        assert sampled.result().text == "delpmas"
+        assert backend.encoded == backend.decoded == 7
+
+        metrics = scheduler.get_metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["requests"] == 7
+        assert metrics["batches"] == 3
+        assert metrics["average_batch_size"] == pytest.approx(7 / 3)
+        assert metrics["max_batch_size_seen"] == 4
+        assert metrics["generated_tokens"] == 7 * 7
+        assert metrics["tokens_per_second"] > 0
+
+    @pytest.mark.unit
+    def test_batches_respect_kv_cache_budget_and_group_similar_lengths(self: Self):
+        backend = EchoBackend()
+        params = GenerationParams(max_new_tokens=10)
+        scheduler = BatchScheduler(backend, max_batch_size=8, max_wait_ms=100, max_batch_tokens=3 * (12 + 10))
+
+        handles = [scheduler.submit("x" * length, params) for length in (10, 40, 12, 11)]
+        for handle in handles:
+            handle.result(5)
+        scheduler.stop()
+
+        assert [sizes for sizes, _params in backend.batches] == [[10, 11, 12], [40]]
+
+        release = threading.Event()
+        blocked = BatchScheduler(EchoBackend(release=release), max_batch_size=1, max_wait_ms=0, max_queue_size=2)
+        first = blocked.submit("running", params)
+        deadline = time.monotonic() + 5
+        while blocked.get_metrics()["queue_depth"] and time.monotonic() < deadline:
+            time.sleep(0.001)
+        blocked.submit("queued 1", params)
+        blocked.submit("queued 2", params)
+        assert blocked.get_metrics()["queue_depth"] == 2
+        with pytest.raises(SchedulerQueueFullError):
+            blocked.submit("rejected", params)
+        release.set()
+        assert first.result(5).text == "gninnur"
+        blocked.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_match_result_and_errors_reach_callers(self: Self):
+        scheduler = BatchScheduler(EchoBackend(), max_batch_size=2, max_wait_ms=50)
+        params = GenerationParams(max_new_tokens=6)
+
+        streamed = scheduler.submit("abcdefgh", params, stream=True)
+        plain = scheduler.submit("xyz", params)
+        chunks = [chunk async for chunk in streamed]
+        assert chunks == ["h", "g", "f", "e", "d"]
+        assert "".join(streamed) == (await streamed.wait()).text == "hgfed"
+        assert plain.result().text == "zyx"
+        assert list(plain) == []
+        scheduler.stop()
+
+        failing = BatchScheduler(EchoBackend(fail=True), max_wait_ms=0)
+        handle = failing.submit("boom", params, stream=True)
+        assert list(handle) == []
+        with pytest.raises(RuntimeError, match="out of memory"):
+            await handle.wait()
+        assert failing.get_metrics()["failed_requests"] == 1
+        failing.stop()
+        with pytest.raises(RuntimeError, match="stopped"):
+            failing.submit("late", params)
+
+    @pytest.mark.unit
+    def test_worker_failures_fail_handles_instead_of_hanging(self: Self, monkeypatch):
+        class BrokenDecodeBackend(EchoBackend):
+            def decode(self, token_ids: list[int]) -> str:
+                if chr(token_ids[0]) == "!":
+                    raise UnicodeDecodeError("utf-8", b"", 0, 1, "invalid start byte")
+                return super().decode(token_ids)
+
+        params = GenerationParams(max_new_tokens=4)
+        scheduler = BatchScheduler(BrokenDecodeBackend(), max_batch_size=2, max_wait_ms=50)
+        broken = [scheduler.submit("ab!", params, stream=True), scheduler.submit("cd", params)]
+        for handle in broken:
+            with pytest.raises(UnicodeDecodeError):
+                handle.result(5)
+        assert scheduler.submit("ef", params).result(5).text == "fe"
+        assert scheduler.get_metrics()["failed_requests"] == 2
+        scheduler.stop()
+
+        def fail_take_batch(self: BatchScheduler, head) -> list:
+            raise RuntimeError("scheduler bug")
+
+        monkeypatch.setattr(BatchScheduler, "_take_batch", fail_take_batch)
+        crashed = BatchScheduler(EchoBackend(), max_wait_ms=0)
+        handle = crashed.submit("gh", params)
+        with pytest.raises(RuntimeError, match="scheduler bug"):
+            handle.result(5)
+        with pytest.raises(RuntimeError, match="stopped"):
+            crashed.submit("ij", params)
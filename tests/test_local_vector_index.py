@@ -0,0 +1,145 @@
+"""Tests for the in-process ANN index used by SemanticCodeSearch."""
+
+from types import SimpleNamespace
+from typing import Self
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.ignition.code_intelligence import embeddings
+from src.ignition.code_intelligence.manager import CodeIntelligenceManager
+from src.ignition.code_intelligence.vector_index import LocalVectorIndex
+
+
+def _clustered(n: int, dims: int = 32, clusters: int = 20, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dims))
+    return (centers[rng.integers(0, clusters, n)] + 0.5 * rng.normal(size=(n, dims))).astype(np.float32)
+
+
+def _brute_force(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:k].tolist()
+
+
+class TestLocalVectorIndex:
+    """Test cases for LocalVectorIndex."""
+
+    @pytest.mark.unit
+    def test_untrained_search_is_exact(self: Self):
+        vectors = _clustered(200)
+        index = LocalVectorIndex(32)
+        index.add([f"k{i}" for i in range(200)], vectors)
+
+        assert not index.is_trained
+        hits = index.search(vectors[7], 5)
+        assert [key for key, _ in hits] == [f"k{i}" for i in _brute_force(vectors, vectors[7], 5)]
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.unit
+    def test_trained_recall_against_brute_force(self: Self):
+        vectors = _clustered(3000)
+        index = LocalVectorIndex(32, n_probe=8, train_threshold=1000)
+        index.add([f"k{i}" for i in range(3000)], vectors)
+        assert index.is_trained
+
+        queries = vectors[:20] + 0.3 * np.random.default_rng(1).normal(size=(20, 32)).astype(np.float32)
+        recall = np.mean(
+            [
+                len({key for key, _ in index.search(q, 10)} & {f"k{i}" for i in _brute_force(vectors, q, 10)}) / 10
+                for q in queries
+            ]
+        )
+        assert recall >= 0.9
+
+    @pytest.mark.unit
+    def test_incremental_add_replace_remove(self: Self):
+        vectors = _clustered(1500)
+        index = LocalVectorIndex(32, train_threshold=1000)
+        index.add([f"a.py::{i}" for i in range(500)], vectors[:500])
+        index.add([f"b.py::{i}" for i in range(1000)], vectors[500:])
+
+        assert index.remove_prefixes({"a.py", "c.py"}) == 500
+        assert len(index) == 1000
+        assert all(key.startswith("b.py::") for key, _ in index.search(vectors[0], 10))
+
+        index.add(["b.py::0"], vectors[0])
+        assert index.search(vectors[0], 1)[0][0] == "b.py::0"
+
+    @pytest.mark.unit
+    def test_save_and_load_round_trip(self: Self, temp_dir):
+        vectors = _clustered(1200)
+        index = LocalVectorIndex(32, train_threshold=1000)
+        index.add([f"k{i}" for i in range(1200)], vectors)
+        index.remove(["k0", "k1"])
+        index.save(temp_dir / "file.npz")
+
+        loaded = LocalVectorIndex.load(temp_dir / "file.npz")
+
+        assert len(loaded) == 1198
+        assert loaded.is_trained
+        assert loaded.search(vectors[5], 3) == index.search(vectors[5], 3)
+
+
+class TestSemanticSearchLocalIndex:
+    """Test cases for routing SemanticCodeSearch through a local index."""
+
+    @pytest.mark.unit
+    def test_search_hydrates_local_hits(self: Self, temp_dir):
+        client = MagicMock()
+        client.execute_query.return_value = []
+        search = embeddings.SemanticCodeSearch(client, SimpleNamespace(dimensions=4), local_index_dir=temp_dir)
+        search.local_indexes["method"].add(["src/a.py::run::12"], [[1.0, 0.0, 0.0, 0.0]])
+
+        search._search_methods([1.0, 0.1, 0.0, 0.0], limit=5)
+
+        cypher, params = client.execute_query.call_args[0]
+        assert "db.index.vector" not in cypher
+        assert "UNWIND $hits AS hit" in cypher
+        assert params["hits"][0]["file_path"] == "src/a.py"
+        assert params["hits"][0]["name"] == "run"
+        assert params["hits"][0]["start_line"] == 12
+
+    @pytest.mark.unit
+    def test_incremental_run_drops_and_refreshes_local_entries(self: Self, temp_dir):
+        edited = temp_dir / "edited.py"
+        edited.write_text("class Renamed:\n    def run(self):\n        return 2\n")
+        edited_path, gone_path = str(edited), str(temp_dir / "gone.py")
+
+        def execute_query(query: str, params: dict | None = None) -> list[dict]:
+            if "f.content_hash as content_hash" in query:
+                return [
+                    {"path": path, "content_hash": "old", "last_modified": "", "size_bytes": 0}
+                    for path in (edited_path, gone_path)
+                ]
+            if query in embeddings.LOCAL_INDEX_QUERIES.values() and edited_path in params["paths"]:
+                # Nodes re-stored for the edited file, now with fresh embeddings
+                key = {
+                    embeddings.LOCAL_INDEX_QUERIES["file"]: edited_path,
+                    embeddings.LOCAL_INDEX_QUERIES["class"]: f"{edited_path}::Renamed",
+                    embeddings.LOCAL_INDEX_QUERIES["method"]: f"{edited_path}::run::2",
+                }[query]
+                return [{"key": key, "embedding": [0.0, 0.0, 0.0, 1.0]}]
+            return []
+
+        client = MagicMock()
+        client.execute_query.side_effect = execute_query
+        search = embeddings.SemanticCodeSearch(client, SimpleNamespace(dimensions=4), local_index_dir=temp_dir / "ann")
+        for node_type, suffix in (("file", ""), ("class", "::Original"), ("method", "::run::5")):
+            search.local_indexes[node_type].add(
+                [edited_path + suffix, gone_path + suffix], [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]]
+            )
+        manager = CodeIntelligenceManager(client, semantic_search=search)
+
+        results = manager.analyze_and_store_directory(temp_dir, incremental=True)
+
+        assert (results["files_changed"], results["files_removed"]) == (1, 1)
+        assert search.local_indexes["file"].keys() == [edited_path]
+        assert search.local_indexes["class"].keys() == [f"{edited_path}::Renamed"]
+        assert search.local_indexes["method"].keys() == [f"{edited_path}::run::2"]
+        assert search.local_indexes["file"].get(edited_path).tolist() == [0.0, 0.0, 0.0, 1.0]
+        reloaded = embeddings.SemanticCodeSearch(
+            client, SimpleNamespace(dimensions=4), local_index_dir=temp_dir / "ann"
+        )
+        assert reloaded.local_indexes["class"].keys() == [f"{edited_path}::Renamed"]
@@ -0,0 +1,132 @@
+"""Tests for the ring-buffer metric store used by ProductionPerformanceMonitor."""
+
+import statistics
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.mpc_framework import metric_store
+from src.ignition.modules.mpc_framework.metric_store import MetricRingBuffer
+from src.ignition.modules.mpc_framework.performance_monitor import (
+    KPIConfiguration,
+    PerformanceConfiguration,
+    PerformanceMetric,
+    PerformanceThreshold,
+    ProductionPerformanceMonitor,
+)
+
+
+def _reference_slope(values: np.ndarray) -> float:
+    return float(np.polyfit(np.arange(len(values)), values, 1)[0])
+
+
+class TestMetricRingBuffer:
+    """Test cases for the circular buffer and its rolling windows."""
+
+    @pytest.mark.unit
+    def test_rolling_statistics_match_recomputed_values(self: Self, monkeypatch):
+        monkeypatch.setattr(metric_store, "REBASE_INTERVAL", 97)
+        rng = np.random.default_rng(0)
+        buffer = MetricRingBuffer(capacity=64, windows=(10, 50), initial_capacity=4)
+
+        for i, value in enumerate(1000.0 + rng.normal(0, 5, 500) + 0.1 * np.arange(500)):
+            buffer.append(float(i), float(value))
+            for size, window in buffer.windows.items():
+                recent = buffer.values(size)
+                assert window.count == len(recent)
+                assert window.mean == pytest.approx(recent.mean())
+                if len(recent) > 1:
+                    assert window.variance == pytest.approx(statistics.variance(recent), rel=1e-6)
+                    assert window.slope == pytest.approx(_reference_slope(recent), rel=1e-6, abs=1e-9)
+
+        assert len(buffer) == 64
+        np.testing.assert_array_equal(buffer.timestamps(), np.arange(436, 500, dtype=float))
+
+    @pytest.mark.unit
+    def test_variance_survives_large_offset(self: Self):
+        rng = np.random.default_rng(1)
+        buffer = MetricRingBuffer(capacity=128, windows=(50,))
+        samples = 1e7 + rng.normal(0, 0.01, 120)
+
+        for i, value in enumerate(samples):
+            buffer.append(float(i), float(value))
+
+        window = buffer.window(50)
+        recent = buffer.values(50)
+        assert window.variance == pytest.approx(statistics.variance(recent), rel=1e-6)
+        assert window.mean == pytest.approx(recent.mean(), rel=1e-12)
+        assert window.total == pytest.approx(recent.sum(), rel=1e-12)
+
+        window.reset(recent)
+        assert window.stdev == pytest.approx(statistics.stdev(recent), rel=1e-6)
+
+    @pytest.mark.unit
+    def test_time_eviction_shrinks_windows(self: Self):
+        buffer = MetricRingBuffer(capacity=8, windows=(5,))
+        for i in range(8):
+            buffer.append(float(i), float(i * i))
+
+        assert buffer.evict_older_than(5.0) == 5
+        assert len(buffer) == 3
+        np.testing.assert_array_equal(buffer.values(), [25.0, 36.0, 49.0])
+        window = buffer.window(5)
+        assert window.count == 3
+        assert window.mean == pytest.approx(110.0 / 3)
+        assert window.slope == pytest.approx(_reference_slope(np.array([25.0, 36.0, 49.0])))
+
+        buffer.append(8.0, 64.0)
+        assert buffer.latest() == 64.0
+        assert buffer.window(5).mean == pytest.approx((25 + 36 + 49 + 64) / 4)
+
+    @pytest.mark.unit
+    def test_rejects_window_larger_than_capacity(self: Self):
+        with pytest.raises(ValueError, match="largest window"):
+            MetricRingBuffer(capacity=10, windows=(20,))
+
+
+class TestPerformanceMonitorStorage:
+    """Test cases for KPI, threshold and analytics reads from the metric store."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_analytics_read_rolling_windows(self: Self):
+        config = PerformanceConfiguration(
+            system_name="test",
+            max_samples_per_metric=200,
+            performance_thresholds=[
+                PerformanceThreshold(
+                    metric_name="line_throughput",
+                    metric_type=PerformanceMetric.THROUGHPUT,
+                    warning_threshold=100.0,
+                    critical_threshold=150.0,
+                    time_window_minutes=3,
+                )
+            ],
+            kpis=[
+                KPIConfiguration(
+                    kpi_name="throughput",
+                    description="Average throughput",
+                    calculation_method="average",
+                    target_value=100.0,
+                    unit="units/h",
+                )
+            ],
+        )
+        monitor = ProductionPerformanceMonitor(config=config)
+        monitor._kpi_metrics = {"throughput": []}
+        buffer = monitor.register_metric("line_throughput", "throughput", windows=(3,))
+        values = 2.0 * np.arange(300, dtype=float)
+        for i, value in enumerate(values):
+            buffer.append(float(i), float(value))
+
+        await monitor._update_kpis()
+        await monitor._check_thresholds()
+        await monitor._update_analytics()
+
+        assert monitor._kpi_values["throughput"] == pytest.approx(values[-100:].mean())
+        assert monitor._alert_history[-1]["current_value"] == pytest.approx(values[-3:].mean())
+        assert monitor._alert_history[-1]["alert_level"] == "CRITICAL"
+        assert monitor._trend_analysis["line_throughput"]["trend"] == pytest.approx(2.0)
+        assert monitor.get_performance_summary()["data_statistics"]["line_throughput"]["data_points"] == 200
+        assert [dp.value for dp in monitor.get_data_points("line_throughput", 2)] == [596.0, 598.0]
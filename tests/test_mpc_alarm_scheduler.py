@@ -0,0 +1,115 @@
+"""Tests for deadline-driven escalation and incremental statistics in ProductionAlarmManager."""
+
+import asyncio
+from datetime import timedelta
+from typing import Self
+
+import pytest
+
+from src.ignition.modules.mpc_framework.alarm_manager import (
+    AlarmConfiguration,
+    AlarmDefinition,
+    AlarmPriority,
+    ProductionAlarmManager,
+)
+
+
+def _definition(alarm_id: str, priority: AlarmPriority, category: str = "process") -> AlarmDefinition:
+    return AlarmDefinition(
+        alarm_id=alarm_id,
+        name=alarm_id,
+        description=alarm_id,
+        priority=priority,
+        category=category,
+        source_system="test",
+        escalation_timeout_minutes=1,
+    )
+
+
+def _manager() -> ProductionAlarmManager:
+    config = AlarmConfiguration(
+        system_name="test",
+        alarm_retention_days=1,
+        alarm_definitions=[
+            _definition("a1", AlarmPriority.HIGH),
+            _definition("a2", AlarmPriority.HIGH, "pressure"),
+            _definition("a3", AlarmPriority.LOW),
+        ],
+        notification_rules=[],
+    )
+    return ProductionAlarmManager(config=config)
+
+
+class TestAlarmScheduler:
+    """Test cases for the escalation heap, wake-ups and retention."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_escalates_exactly_at_deadlines(self: Self):
+        async with _manager().managed_alarm_session() as manager:
+            await manager.create_alarm("a1")
+            await manager.create_alarm("a2")
+            alarm = manager._active_alarms["a1"]
+            created = alarm.created_at.timestamp()
+
+            assert 59.0 < manager._seconds_until_next_deadline() <= 60.0
+            assert await manager._process_escalations(now=created + 59.999) == 0
+            assert await manager._process_escalations(now=created + 60.0) == 1
+            assert alarm.escalation_level == 1
+
+            await manager.acknowledge_alarm("a2", "operator")
+            assert await manager._process_escalations(now=created + 120.5) == 1
+            assert alarm.escalation_level == 2
+            assert manager._active_alarms["a2"].escalation_level == 0
+
+            await manager.acknowledge_alarm("a1", "operator")
+            assert await manager._process_escalations(now=created + 600.0) == 0
+            assert manager._escalation_queue == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_processing_loop_wakes_for_earlier_deadline(self: Self):
+        async with _manager().managed_alarm_session() as manager:
+            await manager.create_alarm("a1")
+            alarm = manager._active_alarms["a1"]
+            await asyncio.sleep(0)
+
+            # Pull the deadline forward; the sleeping loop must notice without polling
+            deadline = alarm.created_at.timestamp() + 0.05
+            manager._escalation_queue.clear()
+            manager._schedule_escalation(alarm, deadline)
+            await asyncio.sleep(0.3)
+
+            assert alarm.escalation_level == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_statistics_follow_transitions_and_retention(self: Self):
+        async with _manager().managed_alarm_session() as manager:
+            for alarm_id in ("a1", "a2", "a3"):
+                await manager.create_alarm(alarm_id)
+            await manager._process_escalations(now=manager._active_alarms["a1"].created_at.timestamp() + 60)
+            await manager.acknowledge_alarm("a2", "operator")
+            await manager.suppress_alarm("a3", "operator")
+            await manager.clear_alarm("a1")
+
+            stats = manager.get_status()["statistics"]
+            assert stats["total_alarms"] == 3
+            assert stats["active_alarms"] == 2
+            assert stats["acknowledged_alarms"] == 1
+            assert stats["suppressed_alarms"] == 1
+            assert stats["cleared_alarms"] == 1
+            assert stats["by_priority"]["HIGH"] == 1
+            assert stats["by_priority"]["LOW"] == 1
+            assert stats["by_category"] == {"process": 1, "pressure": 1}
+            assert stats["escalation_rate"] == 0.0
+
+            await manager.clear_alarm("a3")
+            cleared_at = manager._alarm_history[-1].cleared_at
+            assert await manager._cleanup_old_alarms(now=cleared_at + timedelta(days=1)) == 2
+
+            stats = manager.get_status()["statistics"]
+            assert stats["total_alarms"] == 1
+            assert stats["cleared_alarms"] == 0
+            assert stats["suppressed_alarms"] == 0
+            assert stats["average_resolution_time"] == 0.0
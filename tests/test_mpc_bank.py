@@ -0,0 +1,85 @@
+"""Tests for the vectorised MPCControllerBank."""
+
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.mpc_framework.mpc_bank import MPCControllerBank
+from src.ignition.modules.mpc_framework.mpc_controller import (
+    ControlConstraints,
+    MPCConfiguration,
+    ProcessModel,
+    ProductionMPCController,
+)
+
+
+def _config(gain: float, time_constant: float, horizon: int = 10, u_max: float = 100.0) -> MPCConfiguration:
+    return MPCConfiguration(
+        prediction_horizon=horizon,
+        control_horizon=max(1, horizon // 2),
+        sample_time=1.0,
+        Q=[[1.0]],
+        R=[[0.1]],
+        process_model=ProcessModel(
+            model_type="FOPDT",
+            parameters={"gain": gain, "time_constant": time_constant, "dead_time": 0.0},
+            sample_time=1.0,
+        ),
+        constraints=ControlConstraints(u_min=[-u_max], u_max=[u_max], du_min=[-1.0], du_max=[1.0]),
+    )
+
+
+class TestMPCControllerBank:
+    """Test cases for batched Kalman updates and control moves."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_matches_individual_controllers(self: Self):
+        configs = [_config(1.0 + i * 0.25, 2.0 + i, horizon=5 + i) for i in range(4)]
+        controllers = [ProductionMPCController(config=config) for config in configs]
+        for controller in controllers:
+            await controller.initialize()
+        bank = MPCControllerBank(configs)
+        assert (await bank.initialize())["success"]
+
+        rng = np.random.default_rng(0)
+        for _ in range(5):
+            outputs = rng.normal(size=4)
+            setpoints = rng.normal(size=4)
+            expected = [
+                (await controller.compute_control(float(y), float(r)))["control_output"]
+                for controller, y, r in zip(controllers, outputs, setpoints, strict=True)
+            ]
+
+            np.testing.assert_allclose(bank.step(outputs, setpoints), expected, rtol=1e-6, atol=1e-8)
+
+        states = [float(np.ravel(c._state_estimator["current_state"])[0]) for c in controllers]
+        np.testing.assert_allclose(bank.get_states()[:, 0], states)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clips_to_bounds_and_tracks_throughput(self: Self):
+        bank = MPCControllerBank([_config(1.0, 3.0, u_max=0.5), _config(2.0, 1.0)])
+        await bank.initialize()
+
+        result = await bank.compute_control(np.zeros(2), 5.0)
+
+        assert result["success"]
+        controls = result["control_outputs"]
+        assert controls[0] == 0.5
+        assert controls[1] > 0.5
+        metrics = bank.get_status()["performance_metrics"]
+        assert metrics["clipped_controls"] == 1
+        assert metrics["loops_per_second"] > 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rejects_wrong_output_count(self: Self):
+        bank = MPCControllerBank([_config(1.0, 3.0)])
+        await bank.initialize()
+
+        result = await bank.compute_control(np.zeros(3), 1.0)
+
+        assert not result["success"]
+        assert np.array_equal(result["control_outputs"], np.zeros(1))
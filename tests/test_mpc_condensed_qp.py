@@ -0,0 +1,99 @@
+"""Tests for the condensed QP path in ProductionMPCController."""
+
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.mpc_framework.mpc_controller import (
+    ControlConstraints,
+    MPCConfiguration,
+    ProcessModel,
+    ProductionMPCController,
+    build_condensed_qp,
+)
+
+
+def _config(horizon: int = 10, control_horizon: int | None = None, u_max: float = 10.0, solver: str = "condensed_qp"):
+    return MPCConfiguration(
+        prediction_horizon=horizon,
+        control_horizon=control_horizon or horizon,
+        sample_time=1.0,
+        Q=[[1.0]],
+        R=[[0.1]],
+        process_model=ProcessModel(
+            model_type="FOPDT",
+            parameters={"gain": 1.5, "time_constant": 3.0, "dead_time": 0.5},
+            sample_time=1.0,
+        ),
+        constraints=ControlConstraints(u_min=[-u_max], u_max=[u_max], du_min=[-2.0], du_max=[2.0]),
+        solver=solver,
+    )
+
+
+async def _run(config: MPCConfiguration, steps: int = 5) -> tuple[ProductionMPCController, list[float]]:
+    controller = ProductionMPCController(config=config)
+    assert (await controller.initialize())["success"]
+    controls = []
+    for i in range(steps):
+        result = await controller.compute_control(current_output=1.0 + 0.1 * i, setpoint=2.5)
+        assert result["success"]
+        controls.append(result["control_output"])
+    return controller, controls
+
+
+class TestCondensedQP:
+    """Test cases for the precomputed prediction matrices and the QP solve."""
+
+    @pytest.mark.unit
+    def test_prediction_matrices_match_simulation(self: Self):
+        A = np.array([[0.9, 0.1], [0.0, 0.8]])
+        B = np.array([[0.0], [0.5]])
+        C = np.array([[1.0, 0.0]])
+        qp = build_condensed_qp(A, B, C, _config(horizon=8, control_horizon=3))
+
+        x0 = np.array([0.3, -0.2])
+        u = np.array([1.0, -0.5, 0.25])
+        x, outputs = x0, []
+        for k in range(8):
+            x = A @ x + B @ u[[min(k, 2)]]
+            outputs.append((C @ x)[0])
+
+        np.testing.assert_allclose(qp["phi"] @ x0 + qp["gamma"] @ u, outputs)
+        np.testing.assert_allclose(qp["hessian"], qp["hessian"].T)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("u_max", [10.0, 1.0])
+    async def test_matches_slsqp(self: Self, u_max: float):
+        _, qp_controls = await _run(_config(u_max=u_max))
+        _, slsqp_controls = await _run(_config(u_max=u_max, solver="slsqp"))
+
+        np.testing.assert_allclose(qp_controls, slsqp_controls, atol=1e-3)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_warm_start_and_latency_histogram(self: Self):
+        controller, controls = await _run(_config(horizon=50, u_max=1.0))
+
+        assert controls == [1.0] * 5
+        assert controller._last_solution.shape == (50,)
+        summary = controller.get_performance_summary()
+        assert summary["system_performance"]["qp_solves"] == 5
+        assert sum(summary["latency_histogram"].values()) == 5
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_falls_back_to_slsqp(self: Self, monkeypatch):
+        def fail(setpoint: float) -> float:
+            raise RuntimeError("QP did not converge")
+
+        controller = ProductionMPCController(config=_config())
+        await controller.initialize()
+        monkeypatch.setattr(controller, "_solve_condensed_qp", fail)
+
+        result = await controller.compute_control(current_output=1.0, setpoint=2.5)
+
+        assert result["success"]
+        assert result["control_output"] > 0
+        assert controller._performance_metrics["qp_fallbacks"] == 1
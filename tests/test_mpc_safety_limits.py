@@ -0,0 +1,114 @@
+"""Tests for the compiled safety-limit index and batch parameter updates."""
+
+import time
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.mpc_framework.safety_system import (
+    AlarmPriority,
+    EmergencyProcedure,
+    ProductionSafetySystem,
+    SafetyConfiguration,
+    SafetyLevel,
+    SafetyLimit,
+)
+
+
+def _safety_system() -> ProductionSafetySystem:
+    config = SafetyConfiguration(
+        system_name="test",
+        safety_level=SafetyLevel.SIL_2,
+        watchdog_interval=60.0,
+        safety_limits=[
+            SafetyLimit(
+                parameter_name="temperature",
+                low_limit=10.0,
+                high_limit=85.0,
+                safety_level=SafetyLevel.SIL_2,
+                alarm_priority=AlarmPriority.MEDIUM,
+            ),
+            SafetyLimit(
+                parameter_name="pressure",
+                high_limit=100.0,
+                safety_level=SafetyLevel.SIL_2,
+                alarm_priority=AlarmPriority.HIGH,
+            ),
+            SafetyLimit(
+                parameter_name="level",
+                low_limit=5.0,
+                safety_level=SafetyLevel.SIL_1,
+                alarm_priority=AlarmPriority.LOW,
+            ),
+        ],
+        emergency_procedures=[
+            EmergencyProcedure(
+                procedure_id="shutdown",
+                name="Shutdown",
+                trigger_conditions=["critical alarm"],
+                safety_level=SafetyLevel.SIL_3,
+                timeout_seconds=1.0,
+                steps=["Stop pumps"],
+            )
+        ],
+    )
+    return ProductionSafetySystem(config=config)
+
+
+class TestSafetyLimitIndex:
+    """Test cases for indexed limit checks and batch updates."""
+
+    @pytest.mark.unit
+    def test_index_aligns_limits_to_parameter_names(self: Self):
+        system = _safety_system()
+
+        assert system.parameter_names == ["temperature", "pressure", "level"]
+        np.testing.assert_array_equal(system._low_limits, [10.0, -np.inf, 5.0])
+        np.testing.assert_array_equal(system._high_limits, [85.0, 100.0, np.inf])
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batch_raises_only_violated_alarms(self: Self):
+        async with _safety_system().managed_safety_session() as system:
+            result = await system.update_parameters_batch(
+                {"temperature": 5.0, "pressure": 50.0, "level": 6.0, "flow": 3.0}
+            )
+
+            assert result["success"]
+            assert (result["updated"], result["checked"]) == (4, 3)
+            assert [v["alarm_created"] for v in result["violations"]] == ["temperature_low_limit"]
+            assert list(system._active_alarms) == ["temperature_low_limit"]
+            assert system._parameter_values["flow"] == 3.0
+
+            result = await system.update_parameters_batch(np.array([50.0, 120.0, 1.0]))
+
+            assert [(v["parameter"], v["violation"]) for v in result["violations"]] == [
+                ("level", "low"),
+                ("pressure", "high"),
+            ]
+            assert result["current_state"] == "ALARM"
+            assert not (await system.update_parameters_batch([1.0, 2.0]))["success"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_single_updates_match_batch_checks(self: Self):
+        async with _safety_system().managed_safety_session() as system:
+            high = await system.update_parameter("temperature", 90.0)
+            unlimited = await system.update_parameter("flow", 1e6)
+
+            assert high["safety_check"]["limit_violated"] == 85.0
+            assert unlimited["safety_check"]["safe"]
+            assert system.get_status()["latency_ms"]["update"]["samples"] == 2
+            assert set(system.get_status()["latency_ms"]["update"]) == {"samples", "p50", "p95", "p99"}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_watchdog_flags_stale_parameters(self: Self):
+        async with _safety_system().managed_safety_session() as system:
+            await system.update_parameters_batch({"pressure": 50.0})
+            system._update_times[[0, 2]] = time.time() - 120
+
+            await system._check_safety_parameters()
+
+            assert sorted(system._active_alarms) == ["level_stale_data", "temperature_stale_data"]
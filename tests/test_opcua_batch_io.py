@@ -0,0 +1,67 @@
+"""Tests for batched multi-node reads and writes in IgnitionOPCUAClient."""
+
+from typing import Self
+from unittest.mock import AsyncMock
+
+import pytest
+from asyncua import ua
+
+from src.ignition.opcua.client import IgnitionOPCUAClient
+
+
+def _data_value(value: float, good: bool = True) -> ua.DataValue:
+    status = ua.StatusCode() if good else ua.StatusCode(ua.StatusCodes.BadNodeIdUnknown)
+    return ua.DataValue(ua.Variant(value), StatusCode=status)
+
+
+@pytest.fixture
+def client():
+    opc = IgnitionOPCUAClient("opc.tcp://localhost:4840", batch_concurrency=2)
+    opc.connected = True
+    opc._operation_limits = {"read": 3, "write": 2}
+    return opc
+
+
+class TestBatchIO:
+    """Test cases for chunked, concurrent batch operations."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_read_values_chunks_and_reports_per_node_errors(self: Self, client):
+        async def read_attributes(nodes):
+            return [_data_value(float(node.nodeid.Identifier), node.nodeid.Identifier != 4) for node in nodes]
+
+        client.client.read_attributes = AsyncMock(side_effect=read_attributes)
+        node_ids = [f"ns=2;i={i}" for i in range(1, 8)] + ["not a node id"]
+
+        values = await client.read_values(node_ids)
+
+        assert client.client.read_attributes.await_count == 3
+        assert values == [1.0, 2.0, 3.0, None, 5.0, 6.0, 7.0, None]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_chunk_does_not_fail_other_chunks(self: Self, client):
+        async def read_attributes(nodes):
+            if nodes[0].nodeid.Identifier == 4:
+                raise ConnectionError("chunk failed")
+            return [_data_value(1.0) for _ in nodes]
+
+        client.client.read_attributes = AsyncMock(side_effect=read_attributes)
+
+        values = await client.read_values([f"ns=2;i={i}" for i in range(1, 8)])
+
+        assert values == [1.0, 1.0, 1.0, None, None, None, 1.0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_write_values_uses_multi_node_writes(self: Self, client):
+        async def write_attributes(nodeids, data_values, attr):
+            return [ua.StatusCode(ua.StatusCodes.BadTypeMismatch if n.Identifier == 3 else 0) for n in nodeids]
+
+        client.client.uaclient.write_attributes = AsyncMock(side_effect=write_attributes)
+
+        results = await client.write_values({f"ns=2;i={i}": float(i) for i in range(1, 6)})
+
+        assert client.client.uaclient.write_attributes.await_count == 3
+        assert results == {"ns=2;i=1": True, "ns=2;i=2": True, "ns=2;i=3": False, "ns=2;i=4": True, "ns=2;i=5": True}
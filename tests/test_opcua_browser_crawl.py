@@ -0,0 +1,169 @@
+"""Tests for the breadth-first address-space crawler in AddressSpaceBrowser."""
+
+import socket
+from typing import Self
+
+import pytest
+from asyncua import Client, Server
+
+from src.ignition.opcua.browser import AddressSpaceBrowser
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _start_server(url: str) -> tuple[Server, str]:
+    """Start a server with Provider/Area{i}/Machine{j}/Tag{k}, plus one node reachable from two parents."""
+    server = Server()
+    await server.init()
+    server.set_endpoint(url)
+    namespace = await server.register_namespace("urn:ign-scripts:test")
+    provider = await server.nodes.objects.add_folder(namespace, "Provider")
+    shared = None
+    for i in range(3):
+        area = await provider.add_folder(namespace, f"Area{i}")
+        for j in range(2):
+            machine = await area.add_object(namespace, f"Machine{i}{j}")
+            for k in range(4):
+                await machine.add_variable(namespace, f"Tag{i}{j}{k}", float(k))
+        if shared is None:
+            shared = await area.add_variable(namespace, "Shared", 1.0)
+        else:
+            await area.add_reference(shared.nodeid, "i=35")  # Organizes
+    await server.start()
+    return server, provider.nodeid.to_string()
+
+
+class TestAddressSpaceCrawl:
+    """Test cases for AddressSpaceBrowser.crawl and the snapshot lookups."""
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_crawl_snapshot_and_lookups(self: Self):
+        url = f"opc.tcp://127.0.0.1:{_free_port()}/test/"
+        server, provider_id = await _start_server(url)
+        try:
+            client = Client(url)
+            client.secure_channel_timeout = 10000
+            async with client:
+                browser = AddressSpaceBrowser(client, concurrency=2, batch_size=4)
+
+                nodes = [info async for info in browser.crawl(provider_id, max_depth=3)]
+
+                # root + 3 areas + 6 machines + 24 tags + 1 shared node (visited once)
+                assert len(nodes) == 35
+                assert [info["depth"] for info in nodes] == sorted(info["depth"] for info in nodes)
+                assert sum(info["browse_name"].endswith("'Shared')") for info in nodes) == 1
+
+                tag = next(info for info in nodes if "Tag110" in info["browse_name"])
+                assert tag["node_class"] == "Variable"
+                assert tag["value"] == 0.0
+                assert tag["has_children"] is False
+
+                tree = browser.build_tree(provider_id, max_depth=2)
+                assert len(tree["children"]) == 3
+                machines = [m for area in tree["children"] for m in area["children"] if m["node_class"] == "Object"]
+                assert len(machines) == 6
+                assert all(m["has_children"] and "children" not in m for m in machines)
+
+                await server.stop()
+                server = None
+
+                # Answered from the snapshot with the server gone
+                path = await browser.get_node_path(tag["node_id"])
+                assert [name.split("Name=")[1] for name in path] == [
+                    "'Objects')",
+                    "'Provider')",
+                    "'Area1')",
+                    "'Machine11')",
+                    "'Tag110')",
+                ]
+                matches = await browser.find_nodes_by_browse_name("Machine1", provider_id)
+                assert sorted(m["browse_name"].split("'")[1] for m in matches) == ["Machine10", "Machine11"]
+        finally:
+            if server is not None:
+                await server.stop()
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_browse_tree_marks_last_level(self: Self):
+        url = f"opc.tcp://127.0.0.1:{_free_port()}/test/"
+        server, provider_id = await _start_server(url)
+        try:
+            client = Client(url)
+            client.secure_channel_timeout = 10000
+            async with client:
+                tree = await AddressSpaceBrowser(client).browse_tree(provider_id, max_depth=1)
+
+                assert "children" in tree
+                assert len(tree["children"]) == 3
+                assert all(child["has_children"] for child in tree["children"])
+                assert all("children" not in child for child in tree["children"])
+        finally:
+            await server.stop()
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_search_recrawls_below_a_shallow_snapshot(self: Self):
+        url = f"opc.tcp://127.0.0.1:{_free_port()}/test/"
+        server, provider_id = await _start_server(url)
+        try:
+            client = Client(url)
+            client.secure_channel_timeout = 10000
+            async with client:
+                browser = AddressSpaceBrowser(client)
+                assert len([info async for info in browser.crawl(provider_id, max_depth=1)]) == 4
+
+                matches = await browser.find_nodes_by_browse_name("Tag110", provider_id)
+
+                assert [m["browse_name"].split("'")[1] for m in matches] == ["Tag110"]
+                assert matches[0]["depth"] == 3
+        finally:
+            await server.stop()
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_shared_node_is_linked_under_every_parent(self: Self):
+        url = f"opc.tcp://127.0.0.1:{_free_port()}/test/"
+        server, provider_id = await _start_server(url)
+        try:
+            client = Client(url)
+            client.secure_channel_timeout = 10000
+            async with client:
+                browser = AddressSpaceBrowser(client, batch_size=1)
+                tree = await browser.browse_tree(provider_id, max_depth=2)
+
+                for area in tree["children"]:
+                    assert sum(child["browse_name"].endswith("'Shared')") for child in area["children"]) == 1
+                matches = await browser.find_nodes_by_browse_name("Shared", provider_id)
+                assert len(matches) == 1
+        finally:
+            await server.stop()
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_browse_tree_drops_nodes_deleted_on_the_server(self: Self):
+        url = f"opc.tcp://127.0.0.1:{_free_port()}/test/"
+        server, provider_id = await _start_server(url)
+        try:
+            client = Client(url)
+            client.secure_channel_timeout = 10000
+            async with client:
+                browser = AddressSpaceBrowser(client)
+                nodes = [info async for info in browser.crawl(provider_id, max_depth=3)]
+                machine = next(info for info in nodes if "Machine11" in info["browse_name"])
+                tags = [info["node_id"] for info in nodes if info.get("parent_id") == machine["node_id"]]
+                assert len(tags) == 4
+
+                await server.delete_nodes([server.get_node(machine["node_id"])], recursive=True)
+                tree = await browser.browse_tree(provider_id, max_depth=2)
+
+                machines = [m["browse_name"] for area in tree["children"] for m in area["children"]]
+                assert not any("Machine11" in name for name in machines)
+                assert machine["node_id"] not in browser.snapshot
+                assert not any(tag in browser.snapshot for tag in tags)
+        finally:
+            await server.stop()
@@ -0,0 +1,115 @@
+"""Tests for bounded micro-batch streaming in the data integration adapters."""
+
+import asyncio
+from typing import Any, Self
+
+import pytest
+
+from src.ignition.modules.data_integration.adapters.opcua_adapter import OPCUAAdapter
+from src.ignition.modules.data_integration.adapters.streaming import OverflowPolicy, StreamBuffer
+from src.ignition.modules.data_integration.integration_module import DataSourceConfig, DataSourceType
+
+
+async def _collect(buffer: StreamBuffer) -> list[list[dict[str, Any]]]:
+    return [batch async for batch in buffer.batches()]
+
+
+class FakeSubscriptionClient:
+    """Stands in for IgnitionOPCUAClient subscriptions."""
+
+    def __init__(self) -> None:
+        self.callback = None
+        self.unsubscribed: list[str] = []
+
+    async def subscribe_nodes(self, node_ids: list[str], callback, interval: float = 1000.0) -> str:
+        self.callback = callback
+        return "sub-1"
+
+    async def unsubscribe(self, subscription_id: str) -> bool:
+        self.unsubscribed.append(subscription_id)
+        return True
+
+    async def disconnect(self) -> None:
+        pass
+
+
+class TestStreamBuffer:
+    """Test cases for overflow policies and micro-batching."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_newest_records(self: Self):
+        buffer = StreamBuffer(max_size=4, batch_size=3, batch_window=0.0)
+        for i in range(10):
+            buffer.offer({"node_id": "a", "value": i})
+        buffer.close()
+
+        batches = await _collect(buffer)
+
+        assert [[r["value"] for r in batch] for batch in batches] == [[6, 7, 8], [9]]
+        assert (buffer.stats.received, buffer.stats.delivered, buffer.stats.dropped) == (10, 4, 6)
+        assert buffer.stats.max_depth == 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_latest_value_per_node(self: Self):
+        buffer = StreamBuffer(max_size=2, overflow="coalesce", batch_window=0.0)
+        for i, node in enumerate("ababca"):
+            buffer.offer({"node_id": node, "value": i})
+        buffer.close()
+
+        batches = await _collect(buffer)
+
+        assert [(r["node_id"], r["value"]) for r in batches[0]] == [("c", 4), ("a", 5)]
+        assert (buffer.stats.dropped, buffer.stats.coalesced) == (2, 2)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_block_waits_for_consumer_without_loss(self: Self):
+        buffer = StreamBuffer(max_size=2, batch_size=2, batch_window=0.0, overflow=OverflowPolicy.BLOCK)
+
+        async def produce() -> None:
+            for i in range(20):
+                await buffer.put({"node_id": "a", "value": i})
+            buffer.close()
+
+        producer = asyncio.create_task(produce())
+        batches = await _collect(buffer)
+        await producer
+
+        assert [r["value"] for batch in batches for r in batch] == list(range(20))
+        assert buffer.stats.dropped == 0
+        assert buffer.stats.blocked > 0
+        assert buffer.stats.max_depth <= 2
+
+
+class TestOPCUAAdapterStreaming:
+    """Test cases for OPC-UA subscriptions delivered as micro-batches."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stream_batches_data_changes_until_disconnect(self: Self):
+        config = DataSourceConfig(
+            source_id="plc", source_type=DataSourceType.OPC_UA, connection_params={"url": "opc.tcp://plc:4840"}
+        )
+        adapter = OPCUAAdapter(config)
+        client = FakeSubscriptionClient()
+        adapter._client, adapter._connected = client, True
+
+        async def consume() -> list[list[dict[str, Any]]]:
+            query = {"node_ids": ["ns=2;s=A", "ns=2;s=B"]}
+            return [batch async for batch in adapter.stream(query, batch_size=100, overflow="coalesce")]
+
+        consumer = asyncio.create_task(consume())
+        while client.callback is None:
+            await asyncio.sleep(0)
+        for i in range(500):
+            client.callback("ns=2;s=A" if i % 2 else "ns=2;s=B", i)
+        assert adapter.get_connection_info()["streams"][0]["coalesced"] == 498
+
+        await adapter.disconnect()
+        batches = await consumer
+
+        assert {r["node_id"]: r["value"] for batch in batches for r in batch} == {"ns=2;s=A": 499, "ns=2;s=B": 498}
+        assert batches[0][0]["source_id"] == "plc"
+        assert adapter._streams == []
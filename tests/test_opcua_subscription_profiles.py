@@ -0,0 +1,133 @@
+"""Tests for monitoring profiles and sampling-class grouping in the SubscriptionManager."""
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncua import Node, ua
+from asyncua.common.subscription import DataChangeNotif, Subscription, SubscriptionItemData
+
+from src.ignition.opcua.subscription import DeadbandType, MonitoringProfile, SubscriptionManager
+
+ANALOG = MonitoringProfile(sampling_interval=500.0, deadband_type=DeadbandType.ABSOLUTE, deadband_value=0.5)
+DISCRETE = MonitoringProfile(sampling_interval=100.0, queue_size=5, discard_oldest=False)
+
+
+class FakeClient:
+    """asyncua client double whose subscriptions record CreateMonitoredItems batches."""
+
+    def __init__(self) -> None:
+        self.subscriptions: dict[float, Subscription] = {}
+        self.batches: dict[float, list[list[ua.MonitoredItemCreateRequest]]] = {}
+
+    async def create_subscription(self, period: float, handler) -> Subscription:
+        subscription = Subscription(MagicMock(), ua.CreateSubscriptionParameters(), handler)
+        subscription.subscription_id = len(self.subscriptions) + 1
+        subscription.delete = AsyncMock()
+        self.subscriptions[period] = subscription
+        self.batches[period] = []
+
+        async def create_monitored_items(requests):
+            self.batches[period].append(requests)
+            return [
+                ua.StatusCode(ua.StatusCodes.BadNodeIdUnknown)
+                if request.ItemToMonitor.NodeId.Identifier == 0
+                else request.RequestedParameters.ClientHandle
+                for request in requests
+            ]
+
+        subscription.create_monitored_items = create_monitored_items
+        return subscription
+
+    def get_node(self, node_id: str) -> Node:
+        return Node(MagicMock(), node_id)
+
+
+def _notification(status: int = 0) -> DataChangeNotif:
+    item = ua.MonitoredItemNotification()
+    item.Value = ua.DataValue(ua.Variant(1.0), StatusCode=ua.StatusCode(status))
+    return DataChangeNotif(SubscriptionItemData(), item)
+
+
+class TestSubscriptionProfiles:
+    """Test cases for per-item monitoring parameters and batching."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_items_are_grouped_by_sampling_class_with_profile_parameters(self: Self):
+        client = FakeClient()
+        manager = SubscriptionManager(client, max_monitored_items_per_call=3)
+        node_ids = [f"ns=2;i={i}" for i in range(8)]
+
+        subscription_id = await manager.create_subscription(
+            node_ids, lambda node_id, value: None, profile=ANALOG, item_profiles={"ns=2;i=7": DISCRETE}
+        )
+
+        assert set(client.subscriptions) == {500.0, 100.0}
+        assert [len(batch) for batch in client.batches[500.0]] == [3, 3, 1]
+        analog = client.batches[500.0][0][1].RequestedParameters
+        assert analog.SamplingInterval == 500.0
+        assert analog.Filter.DeadbandType == ua.DeadbandType.Absolute
+        assert analog.Filter.DeadbandValue == 0.5
+        (discrete,) = client.batches[100.0][0]
+        assert discrete.RequestedParameters.QueueSize == 5
+        assert discrete.RequestedParameters.DiscardOldest is False
+        assert discrete.RequestedParameters.Filter.Body is None
+
+        handles = [
+            request.RequestedParameters.ClientHandle
+            for batches in client.batches.values()
+            for batch in batches
+            for request in batch
+        ]
+        assert len(set(handles)) == len(handles) == 8
+
+        info = await manager.get_subscription_info(subscription_id)
+        assert info["monitored_items"] == 7
+        assert info["failed_items"] == 1
+        assert "ns=2;i=0" not in info["node_ids"]
+        assert sorted(info["subscription_id_internal"]) == [1, 2]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_added_nodes_join_existing_class_in_batches(self: Self):
+        client = FakeClient()
+        manager = SubscriptionManager(client, max_monitored_items_per_call=2)
+        subscription_id = await manager.create_subscription(["ns=2;i=1"], lambda node_id, value: None, profile="slow")
+
+        added = await manager.add_nodes_to_subscription(subscription_id, [f"ns=2;i={i}" for i in range(2, 7)], "slow")
+        unknown = await manager.add_nodes_to_subscription(subscription_id, ["ns=2;i=9"], "missing")
+
+        assert added
+        assert not unknown
+        assert list(client.subscriptions) == [10000.0]
+        assert [len(batch) for batch in client.batches[10000.0]] == [1, 2, 2, 1]
+        assert client.batches[10000.0][1][0].RequestedParameters.Filter.DeadbandType == ua.DeadbandType.Percent
+
+        assert await manager.remove_subscription(subscription_id)
+        client.subscriptions[10000.0].delete.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_status_reports_notification_rates_and_overflows(self: Self):
+        client = FakeClient()
+        manager = SubscriptionManager(client)
+        received = []
+        subscription_id = await manager.create_subscription(
+            ["ns=2;i=1"], lambda node_id, value: received.append(node_id), profile=DISCRETE
+        )
+        handler = manager.subscriptions[subscription_id]["handlers"][100.0]
+        node = client.get_node("ns=2;i=1")
+
+        for status in (0, 0, 0x480):
+            handler.datachange_notification(node, 1.0, _notification(status))
+
+        status = await manager.get_status()
+        stats = status["subscriptions"][subscription_id]
+        assert received == [str(node.nodeid)] * 3
+        assert status["server_subscriptions"] == 1
+        assert stats["notifications"] == 3
+        assert stats["overflows"] == 1
+        assert status["overflows"] == 1
+        assert stats["notification_rate"] > 0
+        assert stats["groups"][0]["publishing_interval"] == 100.0
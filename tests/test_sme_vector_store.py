@@ -0,0 +1,252 @@
+"""Tests for the stable-ID document vector store behind VectorEmbeddingEnhancement."""
+
+import sqlite3
+import threading
+from typing import Self
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.sme_agent.vector_embedding_enhancement import (
+    SearchMode,
+    VectorConfig,
+    VectorEmbeddingEnhancement,
+)
+from src.ignition.modules.sme_agent.vector_store import DocumentVectorStore
+
+DIMENSION = 8
+
+
+def _unit(index: int) -> list[float]:
+    vector = np.full(DIMENSION, 0.05, dtype=np.float32)
+    vector[index] = 1.0
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def _document(doc_id: str, axis: int, text: str | None = None) -> dict:
+    return {"id": doc_id, "text": text or f"text of {doc_id}", "embedding": _unit(axis), "metadata": {"axis": axis}}
+
+
+class KeywordEncoder:
+    """Embedding model double placing each known keyword on its own axis."""
+
+    KEYWORDS = ("pump", "valve", "tank", "motor")
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        vectors = np.full((len(texts), DIMENSION), 0.01, dtype=np.float32)
+        for row, text in enumerate(texts):
+            for axis, keyword in enumerate(self.KEYWORDS):
+                if keyword in text.lower():
+                    vectors[row, axis] = 1.0
+        return vectors
+
+
+class FakeNode(dict):
+    """Neo4j node double: a property mapping with labels."""
+
+    def __init__(self, labels: list[str], **properties) -> None:
+        super().__init__(properties)
+        self.labels = set(labels)
+
+
+class FakeNeo4jDriver:
+    """Neo4j driver double recording Cypher and answering full-text queries."""
+
+    def __init__(self, nodes: list[tuple[str, FakeNode]], existing_index: dict | None = None) -> None:
+        self.nodes = nodes
+        self.existing_index = existing_index
+        self.statements: list[tuple[str, dict]] = []
+        self.query_threads: list[int] = []
+
+    def session(self, database: str | None = None) -> "FakeNeo4jDriver":
+        return self
+
+    def __enter__(self) -> "FakeNeo4jDriver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def run(self, cypher: str, **params):
+        self.statements.append((cypher, params))
+        result = MagicMock()
+        if cypher.startswith("SHOW FULLTEXT INDEXES"):
+            result.single.return_value = self.existing_index
+            return result
+        if "db.index.fulltext.queryNodes" in cypher:
+            self.query_threads.append(threading.get_ident())
+            return [
+                {"node": node, "node_id": node_id, "score": 5.0 - rank}
+                for rank, (node_id, node) in enumerate(self.nodes[: params["max_results"]])
+            ]
+        return result
+
+
+class TestDocumentVectorStore:
+    """Test cases for ID mapping, updates and delta persistence."""
+
+    @pytest.mark.unit
+    def test_updated_document_resolves_to_its_new_version(self: Self):
+        store = DocumentVectorStore(DIMENSION, use_faiss=False)
+        store.add([_document("a", 0), _document("b", 1), _document("c", 2)])
+
+        store.add([_document("b", 3, "b moved"), _document("d", 1)])
+
+        (doc_id, score, doc), *_ = store.search(_unit(3), 2)
+        assert (doc_id, doc["text"]) == ("b", "b moved")
+        assert score == pytest.approx(1.0, abs=1e-5)
+        assert [hit[0] for hit in store.search(_unit(1), 1)] == ["d"]
+        assert len(store) == 4
+        assert store.index.ntotal == 4
+        assert store.vector_id("b") == 4
+
+    @pytest.mark.unit
+    def test_reopen_replays_log_past_checkpoint(self: Self, tmp_path):
+        store = DocumentVectorStore(DIMENSION, tmp_path, use_faiss=False)
+        store.add([_document(f"doc{i}", i) for i in range(4)])
+        assert store.checkpoint()
+        store.add([_document("doc1", 5, "doc1 v2"), _document("doc4", 6)])
+        assert store.delete(["doc2", "missing"]) == 1
+
+        reopened = DocumentVectorStore(DIMENSION, tmp_path, use_faiss=False)
+
+        assert [path.name for path in tmp_path.glob("index-*")] == ["index-4-0.npz"]
+        assert reopened.info()["pending_changes"] == 4
+        assert sorted(reopened.vector_id(f"doc{i}") for i in (0, 1, 3, 4)) == [1, 4, 5, 6]
+        assert reopened.index.ntotal == 4
+        assert reopened.search(_unit(5), 1)[0][2]["text"] == "doc1 v2"
+        assert reopened.search(_unit(2), 4)[-1][0] != "doc2"
+        with sqlite3.connect(tmp_path / "documents.sqlite") as db:
+            assert db.execute("SELECT COUNT(*) FROM documents").fetchone() == (6,)
+            assert db.execute("SELECT COUNT(*) FROM tombstones").fetchone() == (2,)
+
+        reopened.close()
+        assert [path.name for path in tmp_path.glob("index-*")] == ["index-6-2.npz"]
+
+    @pytest.mark.unit
+    def test_ivf_training_with_tuned_nprobe_survives_reopen(self: Self, tmp_path):
+        pytest.importorskip("faiss")
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(300, DIMENSION)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        documents = [
+            {"id": f"doc{i}", "text": f"text of doc{i}", "embedding": vector.tolist()}
+            for i, vector in enumerate(vectors)
+        ]
+        store = DocumentVectorStore(DIMENSION, tmp_path, index_type="IndexIVFFlat", ivf_train_threshold=200)
+        store.add(documents[:150])
+        assert not store.is_trained
+
+        store.add(documents[150:])
+
+        assert store.is_trained
+        assert store.stats["nprobe"] >= 1
+        store.close()
+
+        reopened = DocumentVectorStore(DIMENSION, tmp_path, index_type="IndexIVFFlat", ivf_train_threshold=200)
+        assert reopened.is_trained
+        assert len(reopened) == 300
+        assert reopened.search(vectors[42].tolist(), 1)[0][0] == "doc42"
+
+
+class TestVectorEmbeddingEnhancementSearch:
+    """Test cases for adding and searching documents through the enhancement."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_vector_search_after_re_adding_documents(self: Self, tmp_path):
+        config = VectorConfig(
+            embedding_dimension=DIMENSION,
+            use_faiss=False,
+            index_directory=str(tmp_path / "index"),
+            cache_directory=str(tmp_path / "cache"),
+        )
+        enhancement = VectorEmbeddingEnhancement(config)
+        enhancement.embedding_model = KeywordEncoder()
+        enhancement._create_directories()
+        enhancement._initialize_vector_store()
+
+        documents = [{"id": f"d{i}", "text": f"{kw} datasheet"} for i, kw in enumerate(KeywordEncoder.KEYWORDS)]
+        await enhancement.add_documents(documents, batch_size=3)
+        result = await enhancement.add_documents([{"id": "d0", "text": "tank level transmitter"}])
+        hits = await enhancement.hybrid_search("pump curve", SearchMode.VECTOR_ONLY)
+        tank_hits = await enhancement.hybrid_search("tank", SearchMode.VECTOR_ONLY, max_results=2)
+
+        assert result["total_documents"] == 4
+        assert hits == []
+        assert {hit.id for hit in tank_hits} == {"d0", "d2"}
+        assert enhancement.get_enhancement_stats()["index_info"]["index_size"] == 4
+        await enhancement.cleanup()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hybrid_search_fuses_concurrent_legs_and_caches(self: Self):
+        enhancement = VectorEmbeddingEnhancement(VectorConfig(embedding_dimension=DIMENSION, use_faiss=False))
+        enhancement.config.enable_persistence = False
+        enhancement.embedding_model = KeywordEncoder()
+        enhancement._initialize_vector_store()
+        await enhancement.add_documents([{"id": "d0", "text": "tank level"}, {"id": "d1", "text": "pump tank"}])
+        enhancement.neo4j_driver = FakeNeo4jDriver(
+            [("d1", FakeNode(["Task"], name="pump tank")), ("n7", FakeNode(["Pattern"], name="tank farm"))]
+        )
+
+        results = await enhancement.hybrid_search("tank (T-1)", SearchMode.HYBRID, max_results=3)
+        expected_ranks = dict(results[0].metadata["ranks"])
+        results[0].metadata["ranks"]["vector"] = 99
+        cached = await enhancement.hybrid_search("tank (T-1)", SearchMode.HYBRID, max_results=3)
+        cached[0].metadata["ranks"].clear()
+
+        assert [result.id for result in results] == ["d1", "d0", "n7"]
+        assert expected_ranks == {"vector": 2, "graph": 1}
+        assert next(iter(enhancement.query_cache.values()))[1][0].metadata["ranks"] == expected_ranks
+        assert results[0].score == pytest.approx(0.7 / 62 + 0.3 / 61)
+        assert all(result.source == "hybrid" for result in results)
+        assert enhancement.neo4j_driver.statements[0][1]["query"] == r"tank \(T\-1\)"
+        assert enhancement.neo4j_driver.query_threads != [threading.get_ident()]
+        assert [result.id for result in cached] == ["d1", "d0", "n7"]
+        assert enhancement.stats["query_cache_hits"] == 1
+
+        await enhancement.add_documents([{"id": "d2", "text": "motor"}])
+        await enhancement.hybrid_search("tank (T-1)", SearchMode.HYBRID, max_results=3)
+        assert len(enhancement.neo4j_driver.query_threads) == 2
+
+    @pytest.mark.unit
+    def test_fulltext_index_is_recreated_when_schema_changes(self: Self):
+        enhancement = VectorEmbeddingEnhancement(
+            VectorConfig(fulltext_labels=["Task", "Pattern"], fulltext_properties=["name"])
+        )
+        enhancement.neo4j_driver = FakeNeo4jDriver([], {"labelsOrTypes": ["Task"], "properties": ["name"]})
+
+        enhancement._ensure_fulltext_index()
+
+        statements = [cypher for cypher, _ in enhancement.neo4j_driver.statements]
+        assert statements[1] == "DROP INDEX `sme_knowledge_fulltext` IF EXISTS"
+        assert statements[2] == (
+            "CREATE FULLTEXT INDEX `sme_knowledge_fulltext` IF NOT EXISTS FOR (n:`Pattern`|`Task`) ON EACH [n.`name`]"
+        )
+        assert statements[3].startswith("CALL db.awaitIndex")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_graph_leg_is_skipped_when_fulltext_index_setup_fails(self: Self):
+        class NoFulltextDriver(FakeNeo4jDriver):
+            def run(self, cypher: str, **params):
+                if cypher.startswith("CREATE FULLTEXT INDEX"):
+                    raise RuntimeError("full-text indexes are not supported")
+                return super().run(cypher, **params)
+
+        enhancement = VectorEmbeddingEnhancement(VectorConfig(embedding_dimension=DIMENSION, use_faiss=False))
+        enhancement.config.enable_persistence = False
+        enhancement.embedding_model = KeywordEncoder()
+        enhancement._initialize_vector_store()
+        await enhancement.add_documents([{"id": "d0", "text": "tank level"}])
+        enhancement.neo4j_driver = NoFulltextDriver([("n7", FakeNode(["Pattern"], name="tank farm"))])
+
+        with pytest.raises(RuntimeError, match="not supported"):
+            enhancement._ensure_fulltext_index()
+        results = await enhancement.hybrid_search("tank", SearchMode.HYBRID)
+
+        assert [result.id for result in results] == ["d0"]
+        assert await enhancement.hybrid_search("tank farm", SearchMode.GRAPH_ONLY) == []
+        assert not any("queryNodes" in cypher for cypher, _ in enhancement.neo4j_driver.statements)
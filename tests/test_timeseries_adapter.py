@@ -0,0 +1,123 @@
+"""Tests for the TimeSeriesAdapter against the SQLite historian stand-in."""
+
+from datetime import datetime
+from typing import Self
+
+import numpy as np
+import pytest
+
+from src.ignition.modules.data_integration.adapters import timeseries_adapter
+from src.ignition.modules.data_integration.adapters.timeseries_adapter import (
+    TimeSeriesAdapter,
+    encode_copy_csv,
+    encode_line_protocol,
+)
+from src.ignition.modules.data_integration.integration_module import DataSourceConfig, DataSourceType
+
+START = np.datetime64("2024-01-15T10:00:00", "us")
+
+
+def _adapter(batch_size: int = 100) -> TimeSeriesAdapter:
+    config = DataSourceConfig(
+        source_id="historian",
+        source_type=DataSourceType.SQLITE,
+        connection_params={"database": ":memory:"},
+        batch_size=batch_size,
+        retry_attempts=2,
+    )
+    return TimeSeriesAdapter(config)
+
+
+class TestPointEncoding:
+    """Test cases for line protocol and COPY encoding."""
+
+    @pytest.mark.unit
+    def test_line_protocol_escapes_tags_and_skips_nan(self: Self):
+        body = encode_line_protocol(
+            "plant data",
+            np.array([START, START + 1], dtype="datetime64[us]"),
+            ["Area 1,Temp=A", "Flow"],
+            np.array([1.5, np.nan]),
+            np.array([192, 0]),
+        )
+
+        assert body == "plant\\ data,tag_name=Area\\ 1\\,Temp\\=A value=1.5,quality=192i 1705312800000000000"
+
+    @pytest.mark.unit
+    def test_copy_csv_quotes_and_nulls(self: Self):
+        csv_text = encode_copy_csv(np.array([START]), ['Tank "A", level'], np.array([np.nan]))
+
+        assert csv_text == '2024-01-15T10:00:00.000000,"Tank ""A"", level",\n'
+
+
+class TestTimeSeriesAdapter:
+    """Test cases for chunked writes and columnar block reads."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunked_write_and_paged_block_read(self: Self):
+        adapter = _adapter(batch_size=64)
+        async with adapter:
+            seconds = np.arange(1000)
+            tags = ["Temp" if i % 2 else "Flow" for i in seconds]
+            written = await adapter.write_points(START + seconds * 1_000_000, tags, seconds * 0.5, seconds % 3)
+
+            query = {
+                "tags": ["Temp"],
+                "start_time": datetime(2024, 1, 15, 10, 0),
+                "end_time": datetime(2024, 1, 15, 11, 0),
+            }
+            blocks = [block async for block in adapter.read_blocks(query, page_size=200)]
+
+            assert written == 1000
+            assert adapter.get_connection_info()["write_stats"]["chunks_written"] == 16
+            assert [len(block["value"]) for block in blocks] == [200, 200, 100]
+            block = blocks[0]
+            assert block["timestamp"].dtype == np.dtype("datetime64[us]")
+            assert block["value"].dtype == np.float64
+            np.testing.assert_array_equal(block["value"][:3], [0.5, 1.5, 2.5])
+            np.testing.assert_array_equal(block["quality"][:3], [1, 0, 2])
+
+            aggregated = await adapter.read_data({**query, "aggregation": "avg", "interval": "5", "time_unit": "m"})
+            assert [row["aggregated_value"] for row in aggregated] == [75.0, 225.0, 375.0, 475.0]
+            assert aggregated[0]["time_bucket"] == datetime(2024, 1, 15, 10, 0)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_retried(self: Self, monkeypatch):
+        monkeypatch.setattr(timeseries_adapter, "RETRY_BACKOFF_SECONDS", 0.0)
+        adapter = _adapter(batch_size=2)
+        async with adapter:
+            original = adapter._write_sqlite_chunk
+            failures = iter([True, False])
+
+            def flaky(*chunk):
+                if next(failures, False):
+                    raise RuntimeError("connection reset")
+                original(*chunk)
+
+            adapter._write_sqlite_chunk = flaky
+            ok = await adapter.write_data(
+                [{"timestamp": f"2024-01-15T10:00:0{i}", "tag_name": "Temp", "value": float(i)} for i in range(4)]
+            )
+
+            assert ok
+            assert adapter.get_connection_info()["write_stats"] == {
+                "points_written": 4,
+                "chunks_written": 2,
+                "retries": 1,
+                "failed_chunks": 0,
+            }
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_range_bounds_include_points_on_the_boundaries(self: Self):
+        adapter = _adapter()
+        async with adapter:
+            await adapter.write_points(START + np.arange(3) * 1_000_000, ["Temp"] * 3, np.array([1.0, 2.0, 3.0]))
+
+            rows = await adapter.read_data(
+                {"start_time": datetime(2024, 1, 15, 10, 0, 1), "end_time": datetime(2024, 1, 15, 10, 0, 2)}
+            )
+
+            assert [row["value"] for row in rows] == [2.0, 3.0]